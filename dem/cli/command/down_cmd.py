@@ -0,0 +1,30 @@
+"""down CLI command implementation."""
+# dem/cli/command/down_cmd.py
+
+from dem.core.dev_env import DevEnv
+from dem.core.platform import Platform, PlatformError
+from dem.cli.console import stderr, stdout
+
+def execute(platform: Platform, dev_env_name: str) -> None:
+    """
+        Stop the warm containers of the given Development Environment.
+
+        Args:
+            platform -- the platform
+            dev_env_name -- the name of the Development Environment
+    """
+    dev_env: DevEnv | None = platform.get_dev_env_by_name(dev_env_name)
+
+    if dev_env is None:
+        stderr.print(f"[red]Error: The {dev_env_name} Development Environment does not exist.[/]")
+        return
+
+    try:
+        stopped_container_names = platform.down_dev_env(dev_env)
+    except PlatformError as e:
+        stderr.print(f"[red]{str(e)}[/]")
+    else:
+        if stopped_container_names:
+            stdout.print(f"[green]The {dev_env_name} is down![/]")
+        else:
+            stdout.print(f"[yellow]The {dev_env_name} has no running containers.[/]")
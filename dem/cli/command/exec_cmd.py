@@ -0,0 +1,40 @@
+"""exec CLI command implementation."""
+# dem/cli/command/exec_cmd.py
+
+from dem.core.dev_env import DevEnv
+from dem.core.platform import Platform, PlatformError
+from dem.cli.console import stderr
+import typer
+
+def execute(platform: Platform, dev_env_name: str, tool: str, command: list[str]) -> None:
+    """
+        Execute the command in the warm container of the given Development Environment.
+
+        Args:
+            platform -- the platform
+            dev_env_name -- the name of the Development Environment
+            tool -- the tool image to execute the command in
+            command -- the command with its arguments
+
+        Exceptions:
+            typer.Exit -- with the exit code of the command
+            typer.Abort -- if the command can't be executed
+    """
+    dev_env: DevEnv | None = platform.get_dev_env_by_name(dev_env_name)
+
+    if dev_env is None:
+        stderr.print(f"[red]Error: The {dev_env_name} Development Environment does not exist.[/]")
+        raise typer.Abort()
+
+    if not command:
+        stderr.print("[red]Error: The command to execute is missing.[/]")
+        raise typer.Abort()
+
+    try:
+        exit_code = platform.exec_in_dev_env(dev_env, command, tool)
+    except PlatformError as e:
+        stderr.print(f"[red]{str(e)}[/]")
+        raise typer.Abort()
+
+    if exit_code != 0:
+        raise typer.Exit(code=exit_code)
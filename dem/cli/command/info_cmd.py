@@ -96,7 +96,7 @@ def cat_dev_env_info(platform: Platform, dev_env_name: str, selected_cats: list[
             catalog.request_dev_envs()
             dev_env = catalog.get_dev_env_by_name(dev_env_name)
             if dev_env:
-                dev_env.assign_tool_image_instances(platform.tool_images)
+                platform.resolve_tool_image_instances(dev_env)
                 print_cat_dev_env_info(dev_env, catalog.name)
                 break
     else:
@@ -4,18 +4,47 @@
 from dem.core.dev_env import DevEnv
 from dem.core.platform import Platform, PlatformError
 from dem.cli.console import stderr, stdout
+from rich.filesize import decimal
+from rich.table import Table
+from typing import Any
 
-def execute(platform: Platform, dev_env_name: str) -> None:
+def print_install_plan(install_plan: dict[str, Any]) -> None:
+    """ Print the tool images to pull with their download sizes and the available disk space.
+
+        Args:
+            install_plan -- the install plan of the Development Environment
+    """
+    if not install_plan["tool_images"]:
+        stdout.print("All the tool images are available locally, nothing to pull.")
+        return
+
+    install_plan_table = Table()
+    install_plan_table.add_column("Image")
+    install_plan_table.add_column("Download size", justify="right")
+    for tool_image_name, download_size in install_plan["tool_images"].items():
+        if download_size is None:
+            install_plan_table.add_row(tool_image_name, "[yellow]unknown[/]")
+        else:
+            install_plan_table.add_row(tool_image_name, decimal(download_size))
+    stdout.print(install_plan_table)
+
+    stdout.print(f"Total download size: {decimal(install_plan['download_size'])}")
+    if install_plan["free_space"] is None:
+        stdout.print("[yellow]The free disk space of the Docker Engine is unknown.[/]")
+    elif install_plan["download_size"] > install_plan["free_space"]:
+        stdout.print(f"[red]Free disk space: {decimal(install_plan['free_space'])}[/]")
+    else:
+        stdout.print(f"Free disk space: {decimal(install_plan['free_space'])}")
+
+def execute(platform: Platform, dev_env_name: str, dry_run: bool = False) -> None:
     """
         Install the given Development Environment.
         
         Args:
             platform -- the platform
             dev_env_name -- the name of the Development Environment to install
+            dry_run -- only print the install plan, don't pull anything
     """
-
-    platform.assign_tool_image_instances_to_all_dev_envs()
-
     dev_env_to_install: DevEnv | None = platform.get_dev_env_by_name(dev_env_name)
 
     if dev_env_to_install is None:
@@ -23,8 +52,14 @@ def execute(platform: Platform, dev_env_name: str) -> None:
     elif dev_env_to_install.is_installed == True:
         stderr.print(f"[red]Error: The {dev_env_name} Development Environment is already installed.[/]")
     else:
+        # Only the tool images of the Dev Env get checked, the registries are not crawled.
+        platform.resolve_tool_image_instances(dev_env_to_install, local_first=True)
         try:
-            platform.install_dev_env(dev_env_to_install)            
+            install_plan = platform.get_install_plan(dev_env_to_install)
+            if dry_run:
+                print_install_plan(install_plan)
+                return
+            platform.install_dev_env(dev_env_to_install, install_plan)
         except PlatformError as e:
             stderr.print(f"[red]{e}[/]")
         else:
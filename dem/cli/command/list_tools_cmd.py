@@ -2,16 +2,46 @@
 # dem/cli/command/list_tools_cmd.py
 
 from dem.core.platform import Platform
-from dem.core.tool_images import ToolImage
 from dem.cli.console import stdout, stderr
-from rich.table import Table
-import typer
+from fnmatch import fnmatch
+import typer, json
 
-def list_local_tools(platform: Platform) -> None:
+def print_tool_image(tool_image_name: str, available_locally: bool, json_output: bool) -> None:
+    """ Print a tool image.
+
+        Args:
+            tool_image_name -- the name of the tool image
+            available_locally -- the tool image is available locally
+            json_output -- print the tool image as a JSON object in a single line (NDJSON)
+    """
+    if json_output:
+        stdout.print(json.dumps({"name": tool_image_name, "available_locally": available_locally}),
+                     markup=False, soft_wrap=True)
+    elif available_locally:
+        stdout.print(f"  [green]✔[/] {tool_image_name}")
+    else:
+        stdout.print(f"    {tool_image_name}")
+
+def is_tool_image_selected(tool_image_name: str, repo_filter: list[str]) -> bool:
+    """ Check whether the repository of the tool image matches any of the glob patterns.
+
+        Args:
+            tool_image_name -- the name of the tool image in the repo:tag format
+            repo_filter -- glob patterns, every tool image is selected if empty
+
+        Return with True if the tool image needs to be listed.
+    """
+    repo = tool_image_name.rsplit(":", 1)[0]
+    return not repo_filter or any(fnmatch(repo, pattern) for pattern in repo_filter)
+
+def list_local_tools(platform: Platform, json_output: bool = False, 
+                     repo_filter: list[str] = []) -> None:
     """ List the local tools.
     
         Args:
             platform -- the Platform
+            json_output -- print the tool images as NDJSON
+            repo_filter -- glob patterns, only the tools of the matching repositories get listed
 
         Exceptions:
             typer.Abort -- if no local tool images are available
@@ -19,18 +49,25 @@ def list_local_tools(platform: Platform) -> None:
     # by settings this to True, the update method won't try to update the registry tools
     platform.local_only = True
 
-    if not platform.tool_images.all_tool_images:
-        stdout.print("[yellow]No local tool images are available.[/]")
+    tool_image_names = [tool_image_name for tool_image_name in platform.tool_images.all_tool_images
+                        if is_tool_image_selected(tool_image_name, repo_filter)]
+
+    if not tool_image_names:
+        console = stderr if json_output else stdout
+        console.print("[yellow]No local tool images are available.[/]")
         raise typer.Abort()
 
+    if json_output:
+        for tool_image_name in sorted(tool_image_names):
+            print_tool_image(tool_image_name, True, json_output)
+        return
+
     stdout.print(f"\n [italic]Local Tool Images[/]")
-    # sorted will return a list of tuples, so we can iterate over the items
-    for tool_image in sorted(platform.tool_images.all_tool_images.items()):
-        # tool_image[0] is the name of the tool image and tool_image[1] is the ToolImage instance
-        stdout.print(f"  {tool_image[0]}")
+    for tool_image_name in sorted(tool_image_names):
+        stdout.print(f"  {tool_image_name}")
 
-def update_tools_from_selected_regs(platform: Platform, selected_regs: list[str]) -> None:
-    """ Update the tools from the selected registries only. 
+def check_selected_regs(platform: Platform, selected_regs: list[str]) -> None:
+    """ Check that the selected registries are available.
     
         Args:
             platform -- the Platform
@@ -39,10 +76,6 @@ def update_tools_from_selected_regs(platform: Platform, selected_regs: list[str]
         Exceptions:
             typer.Abort -- if an unknown registry is specified
     """
-    # by settings this to True, the update method won't start automatically so we can provide
-    # the selected registry names
-    platform.disable_tool_update = True
-
     available_regs = set([reg["name"] for reg in platform.config_file.registries])
     selected_regs = set(selected_regs)
 
@@ -51,84 +84,68 @@ def update_tools_from_selected_regs(platform: Platform, selected_regs: list[str]
             stderr.print(f"[red]Error: Registry {unkown_reg} is not available![/]")
         raise typer.Abort()
 
-    platform.tool_images.update(reg_selection=selected_regs)
-
-def list_tools_from_regs(platform: Platform, table: Table) -> None:
+def list_tools_from_regs(platform: Platform, selected_regs: list[str], json_output: bool, 
+                         repo_filter: list[str] = []) -> None:
     """ List the available tools from the registries.
-    
-        Args:
-            platform -- the Platform
-            table -- the rich Table instance to fill with the tool image data
-    """
-    table.add_column("Name")
-    table.add_column("Available locally?")
-    # sorted will return a list of tuples, so we can iterate over the items
-    for tool_image in sorted(platform.tool_images.get_registry_ones().items()):
-        # tool_image[0] is the name of the tool image and tool_image[1] is the ToolImage instance
-        tool_image_name = tool_image[0]
-        tool_image: ToolImage = tool_image[1]
-        
-        if tool_image.availability == ToolImage.LOCAL_AND_REGISTRY:
-            available_locally = "[green]✔[/]"
-        else:
-            available_locally = ""
-
-        table.add_row(tool_image_name, available_locally)
 
-def list_tools_from_selected_regs(platform: Platform, specified_regs: list[str]) -> None:
-    """ List the available tools from the selected registries only.
+        The tool images are printed as soon as their repository gets resolved, so the first results
+        appear before the crawl of the registries is over.
     
         Args:
             platform -- the Platform
-            specified_regs -- the selected registry names
-            
-        Exceptions:
-            typer.Abort -- if no tool images are available in the selected registries
-    """
-    update_tools_from_selected_regs(platform, specified_regs)
+            selected_regs -- the selected registry names, empty list means all registries
+            json_output -- print the tool images as NDJSON, every other message goes to the stderr
+            repo_filter -- glob patterns, only the matching repositories get crawled
 
-    if not platform.tool_images.get_registry_ones():
-        stdout.print("[yellow]No tool images are available in the selected registries.[/]")
-        raise typer.Abort()
-
-    table = Table()
-    list_tools_from_regs(platform, table)
-    stdout.print(f"\n [italic]Available Tool Images from the selected registries[/]")
-    stdout.print(table)
-
-def list_tools_from_all_regs(platform: Platform) -> None:
-    """ List the available tools from all registries.
-    
-        Args:
-            platform -- the Platform
-        
         Exceptions:
             typer.Abort -- if no tool images are available in the registries
     """
-    if not platform.tool_images.get_registry_ones():
-        stdout.print("[yellow]No tool images are available in the registries.[/]")
-        raise typer.Abort()
+    if json_output:
+        # The stdout only holds the NDJSON lines, the messages of the registries go to the stderr.
+        platform.user_output.is_msg_on_stderr = True
 
-    table = Table()
-    list_tools_from_regs(platform, table)
-    stdout.print(f"\n [italic]Available Tool Images from all registries[/]")
-    stdout.print(table)
+    local_tool_image_names = platform.container_engine.get_local_tool_images(
+        platform.registries.get_repo_references(selected_regs))
+
+    if not json_output:
+        if selected_regs:
+            stdout.print(f"\n [italic]Available Tool Images from the selected registries[/]")
+        else:
+            stdout.print(f"\n [italic]Available Tool Images from all registries[/]")
+
+    is_tool_image_available = False
+    for tool_image_name in platform.registries.iter_tool_images(selected_regs, 
+                                                                platform.refresh_registries,
+                                                                repo_filter,
+                                                                platform.incremental_registry_refresh):
+        is_tool_image_available = True
+        print_tool_image(tool_image_name, tool_image_name in local_tool_image_names, json_output)
+
+    if not is_tool_image_available:
+        console = stderr if json_output else stdout
+        if selected_regs:
+            console.print("[yellow]No tool images are available in the selected registries.[/]")
+        else:
+            console.print("[yellow]No tool images are available in the registries.[/]")
+        raise typer.Abort()
 
-def execute(platform: Platform, reg: bool, selected_regs: list[str]) -> None:
+def execute(platform: Platform, reg: bool, selected_regs: list[str], 
+            json_output: bool = False, repo_filter: list[str] = []) -> None:
     """ List the available tools.
         
         Args:
             platform -- the Platform
             reg -- the flag to list the tools from the registries
             selected_regs -- the selected registry names
+            json_output -- print the tool images as NDJSON
+            repo_filter -- glob patterns, only the tools of the matching repositories get listed
         
         Exceptions:
             typer.Abort -- if no tool images are available either locally or in the registries or 
                            if an unknown registry is specified
     """
     if not reg:
-        list_local_tools(platform)
-    elif selected_regs:
-        list_tools_from_selected_regs(platform, selected_regs)
+        list_local_tools(platform, json_output, repo_filter)
     else:
-        list_tools_from_all_regs(platform)
\ No newline at end of file
+        check_selected_regs(platform, selected_regs)
+        list_tools_from_regs(platform, selected_regs, json_output, repo_filter)
@@ -2,8 +2,9 @@
 # dem/cli/command/run_cmd.py
 
 from dem.core.dev_env import DevEnv
-from dem.core.platform import Platform
+from dem.core.platform import Platform, PlatformError
 from dem.cli.console import stdout, stderr
+from rich.filesize import decimal
 import typer
 
 def handle_missing_tool_images(missing_tool_images: set[str], dev_env_local: DevEnv,
@@ -24,9 +25,27 @@ def handle_missing_tool_images(missing_tool_images: set[str], dev_env_local: Dev
     platform.install_dev_env(dev_env_local)
     stdout.print("[green]DEM fixed the " + dev_env_local.name + "![/]")
 
+def print_cache_volume_sizes(platform: Platform, dev_env_local: DevEnv) -> None:
+    """ Print the disk usage of the cache volumes of the Dev Env.
+
+        Args:
+            platform -- provides the interface to query the cache volumes
+            dev_env_local -- local Dev Env
+    """
+    try:
+        cache_volume_sizes = platform.get_cache_volume_sizes(dev_env_local)
+    except PlatformError as e:
+        stderr.print(f"[yellow]{str(e)}[/]")
+        return
+
+    for cache_volume_name, size in cache_volume_sizes.items():
+        size_str = "unknown" if size is None else decimal(size)
+        stdout.print(f"The {cache_volume_name} cache volume uses {size_str}.")
+
 def execute(platform: Platform, dev_env_name: str, container_arguments: list[str]) -> None:
     """ Execute the run command in the given Dev Env context. If something is wrong with the Dev 
-        Env the DEM can try to fix it.
+        Env the DEM can try to fix it. The cache volumes of the Dev Env get created on demand and 
+        mounted in the container.
 
         Args:
             dev_env_name -- name of the Development Environment
@@ -53,4 +72,13 @@ def execute(platform: Platform, dev_env_name: str, container_arguments: list[str
         if missing_tool_images:
             handle_missing_tool_images(missing_tool_images, dev_env_local, platform)
 
-        platform.container_engine.run(container_arguments)
\ No newline at end of file
+        try:
+            cache_volume_mounts = platform.get_cache_volume_mounts(dev_env_local)
+        except PlatformError as e:
+            stderr.print(f"[red]{str(e)}[/]")
+            raise typer.Abort()
+
+        platform.container_engine.run(container_arguments, cache_volume_mounts)
+
+        if cache_volume_mounts:
+            print_cache_volume_sizes(platform, dev_env_local)
\ No newline at end of file
@@ -0,0 +1,32 @@
+"""up CLI command implementation."""
+# dem/cli/command/up_cmd.py
+
+from dem.core.dev_env import DevEnv
+from dem.core.platform import Platform, PlatformError
+from dem.cli.console import stderr, stdout
+
+def execute(platform: Platform, dev_env_name: str, idle_timeout_s: int | None, volumes: list[str],
+            privileged: bool) -> None:
+    """
+        Start the warm containers of the given Development Environment.
+
+        Args:
+            platform -- the platform
+            dev_env_name -- the name of the Development Environment
+            idle_timeout_s -- the containers stop after this many seconds without a command, the 
+                              config is used if None
+            volumes -- additional volumes to mount in the containers
+            privileged -- give extended privileges to the containers
+    """
+    dev_env: DevEnv | None = platform.get_dev_env_by_name(dev_env_name)
+
+    if dev_env is None:
+        stderr.print(f"[red]Error: The {dev_env_name} Development Environment does not exist.[/]")
+        return
+
+    try:
+        platform.up_dev_env(dev_env, idle_timeout_s, volumes, privileged)
+    except PlatformError as e:
+        stderr.print(f"[red]{str(e)}[/]")
+    else:
+        stdout.print(f"[green]The {dev_env_name} is up![/]")
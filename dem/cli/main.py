@@ -2,7 +2,7 @@
 # dem/cli/main.py
 
 import typer, importlib.metadata
-from typing import Generator
+from typing import Generator, Optional
 from typing_extensions import Annotated
 import os
 from dem import __command__, __app_name__
@@ -10,7 +10,7 @@ from dem.cli.command import cp_cmd, import_cmd, info_cmd, list_cmd, create_cmd,
                             rename_cmd, run_cmd, export_cmd, clone_cmd, add_reg_cmd, \
                             list_reg_cmd, del_reg_cmd, add_cat_cmd, list_cat_cmd, del_cat_cmd, \
                             add_host_cmd, uninstall_cmd, install_cmd, assign_cmd, init_cmd, \
-                            list_host_cmd, del_host_cmd, list_tools_cmd
+                            list_host_cmd, del_host_cmd, list_tools_cmd, up_cmd, exec_cmd, down_cmd
 from dem.cli.console import stdout
 from dem.core.platform import Platform
 from dem.core.exceptions import InternalError
@@ -97,6 +97,13 @@ def list_(cat: Annotated[bool, typer.Option(help="List the Dev Envs available fr
 @typer_cli.command(context_settings={"allow_extra_args": True})
 def list_tools(reg: Annotated[bool, typer.Option(help="List the available tools in the registries.",
                                                   show_default=False)] = False,
+               json_output: Annotated[bool, typer.Option("--json", 
+                                                         help="Print the tools as NDJSON.",
+                                                         show_default=False)] = False,
+               repo_filter: Annotated[Optional[list[str]], 
+                                      typer.Option("--filter", 
+                                                   help="Glob pattern of the repositories to list.",
+                                                   show_default=False)] = None,
                ctx: Annotated[typer.Context, typer.Option()] = None) -> None:
     """
     List the available tools.
@@ -105,10 +112,15 @@ def list_tools(reg: Annotated[bool, typer.Option(help="List the available tools
 
     --reg: List the available tools in the registries. Specify the registry's name to list the tools
     from. More then one registry can be specified. If no registry is specified, all the available
-    registries will be used.
+    registries will be used. The tools are printed as soon as they are found.
+
+    --json: Print one JSON object per tool (NDJSON) instead of the human readable list.
+
+    --filter: Only list the repositories matching the glob pattern (e.g. "axemsolutions/*arm*"). Can
+    be used multiple times. The registries get crawled for the matching repositories only.
     """
     if platform and ctx:
-        list_tools_cmd.execute(platform, reg, ctx.args)
+        list_tools_cmd.execute(platform, reg, ctx.args, json_output, repo_filter or [])
     else:
         raise InternalError("Error: The platform hasn't been initialized properly!")
 
@@ -225,12 +237,13 @@ def delete(dev_env_name: Annotated[str, typer.Argument(help="Name of the Develop
 
 @typer_cli.command()
 def install(dev_env_name: Annotated[str, typer.Argument(help="Name of the Development Environment to install.",
-                                                       autocompletion=autocomplete_dev_env_name)]) -> None:
+                                                       autocompletion=autocomplete_dev_env_name)],
+            dry_run: Annotated[bool, typer.Option(help="Only print the tool images to pull, their download size and the free disk space.")] = False) -> None:
     """
     Install the Development Environment.
     """
     if platform is not None:
-        install_cmd.execute(platform, dev_env_name)
+        install_cmd.execute(platform, dev_env_name, dry_run)
     else:
         raise InternalError("Error: The platform hasn't been initialized properly!")
     
@@ -290,6 +303,53 @@ def run(dev_env_name: Annotated[str, typer.Argument(help="Run the container in t
     else:
         raise InternalError("Error: The platform hasn't been initialized properly!")
 
+@typer_cli.command()
+def up(dev_env_name: Annotated[str, typer.Argument(help="Name of the Development Environment to start.",
+                                                   autocompletion=autocomplete_dev_env_name)],
+       idle_timeout: Annotated[int, typer.Option(help="Stop the containers after this many seconds without a command. [default: warm_container_idle_timeout_s from the config.json]",
+                                                 show_default=False)] = None,
+       volume: Annotated[list[str], typer.Option("--volume", "-v", help="Additional volume to mount in the host-path:container-path[:mode] format. Can be used multiple times.")] = [],
+       privileged: Annotated[bool, typer.Option(help="Give extended privileges to the containers (e.g. to access a debugger).")] = False) -> None:
+    """
+    Start a warm container for each tool image of the Development Environment.
+
+    The current working directory gets mounted to the same path in the containers. Use `dem exec` 
+    to run commands in them. The containers stop when no command has been running in them for the
+    idle timeout.
+    """
+    if platform:
+        up_cmd.execute(platform, dev_env_name, idle_timeout, volume, privileged)
+    else:
+        raise InternalError("Error: The platform hasn't been initialized properly!")
+
+@typer_cli.command("exec", context_settings={"allow_extra_args": True, "ignore_unknown_options": True}) # "exec" is a Python builtin
+def exec_(dev_env_name: Annotated[str, typer.Argument(help="Name of the Development Environment to execute the command in.",
+                                                      autocompletion=autocomplete_dev_env_name)],
+          ctx: Annotated[typer.Context, typer.Option()],
+          tool: Annotated[str, typer.Option(help="The tool image to execute the command in: its name, repository or the last part of its repository. Can be omitted if the Dev Env has a single tool image.")] = "") -> None:
+    """
+    Execute a command in the warm container of the Development Environment started by `dem up`.
+
+    The command runs in the current working directory and the exit code of the command is returned.
+    Put -- before the command if it has an option also used by DEM.
+    Example: dem exec dev_env --tool make_gnu_arm -- make -j4
+    """
+    if platform:
+        exec_cmd.execute(platform, dev_env_name, tool, ctx.args)
+    else:
+        raise InternalError("Error: The platform hasn't been initialized properly!")
+
+@typer_cli.command()
+def down(dev_env_name: Annotated[str, typer.Argument(help="Name of the Development Environment to stop.",
+                                                     autocompletion=autocomplete_dev_env_name)]) -> None:
+    """
+    Stop the warm containers of the Development Environment started by `dem up`.
+    """
+    if platform:
+        down_cmd.execute(platform, dev_env_name)
+    else:
+        raise InternalError("Error: The platform hasn't been initialized properly!")
+
 @typer_cli.command()
 def add_reg(name: Annotated[str, typer.Argument(help="Name of the registry to add")], 
             url: Annotated[str, typer.Argument(help="API URL of the registry")]) -> None:
@@ -418,10 +478,25 @@ def main(
         help="Show the dem version.",
         callback=_version_callback,
         is_eager=True,
+    ),
+    refresh: bool = typer.Option(
+        False,
+        "--refresh",
+        help="Ignore the registry cache and crawl the registries from scratch.",
+        show_default=False,
+    ),
+    incremental: bool = typer.Option(
+        False,
+        "--incremental",
+        help="Crawl only the new and changed registry repositories, reuse the cached tags of the others.",
+        show_default=False,
     )) -> None:
     """
     Development Environment Manager (dem)
     
     Manage your containerized Development Environments with ease.
     """
-    return
+    if refresh and platform is not None:
+        platform.refresh_registries = True
+    if incremental and platform is not None:
+        platform.incremental_registry_refresh = True
@@ -4,72 +4,170 @@
 from dem.cli.console import stdout, stderr
 from dem.core.user_output import UserOutput
 
+import time
 import typer
 from typing import Generator
-from rich.progress import Progress, TaskID, TextColumn, BarColumn, TaskProgressColumn
+from rich.filesize import decimal
+from rich.progress import Progress, TaskID, TextColumn, BarColumn, DownloadColumn, \
+    TransferSpeedColumn, TimeRemainingColumn
 from rich.status import Status
 
 class PullProgressBar():
-    """ Visualize the status of the pull command on a progress bar."""
+    """ Visualize the status of the pull command on a progress bar.
+
+        The events of the pull are coalesced per layer and the display is only updated at a fixed 
+        rate. A progress bar shows the downloaded bytes of each image, and another one the total of
+        all images if more images are pulled at the same time. If the output is not a terminal, 
+        only a summary line per image is printed periodically.
+
+        Class attributes:
+            _render_interval_s -- the minimum time between two updates of the progress bars
+            _summary_interval_s -- the time between two summaries if the output is not a terminal
+            _downloaded_statuses -- the layer statuses that mean the layer has been downloaded
+            _skipped_statuses -- the layer statuses that mean the layer doesn't need to be 
+                                 downloaded
+    """
+    _render_interval_s = 0.1
+    _summary_interval_s = 10.0
+    _downloaded_statuses = ("Verifying Checksum", "Download complete", "Extracting", "Pull complete")
+    _skipped_statuses = ("Already exists",)
+
     def __init__(self, generator: Generator) -> None:
         """ Init the class
         
             Args:
                 generator -- the status of the pull command is presented through this generator
         """
-        self.tasks = {}
         self.generator = generator
-
-    def _update_progress_bar(self, id: str, item: dict, status: str) -> None:
-        """ Update the progress bar of the image pull.
+        self.progress: Progress | None = None
+        # The downloaded and the total bytes of the layers by image and layer id.
+        self.layers: dict[str, dict[str, list[float]]] = {}
+        # The progress bar of each image, and of the total under the None key.
+        self.tasks: dict[str | None, TaskID] = {}
+        self.rendered_at = 0.0
+        self.is_changed = False
+
+    def _update_layer(self, image: str, id: str, item: dict, status: str) -> None:
+        """ Update the download progress of the layer.
         
             Args:
+                image -- the image the layer belongs to
                 id -- layer id
                 item -- current item from the generator
-                status -- which process's status the progress bar shows
+                status -- the status of the layer
         """
-        task = self.tasks.get(id)
-
-        if task is None:
-            task = self.progress.add_task(str(id), id=id)
-            self.tasks[id] = task
+        layer = self.layers.setdefault(image, {}).setdefault(id, [0.0, 0.0])
 
-        progress_detail = item.get("progressDetail")
-        current = None
-        total = None
-        if progress_detail:
+        if status in self._skipped_statuses:
+            layer[0] = layer[1] = 0.0
+        elif status in self._downloaded_statuses:
+            layer[0] = layer[1]
+        else:
+            progress_detail = item.get("progressDetail") or {}
             current = progress_detail.get("current")
             total = progress_detail.get("total")
+            if current and total:
+                layer[0] = float(current)
+                layer[1] = float(total)
 
-        if current and total:
-            self.progress.update(task, description=str(status), total=float(total), 
-                                 completed=float(current))
+        self.is_changed = True
 
     def _process(self, item: dict) -> None:
         """ Process an item from the generator provided by the pull command.
+
+            The layer events only update the state of the layer. The other messages are printed.
         
         Args:
             item-- current item from the generator
             """
         status = item.get("status")
         id = item.get("id")
+        image = item.get("image", "")
 
-        if status:
-            if id:
-                if item.get("progressDetail"):
-                    self._update_progress_bar(id, item, status)
-                else:
-                    self.progress.console.print(str(id) + ": " + str(status))
-            else:
-                self.progress.console.print(str(status))
+        if not status:
+            return
+
+        if id and ("progressDetail" in item or status in self._downloaded_statuses or 
+                   status in self._skipped_statuses):
+            self._update_layer(image, str(id), item, str(status))
+        else:
+            message = str(id) + ": " + str(status) if id else str(status)
+            stdout.print(image + ": " + message if image else message)
+
+    def _get_image_progress(self, image: str) -> tuple[float, float]:
+        """ Get the download progress of the image.
+
+            Args:
+                image -- the image
+
+            Return with the downloaded and the total bytes of the known layers.
+        """
+        layers = self.layers.get(image, {}).values()
+        return sum(layer[0] for layer in layers), sum(layer[1] for layer in layers)
+
+    def _update_progress_bars(self) -> None:
+        """ Update the progress bars of the images and the total with the coalesced state."""
+        total_completed = total_size = 0.0
+        for image in self.layers:
+            completed, size = self._get_image_progress(image)
+            total_completed += completed
+            total_size += size
+
+            if image not in self.tasks:
+                self.tasks[image] = self.progress.add_task(image or "Pulling")
+            self.progress.update(self.tasks[image], completed=completed, total=size or None)
+
+        if len(self.layers) > 1:
+            if None not in self.tasks:
+                self.tasks[None] = self.progress.add_task("Total")
+            self.progress.update(self.tasks[None], completed=total_completed, 
+                                 total=total_size or None)
+
+        self.progress.refresh()
+
+    def _print_summary(self) -> None:
+        """ Print the download progress of the images, a line per image."""
+        for image in self.layers:
+            completed, size = self._get_image_progress(image)
+            percentage = 100 * completed / size if size else 0.0
+            stdout.print((image or "Pulling") + ": " + decimal(int(completed)) + " / " + \
+                         decimal(int(size)) + f" ({percentage:.0f}%)")
+
+    def _render(self, force: bool = False) -> None:
+        """ Show the changes since the last render, if enough time has passed.
+
+            Args:
+                force -- render the changes regardless of the time passed
+        """
+        now = time.monotonic()
+        interval_s = self._render_interval_s if self.progress is not None else self._summary_interval_s
+        if not self.is_changed or (not force and now - self.rendered_at < interval_s):
+            return
+
+        self.rendered_at = now
+        self.is_changed = False
+        if self.progress is not None:
+            self._update_progress_bars()
+        else:
+            self._print_summary()
 
     def run_generator(self):
-        with Progress(TextColumn("[progress.layer_id]{task.fields[id]}"), 
-                      TextColumn("[progress.description]{task.description}"),
-                      BarColumn(), TaskProgressColumn(), console=stdout) as self.progress:
+        """ Process the items of the generator until it is exhausted."""
+        self.rendered_at = time.monotonic()
+        if not stdout.is_terminal:
+            for item in self.generator:
+                self._process(item)
+                self._render()
+            self._render(force=True)
+            return
 
+        with Progress(TextColumn("[progress.description]{task.description}"), BarColumn(), 
+                      DownloadColumn(), TransferSpeedColumn(), TimeRemainingColumn(), 
+                      console=stdout, auto_refresh=False) as self.progress:
             for item in self.generator:
                 self._process(item)
+                self._render()
+            self._render(force=True)
 
 class TUIUserOutput(UserOutput):
     """ Provides the interface between the core modules and the rich based TUI."""
@@ -80,10 +178,11 @@ class TUIUserOutput(UserOutput):
                 text -- the text to print
                 is_title -- the text is the title of a new section.
         """
+        console = stderr if self.is_msg_on_stderr else stdout
         if is_title is True:
-            stdout.rule(text)
+            console.rule(text)
         else:
-            stdout.print(text)
+            console.print(text)
 
     def error(self, text: str) -> None:
         """ Send and error message
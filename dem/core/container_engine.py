@@ -3,30 +3,409 @@
 
 from dem.core.core import Core
 from dem.core.exceptions import ContainerEngineError
+from dem.core.data_management import LocalImageIndexJSON, DockerAPIVersionsJSON
+from datetime import datetime, timezone
+from fnmatch import fnmatchcase
 import docker
 import docker.errors
+import docker.utils
+import functools
+import os
+import re
+import requests
+import shutil
+import threading
+import time
+from typing import Any, Callable, Generator, Iterable
+
+def _renegotiate_on_rejected_api_version(method: Callable) -> Callable:
+    """ Decorator for the methods that query the Docker Engine. 
+    
+        If the Docker Engine rejects the cached API version (e.g. it has been downgraded), the 
+        version gets negotiated again and the method is retried once.
+
+        With a cached API version the Docker Engine is not contacted when the client gets created,
+        so the first query is the one that finds out if the Docker Engine is not reachable. The 
+        connection error is converted into a ContainerEngineError.
+
+        Args:
+            method -- the method to decorate
+    """
+    @functools.wraps(method)
+    def wrapper(self: "ContainerEngine", *args, **kwargs) -> Any:
+        try:
+            try:
+                return method(self, *args, **kwargs)
+            except (docker.errors.APIError, ContainerEngineError) as e:
+                if not self._is_api_version_cached or not self._is_api_version_rejection(e):
+                    raise
+                self._negotiate_api_version()
+                return method(self, *args, **kwargs)
+        except requests.exceptions.ConnectionError as e:
+            raise ContainerEngineError(self._get_connection_error_message(e)) from e
+    return wrapper
 
 class ContainerEngine(Core):
-    """ Operations on the Docker Container Engine."""
+    """ Operations on the Docker Container Engine.
+    
+        Class attributes:
+            _event_buffer_size -- the number of events of all types the Docker Engine keeps for 
+                                  replaying, if this many events get replayed, some might have 
+                                  been lost
+            _api_version_rejection_pattern -- the error of the Docker Engine if it doesn't support
+                                              the requested API version
+            _volume_disk_usage_min_api_version -- the first API version that can measure only the
+                                                  volumes
+            _warm_container_script -- the main process of a warm container, it exits when no exec
+                                      has been running for the idle timeout given as its first 
+                                      argument
+            _exec_script -- wraps the command of an exec, so the warm container knows while it's
+                            running
+    """
+    _event_buffer_size = 256
+    _api_version_rejection_pattern = re.compile(r"client version \S+ is too (new|old)", re.IGNORECASE)
+    _volume_disk_usage_min_api_version = "1.42"
+    _warm_container_script = """trap 'exit 0' TERM INT
+touch /tmp/.dem_last_exec
+while :; do
+    for marker in /tmp/.dem_exec.*; do
+        [ -e "$marker" ] || continue
+        if [ -d "/proc/${marker##*.}" ]; then touch /tmp/.dem_last_exec; else rm -f "$marker"; fi
+    done
+    [ $(( $(date +%s) - $(stat -c %Y /tmp/.dem_last_exec) )) -lt "$1" ] || exit 0
+    sleep 5 & wait $!
+done"""
+    _exec_script = """touch /tmp/.dem_exec.$$ /tmp/.dem_last_exec
+"$@"
+status=$?
+rm -f /tmp/.dem_exec.$$
+touch /tmp/.dem_last_exec
+exit $status"""
 
     def __init__(self) -> None:
-        """ Init the class."""
+        """ Init the class.
+        
+            The API version negotiated with the Docker Engine is cached per DOCKER_HOST, so only 
+            the first invocation needs to query the version of the Docker Engine.
+        """
+        self.api_version_cache = DockerAPIVersionsJSON()
+        self._docker_host = os.environ.get("DOCKER_HOST", "")
+        self._is_api_version_cached = False
+
+        self.api_version_cache.update()
+        api_version = self.api_version_cache.get_api_versions().get(self._docker_host, None)
+        if api_version:
+            try:
+                self._docker_client = docker.from_env(version=api_version)
+            except docker.errors.InvalidVersion:
+                self._negotiate_api_version()
+            else:
+                self._is_api_version_cached = True
+        else:
+            self._negotiate_api_version()
+
+        self.local_image_index = LocalImageIndexJSON()
+        self._local_images: dict[str, dict] = {}
+        # The registry layers of the local images by image ID.
+        self._local_image_layers: dict[str, list] = {}
+        self._is_local_image_index_synced = False
+        self._local_image_index_lock = threading.Lock()
+
+    def _negotiate_api_version(self) -> None:
+        """ Create the Docker client with the API version of the Docker Engine and cache the 
+            version.
+        """
         self._docker_client = docker.from_env()
+        self._is_api_version_cached = False
+        self.api_version_cache.get_api_versions()[self._docker_host] = self._docker_client.api.api_version
+        self.api_version_cache.flush()
+
+    @staticmethod
+    def _get_connection_error_message(exception: Exception) -> str:
+        """ Get the error message if the Docker Engine is not reachable.
+
+            Args:
+                exception -- the connection error
+
+            Return with the error message.
+        """
+        return "Error while connecting to the Docker Engine: " + str(exception)
+
+    def _is_api_version_rejection(self, exception: Exception) -> bool:
+        """ Check whether the Docker Engine has rejected the API version of the client.
+
+            Args:
+                exception -- the exception raised by the query (or the exception it has been 
+                             converted from)
+
+            Return with True if the API version is not supported by the Docker Engine.
+        """
+        while exception is not None:
+            if self._api_version_rejection_pattern.search(str(exception)):
+                return True
+            exception = exception.__cause__ or exception.__context__
+        return False
+
+    def _rebuild_local_image_index(self) -> None:
+        """ Build the local image index from the image list of the Docker Engine. 
+        
+            The low-level API is used, so the image models are not built for the listed images.
+        """
+        images = {}
+        for image in self._docker_client.api.images():
+            for tag in image.get("RepoTags") or []:
+                if tag and tag != "<none>:<none>":
+                    images[tag] = {
+                        "id": image["Id"],
+                        "size": image.get("Size", 0),
+                        "created": image.get("Created", 0),
+                    }
+        self._local_images = images
+
+    def _update_local_image_index_entry(self, reference: str) -> None:
+        """ Update the tags of an image in the local image index after an image event.
+
+            Args:
+                reference -- the image ID or the name of the image from the event
+        """
+        images = self._local_images
+        try:
+            image = self._docker_client.api.inspect_image(reference)
+        except docker.errors.NotFound:
+            # The image has been deleted.
+            images.pop(reference, None)
+            for tag in [tag for tag, entry in images.items() if entry["id"] == reference]:
+                del images[tag]
+            return
+
+        for tag in [tag for tag, entry in images.items() if entry["id"] == image["Id"]]:
+            del images[tag]
+        # The creation time is in the RFC 3339 format in UTC, the fraction of the seconds is 
+        # dropped.
+        created = datetime.strptime(image.get("Created", "1970-01-01T00:00:00")[:19], 
+                                    "%Y-%m-%dT%H:%M:%S").replace(tzinfo=timezone.utc)
+        for tag in image.get("RepoTags") or []:
+            images[tag] = {
+                "id": image["Id"],
+                "size": image.get("Size", 0),
+                "created": int(created.timestamp()),
+            }
+
+    @staticmethod
+    def _get_event_marker(event: dict) -> dict:
+        """ Get the fields that identify an event of the Docker Engine.
+
+            Args:
+                event -- the event
+
+            Return with the time, type, action and actor of the event.
+        """
+        return {
+            "time_nano": event.get("timeNano", None),
+            "type": event.get("Type", None),
+            "action": event.get("Action", None),
+            "actor_id": (event.get("Actor") or {}).get("ID", None),
+        }
 
-    def get_local_tool_images(self) -> list[str]:
+    def _replay_events(self, daemon_index: dict[str, Any], now: int, image_count: int) -> None:
+        """ Replay the events of the Docker Engine since the last sync on the local image index.
+
+            The Docker Engine keeps only the last _event_buffer_size events of all types, and it 
+            loses them when it gets restarted. So the events are replayed from the last seen event 
+            without filtering by type: if the last seen event is not replayed anymore, the events 
+            after it might have been lost. Without a last seen event, the events might have been 
+            lost if the buffer is full, or if the number of images has changed without any image 
+            event. The index is rebuilt if some events might have been lost.
+
+            Args:
+                daemon_index -- the index of the Docker Engine
+                now -- the events are replayed until this time
+                image_count -- the current number of images of the Docker Engine
+        """
+        last_event = daemon_index["last_event"]
+        if last_event is None:
+            since = daemon_index["last_sync_time"]
+        else:
+            since = last_event["time_nano"] // 1_000_000_000
+        events = list(self._docker_client.api.events(since=since, until=now, decode=True))
+
+        if last_event is None:
+            new_events = events
+            is_gap = len(events) >= self._event_buffer_size
+        else:
+            markers = [self._get_event_marker(event) for event in events]
+            if last_event in markers:
+                new_events = events[len(markers) - markers[::-1].index(last_event):]
+                is_gap = False
+            else:
+                new_events = events
+                is_gap = True
+
+        image_events = [event for event in new_events if event.get("Type") == "image"]
+        if not image_events and image_count != daemon_index["image_count"]:
+            is_gap = True
+
+        if is_gap:
+            self._rebuild_local_image_index()
+        else:
+            # The pull events refer to the image by name, the others by image ID.
+            references = dict.fromkeys(event.get("id") or (event.get("Actor") or {}).get("ID", "")
+                                       for event in image_events)
+            for reference in references:
+                if reference:
+                    self._update_local_image_index_entry(reference)
+
+        # The last seen event is dropped if it's not replayed anymore (e.g. after a restart of the 
+        # Docker Engine), otherwise the index would be rebuilt on every invocation.
+        daemon_index["last_event"] = self._get_event_marker(events[-1]) if events else None
+
+    @_renegotiate_on_rejected_api_version
+    def _sync_local_image_index(self) -> None:
+        """ Bring the local image index of the Docker Engine up-to-date.
+
+            The index is selected by the DOCKER_HOST and the ID of the Docker Engine. The events 
+            since the last invocation are replayed, only the images affected by them are inspected. 
+            The index is rebuilt from the image list if it doesn't exist yet or some events might 
+            have been lost.
+
+            Exceptions:
+                ContainerEngineError -- if the Docker Engine can't be queried
+        """
+        with self._local_image_index_lock:
+            if self._is_local_image_index_synced:
+                return
+
+            self.local_image_index.update()
+            now = int(time.time())
+
+            try:
+                info = self._docker_client.api.info()
+                daemon_index = self.local_image_index.get_daemon_index(self._docker_host, 
+                                                                       info.get("ID", ""))
+                image_count = info.get("Images", None)
+                self._local_images = daemon_index["images"]
+
+                if self._local_images is None or daemon_index["last_sync_time"] is None:
+                    self._rebuild_local_image_index()
+                else:
+                    self._replay_events(daemon_index, now, image_count)
+            except docker.errors.APIError as e:
+                raise ContainerEngineError(str(e)) from e
+
+            daemon_index["images"] = self._local_images
+            daemon_index["last_sync_time"] = now
+            daemon_index["image_count"] = image_count
+            # The layers of the deleted images are dropped.
+            image_ids = {entry["id"] for entry in self._local_images.values()}
+            self._local_image_layers = {image_id: layers for image_id, layers 
+                                        in daemon_index.get("image_layers", {}).items()
+                                        if image_id in image_ids}
+            daemon_index["image_layers"] = self._local_image_layers
+            self.local_image_index.flush()
+            self._is_local_image_index_synced = True
+
+    def is_local_tool_image(self, tool_image_name: str) -> bool:
+        """ Check whether the tool image is available locally.
+
+            Args:
+                tool_image_name -- the name of the tool image in the repo:tag format
+
+            Return with True if the tool image is in the local image index.
+        """
+        self._sync_local_image_index()
+        return tool_image_name in self._local_images
+
+    def get_local_tool_images(self, references: Iterable[str] = ()) -> set[str]:
         """ Get local tool images.
+
+            The tool images are obtained from the local image index, the images of the Docker Engine
+            don't get listed. A reference matches a tool image if it matches the name or the 
+            repository of the tool image.
+
+            Args:
+                references -- image names or glob patterns (e.g. axemsolutions/*), all the local 
+                              images are listed if empty
         
-            Return with the list of the locally avialable tool image names.
+            Return with the set of the locally avialable tool image names.
         """
-        local_image_tags = []
+        self._sync_local_image_index()
+        local_image_tags = set(self._local_images)
 
-        for image in self._docker_client.images.list():
-            for tag in image.tags:
-                if tag:
-                    local_image_tags.append(tag)
+        references = list(references)
+        if references:
+            local_image_tags = {tag for tag in local_image_tags 
+                                if any(fnmatchcase(tag, reference) or 
+                                       fnmatchcase(tag.rpartition(":")[0], reference)
+                                       for reference in references)}
 
         return local_image_tags
 
+    def get_local_image_layers(self, tool_image_names: Iterable[str]) -> dict[str, list]:
+        """ Get the registry layers of local tool images from the local image index.
+
+            Args:
+                tool_image_names -- the tool images in the repo:tag format
+
+            Return with the digest and the size of the layers by tool image. The tool images that 
+            are not local or whose layers haven't been stored are omitted.
+        """
+        self._sync_local_image_index()
+        layers_per_image = {}
+        for tool_image_name in tool_image_names:
+            entry = self._local_images.get(tool_image_name)
+            if entry is not None and entry["id"] in self._local_image_layers:
+                layers_per_image[tool_image_name] = self._local_image_layers[entry["id"]]
+        return layers_per_image
+
+    def set_local_image_layers(self, layers_per_image: dict[str, list[tuple[str, int]]]) -> None:
+        """ Store the registry layers of local tool images in the local image index.
+
+            The layers are stored by image ID, so they are valid as long as the image exists. The 
+            empty layer lists (the layers couldn't be obtained) and the tool images that are not 
+            local are skipped.
+
+            Args:
+                layers_per_image -- the digest and the size of the layers by tool image
+        """
+        self._sync_local_image_index()
+        with self._local_image_index_lock:
+            for tool_image_name, layers in layers_per_image.items():
+                entry = self._local_images.get(tool_image_name)
+                if entry is not None and layers:
+                    self._local_image_layers[entry["id"]] = [list(layer) for layer in layers]
+            self.local_image_index.flush()
+
+    @_renegotiate_on_rejected_api_version
+    def get_free_space(self) -> int | None:
+        """ Get the free disk space in the data root of the Docker Engine.
+
+            The data root is only measured if the Docker Engine is accessed at a unix socket (the 
+            default if DOCKER_HOST is not set). A remote Docker Engine's data root is not on this 
+            host, even if a directory with the same path exists here.
+
+            Return with the free space in bytes, or None if the data root is not accessible from 
+            this host (e.g. the Docker Engine is remote or runs in a virtual machine).
+
+            Exceptions:
+                ContainerEngineError -- if the Docker Engine can't be queried
+        """
+        if self._docker_host and not self._docker_host.startswith("unix://"):
+            return None
+
+        try:
+            docker_root_dir = self._docker_client.info().get("DockerRootDir", "")
+        except docker.errors.APIError as e:
+            raise ContainerEngineError(str(e)) from e
+
+        if not docker_root_dir:
+            return None
+
+        try:
+            return shutil.disk_usage(docker_root_dir).free
+        except OSError:
+            return None
+
+    @_renegotiate_on_rejected_api_version
     def pull(self, repository: str) -> None:
         """ Pull a repository from the axemsolutions registry.
         
@@ -35,8 +414,35 @@ class ContainerEngine(Core):
         """
         resp = self._docker_client.api.pull(repository, stream=True, decode=True)
         self.user_output.progress_generator(resp)
+        self._is_local_image_index_synced = False
+
+    def iter_pull(self, repository: str) -> Generator:
+        """ Generator function for pulling a repository. The progress of the pull is not sent to 
+            the user output, so the caller can combine the progress of several pulls.
+
+            Args:
+                repository -- repository to pull
 
-    def run(self, container_arguments: list[str]) -> None:
+            Yields the progress items of the pull.
+
+            Exceptions:
+                ContainerEngineError -- if the pull fails
+        """
+        try:
+            for item in self._docker_client.api.pull(repository, stream=True, decode=True):
+                if "error" in item:
+                    raise ContainerEngineError(str(item["error"]))
+                yield item
+        except docker.errors.APIError as e:
+            raise ContainerEngineError(str(e)) from e
+        except requests.exceptions.ConnectionError as e:
+            raise ContainerEngineError(self._get_connection_error_message(e)) from e
+        finally:
+            # The pull events get replayed at the next query.
+            self._is_local_image_index_synced = False
+
+    @_renegotiate_on_rejected_api_version
+    def run(self, container_arguments: list[str], volumes: list[str] = []) -> None:
         """ Run the container. 
         
             The function converts the Docker CLI commands to Docker Engine API call parameters.
@@ -48,13 +454,14 @@ class ContainerEngine(Core):
 
             Args:
                 container_arguments -- list of arguments to pass to the API call
+                volumes -- volumes to mount in addition to the ones given with the -v option
         """
         container_arguments_iter = iter(container_arguments)
 
         image = ""
         ports = {}
         name = ""
-        volumes = []
+        volumes = list(volumes)
         command = ""
         privileged = False
         auto_remove = False
@@ -101,6 +508,187 @@ class ContainerEngine(Core):
             for line in run_result.logs(stream=True):
                 self.user_output.msg(line.decode().strip())
 
+    @_renegotiate_on_rejected_api_version
+    def create_volume(self, name: str, labels: dict[str, str]) -> None:
+        """ Create a named volume if it doesn't exist yet.
+
+            Args:
+                name -- the name of the volume
+                labels -- the labels of the volume, only set when the volume gets created
+
+            Exceptions:
+                ContainerEngineError -- if the volume can't be created
+        """
+        try:
+            self._docker_client.api.inspect_volume(name)
+        except docker.errors.NotFound:
+            try:
+                self._docker_client.api.create_volume(name=name, labels=labels)
+            except docker.errors.APIError as e:
+                raise ContainerEngineError(str(e)) from e
+        except docker.errors.APIError as e:
+            raise ContainerEngineError(str(e)) from e
+
+    @_renegotiate_on_rejected_api_version
+    def get_volume_sizes(self, names: list[str]) -> dict[str, int]:
+        """ Get the disk usage of named volumes.
+
+            Only the volumes are measured, which requires API version 1.42 or newer. An older 
+            Docker Engine would compute the disk usage of every image and container too, which can 
+            take long on a host with many images, so no size is reported then.
+
+            Args:
+                names -- the names of the volumes
+
+            Return with the size in bytes by volume name. The volumes that don't exist, or whose 
+            size the Docker Engine can't report (e.g. not local volumes), are omitted.
+
+            Exceptions:
+                ContainerEngineError -- if the Docker Engine can't be queried
+        """
+        api = self._docker_client.api
+        if not docker.utils.version_gte(api.api_version, self._volume_disk_usage_min_api_version):
+            return {}
+
+        # The docker SDK's df() has no parameter to select the object types, so the endpoint is 
+        # requested through the HTTP session of the API client.
+        response = api.get(f"{api.base_url}/v{api.api_version}/system/df", 
+                           params={"type": "volume"})
+        try:
+            try:
+                response.raise_for_status()
+            except requests.exceptions.HTTPError as e:
+                # Raises the same APIError as the methods of the docker SDK.
+                docker.errors.create_api_error_from_http_exception(e)
+        except docker.errors.APIError as e:
+            raise ContainerEngineError(str(e)) from e
+        disk_usage = response.json()
+
+        volume_sizes = {}
+        for volume in disk_usage.get("Volumes") or []:
+            size = (volume.get("UsageData") or {}).get("Size", -1)
+            if volume.get("Name") in names and size >= 0:
+                volume_sizes[volume["Name"]] = size
+        return volume_sizes
+
+    @_renegotiate_on_rejected_api_version
+    def get_running_container_labels(self, name: str) -> dict[str, str] | None:
+        """ Get the labels of a running container.
+
+            Args:
+                name -- the name of the container
+
+            Return with the labels of the container, or None if the container is not running.
+
+            Exceptions:
+                ContainerEngineError -- if the Docker Engine can't be queried
+        """
+        try:
+            container = self._docker_client.api.inspect_container(name)
+        except docker.errors.NotFound:
+            return None
+        except docker.errors.APIError as e:
+            raise ContainerEngineError(str(e)) from e
+
+        if not container.get("State", {}).get("Running", False):
+            return None
+        return container.get("Config", {}).get("Labels") or {}
+
+    @_renegotiate_on_rejected_api_version
+    def start_warm_container(self, name: str, image: str, labels: dict[str, str], 
+                             idle_timeout_s: int, volumes: list[str] = [], privileged: bool = False,
+                             workdir: str = "") -> None:
+        """ Start a container that is kept running, so commands can be executed in it without 
+            creating a new container for each of them.
+
+            The container stops and gets removed when no exec has been running in it for the idle 
+            timeout. The image must provide a POSIX shell.
+
+            Args:
+                name -- the name of the container
+                image -- the image to start the container from
+                labels -- the labels of the container
+                idle_timeout_s -- the container stops after this many seconds without an exec
+                volumes -- the volumes to mount in the host-path:container-path[:mode] format
+                privileged -- give extended privileges to the container (e.g. to access a debugger)
+                workdir -- the working directory in the container
+
+            Exceptions:
+                ContainerEngineError -- if the container can't be started
+        """
+        try:
+            # A stopped container with the same name might still wait for its removal.
+            try:
+                self._docker_client.api.remove_container(name, force=True)
+            except docker.errors.NotFound:
+                pass
+
+            self._docker_client.containers.run(image, 
+                                               command=[self._warm_container_script, "sh", 
+                                                        str(idle_timeout_s)],
+                                               entrypoint=["sh", "-c"], name=name, labels=labels,
+                                               volumes=volumes, privileged=privileged, 
+                                               working_dir=workdir or None, auto_remove=True, 
+                                               detach=True)
+        except docker.errors.DockerException as e:
+            raise ContainerEngineError(str(e)) from e
+
+    @_renegotiate_on_rejected_api_version
+    def exec(self, name: str, command: list[str], workdir: str = "") -> int:
+        """ Execute a command in a running container. The output of the command is streamed to the 
+            user output.
+
+            Args:
+                name -- the name of the container
+                command -- the command with its arguments
+                workdir -- the working directory of the command, the container's default is used 
+                           if empty
+
+            Return with the exit code of the command.
+
+            Exceptions:
+                ContainerEngineError -- if the command can't be executed
+        """
+        try:
+            exec_id = self._docker_client.api.exec_create(name, 
+                                                          ["sh", "-c", self._exec_script, "sh"] + command,
+                                                          workdir=workdir or None)["Id"]
+            line = b""
+            for chunk in self._docker_client.api.exec_start(exec_id, stream=True):
+                lines = (line + chunk).split(b"\n")
+                line = lines.pop()
+                for complete_line in lines:
+                    self.user_output.msg(complete_line.decode(errors="replace").rstrip("\r"))
+            if line:
+                self.user_output.msg(line.decode(errors="replace").rstrip("\r"))
+
+            return self._docker_client.api.exec_inspect(exec_id).get("ExitCode") or 0
+        except docker.errors.APIError as e:
+            raise ContainerEngineError(str(e)) from e
+
+    @_renegotiate_on_rejected_api_version
+    def stop_containers(self, labels: dict[str, str]) -> list[str]:
+        """ Stop the running containers that have the given labels.
+
+            Args:
+                labels -- the labels the containers must have
+
+            Return with the names of the stopped containers.
+
+            Exceptions:
+                ContainerEngineError -- if the containers can't be stopped
+        """
+        stopped_container_names = []
+        try:
+            label_filters = [key + "=" + value for key, value in labels.items()]
+            for container in self._docker_client.api.containers(filters={"label": label_filters}):
+                self._docker_client.api.stop(container["Id"], timeout=10)
+                stopped_container_names.append(container["Names"][0].lstrip("/"))
+        except docker.errors.APIError as e:
+            raise ContainerEngineError(str(e)) from e
+        return stopped_container_names
+
+    @_renegotiate_on_rejected_api_version
     def remove(self, image: str) -> None:
         """ Remove a tool image.
 
@@ -109,6 +697,7 @@ class ContainerEngine(Core):
             Args: 
                 image -- the tool image to remove
         """
+        self._is_local_image_index_synced = False
         try:
             self._docker_client.images.remove(image)
         except docker.errors.ImageNotFound:
@@ -118,6 +707,7 @@ class ContainerEngine(Core):
         else:
             self.user_output.msg(f"[green]Successfully removed the {image}![/]\n")
 
+    @_renegotiate_on_rejected_api_version
     def search(self, registry: str) -> list[str]:
         """ Search repository in the axemsolutions registry.
         
@@ -3,15 +3,23 @@
 
 from dem.core.user_output import UserOutput, NoUserOutput
 from dem.core.data_management import ConfigFile
+from requests.adapters import HTTPAdapter
+import requests
+import threading
 
 class Core():
     """ Base class for all core classes.
     
         Class attributes:
             user_output -- interface to the UI (must be a descendant of the UserOutput class)
+            config_file -- the deserialized config.json file
+            _http_session -- HTTP session shared by all core classes (created at the first access)
+            _http_session_lock -- protects the creation of the HTTP session
     """
     user_output: UserOutput = NoUserOutput()
     config_file: ConfigFile = ConfigFile()
+    _http_session: requests.Session | None = None
+    _http_session_lock = threading.Lock()
 
     """ Set the user output class for all core descendant core classes.
     
@@ -20,4 +28,22 @@ class Core():
     """
     @classmethod
     def set_user_output(cls, user_output: UserOutput) -> None:
-        cls.user_output = user_output
\ No newline at end of file
+        cls.user_output = user_output
+
+    @property
+    def http_session(self) -> requests.Session:
+        """ The HTTP session shared by all core classes.
+
+            The session keeps the connections alive, so the requests to the same host reuse the 
+            already established TCP and TLS connections. A connection pool gets created for each 
+            host, its size is set by the http_pool_size in the config file.
+        """
+        with Core._http_session_lock:
+            if Core._http_session is None:
+                http_adapter = HTTPAdapter(pool_maxsize=self.config_file.http_pool_size)
+                http_session = requests.Session()
+                http_session.mount("http://", http_adapter)
+                http_session.mount("https://", http_adapter)
+                Core._http_session = http_session
+
+        return Core._http_session
@@ -85,7 +85,47 @@ class LocalDevEnvJSON(BaseJSON):
             raise DataStorageError(f"The dev_env.json file is corrupted.\n{str(e)}") from e
 
 class ConfigFile(BaseJSON):
-    """ Serialize and deserialize the config.json file."""
+    """ Serialize and deserialize the config.json file.
+    
+        Class attributes:
+            _default_max_workers -- number of concurrent registry requests if not set in the file
+            _default_registry_cache_ttl_s -- lifetime of the cached registry tags if not set in the 
+                                             file
+            _default_http_pool_size -- number of kept-alive connections per host if not set in the 
+                                       file
+            _default_http_rate_limit_per_s -- number of requests per second per registry host if not
+                                              set in the file
+            _default_http_max_retries -- number of retries of a throttled request if not set in the 
+                                         file
+            _default_circuit_breaker_threshold -- number of consecutive failures that disable a 
+                                                  registry if not set in the file
+            _default_circuit_breaker_cooldown_s -- how long a failing registry stays disabled if not
+                                                   set in the file
+            _default_registry_crawl_deadline_s -- the time limit of a registry crawl if not set in 
+                                                  the file (0 means no limit)
+            _default_registry_token_cache_on_disk -- save the registry tokens to the registry cache
+                                                     if not set in the file
+            _default_registry_cache_max_staleness_s -- the age until the expired registry tags are
+                                                       still served while they get revalidated in 
+                                                       the background if not set in the file
+            _default_pull_max_workers -- number of concurrent image pulls if not set in the file
+            _default_warm_container_idle_timeout_s -- how long a container started by dem up is 
+                                                      kept running without an exec if not set in 
+                                                      the file
+    """
+    _default_max_workers = 8
+    _default_registry_cache_ttl_s = 3600
+    _default_http_pool_size = 10
+    _default_http_rate_limit_per_s = 10
+    _default_http_max_retries = 5
+    _default_circuit_breaker_threshold = 3
+    _default_circuit_breaker_cooldown_s = 300
+    _default_registry_crawl_deadline_s = 120
+    _default_registry_token_cache_on_disk = False
+    _default_registry_cache_max_staleness_s = 86400
+    _default_pull_max_workers = 4
+    _default_warm_container_idle_timeout_s = 1800
+
     def __init__(self) -> None:
         """ Init the class."""
         self._path = PurePath(self._config_dir + "/config.json")
@@ -103,7 +143,19 @@ class ConfigFile(BaseJSON):
         }
     ],
     "hosts": [],
-    "http_request_timeout_s": 2
+    "http_request_timeout_s": 2,
+    "max_workers": 8,
+    "registry_cache_ttl_s": 3600,
+    "http_pool_size": 10,
+    "http_rate_limit_per_s": 10,
+    "http_max_retries": 5,
+    "circuit_breaker_threshold": 3,
+    "circuit_breaker_cooldown_s": 300,
+    "registry_crawl_deadline_s": 120,
+    "registry_token_cache_on_disk": false,
+    "registry_cache_max_staleness_s": 86400,
+    "pull_max_workers": 4,
+    "warm_container_idle_timeout_s": 1800
 }"""
         super().__init__()
 
@@ -117,6 +169,200 @@ class ConfigFile(BaseJSON):
         self.catalogs: list[dict] = self.deserialized.get("catalogs", [])
         self.hosts: list[dict] = self.deserialized.get("hosts", [])
         self.http_request_timeout_s: float = self.deserialized.get("http_request_timeout_s", None)
+        self.max_workers: int = self.deserialized.get("max_workers", self._default_max_workers)
+        self.registry_cache_ttl_s: float = self.deserialized.get("registry_cache_ttl_s", 
+                                                                 self._default_registry_cache_ttl_s)
+        self.http_pool_size: int = self.deserialized.get("http_pool_size", 
+                                                         self._default_http_pool_size)
+        self.http_rate_limit_per_s: float = self.deserialized.get("http_rate_limit_per_s", 
+                                                                  self._default_http_rate_limit_per_s)
+        self.http_max_retries: int = self.deserialized.get("http_max_retries", 
+                                                           self._default_http_max_retries)
+        self.circuit_breaker_threshold: int = \
+            self.deserialized.get("circuit_breaker_threshold", self._default_circuit_breaker_threshold)
+        self.circuit_breaker_cooldown_s: float = \
+            self.deserialized.get("circuit_breaker_cooldown_s", self._default_circuit_breaker_cooldown_s)
+        self.registry_crawl_deadline_s: float = \
+            self.deserialized.get("registry_crawl_deadline_s", self._default_registry_crawl_deadline_s)
+        self.registry_token_cache_on_disk: bool = \
+            self.deserialized.get("registry_token_cache_on_disk", 
+                                  self._default_registry_token_cache_on_disk)
+        self.registry_cache_max_staleness_s: float = \
+            self.deserialized.get("registry_cache_max_staleness_s", 
+                                  self._default_registry_cache_max_staleness_s)
+        self.pull_max_workers: int = self.deserialized.get("pull_max_workers", 
+                                                           self._default_pull_max_workers)
+        self.warm_container_idle_timeout_s: int = \
+            self.deserialized.get("warm_container_idle_timeout_s", 
+                                  self._default_warm_container_idle_timeout_s)
         
         if self.http_request_timeout_s is None:
-            raise DataStorageError("The http_request_timeout_s is not set in the config.json file.")
\ No newline at end of file
+            raise DataStorageError("The http_request_timeout_s is not set in the config.json file.")
+
+class CacheJSON(BaseJSON):
+    """ Base class of the json files that cache data that can be rebuilt at any time."""
+
+    def update(self) -> None:
+        """ Update the buffer with the content from the json file. 
+        
+            The cache can be rebuilt at any time, so a corrupted file gets restored silently.
+        """
+        try:
+            super().update()
+        except json.decoder.JSONDecodeError:
+            self.restore()
+
+    def flush(self) -> None:
+        """ Write the buffer content to the json file. 
+        
+            The content is written to a temporary file first, which then replaces the json file, so
+            a concurrent invocation never reads a partially written cache.
+        """
+        tmp_path = str(self._path) + "." + str(os.getpid()) + ".tmp"
+        with open(tmp_path, "w") as json_file:
+            json.dump(self.deserialized, json_file, indent=4)
+        os.replace(tmp_path, self._path)
+
+class RegistryCacheJSON(CacheJSON):
+    """ Serialize and deserialize the registry_cache.json file.
+    
+        The tags of the repositories and the repository listings are stored per registry URL, so the
+        registries don't need to be crawled on every invocation. The state of the registries' 
+        circuit breakers is also stored here, so a failing registry stays disabled across 
+        invocations. The bearer tokens of the 
+        registries are stored here too if the registry_token_cache_on_disk setting is enabled.
+    """
+    def __init__(self) -> None:
+        """ Init the class."""
+        self._path = PurePath(self._config_dir + "/registry_cache.json")
+        self._default_json = """{
+    "version": "0.1",
+    "registries": {},
+    "repo_listings": {},
+    "circuit_breakers": {},
+    "bearer_tokens": {}
+}
+"""
+        super().__init__()
+
+    def get_registry_cache(self, registry_url: str) -> dict[str, dict]:
+        """ Get the cache entries of a registry.
+
+            Args:
+                registry_url -- the URL of the registry
+
+            Return with the cache entries of the registry by repository. The returned dictionary is
+            part of the buffer, so the changes get saved with flush().
+        """
+        return self.deserialized.setdefault("registries", {}).setdefault(registry_url, {})
+
+    def get_repo_listing(self, registry_url: str) -> dict[str, Any]:
+        """ Get the cached repository listing of a registry.
+
+            Args:
+                registry_url -- the URL of the registry
+
+            Return with the repositories, their change markers and the time of the listing, or an 
+            empty dictionary if the listing hasn't been cached yet. The returned dictionary is part 
+            of the buffer, so the changes get saved with flush().
+        """
+        return self.deserialized.setdefault("repo_listings", {}).setdefault(registry_url, {})
+
+    def get_circuit_breaker(self, registry_url: str) -> dict:
+        """ Get the circuit breaker state of a registry.
+
+            Args:
+                registry_url -- the URL of the registry
+
+            Return with the number of consecutive failures and the time the circuit was opened at.
+            The returned dictionary is part of the buffer, so the changes get saved with flush().
+        """
+        return self.deserialized.setdefault("circuit_breakers", {}).setdefault(registry_url, {
+            "failures": 0,
+            "opened_at": 0.0,
+        })
+
+    def get_bearer_tokens(self) -> dict[str, dict]:
+        """ Get the stored bearer tokens.
+
+            Return with the tokens and their expiry times by token service and scope. The returned 
+            dictionary is part of the buffer, so the changes get saved with flush().
+        """
+        return self.deserialized.setdefault("bearer_tokens", {})
+
+class LocalImageIndexJSON(CacheJSON):
+    """ Serialize and deserialize the local_image_index.json file.
+    
+        The local images are stored by tag with their image ID, size and creation time, so the 
+        images of the Docker Engine don't need to be listed on every invocation. The registry layers
+        of the images are stored by image ID, so their manifests are only requested once. A 
+        separate index is kept for each Docker Engine, by DOCKER_HOST and daemon ID. An index is 
+        kept up-to-date by replaying the events of its Docker Engine since the last seen event.
+
+        Class attributes:
+            _version -- the version of the file format, a file of another version gets restored
+    """
+    _version = "0.2"
+
+    def __init__(self) -> None:
+        """ Init the class."""
+        self._path = PurePath(self._config_dir + "/local_image_index.json")
+        self._default_json = """{
+    "version": "0.2",
+    "daemons": {}
+}
+"""
+        super().__init__()
+
+    def update(self) -> None:
+        """ Update the buffer with the content from the json file. 
+        
+            The index of an earlier version can't be migrated, so it gets restored.
+        """
+        super().update()
+        if self.deserialized.get("version", None) != self._version:
+            self.restore()
+
+    def get_daemon_index(self, docker_host: str, daemon_id: str) -> dict[str, Any]:
+        """ Get the index of a Docker Engine.
+
+            Args:
+                docker_host -- the DOCKER_HOST the Docker Engine is accessed at
+                daemon_id -- the ID of the Docker Engine
+
+            Return with the index: the local images by tag (None if the index needs to be built), 
+            the last seen event (None if no event has been seen), the time of the last sync, the
+            number of images at the last sync and the registry layers of the images by image ID. 
+            The returned dictionary is part of the buffer, so the changes get saved with flush().
+        """
+        return self.deserialized.setdefault("daemons", {}).setdefault(docker_host, {}).setdefault(daemon_id, {
+            "images": None,
+            "last_event": None,
+            "last_sync_time": None,
+            "image_count": None,
+            "image_layers": {},
+        })
+
+class DockerAPIVersionsJSON(CacheJSON):
+    """ Serialize and deserialize the docker_api_versions.json file.
+    
+        The API versions negotiated with the Docker Engines are stored by DOCKER_HOST, so the 
+        version doesn't need to be queried from the Docker Engine on every invocation.
+    """
+    def __init__(self) -> None:
+        """ Init the class."""
+        self._path = PurePath(self._config_dir + "/docker_api_versions.json")
+        self._default_json = """{
+    "version": "0.1",
+    "api_versions": {}
+}
+"""
+        super().__init__()
+
+    def get_api_versions(self) -> dict[str, str]:
+        """ Get the stored API versions.
+
+            Return with the API versions by DOCKER_HOST. The returned dictionary is part of the 
+            buffer, so the changes get saved with flush().
+        """
+        return self.deserialized.setdefault("api_versions", {})
@@ -44,6 +44,8 @@ class DevEnv():
 
         self.name: str = descriptor["name"]
         self.tool_image_descriptors: list[dict[str, str]] = descriptor["tools"]
+        # The named volumes that keep the build caches across the container runs.
+        self.cache_volume_descriptors: list[dict[str, str]] = descriptor.get("cache_volumes", [])
         self.tool_images: list[ToolImage] = []
         descriptor_installed = descriptor.get("installed", "False")
         if "True" == descriptor_installed:
@@ -95,6 +97,9 @@ class DevEnv():
             "name": self.name,
             "tools": self.tool_image_descriptors
         }
+
+        if self.cache_volume_descriptors:
+            dev_env_json_deserialized["cache_volumes"] = self.cache_volume_descriptors
         
         if omit_is_installed is False:
             if self.is_installed:
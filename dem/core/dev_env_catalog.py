@@ -28,8 +28,8 @@ class DevEnvCatalog(Core):
                 CatalogError -- if the communication with the catalog fails
         """
         try:
-            deser_json_response: requests.Response = requests.get(self.url, 
-                                                                timeout=self.config_file.http_request_timeout_s)
+            deser_json_response: requests.Response = self.http_session.get(self.url, 
+                                                                           timeout=self.config_file.http_request_timeout_s)
         except Exception as e:
             raise CatalogError(f"Error in communication with the [bold]{self.name}[/bold] Development Environment Catalog.\n{str(e)}")
 
@@ -2,7 +2,11 @@
 """
 
 import os
-from typing import Any
+import re
+import threading
+from concurrent.futures import ThreadPoolExecutor
+from queue import Queue
+from typing import Any, Generator
 from dem.core.core import Core
 from dem.core.properties import __supported_dev_env_major_version__
 from dem.core.exceptions import DataStorageError, PlatformError, ContainerEngineError
@@ -38,12 +42,20 @@ class Platform(Core):
         self._container_engine = None
         self._registries = None
         self._hosts = None
+        # Loaded by load_dev_envs()
+        self.local_dev_envs: list[DevEnv] = []
 
         # Set this to true in the platform instance to work with the local tool images only
         self.local_only = False
         # Set this to true in the platform instance so when first accessing the `tool_images` 
         # instance variable, do not automatically update the tool images from the registries
         self.disable_tool_update = False
+        # Set this to true in the platform instance to ignore the registry cache and crawl the 
+        # registries from scratch
+        self.refresh_registries = False
+        # Set this to true in the platform instance to refresh the registry cache incrementally: 
+        # only the new and changed repositories get crawled
+        self.incremental_registry_refresh = False
 
     def load_dev_envs(self) -> None:
         """ Load the Development Environments from the dev_env.json file.
@@ -63,6 +75,22 @@ class Platform(Core):
         for dev_env in self.local_dev_envs:
             dev_env.assign_tool_image_instances(self.tool_images)
 
+    def resolve_tool_image_instances(self, dev_env: DevEnv, local_first: bool = False) -> None:
+        """ Assign the ToolImage instances to the Development Environment, with the availability of 
+            its tool images resolved directly, without crawling the registries.
+
+            Args:
+                dev_env -- the Development Environment
+                local_first -- don't check the locally available tool images in the registries
+        """
+        if self._tool_images is None:
+            self._tool_images = ToolImages(self.container_engine, self.registries)
+
+        tool_image_names = [tool_image_descriptor["image_name"] + ":" + tool_image_descriptor["image_version"]
+                            for tool_image_descriptor in dev_env.tool_image_descriptors]
+        self._tool_images.resolve(tool_image_names, local_first)
+        dev_env.assign_tool_image_instances(self._tool_images)
+
     @property
     def tool_images(self) -> ToolImages:
         """ The tool images.
@@ -72,8 +100,22 @@ class Platform(Core):
         if self._tool_images is None:
             self._tool_images = ToolImages(self.container_engine, self.registries)
             if not self.disable_tool_update:
-                self._tool_images.update(local_only=self.local_only)
+                self._tool_images.update(local_only=self.local_only, 
+                                         refresh=self.refresh_registries,
+                                         incremental=self.incremental_registry_refresh,
+                                         priority_repos=self._get_referenced_repos())
         return self._tool_images
+
+    def _get_referenced_repos(self) -> list[str]:
+        """ Get the repositories referenced by the local Development Environments.
+
+            Return with the repositories in the order of their first reference.
+        """
+        referenced_repos = {}
+        for dev_env in self.local_dev_envs:
+            for tool_image_descriptor in dev_env.tool_image_descriptors:
+                referenced_repos[tool_image_descriptor["image_name"]] = None
+        return list(referenced_repos)
     
     @property
     def container_engine(self) -> ContainerEngine:
@@ -146,11 +188,183 @@ class Platform(Core):
             if dev_env.name == dev_env_name:
                 return dev_env
 
-    def install_dev_env(self, dev_env_to_install: DevEnv) -> None:
-        """ Install the Dev Env by pulling the required images.
-        
+    def _pull_tool_image(self, tool_image_name: str, event_queue: Queue, 
+                         cancel_event: threading.Event) -> None:
+        """ Pull a tool image. Executed by a worker thread.
+
+            The progress items of the pull are forwarded to the event queue, with the name of the 
+            tool image added as the image field. When the pull is over, the name of the tool image 
+            and the error (None on success) are put into the queue. Any exception fails the pull 
+            (e.g. a dropped connection during the stream), so it's reported as a 
+            ContainerEngineError.
+
+            Args:
+                tool_image_name -- the tool image to pull
+                event_queue -- the events are forwarded to this queue
+                cancel_event -- the pull stops when this event gets set
+        """
+        error = None
+        try:
+            for item in self.container_engine.iter_pull(tool_image_name):
+                if cancel_event.is_set():
+                    return
+                event_queue.put(item | {"image": tool_image_name})
+        except ContainerEngineError as e:
+            error = e
+        except Exception as e:
+            error = ContainerEngineError(f"The pull of {tool_image_name} failed: {str(e)}")
+            error.__cause__ = e
+        finally:
+            event_queue.put((tool_image_name, error))
+
+    def _schedule_pulls(self, tool_image_names: list[str], 
+                        layers_per_image: dict[str, list[tuple[str, int]]]) -> tuple[list[str], dict[str, set[str]]]:
+        """ Schedule the pulls by the layers the tool images share, so a shared layer is only 
+            downloaded by one pull.
+
+            The images with the most shared bytes are pulled first. A shared layer gets downloaded 
+            by the first image that contains it, the other images containing the layer wait for 
+            that pull to finish and then find the layer locally.
+
+            Args:
+                tool_image_names -- the tool images to pull
+                layers_per_image -- the layers of the tool images from their manifests
+
+            Return with the tool images in the order to pull them and the images each tool image 
+            needs to wait for.
+        """
+        image_count_per_layer = {}
+        for tool_image_name in tool_image_names:
+            for digest in {digest for digest, _ in layers_per_image.get(tool_image_name, [])}:
+                image_count_per_layer[digest] = image_count_per_layer.get(digest, 0) + 1
+
+        def get_shared_bytes(tool_image_name: str) -> int:
+            return sum(size for digest, size in layers_per_image.get(tool_image_name, []) 
+                       if image_count_per_layer[digest] > 1)
+
+        ordered_tool_image_names = sorted(tool_image_names, key=get_shared_bytes, reverse=True)
+
+        downloading_images = {}
+        dependencies = {}
+        for tool_image_name in ordered_tool_image_names:
+            dependencies[tool_image_name] = set()
+            for digest, _ in layers_per_image.get(tool_image_name, []):
+                if image_count_per_layer[digest] > 1:
+                    downloading_image = downloading_images.setdefault(digest, tool_image_name)
+                    if downloading_image != tool_image_name:
+                        dependencies[tool_image_name].add(downloading_image)
+
+        return ordered_tool_image_names, dependencies
+
+    def _iter_pulls(self, tool_image_names: list[str], pulled_tool_image_names: list[str], 
+                    dependencies: dict[str, set[str]] = {}) -> Generator:
+        """ Generator function for pulling the tool images concurrently.
+
+            At most pull_max_workers images are pulled at the same time. A tool image only starts 
+            when the images it depends on have been pulled. If a pull fails, the remaining pulls 
+            get cancelled.
+
+            Args:
+                tool_image_names -- the tool images to pull
+                pulled_tool_image_names -- the successfully pulled tool images get appended to this
+                                           list
+                dependencies -- the images each tool image needs to wait for
+
+            Yields the progress items of all pulls as they arrive.
+
+            Exceptions:
+                ContainerEngineError -- if a pull fails
+        """
+        event_queue = Queue()
+        cancel_event = threading.Event()
+        executor = ThreadPoolExecutor(max_workers=self.config_file.pull_max_workers)
+        waiting_tool_image_names = list(tool_image_names)
+        running_pulls = 0
+
+        def start_ready_pulls() -> None:
+            nonlocal running_pulls
+            for tool_image_name in list(waiting_tool_image_names):
+                if dependencies.get(tool_image_name, set()).issubset(pulled_tool_image_names):
+                    waiting_tool_image_names.remove(tool_image_name)
+                    executor.submit(self._pull_tool_image, tool_image_name, event_queue, cancel_event)
+                    running_pulls += 1
+
+        try:
+            start_ready_pulls()
+            while running_pulls:
+                event = event_queue.get()
+                if isinstance(event, tuple):
+                    running_pulls -= 1
+                    tool_image_name, error = event
+                    if error is not None:
+                        raise error
+                    pulled_tool_image_names.append(tool_image_name)
+                    start_ready_pulls()
+                else:
+                    yield event
+        finally:
+            cancel_event.set()
+            executor.shutdown(wait=True, cancel_futures=True)
+
+    def _get_local_layers(self, dev_env: DevEnv) -> set[str]:
+        """ Get the layers already present locally that are used by the tool images.
+
+            The Docker Engine only reports the digests of the uncompressed layers, which don't 
+            match the layer digests of the registry manifests. So the manifests of the local tool 
+            images referenced by the Dev Env and by the installed Dev Envs are used instead. The 
+            local tool images of the Dev Env are LOCAL_ONLY if they were resolved local first (e.g.
+            by the install command), their manifests are obtained as well.
+
+            The layers of a local image are stored in the local image index, so its manifest is 
+            only requested from the registry once.
+
+            Args:
+                dev_env -- the Development Environment to install
+
+            Return with the digests of the local layers.
+        """
+        tool_image_names = {tool_image.name for tool_image in dev_env.tool_images
+                            if tool_image.availability in (ToolImage.LOCAL_ONLY, 
+                                                           ToolImage.LOCAL_AND_REGISTRY)}
+        for local_dev_env in self.local_dev_envs:
+            if local_dev_env.is_installed:
+                for tool_image_descriptor in local_dev_env.tool_image_descriptors:
+                    tool_image_name = tool_image_descriptor["image_name"] + ":" + \
+                                      tool_image_descriptor["image_version"]
+                    if self.container_engine.is_local_tool_image(tool_image_name):
+                        tool_image_names.add(tool_image_name)
+
+        layers_per_image = self.container_engine.get_local_image_layers(tool_image_names)
+        missing_tool_image_names = sorted(tool_image_names - layers_per_image.keys())
+        if missing_tool_image_names:
+            missing_layers_per_image = self.registries.get_tool_image_layers(missing_tool_image_names)
+            self.container_engine.set_local_image_layers(missing_layers_per_image)
+            layers_per_image.update(missing_layers_per_image)
+
+        local_layers = set()
+        for layers in layers_per_image.values():
+            local_layers.update(digest for digest, _ in layers)
+        return local_layers
+
+    def get_install_plan(self, dev_env_to_install: DevEnv) -> dict[str, Any]:
+        """ Plan the install of the Dev Env without pulling anything.
+
+            The manifests of the missing tool images are obtained from the registries. The download
+            size of a tool image is the compressed size of its layers that are not present locally 
+            and are not downloaded by a tool image earlier in the plan.
+
             Args:
                 dev_env_to_install -- the Development Environment to install
+
+            Return with the plan:
+                tool_images -- the download size of each tool image to pull, None if unknown
+                layers -- the layers of each tool image to pull
+                download_size -- the total download size in bytes
+                free_space -- the free space in the data root of the Docker Engine in bytes, None 
+                              if unknown
+
+            Exceptions:
+                PlatformError -- if a tool image is not available
         """
         # First check if the missing images are available in the registries, so DEM won't start to 
         # pull the images and then fail.
@@ -158,13 +372,85 @@ class Platform(Core):
             if tool_image.availability == ToolImage.NOT_AVAILABLE:
                 raise PlatformError(f"The {tool_image.name} image is not available.")
 
-        for tool_image in dev_env_to_install.tool_images:
-            if tool_image.availability == ToolImage.REGISTRY_ONLY:
-                self.user_output.msg(f"\nPulling image {tool_image.name}", is_title=True)
-                try:                
-                    self.container_engine.pull(tool_image.name)
-                except ContainerEngineError as e:
-                    raise PlatformError(f"Dev Env install failed. --> {str(e)}")
+        install_plan = {
+            "tool_images": {},
+            "layers": {},
+            "download_size": 0,
+            "free_space": None,
+        }
+        tool_image_names = [tool_image.name for tool_image in dev_env_to_install.tool_images 
+                            if tool_image.availability == ToolImage.REGISTRY_ONLY]
+        if not tool_image_names:
+            return install_plan
+
+        install_plan["layers"] = self.registries.get_tool_image_layers(tool_image_names)
+        downloaded_layers = self._get_local_layers(dev_env_to_install)
+        for tool_image_name in tool_image_names:
+            layers = install_plan["layers"].get(tool_image_name, [])
+            if not layers:
+                install_plan["tool_images"][tool_image_name] = None
+                continue
+
+            download_size = 0
+            for digest, size in layers:
+                if digest not in downloaded_layers:
+                    downloaded_layers.add(digest)
+                    download_size += size
+            install_plan["tool_images"][tool_image_name] = download_size
+            install_plan["download_size"] += download_size
+
+        try:
+            install_plan["free_space"] = self.container_engine.get_free_space()
+        except ContainerEngineError:
+            pass
+
+        return install_plan
+
+    def install_dev_env(self, dev_env_to_install: DevEnv, 
+                        install_plan: dict[str, Any] | None = None) -> None:
+        """ Install the Dev Env by pulling the required images.
+
+            The install fails before pulling anything if the download doesn't fit in the free space 
+            of the Docker Engine's data root. The images are pulled concurrently, their progress is 
+            shown together. The pulls are ordered by the layers the images share, so a shared layer
+            is downloaded only once. If a pull fails, the remaining pulls get cancelled and the 
+            already pulled images are reported.
+        
+            Args:
+                dev_env_to_install -- the Development Environment to install
+                install_plan -- the plan from get_install_plan(), it gets created if not given
+
+            Exceptions:
+                PlatformError -- if a tool image is not available, there is not enough disk space or
+                                 a pull fails
+        """
+        if install_plan is None:
+            install_plan = self.get_install_plan(dev_env_to_install)
+
+        free_space = install_plan["free_space"]
+        if free_space is not None and install_plan["download_size"] > free_space:
+            raise PlatformError(f"Not enough disk space to install the Dev Env. The download size "
+                                f"is {install_plan['download_size'] / 1e6:.1f} MB, but only "
+                                f"{free_space / 1e6:.1f} MB is free.")
+
+        tool_image_names = list(install_plan["tool_images"])
+        if tool_image_names:
+            dependencies = {}
+            if len(tool_image_names) > 1:
+                tool_image_names, dependencies = self._schedule_pulls(tool_image_names, 
+                                                                      install_plan["layers"])
+
+            self.user_output.msg("\nPulling the tool images", is_title=True)
+            pulled_tool_image_names = []
+            try:
+                self.user_output.progress_generator(self._iter_pulls(tool_image_names, 
+                                                                     pulled_tool_image_names,
+                                                                     dependencies))
+            except ContainerEngineError as e:
+                if pulled_tool_image_names:
+                    self.user_output.msg("The successfully pulled images: " + \
+                                         ", ".join(pulled_tool_image_names))
+                raise PlatformError(f"Dev Env install failed. --> {str(e)}")
 
         dev_env_to_install.is_installed = True
         self.flush_descriptors()
@@ -199,6 +485,208 @@ class Platform(Core):
         dev_env_to_uninstall.is_installed = False
         self.flush_descriptors()
 
+    @staticmethod
+    def _get_warm_container_name(dev_env_name: str, tool_image_name: str) -> str:
+        """ Get the name of the warm container of a Dev Env's tool image.
+
+            Args:
+                dev_env_name -- the name of the Development Environment
+                tool_image_name -- the name of the tool image
+
+            Return with the container name, the characters not allowed in a container name are 
+            replaced.
+        """
+        return re.sub(r"[^a-zA-Z0-9_.-]", "_", f"dem_{dev_env_name}_{tool_image_name}")
+
+    def up_dev_env(self, dev_env: DevEnv, idle_timeout_s: int | None = None, 
+                   volumes: list[str] = [], privileged: bool = False) -> None:
+        """ Start a warm container for each tool image of the Dev Env, so commands can be executed 
+            in them with exec_in_dev_env() without creating a new container for each command.
+
+            The current working directory is mounted to the same path in the containers, together
+            with the cache volumes of the Dev Env. A container stops when no command has been 
+            running in it for the idle timeout. The already running containers are reused.
+
+            Args:
+                dev_env -- the Development Environment
+                idle_timeout_s -- the idle timeout, the warm_container_idle_timeout_s config is 
+                                  used if None
+                volumes -- additional volumes in the host-path:container-path[:mode] format
+                privileged -- give extended privileges to the containers
+
+            Exceptions:
+                PlatformError -- if a tool image is not available locally, or a cache volume or a 
+                                 container can't be created
+        """
+        if idle_timeout_s is None:
+            idle_timeout_s = self.config_file.warm_container_idle_timeout_s
+        workspace = os.getcwd()
+        cache_volume_mounts = self.get_cache_volume_mounts(dev_env)
+
+        try:
+            for tool_image_descriptor in dev_env.tool_image_descriptors:
+                tool_image_name = tool_image_descriptor["image_name"] + ":" + \
+                                  tool_image_descriptor["image_version"]
+                container_name = self._get_warm_container_name(dev_env.name, tool_image_name)
+
+                if self.container_engine.get_running_container_labels(container_name) is not None:
+                    self.user_output.msg(f"The {tool_image_name} container is already running.")
+                    continue
+
+                if not self.container_engine.is_local_tool_image(tool_image_name):
+                    raise PlatformError(f"The {tool_image_name} image is not available locally. "
+                                        f"Install the {dev_env.name} Dev Env first.")
+
+                self.container_engine.start_warm_container(container_name, tool_image_name, {
+                    "dem.dev_env": dev_env.name,
+                    "dem.tool_image": tool_image_name,
+                    "dem.workspace": workspace,
+                }, idle_timeout_s, [f"{workspace}:{workspace}"] + cache_volume_mounts + volumes, 
+                   privileged, workspace)
+                self.user_output.msg(f"Started the {tool_image_name} container.")
+        except ContainerEngineError as e:
+            raise PlatformError(f"Dev Env up failed. --> {str(e)}")
+
+    def exec_in_dev_env(self, dev_env: DevEnv, command: list[str], tool: str = "") -> int:
+        """ Execute a command in the warm container of a tool image of the Dev Env.
+
+            The command runs in the current working directory if it's inside the directory the 
+            containers were started from, otherwise in that directory.
+
+            Args:
+                dev_env -- the Development Environment
+                command -- the command with its arguments
+                tool -- the tool image to use: its name, its repository or the last part of its 
+                        repository, it can be omitted if the Dev Env has a single tool image
+
+            Return with the exit code of the command.
+
+            Exceptions:
+                PlatformError -- if the tool image can't be selected, its container is not running
+                                 or the command can't be executed
+        """
+        tool_image_names = [tool_image_descriptor["image_name"] + ":" + \
+                            tool_image_descriptor["image_version"]
+                            for tool_image_descriptor in dev_env.tool_image_descriptors]
+        if tool:
+            tool_image_names = [tool_image_name for tool_image_name in tool_image_names
+                                if tool in (tool_image_name, tool_image_name.rpartition(":")[0], 
+                                            tool_image_name.rpartition(":")[0].rpartition("/")[2])]
+        if len(tool_image_names) != 1:
+            raise PlatformError(f"Select one of the tool images of the {dev_env.name} Dev Env " + \
+                                "with --tool: " + ", ".join(tool_image_descriptor["image_name"] 
+                                                           for tool_image_descriptor in dev_env.tool_image_descriptors))
+
+        container_name = self._get_warm_container_name(dev_env.name, tool_image_names[0])
+        try:
+            labels = self.container_engine.get_running_container_labels(container_name)
+            if labels is None:
+                raise PlatformError(f"The {tool_image_names[0]} container is not running. "
+                                    f"Start it with: dem up {dev_env.name}")
+
+            workdir = os.getcwd()
+            workspace = labels.get("dem.workspace", "")
+            if workspace and os.path.commonpath([workspace, workdir]) != workspace:
+                workdir = workspace
+
+            return self.container_engine.exec(container_name, command, workdir)
+        except ContainerEngineError as e:
+            raise PlatformError(f"Dev Env exec failed. --> {str(e)}")
+
+    def down_dev_env(self, dev_env: DevEnv) -> list[str]:
+        """ Stop the warm containers of the Dev Env.
+
+            Args:
+                dev_env -- the Development Environment
+
+            Return with the names of the stopped containers.
+
+            Exceptions:
+                PlatformError -- if the containers can't be stopped
+        """
+        try:
+            return self.container_engine.stop_containers({"dem.dev_env": dev_env.name})
+        except ContainerEngineError as e:
+            raise PlatformError(f"Dev Env down failed. --> {str(e)}")
+
+    @staticmethod
+    def _get_cache_volume_name(dev_env_name: str, cache_volume_name: str) -> str:
+        """ Get the name of the Docker volume of a Dev Env's cache volume.
+
+            Args:
+                dev_env_name -- the name of the Development Environment
+                cache_volume_name -- the name of the cache volume in the Dev Env descriptor
+
+            Return with the volume name, the characters not allowed in a volume name are replaced.
+        """
+        return re.sub(r"[^a-zA-Z0-9_.-]", "_", f"dem_{dev_env_name}_cache_{cache_volume_name}")
+
+    def get_cache_volume_mounts(self, dev_env: DevEnv) -> list[str]:
+        """ Create the cache volumes of the Dev Env that don't exist yet.
+
+            The cache volumes are named volumes declared in the Dev Env descriptor, so the build 
+            caches (e.g. ccache, CMake build trees, package caches) are kept across the container 
+            runs.
+
+            Args:
+                dev_env -- the Development Environment
+
+            Return with the volumes to mount in the volume-name:container-path format.
+
+            Exceptions:
+                PlatformError -- if a cache volume descriptor is invalid or the volume can't be 
+                                 created
+        """
+        mounts = []
+        for cache_volume_descriptor in dev_env.cache_volume_descriptors:
+            cache_volume_name = cache_volume_descriptor.get("name", "")
+            path = cache_volume_descriptor.get("path", "")
+            if not cache_volume_name or not path.startswith("/"):
+                raise PlatformError(f"The {dev_env.name} Dev Env has an invalid cache volume: "
+                                    f"{cache_volume_descriptor}. The name and the absolute path in "
+                                    "the container are required.")
+
+            volume_name = self._get_cache_volume_name(dev_env.name, cache_volume_name)
+            try:
+                self.container_engine.create_volume(volume_name, {
+                    "dem.dev_env": dev_env.name,
+                    "dem.cache_volume": cache_volume_name,
+                })
+            except ContainerEngineError as e:
+                raise PlatformError(f"The {cache_volume_name} cache volume can't be created. --> "
+                                    f"{str(e)}")
+            mounts.append(f"{volume_name}:{path}")
+        return mounts
+
+    def get_cache_volume_sizes(self, dev_env: DevEnv) -> dict[str, int | None]:
+        """ Get the disk usage of the cache volumes of the Dev Env.
+
+            Args:
+                dev_env -- the Development Environment
+
+            Return with the size in bytes by cache volume name, or None if the size is not known.
+
+            Exceptions:
+                PlatformError -- if the Docker Engine can't be queried
+        """
+        volume_names = {
+            cache_volume_descriptor["name"]: self._get_cache_volume_name(dev_env.name, 
+                                                                         cache_volume_descriptor["name"])
+            for cache_volume_descriptor in dev_env.cache_volume_descriptors
+        }
+        if not volume_names:
+            return {}
+
+        try:
+            volume_sizes = self.container_engine.get_volume_sizes(list(volume_names.values()))
+        except ContainerEngineError as e:
+            raise PlatformError(f"The size of the cache volumes can't be queried. --> {str(e)}")
+
+        return {
+            cache_volume_name: volume_sizes.get(volume_name) 
+            for cache_volume_name, volume_name in volume_names.items()
+        }
+
     def flush_descriptors(self) -> None:
         """ Writes the deserialized json to the dev_env.json file."""
         # Get the up-to-date deserialized data.
@@ -0,0 +1,104 @@
+"""Client side rate limiting of the HTTP requests."""
+# dem/core/rate_limiter.py
+
+import threading
+import time
+
+class TokenBucket():
+    """ Token bucket shared by the threads that send requests to the same host.
+
+        Every request consumes a token. The tokens get refilled with the request rate, up to the
+        capacity of the bucket. The rate adapts to the remaining quota reported by the server, and
+        the bucket can be paused until a throttled host accepts requests again.
+    """
+    def __init__(self, rate: float, capacity: float) -> None:
+        """ Init the class.
+
+            Args:
+                rate -- the nominal number of requests per second
+                capacity -- the maximum number of requests that can be sent in a burst
+        """
+        self._nominal_rate = rate
+        self._rate = rate
+        self._capacity = capacity
+        self._tokens = capacity
+        self._updated_at = time.monotonic()
+        self._paused_until = 0.0
+        self._lock = threading.Lock()
+
+    def _refill(self, now: float) -> None:
+        """ Add the tokens generated since the last refill. No tokens are generated while the 
+            bucket is paused. The lock must be held by the caller.
+
+            Args:
+                now -- the actual monotonic time
+        """
+        elapsed_s = max(0.0, now - max(self._updated_at, self._paused_until))
+        self._tokens = min(self._capacity, self._tokens + elapsed_s * self._rate)
+        self._updated_at = now
+
+    def acquire(self, timeout_s: float | None = None) -> bool:
+        """ Take a token. Block until a token is available and the bucket is not paused.
+
+            Args:
+                timeout_s -- the longest time to wait for a token (None means no limit)
+
+            Return with True if a token has been taken, False if the timeout has expired.
+        """
+        give_up_at = None if timeout_s is None else time.monotonic() + timeout_s
+        while True:
+            with self._lock:
+                now = time.monotonic()
+                self._refill(now)
+
+                if now < self._paused_until:
+                    wait_s = self._paused_until - now
+                elif self._tokens >= 1:
+                    self._tokens -= 1
+                    return True
+                else:
+                    wait_s = (1 - self._tokens) / self._rate
+
+            if give_up_at is not None and now + wait_s > give_up_at:
+                return False
+
+            time.sleep(wait_s)
+
+    def pause(self, delay_s: float) -> None:
+        """ Don't give out tokens for the given time.
+
+            Args:
+                delay_s -- the length of the pause in seconds
+        """
+        with self._lock:
+            now = time.monotonic()
+            self._refill(now)
+            self._paused_until = max(self._paused_until, now + delay_s)
+            self._tokens = 0
+
+    def update_quota(self, remaining: float | None, reset_s: float | None) -> None:
+        """ Adapt the bucket to the quota reported by the server.
+
+            The remaining requests get spread over the time left from the rate limit window, so the
+            workers slow down before the quota runs out. If the quota is exhausted, the bucket is
+            paused until the window resets.
+
+            Args:
+                remaining -- the number of requests left in the actual window (None if unknown)
+                reset_s -- the number of seconds until the window resets (None if unknown)
+        """
+        if remaining is None:
+            return
+
+        if remaining < 1:
+            if reset_s is not None and reset_s > 0:
+                self.pause(reset_s)
+            return
+
+        with self._lock:
+            self._refill(time.monotonic())
+            self._tokens = min(self._tokens, remaining)
+            if reset_s is not None and reset_s > 0:
+                self._rate = min(self._nominal_rate, remaining / reset_s)
+            else:
+                self._rate = self._nominal_rate
@@ -4,58 +4,968 @@
 from dem.core.core import Core
 from dem.core.container_engine import ContainerEngine
 from dem.core.exceptions import RegistryError
+from dem.core.data_management import RegistryCacheJSON
+from dem.core.rate_limiter import TokenBucket
 import requests
-from typing import Generator
+import atexit
+import platform
+import random
+import re
+import threading
+import time
+from fnmatch import fnmatch
+from email.utils import parsedate_to_datetime
+from urllib.parse import urljoin, urlparse
+from concurrent.futures import ThreadPoolExecutor, TimeoutError as FuturesTimeoutError
+from queue import Empty, Queue
+from typing import Generator, Iterable
 from abc import ABC, abstractmethod
 
 class Registry(Core, ABC):
-    """ Abstract base class for a registry."""
-    def __init__(self, container_engine: ContainerEngine, registry_config: dict) -> None:
+    """ Abstract base class for a registry.
+    
+        Class attributes:
+            _token_buckets -- the rate limiters of the registry hosts, shared by all registries
+            _token_buckets_lock -- protects the creation of the rate limiters
+            _backoff_base_s -- the base of the exponential backoff if the server doesn't tell when 
+                               to retry
+            _backoff_max_s -- the upper limit of the backoff
+            _manifest_request_method -- the HTTP method to check the existence of a tag
+            _manifest_media_types -- the accepted manifest formats
+            _manifest_list_media_types -- the manifest formats that list the manifests per platform
+            _architectures -- the image architectures by machine type
+            _bearer_challenges -- the token services of the registry hosts that answered with a 
+                                  Bearer challenge
+            _bearer_tokens -- the bearer tokens by token service and scope, shared by all 
+                              registries
+            _bearer_token_locks -- one lock per token scope, so the parallel requests wait for a 
+                                   single token request
+            _bearer_tokens_lock -- protects the bearer token dictionaries
+            _bearer_token_lifetime_s -- the lifetime of a token if the token service doesn't tell it
+            _bearer_token_expiry_margin_s -- a token is renewed this much earlier than it expires
+            _deadline_reached_message -- the error of the requests that are not sent because of the
+                                         crawl deadline
+    """
+    _token_buckets: dict[str, TokenBucket] = {}
+    _token_buckets_lock = threading.Lock()
+    _backoff_base_s = 1.0
+    _backoff_max_s = 60.0
+    _manifest_request_method = "HEAD"
+    _manifest_media_types = [
+        "application/vnd.docker.distribution.manifest.v2+json",
+        "application/vnd.docker.distribution.manifest.list.v2+json",
+        "application/vnd.oci.image.manifest.v1+json",
+        "application/vnd.oci.image.index.v1+json",
+    ]
+    _manifest_list_media_types = [
+        "application/vnd.docker.distribution.manifest.list.v2+json",
+        "application/vnd.oci.image.index.v1+json",
+    ]
+    _architectures = {
+        "x86_64": "amd64",
+        "amd64": "amd64",
+        "aarch64": "arm64",
+        "arm64": "arm64",
+        "armv7l": "arm",
+    }
+    _bearer_challenges: dict[str, dict[str, str]] = {}
+    _bearer_tokens: dict[str, dict] = {}
+    _bearer_token_locks: dict[str, threading.Lock] = {}
+    _bearer_tokens_lock = threading.Lock()
+    _bearer_token_lifetime_s = 60
+    _bearer_token_expiry_margin_s = 10
+    _deadline_reached_message = "The crawl deadline is reached."
+
+    def __init__(self, container_engine: ContainerEngine, registry_config: dict, 
+                 registry_cache: RegistryCacheJSON | None = None) -> None:
         """ Init the class.
         
             Args:
                 container_engine -- the container engine
                 registry_config -- container the name of the registry and its URL
+                registry_cache -- the persistent tag cache (optional)
         """
         self._container_engine = container_engine
         self._registry_config = registry_config
+        self._registry_cache = registry_cache
         self._repos = []
+        # The tags are collected per repository, so the worker threads don't need to share a list.
+        self._tags: dict[str, list[str]] = {}
+        # The cache entries of this registry by repository.
+        self._cache: dict[str, dict] = {}
+        # Set this to true to ignore the cached tags and crawl the registry from scratch.
+        self.refresh = False
+        # Set this to true to serve the expired cached tags (up to the max staleness) instead of 
+        # waiting for their revalidation. The served repositories get collected in _stale_repos.
+        self.serve_stale = False
+        self._stale_repos: list[str] = []
+        # Set when the expired cached repository listing has been served.
+        self._is_repo_listing_stale = False
+        # Set this to true to request the tags of the new and changed repositories only. The cached
+        # tags of the unchanged repositories are used regardless of their age.
+        self.incremental = False
+        # The change markers (e.g. the last update time) of the repositories, if the repository 
+        # listing provides them.
+        self._repo_versions: dict[str, str] = {}
+        # Set by the repository listing when all repositories of the registry have been obtained, 
+        # so the removed repositories can be dropped from the cache.
+        self._repo_listing_complete = False
+        # Ad hoc glob patterns, only the matching repositories get listed if set.
+        self.repo_filter: list[str] = []
+        # The tags of these repositories are requested before the others.
+        self.priority_repos: list[str] = []
+        # The monotonic time the crawl must be finished by (None means no deadline).
+        self.deadline: float | None = None
+        # Set when a crawl is cut short by the deadline. The workers still running don't wait to be
+        # finished, so they must not modify the cache after the crawl anymore.
+        self._is_crawl_abandoned = False
+        self._cache_lock = threading.Lock()
+        # The circuit breaker state if there is no registry cache to store it.
+        self._circuit_breaker = {
+            "failures": 0,
+            "opened_at": 0.0,
+        }
+        self._circuit_breaker_lock = threading.Lock()
 
     @abstractmethod
     def _append_repo_with_tag(self, endpoint_response: dict, repo: str) -> None:
-        """ Get the tags from the endpoint response. Save the tags alongside with the actual repo
-            in the private repo list.
+        """ Get the tags from the endpoint response. Save the tags for the actual repo in the 
+            private tag dictionary.
         """
 
     @abstractmethod
     def _get_tag_endpoint_url(self, repo_name: str) -> str:
         """ Get the registry specific endpoint to obtain the tags."""
 
+    @abstractmethod
+    def _search(self, report_errors: bool = True) -> Generator:
+        """ Generator function for listing the repositories of the registry."""
+
+    @abstractmethod
+    def _get_next_page_url(self, response: requests.Response, endpoint_response: dict) -> str | None:
+        """ Get the URL of the next page of a paginated endpoint. Return with None for the last 
+            page.
+        """
+
     @abstractmethod
     def _list_repos_in_registry(self) -> Generator:
         """ Generator function for listing the repos. """
 
-    def _list_tags(self, repo: str) -> None:
+    def _get_token_bucket(self, url: str) -> TokenBucket:
+        """ Get the rate limiter of the host. The rate limiter gets created at the first request to 
+            the host.
+
+            Args:
+                url -- the URL to request
+
+            Return with the rate limiter of the host.
+        """
+        host = urlparse(url).netloc
+        with Registry._token_buckets_lock:
+            if host not in Registry._token_buckets:
+                Registry._token_buckets[host] = TokenBucket(self.config_file.http_rate_limit_per_s,
+                                                            self.config_file.http_rate_limit_per_s)
+        return Registry._token_buckets[host]
+
+    @staticmethod
+    def _parse_rate_limit_header(value: str | None) -> float | None:
+        """ Parse a numeric rate limit header. The "76;w=21600" format is also accepted.
+
+            Args:
+                value -- the value of the header
+
+            Return with the number or None if the header is missing or invalid.
+        """
+        if value is None:
+            return None
+
+        try:
+            return float(str(value).split(";")[0])
+        except ValueError:
+            return None
+
+    def _get_rate_limit_quota(self, response: requests.Response) -> tuple[float | None, float | None]:
+        """ Get the remaining quota from the X-RateLimit-* (or RateLimit-*) response headers.
+
+            Args:
+                response -- the response of the registry
+
+            Return with the remaining number of requests and the seconds until the quota resets.
+        """
+        remaining = self._parse_rate_limit_header(response.headers.get("X-RateLimit-Remaining", 
+                                                                       response.headers.get("RateLimit-Remaining")))
+        reset_s = self._parse_rate_limit_header(response.headers.get("X-RateLimit-Reset", 
+                                                                     response.headers.get("RateLimit-Reset")))
+
+        if reset_s is not None and reset_s > time.time() / 2:
+            # The reset is an epoch timestamp, not a delay.
+            reset_s = reset_s - time.time()
+
+        return remaining, reset_s
+
+    def _get_max_retry_delay(self) -> float:
+        """ Get the longest time a throttled request may wait before its retry.
+
+            Return with the upper limit of the backoff, or the time left until the crawl deadline 
+            if it's shorter.
+        """
+        time_left_s = self._get_time_left()
+        if time_left_s is None:
+            return self._backoff_max_s
+        return min(self._backoff_max_s, time_left_s)
+
+    def _get_retry_delay(self, response: requests.Response, attempt: int) -> float:
+        """ Get the time to wait before retrying a throttled request.
+
+            The Retry-After header is honoured if present. Otherwise the reset of the rate limit 
+            window or a jittered exponential backoff is used. The delay requested by the server is 
+            not shortened: if it's longer than the backoff limit or the time left until the crawl 
+            deadline, the request is given up.
+
+            Args:
+                response -- the throttled response
+                attempt -- the number of the already failed attempts
+
+            Return with the delay in seconds.
+
+            Exceptions:
+                RegistryError -- if the server asks for a longer wait than allowed
+        """
+        max_delay_s = self._get_max_retry_delay()
+        delay_s = None
+
+        retry_after = response.headers.get("Retry-After")
+        if retry_after is not None:
+            delay_s = self._parse_rate_limit_header(retry_after)
+            if delay_s is None:
+                try:
+                    delay_s = parsedate_to_datetime(str(retry_after)).timestamp() - time.time()
+                except (TypeError, ValueError):
+                    delay_s = None
+
+        if delay_s is None:
+            remaining, reset_s = self._get_rate_limit_quota(response)
+            if remaining is not None and remaining < 1 and reset_s is not None and reset_s > 0:
+                delay_s = reset_s
+
+        if delay_s is not None:
+            delay_s = max(delay_s, 0.0)
+            if delay_s > max_delay_s:
+                raise RegistryError("The registry is throttling the requests, it asked to retry "
+                                    f"in {delay_s:.0f} seconds. Giving up the request.")
+            return delay_s
+
+        # Full jitter, so the throttled workers don't retry at the same time.
+        return random.uniform(0, min(max_delay_s, self._backoff_base_s * 2 ** attempt))
+
+    def _get_circuit_breaker(self) -> dict:
+        """ Get the circuit breaker state of the registry. The state is stored in the registry cache
+            if available, so it persists across invocations.
+
+            Return with the number of consecutive failures and the time the circuit was opened at.
+        """
+        if self._registry_cache is None:
+            return self._circuit_breaker
+        return self._registry_cache.get_circuit_breaker(self._registry_config["url"])
+
+    def _is_circuit_open(self) -> bool:
+        """ Check whether the registry is disabled because of the repeated failures.
+
+            After the cooldown the circuit gets half-open: the requests are allowed again, the 
+            first success closes the circuit, a failure opens it for another cooldown.
+
+            Return with True if no requests should be sent to the registry.
+        """
+        with self._circuit_breaker_lock:
+            circuit_breaker = self._get_circuit_breaker()
+            if circuit_breaker["failures"] < self.config_file.circuit_breaker_threshold:
+                return False
+            return time.time() - circuit_breaker["opened_at"] < self.config_file.circuit_breaker_cooldown_s
+
+    def _record_request_result(self, success: bool) -> None:
+        """ Update the circuit breaker with the result of a request.
+
+            Args:
+                success -- the registry responded to the request
+        """
+        with self._circuit_breaker_lock:
+            circuit_breaker = self._get_circuit_breaker()
+            if success:
+                circuit_breaker["failures"] = 0
+                return
+
+            circuit_breaker["failures"] += 1
+            if circuit_breaker["failures"] >= self.config_file.circuit_breaker_threshold:
+                circuit_breaker["opened_at"] = time.time()
+
+    def _get_circuit_open_message(self) -> str:
+        """ Get the reason of skipping a registry with an open circuit."""
+        return "The registry failed repeatedly, it is disabled for " + \
+               str(self.config_file.circuit_breaker_cooldown_s) + " seconds. Use the --refresh option to retry now."
+
+    def _get_time_left(self) -> float | None:
+        """ Get the time left until the crawl deadline.
+
+            Return with the seconds left (0 if the deadline has passed) or None if there is no 
+            deadline.
+        """
+        if self.deadline is None:
+            return None
+        return max(0.0, self.deadline - time.monotonic())
+
+    @staticmethod
+    def _parse_bearer_challenge(value: str | None) -> dict[str, str] | None:
+        """ Parse the Bearer challenge of a WWW-Authenticate header.
+
+            Args:
+                value -- the value of the header
+
+            Return with the parameters of the challenge (realm, service, scope) or None if it is not
+            a Bearer challenge.
+        """
+        if value is None or not value.lower().startswith("bearer "):
+            return None
+
+        challenge = dict(re.findall(r'(\w+)="([^"]*)"', value))
+        if "realm" not in challenge:
+            return None
+        return challenge
+
+    @staticmethod
+    def _get_bearer_scope(url: str) -> str | None:
+        """ Get the token scope required by a v2 endpoint.
+
+            The Docker Hub API (/v2/repositories/) shares the v2 prefix with the registry API, but
+            it is not a registry endpoint, so it has no token scope.
+
+            Args:
+                url -- the URL of the endpoint
+
+            Return with the scope or None if the endpoint is not known.
+        """
+        path = urlparse(url).path
+        if path.startswith("/v2/repositories/"):
+            return None
+        if path.startswith("/v2/_catalog"):
+            return "registry:catalog:*"
+
+        match = re.match(r"^/v2/(.+)/(tags|manifests|blobs)/", path)
+        if match is None:
+            return None
+        return "repository:" + match.group(1) + ":pull"
+
+    def _get_stored_bearer_tokens(self) -> dict[str, dict] | None:
+        """ Get the tokens stored in the registry cache.
+
+            Return with the tokens by key or None if the tokens are kept in memory only.
+        """
+        if self._registry_cache is None or self.config_file.registry_token_cache_on_disk is not True:
+            return None
+        return self._registry_cache.get_bearer_tokens()
+
+    def _get_bearer_token(self, challenge: dict[str, str], scope: str | None, 
+                          rejected_token: str | None = None) -> str:
+        """ Get a bearer token for the scope. The token is requested from the token service only if
+            there is no valid token in the cache. The parallel requests for the same scope wait for
+            the first one to obtain the token.
+
+            Args:
+                challenge -- the parameters of the Bearer challenge
+                scope -- the required scope (None if not known)
+                rejected_token -- a token that the registry didn't accept, it won't be used again
+
+            Return with the token.
+
+            Exceptions:
+                RegistryError -- if the token can't be obtained
+        """
+        key = " ".join((challenge["realm"], challenge.get("service", ""), scope or ""))
+        with Registry._bearer_tokens_lock:
+            token_lock = Registry._bearer_token_locks.setdefault(key, threading.Lock())
+
+        with token_lock:
+            stored_tokens = self._get_stored_bearer_tokens()
+            with Registry._bearer_tokens_lock:
+                cached_token = Registry._bearer_tokens.get(key)
+                if cached_token is None and stored_tokens is not None:
+                    cached_token = stored_tokens.get(key)
+                if cached_token is not None and cached_token["token"] != rejected_token and \
+                   time.time() < cached_token["expires_at"]:
+                    return cached_token["token"]
+
+            params = {}
+            if "service" in challenge:
+                params["service"] = challenge["service"]
+            if scope:
+                params["scope"] = scope
+
+            self._get_token_bucket(challenge["realm"]).acquire()
+            try:
+                response = self.http_session.get(challenge["realm"], params=params, 
+                                                 timeout=self.config_file.http_request_timeout_s)
+                token_response = response.json() if response.status_code == requests.codes.ok else {}
+            except Exception as e:
+                raise RegistryError("Failed to obtain a token from " + challenge["realm"] + ". " + str(e)) from e
+
+            token = token_response.get("token", token_response.get("access_token"))
+            if not token:
+                raise RegistryError("Failed to obtain a token from " + challenge["realm"] + \
+                                    ". Response status code: " + str(response.status_code))
+
+            lifetime_s = token_response.get("expires_in", self._bearer_token_lifetime_s)
+            cached_token = {
+                "token": token,
+                "expires_at": time.time() + max(0, lifetime_s - self._bearer_token_expiry_margin_s),
+            }
+            with Registry._bearer_tokens_lock:
+                Registry._bearer_tokens[key] = cached_token
+                if stored_tokens is not None:
+                    for stored_key, stored_token in list(stored_tokens.items()):
+                        if time.time() >= stored_token["expires_at"]:
+                            del stored_tokens[stored_key]
+                    stored_tokens[key] = cached_token
+            return token
+
+    def _get_authorization_headers(self, url: str) -> dict[str, str]:
+        """ Get the Authorization header for a request to a host that is known to require a bearer
+            token, so the token doesn't cost an extra 401 round trip.
+
+            Args:
+                url -- the URL to request
+
+            Return with the Authorization header or an empty dictionary if no token is needed or 
+            the scope of the endpoint is not known.
+
+            Exceptions:
+                RegistryError -- if the token can't be obtained
+        """
+        challenge = Registry._bearer_challenges.get(urlparse(url).netloc)
+        scope = self._get_bearer_scope(url)
+        if challenge is None or scope is None:
+            return {}
+        return {"Authorization": "Bearer " + self._get_bearer_token(challenge, scope)}
+
+    def _send_request(self, url: str, headers: dict[str, str] = {}, method: str = "GET") -> requests.Response:
+        """ Send a request to the registry.
+
+            The requests to the same host are rate limited. A throttled request (429) is retried 
+            after the delay requested by the server or a jittered backoff, at most 
+            http_max_retries times. The request is given up if the server asks for a longer delay 
+            than _backoff_max_s or the time left until the crawl deadline.
+
+            The failed requests (no response or a server error) are counted by the circuit breaker
+            of the registry. No requests are sent while the circuit is open.
+
+            No requests (including the retries) are sent after the crawl deadline, and a request 
+            doesn't wait for a response longer than the time left until the deadline.
+
+            If the registry answers with a Bearer challenge (401), a token is obtained for the scope
+            and the request is repeated once with the token. The host is remembered, so the later 
+            requests send the cached token of their scope right away. A challenge without a known 
+            scope is not answered, the 401 response is returned.
+
+            Args:
+                url -- the URL to request
+                headers -- the headers of the request
+                method -- GET or HEAD
+
+            Return with the response.
+
+            Exceptions:
+                RegistryError -- if the circuit is open, the crawl deadline is reached or the 
+                                 request fails
+        """
+        token_bucket = self._get_token_bucket(url)
+        send = self.http_session.head if method == "HEAD" else self.http_session.get
+        request_headers = headers | self._get_authorization_headers(url)
+        authenticated = False
+        attempt = 0
+        while True:
+            if self._is_circuit_open():
+                raise RegistryError(self._get_circuit_open_message())
+
+            time_left_s = self._get_time_left()
+            if time_left_s == 0 or not token_bucket.acquire(time_left_s):
+                raise RegistryError(self._deadline_reached_message)
+
+            timeout_s = self.config_file.http_request_timeout_s
+            if time_left_s is not None:
+                timeout_s = min(timeout_s, time_left_s)
+            try:
+                response = send(url, headers=request_headers, timeout=timeout_s)
+            except Exception as e:
+                self._record_request_result(False)
+                raise RegistryError(str(e)) from e
+
+            self._record_request_result(response.status_code < requests.codes.internal_server_error)
+            remaining, reset_s = self._get_rate_limit_quota(response)
+            if remaining is not None and remaining < 1 and reset_s is not None:
+                # The workers of the host are not paused longer than a retry may wait, a request 
+                # that would need to wait longer is given up instead.
+                reset_s = min(reset_s, self._get_max_retry_delay())
+            token_bucket.update_quota(remaining, reset_s)
+
+            if response.status_code == requests.codes.unauthorized and not authenticated:
+                challenge = self._parse_bearer_challenge(response.headers.get("WWW-Authenticate"))
+                scope = None
+                if challenge is not None:
+                    scope = challenge.get("scope", self._get_bearer_scope(url))
+                if scope is not None:
+                    Registry._bearer_challenges[urlparse(url).netloc] = challenge
+                    rejected_token = request_headers.get("Authorization", "").removeprefix("Bearer ")
+                    token = self._get_bearer_token(challenge, scope, rejected_token or None)
+                    request_headers = headers | {"Authorization": "Bearer " + token}
+                    authenticated = True
+                    continue
+
+            if response.status_code == requests.codes.too_many_requests and \
+               attempt < self.config_file.http_max_retries:
+                # Every worker of the host waits, not only the throttled one.
+                token_bucket.pause(self._get_retry_delay(response, attempt))
+                attempt += 1
+                continue
+
+            return response
+
+    def _iter_pages(self, url: str, headers: dict[str, str] = {}) -> Generator:
+        """ Generator function for requesting a paginated endpoint page by page.
+
+            The next page is only requested when the previous one has been consumed. The headers 
+            are only sent with the first request. If the first request gets a 304 response, no 
+            more pages are requested. No more pages are requested after the crawl deadline.
+
+            Args:
+                url -- the URL of the first page
+                headers -- the headers of the first request
+
+            Yields the response and the deserialized JSON content of each page (None for a 304 
+            response).
+
+            Exceptions:
+                RegistryError -- if a page can't be obtained or the crawl deadline is reached
+        """
+        while url:
+            response = self._send_request(url, headers)
+
+            if response.status_code == requests.codes.not_modified:
+                yield response, None
+                return
+
+            if response.status_code != requests.codes.ok:
+                raise RegistryError("Error in communication with the registry. Response status code: " + str(response.status_code))
+
+            endpoint_response = response.json()
+            yield response, endpoint_response
+
+            url = self._get_next_page_url(response, endpoint_response)
+            headers = {}
+
+    def _get_manifest_url(self, repo: str, tag: str) -> str:
+        """ Get the endpoint to check the existence of a tag.
+
+            Args:
+                repo -- the repository
+                tag -- the tag
+        """
+        return self._registry_config["url"] + "/v2/" + repo + "/manifests/" + tag
+
+    def _get_image_manifest_url(self, repo: str, reference: str) -> str:
+        """ Get the endpoint of the image manifest that describes the layers.
+
+            Args:
+                repo -- the repository
+                reference -- the tag or the digest of the manifest
+        """
+        return self._get_manifest_url(repo, reference)
+
+    def _get_image_manifest(self, repo: str, reference: str) -> dict:
+        """ Get an image manifest.
+
+            Args:
+                repo -- the repository
+                reference -- the tag or the digest of the manifest
+
+            Return with the deserialized manifest.
+
+            Exceptions:
+                RegistryError -- if the manifest can't be obtained
+        """
+        response = self._send_request(self._get_image_manifest_url(repo, reference), 
+                                      {"Accept": ", ".join(self._manifest_media_types)})
+
+        if response.status_code != requests.codes.ok:
+            raise RegistryError("Error in communication with the registry. Response status code: " + str(response.status_code))
+
+        return response.json()
+
+    def get_layers(self, repo: str, tag: str) -> list[tuple[str, int]]:
+        """ Get the layers of the image. For a multi-platform image the layers of the host's 
+            platform are returned.
+
+            Args:
+                repo -- the repository
+                tag -- the tag
+
+            Return with the digest and the size of each layer. The list is empty if the manifest 
+            format doesn't describe the layers or the host's platform is not supported.
+
+            Exceptions:
+                RegistryError -- if the manifest can't be obtained
+        """
+        manifest = self._get_image_manifest(repo, tag)
+
+        if manifest.get("mediaType") in self._manifest_list_media_types or "manifests" in manifest:
+            architecture = self._architectures.get(platform.machine().lower())
+            for platform_manifest in manifest.get("manifests", []):
+                manifest_platform = platform_manifest.get("platform", {})
+                if manifest_platform.get("os") == "linux" and \
+                   manifest_platform.get("architecture") == architecture:
+                    manifest = self._get_image_manifest(repo, platform_manifest["digest"])
+                    break
+            else:
+                return []
+
+        return [(layer["digest"], layer.get("size", 0)) for layer in manifest.get("layers", [])]
+
+    def is_tag_available(self, repo: str, tag: str) -> bool:
+        """ Check whether the tag exists in the registry without listing the repository.
+
+            Fresh tags from the cache are used if available, otherwise a single request is sent.
+
+            Args:
+                repo -- the repository
+                tag -- the tag
+
+            Return with True if the tag is available in the registry.
+
+            Exceptions:
+                RegistryError -- if the registry can't be reached
+        """
+        if self._registry_cache is not None:
+            self._cache = self._registry_cache.get_registry_cache(self._registry_config["url"])
+        cached_tags = self._get_cached_tags(repo)
+        if cached_tags is not None and tag in cached_tags:
+            return True
+
+        response = self._send_request(self._get_manifest_url(repo, tag), 
+                                      {"Accept": ", ".join(self._manifest_media_types)}, 
+                                      self._manifest_request_method)
+
+        if response.status_code == requests.codes.ok:
+            return True
+        if response.status_code == requests.codes.not_found:
+            return False
+        raise RegistryError("Error in communication with the registry. Response status code: " + str(response.status_code))
+
+    def _get_cached_tags(self, repo: str) -> list[str] | None:
+        """ Get the tags of the repository from the cache, if they are not older than the TTL of the
+            registry.
+
+            In incremental mode the age of the entry doesn't matter, the entry is only invalid if 
+            the change marker of the repository differs from the cached one. If the registry 
+            doesn't report a change marker for the repository, the TTL applies.
+
+            If serving stale tags is enabled, an expired entry is still returned until it gets 
+            older than the max staleness. The repository is then recorded for revalidation.
+
+            Args:
+                repo -- the repository
+
+            Return with the cached tags or None if there is no fresh entry in the cache.
+        """
+        cache_entry = self._cache.get(repo)
+
+        if self.refresh or cache_entry is None:
+            return None
+
+        if self.incremental and repo in self._repo_versions:
+            if self._repo_versions[repo] != cache_entry.get("last_updated"):
+                return None
+            return cache_entry["tags"]
+
+        cache_age_s = time.time() - cache_entry["timestamp"]
+        if cache_age_s < self._get_cache_ttl_s():
+            return cache_entry["tags"]
+
+        if self.serve_stale and cache_age_s < self._get_cache_max_staleness_s():
+            self._stale_repos.append(repo)
+            return cache_entry["tags"]
+
+        return None
+
+    def _get_cache_ttl_s(self) -> float:
+        """ Get the time the cached data of the registry is fresh for."""
+        return self._registry_config.get("cache_ttl_s", self.config_file.registry_cache_ttl_s)
+
+    def _get_cache_max_staleness_s(self) -> float:
+        """ Get the age until the expired cached data of the registry can still be served."""
+        return self._registry_config.get("cache_max_staleness_s", 
+                                         self.config_file.registry_cache_max_staleness_s)
+
+    def _get_cached_repo_listing(self) -> dict | None:
+        """ Get the repository listing of the registry from the cache, if it's not older than the 
+            TTL of the registry.
+
+            The cached listing is not used in incremental mode, which is about finding the changes 
+            of the listing.
+
+            If serving stale data is enabled, an expired listing is still returned until it gets 
+            older than the max staleness. The listing is then recorded for revalidation.
+
+            Return with the cached listing or None if there is no fresh listing in the cache.
+        """
+        if self._registry_cache is None or self.refresh or self.incremental:
+            return None
+
+        listing = self._registry_cache.get_repo_listing(self._registry_config["url"])
+        if not listing:
+            return None
+
+        listing_age_s = time.time() - listing["timestamp"]
+        if listing_age_s < self._get_cache_ttl_s():
+            return listing
+
+        if self.serve_stale and listing_age_s < self._get_cache_max_staleness_s():
+            self._is_repo_listing_stale = True
+            return listing
+
+        return None
+
+    def _iter_repo_listing(self, report_errors: bool = True) -> Generator:
+        """ Generator function for listing the repositories of the registry.
+
+            The listing is taken from the cache if it's fresh, otherwise the registry gets searched.
+            A complete listing is saved to the cache with the change markers of the repositories.
+
+            Args:
+                report_errors -- report if the registry can't be searched
+
+            Yields the names of the repositories as returned by _search().
+        """
+        cached_listing = self._get_cached_repo_listing()
+        if cached_listing is not None:
+            self._repo_versions.update(cached_listing["repo_versions"])
+            self._repo_listing_complete = True
+            yield from cached_listing["repos"]
+            return
+
+        repos = []
+        for repo in self._search(report_errors):
+            repos.append(repo)
+            yield repo
+
+        if self._repo_listing_complete and self._registry_cache is not None:
+            with self._cache_lock:
+                if not self._is_crawl_abandoned:
+                    self._registry_cache.get_repo_listing(self._registry_config["url"]).update({
+                        "repos": repos,
+                        "repo_versions": {repo: self._repo_versions[repo] for repo in repos 
+                                          if repo in self._repo_versions},
+                        "timestamp": time.time(),
+                    })
+
+    def _revalidate_repo_listing(self) -> None:
+        """ Search the registry again for its expired repository listing and save it to the cache.
+            The errors are not reported.
+        """
+        for _ in self._iter_repo_listing(False):
+            pass
+
+    def _get_conditional_headers(self, repo: str) -> dict[str, str]:
+        """ Get the headers to revalidate the cached tags of the repository.
+
+            Args:
+                repo -- the repository
+
+            Return with the If-None-Match and If-Modified-Since headers if the validators are 
+            available for the cached tags.
+        """
+        headers = {}
+        cache_entry = self._cache.get(repo)
+
+        if self.refresh or cache_entry is None:
+            return headers
+
+        if cache_entry.get("etag"):
+            headers["If-None-Match"] = cache_entry["etag"]
+        if cache_entry.get("last_modified"):
+            headers["If-Modified-Since"] = cache_entry["last_modified"]
+
+        return headers
+
+    def _list_tags(self, repo: str, report_errors: bool = True) -> None:
         """ Get the tags from the respective endpoint and call the registry specific function to 
             populate the private repo list.
 
+            Fresh tags are taken from the cache. Stale tags get revalidated with a conditional 
+            request, so an unchanged repository costs a 304 response only. The tags listed on more
+            than one page are requested again instead.
+
             Args:
                 repo -- get the tags of this repository
+                report_errors -- report if the tags can't be obtained
         """
+        cached_tags = self._get_cached_tags(repo)
+        if cached_tags is not None:
+            self._tags[repo] = list(cached_tags)
+            return
+
+        # The stale tags served earlier are replaced, not extended by the new pages.
+        self._tags[repo] = []
+        cache_entry = {}
         try:
-            response = requests.get(self._get_tag_endpoint_url(repo), 
-                                              timeout=self.config_file.http_request_timeout_s)
-        except Exception as e:
-            self.user_output.error(str(e))
-        else:
-            if response.status_code == requests.codes.ok:
-                self._append_repo_with_tag(response.json(), repo)
-                return
-            else:
-                self.user_output.error("Error in communication with the registry. Failed to retrieve tags. Response status code: " + str(response.status_code))
+            for response, endpoint_response in self._iter_pages(self._get_tag_endpoint_url(repo), 
+                                                                self._get_conditional_headers(repo)):
+                if endpoint_response is None:
+                    # Not modified, the cached tags are still valid.
+                    with self._cache_lock:
+                        if not self._is_crawl_abandoned:
+                            self._cache[repo]["timestamp"] = time.time()
+                    self._tags[repo] = list(self._cache[repo]["tags"])
+                    return
+
+                if not cache_entry:
+                    cache_entry = {
+                        "timestamp": time.time(),
+                        "etag": response.headers.get("ETag"),
+                        "last_modified": response.headers.get("Last-Modified"),
+                        "last_updated": self._repo_versions.get(repo),
+                    }
+                else:
+                    # The validators only cover the first page, a 304 response to them would keep
+                    # the later pages unchecked. So a multi-page tag list is never revalidated.
+                    cache_entry["etag"] = None
+                    cache_entry["last_modified"] = None
+
+                # The tags are saved page by page as they arrive.
+                self._append_repo_with_tag(endpoint_response, repo)
+        except RegistryError as e:
+            if report_errors:
+                self.user_output.error(str(e))
+                self.user_output.msg("Skipping repository: " + repo)
+            # Don't keep the tags of an incompletely listed repository.
+            self._tags.pop(repo, None)
+            return
+
+        cache_entry["tags"] = self._tags.setdefault(repo, [])
+        with self._cache_lock:
+            if not self._is_crawl_abandoned:
+                self._cache[repo] = cache_entry
+
+    def _is_repo_selected(self, repo: str) -> bool:
+        """ Check whether the repository passes the repository filters.
+
+            The glob patterns are matched against the full repository name (without the tag). The
+            include and exclude patterns can be set per registry in the config file, the ad hoc 
+            patterns in the repo_filter attribute.
+
+            Args:
+                repo -- the repository
+
+            Return with True if the repository needs to be listed.
+        """
+        include_patterns = self._registry_config.get("include", [])
+        exclude_patterns = self._registry_config.get("exclude", [])
+
+        if include_patterns and not any(fnmatch(repo, pattern) for pattern in include_patterns):
+            return False
+
+        if any(fnmatch(repo, pattern) for pattern in exclude_patterns):
+            return False
+
+        if self.repo_filter and not any(fnmatch(repo, pattern) for pattern in self.repo_filter):
+            return False
+
+        return True
+
+    def _list_tags_of_repos(self, repos: Iterable[str]) -> Generator:
+        """ Generator function for getting the tags of the repositories concurrently.
+
+            The tag requests are executed by a bounded worker pool, but the results are processed 
+            in the order of the input repositories, so the content of the private repo list is 
+            deterministic. The tag request of a repository is submitted as soon as the input 
+            iterable provides it.
+
+            The repositories that don't pass the repository filters are dropped before their tags 
+            get requested. The tags of the priority repositories are requested first, without 
+            waiting for them in the input iterable, so they are resolved even if the crawl gets cut
+            short. A missing priority repository is skipped silently.
+
+            If the crawl deadline is reached, the listing stops and the repositories obtained so 
+            far are kept, the running requests are not waited for. If the circuit breaker opens 
+            during the crawl, the listing is aborted.
+
+            In incremental mode the repositories that are missing from a complete repository 
+            listing get dropped from the cache.
+
+            Args:
+                repos -- get the tags of these repositories
+
+            Exceptions:
+                RegistryError -- if the circuit breaker of the registry is open
+        """
+        if self._registry_cache is not None:
+            self._cache = self._registry_cache.get_registry_cache(self._registry_config["url"])
+
+        self._is_crawl_abandoned = False
+        executor = ThreadPoolExecutor(max_workers=self.config_file.max_workers)
+        deadline_reached = False
+        try:
+            futures = []
+            for repo in self.priority_repos:
+                if self._is_repo_selected(repo):
+                    futures.append((repo, executor.submit(self._list_tags, repo, False)))
+            submitted_repos = {repo for repo, _ in futures}
 
-        self.user_output.msg("Skipping repository: " + repo)
+            listed_repos = set()
+            for repo in repos:
+                if self._get_time_left() == 0:
+                    deadline_reached = True
+                    break
+                listed_repos.add(repo)
+                if repo not in submitted_repos and self._is_repo_selected(repo):
+                    futures.append((repo, executor.submit(self._list_tags, repo)))
+
+            for repo, future in futures:
+                if self._is_circuit_open():
+                    raise RegistryError(self._get_circuit_open_message())
+
+                yield "Loading image data from: " + repo
+                try:
+                    future.result(timeout=self._get_time_left())
+                except FuturesTimeoutError:
+                    deadline_reached = True
+                    break
+                for tag in self._tags.get(repo, []):
+                    self._repos.append(repo + ":" + tag)
+
+            if deadline_reached:
+                self.user_output.msg("[yellow]The crawl deadline is reached, the tool image list of the " + \
+                                     self._registry_config["name"] + " registry is incomplete.[/]")
+            elif self.incremental and self._repo_listing_complete:
+                self._drop_removed_repos(listed_repos)
+        finally:
+            if deadline_reached:
+                # The running requests give up at the deadline anyway, they are not waited for. 
+                # They don't modify the cache anymore, so it can be flushed.
+                with self._cache_lock:
+                    self._is_crawl_abandoned = True
+                executor.shutdown(wait=False, cancel_futures=True)
+            else:
+                # The running requests are waited for, so they don't modify the cache after the 
+                # flush.
+                executor.shutdown(wait=True, cancel_futures=True)
     
+    def _drop_removed_repos(self, listed_repos: set[str]) -> None:
+        """ Drop the cache entries of the repositories that have been removed from the registry.
+
+            Args:
+                listed_repos -- all repositories of the registry
+        """
+        for repo in list(self._cache):
+            if repo not in listed_repos:
+                del self._cache[repo]
+
     @property
     def repos(self) -> list[str]:
         """ Getter function for the repos in the registry.
@@ -72,20 +982,27 @@ class DockerHub(Registry):
             _docker_hub_domain -- the Docker Hub domain (used to determine if the config is for a 
                                   Docker Hub registry)
             _tag_endpoint_response_key -- used to obtain the tags from the endpoint response
+            _page_size -- the maximum page size allowed by Docker Hub, so the tags can be obtained
+                          in the fewest requests
+            _manifest_request_method -- the Docker Hub API only answers GET requests on the tag 
+                                        endpoint
     """
     _docker_hub_domain = "registry.hub.docker.com"
     _tag_endpoint_response_key = "results"
+    _page_size = 100
+    _manifest_request_method = "GET"
 
     def _append_repo_with_tag(self, endpoint_response: dict, repo: str) -> None:
-        """ Get the tags from the endpoint response. Save the tags alongside with the actual repo
-            in the private repo list.
+        """ Get the tags from the endpoint response. Save the tags for the actual repo in the 
+            private tag dictionary.
 
             Args:
                 endpoint_response -- the response from the endpoint
                 repo -- append the tags of this repoistory
         """
+        tags = self._tags.setdefault(repo, [])
         for result in endpoint_response[self._tag_endpoint_response_key]:
-            self._repos.append(repo + ":" + result["name"])
+            tags.append(result["name"])
 
     def _get_tag_endpoint_url(self, repo: str) -> str:
         """ Get the Docker Hub specific endpoint url to obtain the tags.
@@ -93,32 +1010,117 @@ class DockerHub(Registry):
             Args:
                 repo -- we would like to get the tags for this repository
         """
-        return self._registry_config["url"] + "/v2/repositories/" + repo + "/tags/"
+        return self._registry_config["url"] + "/v2/repositories/" + repo + "/tags/?page_size=" + \
+            str(self._page_size)
+
+    def _get_next_page_url(self, response: requests.Response, endpoint_response: dict) -> str | None:
+        """ Get the URL of the next page from the Docker Hub specific endpoint response.
+
+            Args:
+                response -- the response of the current page
+                endpoint_response -- the deserialized content of the current page
+
+            Return with the URL of the next page or None if this is the last page.
+        """
+        return endpoint_response.get("next")
+
+    def _get_manifest_url(self, repo: str, tag: str) -> str:
+        """ Get the Docker Hub specific endpoint to check the existence of a tag. The Docker Hub API
+            has no manifest endpoint, but a single tag can be requested.
+
+            Args:
+                repo -- the repository
+                tag -- the tag
+        """
+        return self._registry_config["url"] + "/v2/repositories/" + repo + "/tags/" + tag
+
+    def _get_image_manifest_url(self, repo: str, reference: str) -> str:
+        """ Get the endpoint of the image manifest. The Docker Hub domain serves the registry API 
+            too, it only requires a bearer token.
+
+            Args:
+                repo -- the repository
+                reference -- the tag or the digest of the manifest
+        """
+        return self._registry_config["url"] + "/v2/" + repo + "/manifests/" + reference
+
+    def _search(self, report_errors: bool = True) -> Generator:
+        """ Generator function for listing the repositories of the namespace.
+
+            The repositories are requested page by page and their names are yielded as the pages 
+            arrive. The last update times of the repositories are saved as their change markers. If
+            something bad happens, the error gets reported and the generator stops.
+
+            Args:
+                report_errors -- report if the namespace can't be listed
+        """
+        repo_endpoint = self._registry_config["url"] + "/v2/repositories/" + \
+            self._registry_config["name"] + "/?page_size=" + str(self._page_size)
+
+        self._repo_listing_complete = False
+        try:
+            for _, endpoint_response in self._iter_pages(repo_endpoint):
+                for result in endpoint_response[self._tag_endpoint_response_key]:
+                    repo = result.get("namespace", self._registry_config["name"]) + "/" + result["name"]
+                    if result.get("last_updated"):
+                        self._repo_versions[repo] = result["last_updated"]
+                    yield repo
+            self._repo_listing_complete = True
+            return
+        except requests.exceptions.JSONDecodeError as e:
+            error = "Invalid JSON format in response. " + str(e)
+        except Exception as e:
+            error = str(e)
+
+        if report_errors:
+            self.user_output.error(error)
+            self.user_output.msg("Skipping registry: " + self._registry_config["name"])
 
     def _list_repos_in_registry(self) -> Generator:
-        """ Generator function for listing the repos. """
-        for repo in self._container_engine.search(self._registry_config["name"]):
-            yield "Loading image data from: " + repo
-            self._list_tags(repo)
+        """ Generator function for listing the repos. 
+        
+            The tag requests of the repositories start while the next page of the namespace is 
+            requested.
+        """
+        yield from self._list_tags_of_repos(self._iter_repo_listing())
 
 class DockerRegistry(Registry):
     """ Docker Registry
     
         Class variables:
             _tag_endpoint_response_key -- used to obtain the tags from the endpoint response
+            _default_page_size -- the number of entries requested per page if the page_size is not
+                                  set in the registry config
     """
     _tag_endpoint_response_key = "tags"
+    _default_page_size = 100
+
+    @property
+    def _page_size(self) -> int:
+        """ The number of entries requested per page (the n parameter of the endpoints)."""
+        return self._registry_config.get("page_size", self._default_page_size)
 
     def _append_repo_with_tag(self, endpoint_response: dict, repo: str) -> None:
-        """ Get the tags from the endpoint response. Save the tags alongside with the actual repo
-            in the private repo list.
+        """ Get the tags from the endpoint response. Save the tags for the actual repo in the 
+            private tag dictionary.
 
             Args:
                 endpoint_response -- the response from the endpoint
                 repo -- append the tags of this repoistory
         """
-        for result in endpoint_response[self._tag_endpoint_response_key]:
-            self._repos.append(repo + ":" + result)
+        self._tags.setdefault(repo, []).extend(endpoint_response[self._tag_endpoint_response_key])
+
+    @staticmethod
+    def _get_repo_path(repo: str) -> str:
+        """ Get the path of the repository in the registry API.
+
+            Args:
+                repo -- the repository, prefixed with the name of the registry
+
+            Return with the repository without the registry name, the nested repositories keep 
+            all of their path components.
+        """
+        return repo.split("/", 1)[1]
 
     def _get_tag_endpoint_url(self, repo: str) -> str:
         """ Get the Docker Registry specific endpoint url to obtain the tags.
@@ -126,42 +1128,85 @@ class DockerRegistry(Registry):
             Args:
                 repo -- we would like to get the tags for this repository
         """
-        return self._registry_config["url"] + "/v2/" + repo.split("/")[1] + "/tags/list"
+        return self._registry_config["url"] + "/v2/" + self._get_repo_path(repo) + "/tags/list?n=" + \
+            str(self._page_size)
 
-    def _search(self) -> list[str]:
-        """ Search the registry for the repositories
-        
-            Return with the repo list or an empty list if something bad happened.
+    def _get_manifest_url(self, repo: str, tag: str) -> str:
+        """ Get the Docker Registry specific manifest endpoint to check the existence of a tag.
+
+            Args:
+                repo -- the repository
+                tag -- the tag
+        """
+        return self._registry_config["url"] + "/v2/" + self._get_repo_path(repo) + "/manifests/" + tag
+
+    def _get_next_page_url(self, response: requests.Response, endpoint_response: dict) -> str | None:
+        """ Get the URL of the next page from the RFC 5988 Link header of the response.
+
+            The Link header contains the n and last parameters for the next page. Its URL is 
+            relative to the registry's URL.
+
+            Args:
+                response -- the response of the current page
+                endpoint_response -- the deserialized content of the current page
+
+            Return with the URL of the next page or None if this is the last page.
         """
-        repo_endpoint = self._registry_config["url"] + "/v2/_catalog"
+        next_page_link = response.links.get("next")
+
+        if next_page_link is None:
+            return None
+
+        return urljoin(self._registry_config["url"], next_page_link["url"])
+
+    def _search(self, report_errors: bool = True) -> Generator:
+        """ Generator function for searching the registry for the repositories.
 
+            The catalog is requested page by page and the repository names are yielded as the pages 
+            arrive. If something bad happens, the error gets reported and the generator stops.
+
+            Args:
+                report_errors -- report if the catalog can't be listed
+        """
+        repo_endpoint = self._registry_config["url"] + "/v2/_catalog?n=" + str(self._page_size)
+
+        self._repo_listing_complete = False
         try:
-            response = requests.get(repo_endpoint, timeout=self.config_file.http_request_timeout_s)
+            for _, endpoint_response in self._iter_pages(repo_endpoint):
+                yield from endpoint_response["repositories"]
+            self._repo_listing_complete = True
+            return
+        except requests.exceptions.JSONDecodeError as e:
+            error = "Invalid JSON format in response. " + str(e)
         except Exception as e:
-            self.user_output.error(str(e))
-        else:
-            if response.status_code == requests.codes.ok:
-                try:
-                    return response.json()["repositories"]
-                except requests.exceptions.JSONDecodeError as e:
-                    self.user_output.error("Invalid JSON format in response. " + str(e))
-                except Exception as e:
-                    self.user_output.error(str(e))
-            else:
-                self.user_output.error("Error in communication with the registry. Failed to retrieve the repositories. Response status code: " + str(response.status_code))
+            error = str(e)
 
-        self.user_output.msg("Skipping registry: " + self._registry_config["name"])
-        return []
+        if report_errors:
+            self.user_output.error(error)
+            self.user_output.msg("Skipping registry: " + self._registry_config["name"])
 
     def _list_repos_in_registry(self) -> Generator:
-        """ Generator function for listing the repos. """
-        for repo_name in self._search():
-            repo = self._registry_config["name"] + '/' + repo_name
-            yield "Loading image data from: " + repo
-            self._list_tags(repo)
+        """ Generator function for listing the repos. 
+        
+            The tag requests of the repositories start while the next catalog page is requested.
+        """
+        repos = (self._registry_config["name"] + '/' + repo_name 
+                 for repo_name in self._iter_repo_listing())
+        yield from self._list_tags_of_repos(repos)
 
 class Registries(Core):
-    """ Contains all configured registiries."""
+    """ Contains all configured registiries.
+    
+        Class variables:
+            STATUS_EVENT -- the crawl event is a status message
+            TOOL_IMAGE_EVENT -- the crawl event is a tool image of a resolved repository
+            _revalidation_exit_timeout_s -- the process waits this long at most for the background
+                                            revalidation when it exits
+    """
+    STATUS_EVENT = "status"
+    TOOL_IMAGE_EVENT = "tool_image"
+    _revalidation_exit_timeout_s = 1.0
+
     def __init__(self, container_engine: ContainerEngine) -> None:
         """ Init the class by creating the registry instances.
             
@@ -170,7 +1215,14 @@ class Registries(Core):
                 config_file -- config file that contains the registry parameters
         """
         self._container_engine = container_engine
+        self.registry_cache = RegistryCacheJSON()
         self.registries: list[Registry] = []
+        # Revalidates the stale repository listings and tags in the background.
+        self._revalidation_thread: threading.Thread | None = None
+        # Set when the process exits before the revalidation finishes, so the revalidation doesn't
+        # save the registry cache anymore.
+        self._is_revalidation_abandoned = False
+        self._revalidation_flush_lock = threading.Lock()
         for registry_config in self.config_file.registries:
             self._add_registry_instance(registry_config)
     
@@ -182,30 +1234,390 @@ class Registries(Core):
                 registry_config -- registry config
             """
         if DockerHub._docker_hub_domain in registry_config["url"]:
-            self.registries.append(DockerHub(self._container_engine, registry_config))
+            self.registries.append(DockerHub(self._container_engine, registry_config, 
+                                             self.registry_cache))
+        else:
+            self.registries.append(DockerRegistry(self._container_engine, registry_config, 
+                                                  self.registry_cache))
+
+    def _crawl_registry(self, registry: Registry, event_queue: Queue) -> list[str]:
+        """ Crawl a registry. Executed by a worker thread.
+
+            The status messages and the tool images of the registry are forwarded to the event 
+            queue as soon as they are available. When the crawl is over, None is put into the queue 
+            to signal it.
+
+            Args:
+                registry -- the registry to crawl
+                event_queue -- the events are forwarded to this queue
+
+            Return with the repositories of the registry or an empty list if the registry is not 
+            available.
+        """
+        forwarded_repos = 0
+
+        def forward_new_repos() -> None:
+            nonlocal forwarded_repos
+            for repo in registry._repos[forwarded_repos:]:
+                event_queue.put((self.TOOL_IMAGE_EVENT, repo))
+            forwarded_repos = len(registry._repos)
+
+        try:
+            if registry._is_circuit_open():
+                raise RegistryError(registry._get_circuit_open_message())
+
+            for status in registry._list_repos_in_registry():
+                # The repositories that got resolved since the previous status message.
+                forward_new_repos()
+                event_queue.put((self.STATUS_EVENT, status))
+            forward_new_repos()
+        except Exception as e:
+            self.user_output.error(str(e))
+            self.user_output.error("[red]Error: The " + registry._registry_config["name"] + \
+                                   " registry is not available.[/]")
+            return []
         else:
-            self.registries.append(DockerRegistry(self._container_engine, registry_config))
+            return registry._repos
+        finally:
+            event_queue.put(None)
+
+    def _crawl_registries(self, registries: list[Registry], 
+                          repos_per_registry: list[list[str]]) -> Generator:
+        """ Generator function for crawling the registries concurrently.
+
+            Yields the events of all registries as they arrive. An event is a tuple of the event 
+            type (STATUS_EVENT or TOOL_IMAGE_EVENT) and the status message or the tool image name.
+
+            Args:
+                registries -- the registries to crawl
+                repos_per_registry -- the repositories of the registries get appended to this list 
+                                      in the order of the input registries
+        """
+        event_queue = Queue()
+
+        with ThreadPoolExecutor(max_workers=len(registries)) as executor:
+            futures = [executor.submit(self._crawl_registry, registry, event_queue) 
+                       for registry in registries]
 
-    def list_repos(self, reg_selection: list[str]) -> list[str]:
+            running_crawls = len(futures)
+            while running_crawls:
+                event = event_queue.get()
+                if event is None:
+                    running_crawls -= 1
+                else:
+                    yield event
+
+        for future in futures:
+            repos_per_registry.append(future.result())
+
+    def _get_selected_registries(self, reg_selection: list[str], refresh: bool, 
+                                 repo_filter: list[str], incremental: bool = False, 
+                                 priority_repos: list[str] = []) -> list[Registry]:
+        """ Get the selected registries and prepare them for crawling.
+
+            Args:
+                reg_selection -- the selected registries, empty list means all registries
+                refresh -- ignore the cached tags and crawl the registries from scratch
+                repo_filter -- glob patterns, only the matching repositories get listed
+                incremental -- request the tags of the new and changed repositories only
+                priority_repos -- the repositories to request the tags of first
+
+            Return with the selected registries.
+        """
+        selected_registries = [registry for registry in self.registries 
+                               if not reg_selection or registry._registry_config["name"] in reg_selection]
+
+        if selected_registries:
+            self._wait_for_revalidation()
+            self.registry_cache.update()
+            deadline = None
+            if self.config_file.registry_crawl_deadline_s > 0:
+                deadline = time.monotonic() + self.config_file.registry_crawl_deadline_s
+            for registry in selected_registries:
+                registry.refresh = refresh
+                registry.serve_stale = True
+                registry.incremental = incremental
+                registry.repo_filter = repo_filter
+                registry.priority_repos = [repo for repo in priority_repos 
+                                           if self._get_registry_of_repo(repo) is registry]
+                registry.deadline = deadline
+                if refresh:
+                    # The user explicitly asked for a new crawl, so the failing registries are 
+                    # retried too.
+                    registry._record_request_result(True)
+
+        return selected_registries
+
+    def list_repos(self, reg_selection: list[str], refresh: bool = False, 
+                   repo_filter: list[str] = [], incremental: bool = False, 
+                   priority_repos: list[str] = []) -> list[str]:
         """ List the available repositories.
 
+            The registries are crawled concurrently. If a registry is not available, an error gets 
+            reported and the other registries are still listed. The obtained tags are saved to the 
+            registry cache.
+
             Args:
                 reg_selection -- the selected registries, empty list means all registries
+                refresh -- ignore the cached tags and crawl the registries from scratch
+                repo_filter -- glob patterns, only the matching repositories get listed (all 
+                               repositories if empty)
+                incremental -- request the tags of the new and changed repositories only, and drop
+                               the removed repositories from the cache
+                priority_repos -- the repositories to request the tags of first, so they are 
+                                  listed even if the crawl gets cut short
         
             Return with the list of repositories.
         """
-        repo_list: list[str] = []
+        selected_registries = self._get_selected_registries(reg_selection, refresh, repo_filter, 
+                                                            incremental, priority_repos)
+        if not selected_registries:
+            return []
 
-        for registry in self.registries:
-            if not reg_selection or registry._registry_config["name"] in reg_selection:
+        repos_per_registry: list[list[str]] = []
+        events = self._crawl_registries(selected_registries, repos_per_registry)
+        self.user_output.status_generator(item for event_type, item in events 
+                                          if event_type == self.STATUS_EVENT)
+        self.registry_cache.flush()
+        self._revalidate_in_background(selected_registries)
+
+        return [repo for repos in repos_per_registry for repo in repos]
+
+    def iter_tool_images(self, reg_selection: list[str], refresh: bool = False, 
+                         repo_filter: list[str] = [], incremental: bool = False) -> Generator:
+        """ Generator function for listing the available tool images.
+
+            The registries are crawled concurrently, the tool images of a repository are yielded as
+            soon as the repository gets resolved. The obtained tags are saved to the registry cache
+            when the generator is exhausted.
+
+            Args:
+                reg_selection -- the selected registries, empty list means all registries
+                refresh -- ignore the cached tags and crawl the registries from scratch
+                repo_filter -- glob patterns, only the matching repositories get listed (all 
+                               repositories if empty)
+                incremental -- request the tags of the new and changed repositories only, and drop
+                               the removed repositories from the cache
+
+            Yields the tool image names in the repo:tag format.
+        """
+        selected_registries = self._get_selected_registries(reg_selection, refresh, repo_filter, 
+                                                            incremental)
+        if not selected_registries:
+            return
+
+        for event_type, item in self._crawl_registries(selected_registries, []):
+            if event_type == self.TOOL_IMAGE_EVENT:
+                yield item
+
+        self.registry_cache.flush()
+        self._revalidate_in_background(selected_registries)
+
+    def _revalidate_stale_data(self, revalidations: Queue) -> None:
+        """ Revalidate the stale repository listings and tags, and save them to the registry cache. 
+            Executed by the background thread.
+
+            The revalidations are shared by daemon worker threads, so they don't keep the process 
+            alive either.
+
+            Args:
+                revalidations -- the registry and the repository to revalidate the tags of (None to
+                                 revalidate the repository listing of the registry)
+        """
+        def revalidate() -> None:
+            while True:
                 try:
-                    repo_list.extend(registry.repos)
-                except Exception as e:
-                    self.user_output.error(str(e))
-                    self.user_output.error("[red]Error: The " + registry._registry_config["name"] + \
-                                           " registry is not available.[/]")
+                    registry, repo = revalidations.get_nowait()
+                except Empty:
+                    return
+                if repo is None:
+                    registry._revalidate_repo_listing()
+                else:
+                    registry._list_tags(repo, False)
+
+        workers = [threading.Thread(target=revalidate, daemon=True) 
+                   for _ in range(min(self.config_file.max_workers, revalidations.qsize()))]
+        for worker in workers:
+            worker.start()
+        for worker in workers:
+            worker.join()
+
+        with self._revalidation_flush_lock:
+            if not self._is_revalidation_abandoned:
+                self.registry_cache.flush()
+
+    def _revalidate_in_background(self, registries: list[Registry]) -> None:
+        """ Start revalidating the stale repository listings and tags that were served by the crawl
+            of the registries.
+
+            The revalidation runs in a daemon thread, so it doesn't keep the process alive after 
+            the command. The process waits _revalidation_exit_timeout_s at most for it at exit, see
+            _finish_revalidation().
+
+            Args:
+                registries -- the crawled registries
+        """
+        revalidations = Queue()
+        for registry in registries:
+            if registry._is_repo_listing_stale:
+                revalidations.put((registry, None))
+                registry._is_repo_listing_stale = False
+            for repo in registry._stale_repos:
+                revalidations.put((registry, repo))
+            registry._stale_repos = []
+            registry.serve_stale = False
+
+        if revalidations.empty():
+            return
+
+        self._is_revalidation_abandoned = False
+        self._revalidation_thread = threading.Thread(target=self._revalidate_stale_data, 
+                                                     args=(revalidations,), daemon=True)
+        self._revalidation_thread.start()
+        atexit.unregister(self._finish_revalidation)
+        atexit.register(self._finish_revalidation)
+
+    def _wait_for_revalidation(self) -> None:
+        """ Wait for the background revalidation to finish, so it doesn't modify the registry 
+            cache while it is used.
+        """
+        if self._revalidation_thread is not None:
+            self._revalidation_thread.join()
+            self._revalidation_thread = None
+
+    def _finish_revalidation(self) -> None:
+        """ Wait for the background revalidation when the process exits, at most for
+            _revalidation_exit_timeout_s.
+
+            If the revalidation doesn't finish in time, it gets abandoned: the registries don't 
+            modify the registry cache anymore and the results so far get saved. The rest of the 
+            stale data is served and revalidated again by a later invocation.
+        """
+        if self._revalidation_thread is None:
+            return
+
+        self._revalidation_thread.join(self._revalidation_exit_timeout_s)
+        if not self._revalidation_thread.is_alive():
+            return
+
+        for registry in self.registries:
+            with registry._cache_lock:
+                registry._is_crawl_abandoned = True
+        # The stored bearer tokens might still be modified by the running requests.
+        with self._revalidation_flush_lock, Registry._bearer_tokens_lock:
+            self._is_revalidation_abandoned = True
+            self.registry_cache.flush()
+
+    def _get_registry_of_repo(self, repo: str) -> Registry | None:
+        """ Get the registry the repository belongs to.
+
+            Args:
+                repo -- the repository, prefixed with the name of the registry
+
+            Return with the registry or None if no configured registry has the repository.
+        """
+        for registry in self.registries:
+            if repo.startswith(registry._registry_config["name"] + "/"):
+                return registry
+        return None
+
+    def get_repo_references(self, reg_selection: list[str] = []) -> list[str]:
+        """ Get the image reference patterns that match the repositories of the registries. 
+        
+            The patterns can be used to filter the local images.
+
+            Args:
+                reg_selection -- the selected registries, empty list means all registries
+
+            Return with the glob patterns of the repository names.
+        """
+        repo_references = []
+        for registry in self.registries:
+            registry_name = registry._registry_config["name"]
+            if not reg_selection or registry_name in reg_selection:
+                # A * doesn't match the / separator, so the nested repositories need their own 
+                # pattern.
+                repo_references += [registry_name + "/*", registry_name + "/*/*"]
+        return repo_references
+
+    def _is_tool_image_available(self, tool_image_name: str) -> bool:
+        """ Check whether the tool image is available in its registry. Executed by a worker thread.
+
+            Args:
+                tool_image_name -- the name of the tool image in the repo:tag format
+
+            Return with True if the tool image is available. If the registry can't be reached, the
+            error gets reported and the tool image is handled as not available.
+        """
+        repo, _, tag = tool_image_name.rpartition(":")
+        registry = self._get_registry_of_repo(repo)
+        if registry is None:
+            return False
+
+        try:
+            return registry.is_tag_available(repo, tag)
+        except RegistryError as e:
+            self.user_output.error(str(e))
+            return False
+
+    def _get_tool_image_layers(self, tool_image_name: str) -> list[tuple[str, int]]:
+        """ Get the layers of the tool image. Executed by a worker thread.
+
+            Args:
+                tool_image_name -- the name of the tool image in the repo:tag format
+
+            Return with the digest and the size of each layer, or an empty list if the layers can't
+            be obtained.
+        """
+        repo, _, tag = tool_image_name.rpartition(":")
+        registry = self._get_registry_of_repo(repo)
+        if registry is None:
+            return []
+
+        try:
+            return registry.get_layers(repo, tag)
+        except (RegistryError, requests.exceptions.JSONDecodeError):
+            return []
+
+    def get_tool_image_layers(self, tool_image_names: list[str]) -> dict[str, list[tuple[str, int]]]:
+        """ Get the layers of the tool images from their manifests concurrently.
+
+            Args:
+                tool_image_names -- the tool images in the repo:tag format
+
+            Return with the digest and the size of the layers by tool image. The layer list is 
+            empty if it can't be obtained.
+        """
+        if not tool_image_names:
+            return {}
+
+        with ThreadPoolExecutor(max_workers=self.config_file.max_workers) as executor:
+            layers = list(executor.map(self._get_tool_image_layers, tool_image_names))
+
+        return dict(zip(tool_image_names, layers))
+
+    def resolve_tool_images(self, tool_image_names: Iterable[str]) -> set[str]:
+        """ Check the availability of the given tool images only, without crawling the registries.
+
+            The tool images are checked concurrently with one request per tool image.
+
+            Args:
+                tool_image_names -- the tool images to check in the repo:tag format
+
+            Return with the tool images available in the registries.
+        """
+        tool_image_names = list(dict.fromkeys(tool_image_names))
+        if not tool_image_names:
+            return set()
+
+        self._wait_for_revalidation()
+        self.registry_cache.update()
+        with ThreadPoolExecutor(max_workers=self.config_file.max_workers) as executor:
+            availabilities = list(executor.map(self._is_tool_image_available, tool_image_names))
+        self.registry_cache.flush()
 
-        return repo_list
+        return {tool_image_name for tool_image_name, available in zip(tool_image_names, availabilities) 
+                if available}
 
     def add_registry(self, registry_config: dict) -> None:
         """ Add a new registry.
@@ -4,6 +4,7 @@
 from dem.core.container_engine import ContainerEngine
 from dem.core.registry import Registries
 from dem.core.exceptions import ToolImageError
+from typing import Iterable
 
 class ToolImage():
     (
@@ -47,12 +48,19 @@ class ToolImages():
         self.all_tool_images = {}
 
     def update(self, local_only: bool = False, registry_only: bool = False, 
-               reg_selection: list[str] = []) -> None:
+               reg_selection: list[str] = [], refresh: bool = False, 
+               repo_filter: list[str] = [], incremental: bool = False, 
+               priority_repos: list[str] = []) -> None:
         """ Update the list of available tools.
         
             Args:
                 local_only -- update the local tools only
                 registry_only -- update the registry tools only
+                reg_selection -- the selected registries, empty list means all registries
+                refresh -- ignore the cached registry tags and crawl the registries from scratch
+                repo_filter -- glob patterns, only the matching registry repositories get listed
+                incremental -- request the tags of the new and changed registry repositories only
+                priority_repos -- the registry repositories to request the tags of first
         """
         registry_tool_image_names = []
         local_tool_image_names = []
@@ -61,7 +69,8 @@ class ToolImages():
             local_tool_image_names = self.container_engine.get_local_tool_images()
 
         if not local_only:
-            registry_tool_image_names = self.registries.list_repos(reg_selection)
+            registry_tool_image_names = self.registries.list_repos(reg_selection, refresh, repo_filter, 
+                                                                  incremental, priority_repos)
 
         for tool_image_name in local_tool_image_names:
             tool_image = ToolImage(tool_image_name)
@@ -77,6 +86,37 @@ class ToolImages():
                 tool_image.availability = ToolImage.REGISTRY_ONLY
                 self.all_tool_images[tool_image_name] = tool_image
 
+    def resolve(self, tool_image_names: Iterable[str], local_first: bool = False) -> None:
+        """ Update the availability of the given tool images only.
+
+            Instead of crawling the registries, a single request is sent for each tool image.
+
+            Args:
+                tool_image_names -- the tool images to resolve
+                local_first -- don't check the locally available tool images in the registries
+        """
+        tool_image_names = list(dict.fromkeys(tool_image_names))
+        local_tool_image_names = {tool_image_name for tool_image_name in tool_image_names
+                                  if self.container_engine.is_local_tool_image(tool_image_name)}
+
+        if local_first:
+            registry_tool_image_names = self.registries.resolve_tool_images(
+                [tool_image_name for tool_image_name in tool_image_names 
+                 if tool_image_name not in local_tool_image_names])
+        else:
+            registry_tool_image_names = self.registries.resolve_tool_images(tool_image_names)
+
+        for tool_image_name in tool_image_names:
+            tool_image = ToolImage(tool_image_name)
+            if tool_image_name in local_tool_image_names:
+                if tool_image_name in registry_tool_image_names:
+                    tool_image.availability = ToolImage.LOCAL_AND_REGISTRY
+                else:
+                    tool_image.availability = ToolImage.LOCAL_ONLY
+            elif tool_image_name in registry_tool_image_names:
+                tool_image.availability = ToolImage.REGISTRY_ONLY
+            self.all_tool_images[tool_image_name] = tool_image
+
     def get_local_ones(self) -> dict[str, ToolImage]:
         """ Get the local tool images.
         
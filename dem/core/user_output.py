@@ -7,7 +7,13 @@ from typing import Generator
 class UserOutput(ABC):
     """ Abstract base class for the user output. Acts as an interface between the core modules and 
         the UI.
+
+        Class attributes:
+            is_msg_on_stderr -- the messages go to the stderr, so the stdout only holds the 
+                                machine readable output of the command (e.g. NDJSON)
     """
+    is_msg_on_stderr = False
+
     @abstractmethod
     def msg(self, text: str, is_title: bool = False) -> None:
         """ Send a message.
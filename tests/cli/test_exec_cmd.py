@@ -0,0 +1,98 @@
+"""Tests for the exec command."""
+
+# Unit under test:
+import dem.cli.main as main
+import dem.cli.command.exec_cmd as exec_cmd
+
+# Test framework
+from typer.testing import CliRunner
+from unittest.mock import patch, MagicMock
+
+from dem.core.exceptions import PlatformError
+
+## Global test variables
+runner = CliRunner()
+
+def test_exec() -> None:
+    # Setup
+    mock_platform = MagicMock()
+    main.platform = mock_platform
+    mock_dev_env = MagicMock()
+    mock_platform.get_dev_env_by_name.return_value = mock_dev_env
+    mock_platform.exec_in_dev_env.return_value = 0
+    test_dev_env_name = "test_dev_env_name"
+
+    # Run the test
+    runner_result = runner.invoke(main.typer_cli, ["exec", test_dev_env_name, "--tool", "make", 
+                                                   "make", "-j4", "--keep-going"])
+
+    # Check the result
+    assert runner_result.exit_code == 0
+
+    mock_platform.get_dev_env_by_name.assert_called_once_with(test_dev_env_name)
+    mock_platform.exec_in_dev_env.assert_called_once_with(mock_dev_env, 
+                                                          ["make", "-j4", "--keep-going"], "make")
+
+def test_exec_nonzero_exit_code() -> None:
+    # Setup
+    mock_platform = MagicMock()
+    main.platform = mock_platform
+    mock_dev_env = MagicMock()
+    mock_platform.get_dev_env_by_name.return_value = mock_dev_env
+    mock_platform.exec_in_dev_env.return_value = 2
+
+    # Run the test
+    runner_result = runner.invoke(main.typer_cli, ["exec", "test_dev_env_name", "make"])
+
+    # Check the result
+    assert runner_result.exit_code == 2
+
+    mock_platform.exec_in_dev_env.assert_called_once_with(mock_dev_env, ["make"], "")
+
+@patch("dem.cli.command.exec_cmd.stderr.print")
+def test_exec_invalid_name(mock_stderr_print: MagicMock) -> None:
+    # Setup
+    mock_platform = MagicMock()
+    main.platform = mock_platform
+    mock_platform.get_dev_env_by_name.return_value = None
+    test_dev_env_name = "test_dev_env_name"
+
+    # Run the test
+    runner_result = runner.invoke(main.typer_cli, ["exec", test_dev_env_name, "make"])
+
+    # Check the result
+    assert runner_result.exit_code == 1
+
+    mock_stderr_print.assert_called_once_with(f"[red]Error: The {test_dev_env_name} Development Environment does not exist.[/]")
+    mock_platform.exec_in_dev_env.assert_not_called()
+
+@patch("dem.cli.command.exec_cmd.stderr.print")
+def test_exec_missing_command(mock_stderr_print: MagicMock) -> None:
+    # Setup
+    mock_platform = MagicMock()
+    main.platform = mock_platform
+
+    # Run the test
+    runner_result = runner.invoke(main.typer_cli, ["exec", "test_dev_env_name"])
+
+    # Check the result
+    assert runner_result.exit_code == 1
+
+    mock_stderr_print.assert_called_once_with("[red]Error: The command to execute is missing.[/]")
+    mock_platform.exec_in_dev_env.assert_not_called()
+
+@patch("dem.cli.command.exec_cmd.stderr.print")
+def test_exec_PlatformError(mock_stderr_print: MagicMock) -> None:
+    # Setup
+    mock_platform = MagicMock()
+    main.platform = mock_platform
+    test_exception_text = "test_exception_text"
+    mock_platform.exec_in_dev_env.side_effect = PlatformError(test_exception_text)
+
+    # Run the test
+    runner_result = runner.invoke(main.typer_cli, ["exec", "test_dev_env_name", "make"])
+
+    # Check the result
+    assert runner_result.exit_code == 1
+
+    mock_stderr_print.assert_called_once_with(f"[red]Platform error: {test_exception_text}[/]")
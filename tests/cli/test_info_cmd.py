@@ -259,6 +259,7 @@ def test_cat_dev_env_info(mock_print_cat_dev_env_info: MagicMock) -> None:
     # Verify the output
     mock_catalog.request_dev_envs.assert_called_once()
     mock_catalog.get_dev_env_by_name.assert_called_once_with(test_dev_env_name)
+    mock_platform.resolve_tool_image_instances.assert_called_once_with(mock_dev_env)
     mock_print_cat_dev_env_info.assert_called_once_with(mock_dev_env, "test_cat")
 
 @patch("dem.cli.command.info_cmd.stderr.print")
@@ -6,7 +6,7 @@ import dem.cli.command.install_cmd as install_cmd
 
 # Test framework
 from typer.testing import CliRunner
-from unittest.mock import patch, MagicMock
+from unittest.mock import patch, MagicMock, call
 
 ## Global test variables
 runner = CliRunner()
@@ -48,7 +48,11 @@ def test_install_dev_env_valid_name(mock_stdout_print):
     assert 0 == runner_result.exit_code
     
     mock_platform.get_dev_env_by_name.assert_called_once_with(fake_dev_env_to_install.name )
-    mock_platform.install_dev_env.assert_called_once_with(fake_dev_env_to_install)
+    mock_platform.resolve_tool_image_instances.assert_called_once_with(fake_dev_env_to_install, 
+                                                                       local_first=True)
+    mock_platform.get_install_plan.assert_called_once_with(fake_dev_env_to_install)
+    mock_platform.install_dev_env.assert_called_once_with(fake_dev_env_to_install, 
+                                                          mock_platform.get_install_plan.return_value)
     mock_stdout_print.assert_called_once_with(f"[green]Successfully installed the {fake_dev_env_to_install.name}![/]")
 
 
@@ -91,3 +95,68 @@ def test_install_dev_env_valid_name_failed(mock_stderr_print):
     mock_platform.get_dev_env_by_name.assert_called_once_with(fake_dev_env_to_install.name )
     mock_stderr_print.assert_called_once_with(f"[red]Platform error: {test_exception_text}[/]")
 
+
+
+@patch("dem.cli.command.install_cmd.stdout.print")
+def test_install_dev_env_dry_run(mock_stdout_print):
+    # Test setup
+    fake_dev_env_to_install = MagicMock()
+    fake_dev_env_to_install.name = "dev_env"
+    fake_dev_env_to_install.is_installed = False
+    mock_platform = MagicMock()
+    mock_platform.get_dev_env_by_name.return_value = fake_dev_env_to_install
+    mock_platform.get_install_plan.return_value = {
+        "tool_images": {
+            "axem/tool1:latest": 1500000,
+            "axem/tool2:latest": None,
+        },
+        "layers": {},
+        "download_size": 1500000,
+        "free_space": 1000000,
+    }
+    main.platform = mock_platform
+
+    # Run unit under test
+    runner_result = runner.invoke(main.typer_cli, ["install", "--dry-run", 
+                                                   fake_dev_env_to_install.name], color=True)
+
+    # Check expectations
+    assert 0 == runner_result.exit_code
+
+    mock_platform.get_install_plan.assert_called_once_with(fake_dev_env_to_install)
+    mock_platform.install_dev_env.assert_not_called()
+
+    actual_table = mock_stdout_print.call_args_list[0].args[0]
+    assert [cell for cell in actual_table.columns[0].cells] == ["axem/tool1:latest", 
+                                                                 "axem/tool2:latest"]
+    assert [cell for cell in actual_table.columns[1].cells] == ["1.5 MB", "[yellow]unknown[/]"]
+    mock_stdout_print.assert_has_calls([
+        call("Total download size: 1.5 MB"),
+        call("[red]Free disk space: 1.0 MB[/]"),
+    ])
+
+@patch("dem.cli.command.install_cmd.stdout.print")
+def test_install_dev_env_dry_run_nothing_to_pull(mock_stdout_print):
+    # Test setup
+    fake_dev_env_to_install = MagicMock()
+    fake_dev_env_to_install.name = "dev_env"
+    fake_dev_env_to_install.is_installed = False
+    mock_platform = MagicMock()
+    mock_platform.get_dev_env_by_name.return_value = fake_dev_env_to_install
+    mock_platform.get_install_plan.return_value = {
+        "tool_images": {},
+        "layers": {},
+        "download_size": 0,
+        "free_space": None,
+    }
+    main.platform = mock_platform
+
+    # Run unit under test
+    runner_result = runner.invoke(main.typer_cli, ["install", "--dry-run", 
+                                                   fake_dev_env_to_install.name], color=True)
+
+    # Check expectations
+    assert 0 == runner_result.exit_code
+
+    mock_platform.install_dev_env.assert_not_called()
+    mock_stdout_print.assert_called_once_with("All the tool images are available locally, nothing to pull.")
@@ -29,6 +29,22 @@ def test_list_local_tools_no_local_tool_images(mock_print: MagicMock) -> None:
     # Check the result
     mock_print.assert_called_once_with("[yellow]No local tool images are available.[/]")
 
+@patch("dem.cli.command.list_tools_cmd.stderr.print")
+@patch("dem.cli.command.list_tools_cmd.stdout.print")
+def test_list_local_tools_no_local_tool_images_json(mock_stdout_print: MagicMock,
+                                                    mock_stderr_print: MagicMock) -> None:
+    # Setup
+    mock_platform = MagicMock()
+    mock_platform.tool_images.all_tool_images = {}
+    
+    # Run the test
+    with raises(list_tools_cmd.typer.Abort):
+        list_tools_cmd.list_local_tools(mock_platform, True)
+
+    # Check the result
+    mock_stdout_print.assert_not_called()
+    mock_stderr_print.assert_called_once_with("[yellow]No local tool images are available.[/]")
+
 @patch("dem.cli.command.list_tools_cmd.stdout.print")
 def test_list_local_tools(mock_print: MagicMock) -> None:
     # Setup
@@ -44,149 +60,172 @@ def test_list_local_tools(mock_print: MagicMock) -> None:
     mock_print.assert_has_calls([call("\n [italic]Local Tool Images[/]"), 
                                  call("  test_tool_image")])
 
+@patch("dem.cli.command.list_tools_cmd.stdout.print")
+def test_list_local_tools_json(mock_print: MagicMock) -> None:
+    # Setup
+    mock_platform = MagicMock()
+    mock_platform.tool_images.all_tool_images = {"test_tool_image2": MagicMock(), 
+                                                 "test_tool_image1": MagicMock()}
+    
+    # Run the test
+    list_tools_cmd.list_local_tools(mock_platform, True)
+
+    # Check the result
+    mock_print.assert_has_calls([
+        call('{"name": "test_tool_image1", "available_locally": true}', markup=False, 
+             soft_wrap=True),
+        call('{"name": "test_tool_image2", "available_locally": true}', markup=False, 
+             soft_wrap=True),
+    ])
+    assert mock_print.call_count == 2
+
+@patch("dem.cli.command.list_tools_cmd.stdout.print")
+def test_list_local_tools_filtered(mock_print: MagicMock) -> None:
+    # Setup
+    mock_platform = MagicMock()
+    mock_platform.tool_images.all_tool_images = {"axem/make_gnu_arm:latest": MagicMock(), 
+                                                 "axem/cpputest:latest": MagicMock(),
+                                                 "localhost:5000/gcc_arm:v1.0.0": MagicMock()}
+    
+    # Run the test
+    list_tools_cmd.list_local_tools(mock_platform, False, ["*arm*"])
+
+    # Check the result
+    mock_print.assert_has_calls([call("\n [italic]Local Tool Images[/]"), 
+                                 call("  axem/make_gnu_arm:latest"),
+                                 call("  localhost:5000/gcc_arm:v1.0.0")])
+    assert mock_print.call_count == 3
+
 @patch("dem.cli.command.list_tools_cmd.stderr.print")
-def test_update_tools_from_seleted_regs_unknown_registry(mock_print: MagicMock) -> None:
+def test_check_selected_regs_unknown_registry(mock_print: MagicMock) -> None:
     # Setup
     mock_platform = MagicMock()
     mock_platform.config_file.registries = [{"name": "test_reg"}]
     
     # Run the test
     with raises(list_tools_cmd.typer.Abort):
-        list_tools_cmd.update_tools_from_selected_regs(mock_platform, ["unknown_reg"])
+        list_tools_cmd.check_selected_regs(mock_platform, ["unknown_reg"])
 
     # Check the result
     mock_print.assert_called_once_with("[red]Error: Registry unknown_reg is not available![/]")
 
-def test_update_tools_from_seleted_regs() -> None:
+@patch("dem.cli.command.list_tools_cmd.stderr.print")
+def test_check_selected_regs(mock_print: MagicMock) -> None:
     # Setup
     mock_platform = MagicMock()
     mock_platform.config_file.registries = [{"name": "test_reg"}]
     
     # Run the test
-    list_tools_cmd.update_tools_from_selected_regs(mock_platform, ["test_reg"])
+    list_tools_cmd.check_selected_regs(mock_platform, ["test_reg"])
 
     # Check the result
-    mock_platform.tool_images.update.assert_called_once_with(reg_selection={"test_reg"})
+    mock_print.assert_not_called()
 
-def test_list_tools_from_regs() -> None:
+@patch("dem.cli.command.list_tools_cmd.stdout.print")
+def test_list_tools_from_selected_regs(mock_print: MagicMock) -> None:
     # Setup
     mock_platform = MagicMock()
-    mock_table = MagicMock()
-
-    mock_tool_image1 = MagicMock()
-    mock_tool_image1.name = "test_tool_image1"
-    mock_tool_image1.availability = list_tools_cmd.ToolImage.REGISTRY_ONLY
-    mock_tool_image2 = MagicMock()
-    mock_tool_image2.name = "test_tool_image2"
-    mock_tool_image2.availability = list_tools_cmd.ToolImage.LOCAL_AND_REGISTRY
-    mock_tool_image3 = MagicMock()
-    mock_tool_image3.name = "another_tool_image"
-    mock_tool_image3.availability = list_tools_cmd.ToolImage.REGISTRY_ONLY
+    test_specified_regs = ["test_reg"]
+    mock_platform.container_engine.get_local_tool_images.return_value = {"test_tool_image2"}
+    mock_platform.registries.iter_tool_images.return_value = iter(["test_tool_image1", 
+                                                                   "test_tool_image2"])
 
-    mock_platform.tool_images.get_registry_ones.return_value = {
-        "test_tool_image1": mock_tool_image1,
-        "test_tool_image2": mock_tool_image2,
-        "another_tool_image": mock_tool_image3
-    }
-    
     # Run the test
-    list_tools_cmd.list_tools_from_regs(mock_platform, mock_table)
+    list_tools_cmd.list_tools_from_regs(mock_platform, test_specified_regs, False)
 
     # Check the result
-    mock_table.add_column.assert_has_calls([call("Name"), call("Available locally?")])
-    mock_platform.tool_images.get_registry_ones.assert_called_once()
-    mock_table.add_row.assert_has_calls([call("another_tool_image", ""),
-                                         call("test_tool_image1", ""),
-                                         call("test_tool_image2", "[green]✔[/]")])
+    mock_platform.registries.get_repo_references.assert_called_once_with(test_specified_regs)
+    mock_platform.container_engine.get_local_tool_images.assert_called_once_with(
+        mock_platform.registries.get_repo_references.return_value)
+    mock_platform.registries.iter_tool_images.assert_called_once_with(test_specified_regs, 
+                                                                      mock_platform.refresh_registries,
+                                                                      [],
+                                                                      mock_platform.incremental_registry_refresh)
+    mock_print.assert_has_calls([call("\n [italic]Available Tool Images from the selected registries[/]"),
+                                 call("    test_tool_image1"),
+                                 call("  [green]✔[/] test_tool_image2")])
 
 @patch("dem.cli.command.list_tools_cmd.stdout.print")
-@patch("dem.cli.command.list_tools_cmd.list_tools_from_regs")
-@patch("dem.cli.command.list_tools_cmd.Table")
-@patch("dem.cli.command.list_tools_cmd.update_tools_from_selected_regs")
-def test_list_tools_from_selected_regs(mock_update_tools_from_selected_regs: MagicMock,
-                                       mock_Table: MagicMock,
-                                       mock_list_tools_from_regs: MagicMock,
-                                       mock_print: MagicMock) -> None:
+def test_list_tools_from_all_regs_json(mock_print: MagicMock) -> None:
     # Setup
     mock_platform = MagicMock()
-    test_specified_regs = ["test_reg"]
+    mock_platform.container_engine.get_local_tool_images.return_value = {"test_tool_image2"}
+    mock_platform.registries.iter_tool_images.return_value = iter(["test_tool_image1", 
+                                                                   "test_tool_image2"])
 
-    mock_table = MagicMock()
-    mock_Table.return_value = mock_table
+    # Run the test
+    list_tools_cmd.list_tools_from_regs(mock_platform, [], True)
+
+    # Check the result
+    mock_platform.registries.iter_tool_images.assert_called_once_with([], 
+                                                                      mock_platform.refresh_registries,
+                                                                      [],
+                                                                      mock_platform.incremental_registry_refresh)
+    mock_print.assert_has_calls([
+        call('{"name": "test_tool_image1", "available_locally": false}', markup=False, 
+             soft_wrap=True),
+        call('{"name": "test_tool_image2", "available_locally": true}', markup=False, 
+             soft_wrap=True),
+    ])
+    assert mock_print.call_count == 2
 
-    mock_platform.tool_images.get_registry_ones.return_value = {
-        "test_tool_image1": MagicMock(),
-        "test_tool_image2": MagicMock()
-    }
+@patch("dem.cli.command.list_tools_cmd.stdout.print")
+def test_list_tools_from_all_regs(mock_print: MagicMock) -> None:
+    # Setup
+    mock_platform = MagicMock()
+    mock_platform.container_engine.get_local_tool_images.return_value = set()
+    mock_platform.registries.iter_tool_images.return_value = iter(["test_tool_image1"])
 
     # Run the test
-    list_tools_cmd.list_tools_from_selected_regs(mock_platform, test_specified_regs)
+    list_tools_cmd.list_tools_from_regs(mock_platform, [], False)
 
     # Check the result
-    mock_update_tools_from_selected_regs.assert_called_once_with(mock_platform, test_specified_regs)
-    mock_platform.tool_images.get_registry_ones.assert_called_once()
-    mock_Table.assert_called_once()
-    mock_list_tools_from_regs.assert_called_once_with(mock_platform, mock_table)
-    mock_print.assert_has_calls([call("\n [italic]Available Tool Images from the selected registries[/]"),
-                                 call(mock_table)])
+    mock_print.assert_has_calls([call("\n [italic]Available Tool Images from all registries[/]"),
+                                 call("    test_tool_image1")])
 
 @patch("dem.cli.command.list_tools_cmd.stdout.print")
-@patch("dem.cli.command.list_tools_cmd.update_tools_from_selected_regs")
-def test_list_tools_from_selected_regs_no_available_tools(mock_update_tools_from_selected_regs: MagicMock,
-                                                          mock_print: MagicMock) -> None:
+def test_list_tools_from_selected_regs_no_available_tools(mock_print: MagicMock) -> None:
     # Setup
     mock_platform = MagicMock()
-    test_specified_regs = ["test_reg"]
-
-    mock_platform.tool_images.get_registry_ones.return_value = {}
+    mock_platform.registries.iter_tool_images.return_value = iter([])
 
     # Run the test
     with raises(list_tools_cmd.typer.Abort):
-        list_tools_cmd.list_tools_from_selected_regs(mock_platform, test_specified_regs)
+        list_tools_cmd.list_tools_from_regs(mock_platform, ["test_reg"], False)
 
     # Check the result
-    mock_update_tools_from_selected_regs.assert_called_once_with(mock_platform, test_specified_regs)
-    mock_platform.tool_images.get_registry_ones.assert_called_once()
-    mock_print.assert_called_once_with("[yellow]No tool images are available in the selected registries.[/]")
+    mock_print.assert_called_with("[yellow]No tool images are available in the selected registries.[/]")
 
 @patch("dem.cli.command.list_tools_cmd.stdout.print")
-@patch("dem.cli.command.list_tools_cmd.list_tools_from_regs")
-@patch("dem.cli.command.list_tools_cmd.Table")
-def test_list_tools_from_all_regs(mock_Table: MagicMock, mock_list_tools_from_regs: MagicMock,
-                                  mock_print: MagicMock) -> None:
+def test_list_tools_from_all_regs_no_available_tools(mock_print: MagicMock) -> None:
     # Setup
     mock_platform = MagicMock()
-    mock_table = MagicMock()
-
-    mock_Table.return_value = mock_table
-    mock_platform.tool_images.get_registry_ones.return_value = {
-        "test_tool_image1": MagicMock(),
-        "test_tool_image2": MagicMock()
-    }
+    mock_platform.registries.iter_tool_images.return_value = iter([])
 
     # Run the test
-    list_tools_cmd.list_tools_from_all_regs(mock_platform)
+    with raises(list_tools_cmd.typer.Abort):
+        list_tools_cmd.list_tools_from_regs(mock_platform, [], False)
 
     # Check the result
-    mock_platform.tool_images.get_registry_ones.assert_called_once()
-    mock_Table.assert_called_once()
-    mock_list_tools_from_regs.assert_called_once_with(mock_platform, mock_table)
-    mock_print.assert_has_calls([call("\n [italic]Available Tool Images from all registries[/]"),
-                                 call(mock_table)])
+    mock_print.assert_called_with("[yellow]No tool images are available in the registries.[/]")
 
+@patch("dem.cli.command.list_tools_cmd.stderr.print")
 @patch("dem.cli.command.list_tools_cmd.stdout.print")
-def test_list_tools_from_all_regs_no_available_tools(mock_print: MagicMock) -> None:
+def test_list_tools_from_all_regs_no_available_tools_json(mock_stdout_print: MagicMock,
+                                                          mock_stderr_print: MagicMock) -> None:
     # Setup
     mock_platform = MagicMock()
-    mock_platform.tool_images.get_registry_ones.return_value = {}
+    mock_platform.user_output.is_msg_on_stderr = False
+    mock_platform.registries.iter_tool_images.return_value = iter([])
 
     # Run the test
     with raises(list_tools_cmd.typer.Abort):
-        list_tools_cmd.list_tools_from_all_regs(mock_platform)
+        list_tools_cmd.list_tools_from_regs(mock_platform, [], True)
 
     # Check the result
-    mock_platform.tool_images.get_registry_ones.assert_called_once()
-    mock_print.assert_called_once_with("[yellow]No tool images are available in the registries.[/]")
+    assert mock_platform.user_output.is_msg_on_stderr is True
+    mock_stdout_print.assert_not_called()
+    mock_stderr_print.assert_called_once_with("[yellow]No tool images are available in the registries.[/]")
 
 @patch("dem.cli.command.list_tools_cmd.list_local_tools")
 def test_execute_list_local_tools(mock_list_local_tools: MagicMock) -> None:
@@ -197,41 +236,50 @@ def test_execute_list_local_tools(mock_list_local_tools: MagicMock) -> None:
     list_tools_cmd.execute(mock_platform, False, [])
 
     # Check the result
-    mock_list_local_tools.assert_called_once_with(mock_platform)
+    mock_list_local_tools.assert_called_once_with(mock_platform, False, [])
 
-@patch("dem.cli.command.list_tools_cmd.list_tools_from_selected_regs")
-def test_execute_list_tools_from_selected_regs(mock_list_tools_from_selected_regs: MagicMock) -> None:
+@patch("dem.cli.command.list_tools_cmd.list_tools_from_regs")
+@patch("dem.cli.command.list_tools_cmd.check_selected_regs")
+def test_execute_list_tools_from_regs(mock_check_selected_regs: MagicMock,
+                                      mock_list_tools_from_regs: MagicMock) -> None:
     # Setup
     mock_platform = MagicMock()
     test_specified_regs = ["test_reg"]
 
     # Run the test
-    list_tools_cmd.execute(mock_platform, True, test_specified_regs)
+    list_tools_cmd.execute(mock_platform, True, test_specified_regs, True, ["test_repo*"])
 
     # Check the result
-    mock_list_tools_from_selected_regs.assert_called_once_with(mock_platform, test_specified_regs)
+    mock_check_selected_regs.assert_called_once_with(mock_platform, test_specified_regs)
+    mock_list_tools_from_regs.assert_called_once_with(mock_platform, test_specified_regs, True,
+                                                      ["test_repo*"])
 
-@patch("dem.cli.command.list_tools_cmd.list_tools_from_all_regs")
-def test_execute_list_tools_from_all_regs(mock_list_tools_from_all_regs: MagicMock) -> None:
+@patch("dem.cli.command.list_tools_cmd.execute")
+def test_list_tools_cmd(mock_execute: MagicMock) -> None:
     # Setup
     mock_platform = MagicMock()
-
+    main.platform = mock_platform
+    
     # Run the test
-    list_tools_cmd.execute(mock_platform, True, [])
+    result = runner.invoke(main.typer_cli, ["list-tools"])
 
     # Check the result
-    mock_list_tools_from_all_regs.assert_called_once_with(mock_platform)
+    assert result.exit_code == 0
+
+    mock_execute.assert_called_once_with(mock_platform, False, [], False, [])
 
 @patch("dem.cli.command.list_tools_cmd.execute")
-def test_list_tools_cmd(mock_execute: MagicMock) -> None:
+def test_list_tools_cmd_json(mock_execute: MagicMock) -> None:
     # Setup
     mock_platform = MagicMock()
     main.platform = mock_platform
     
     # Run the test
-    result = runner.invoke(main.typer_cli, ["list-tools"])
+    result = runner.invoke(main.typer_cli, ["list-tools", "--json", "--filter", "test_repo*", 
+                                            "--filter", "other_repo", "--reg", "test_reg"])
 
     # Check the result
     assert result.exit_code == 0
 
-    mock_execute.assert_called_once_with(mock_platform, False, [])
\ No newline at end of file
+    mock_execute.assert_called_once_with(mock_platform, True, ["test_reg"], True, 
+                                         ["test_repo*", "other_repo"])
\ No newline at end of file
@@ -140,6 +140,40 @@ def test_version_exit_raised(mock_importlib_metadata_version):
     with pytest.raises(typer.Exit):
         main._version_callback(True)
 
+@patch("dem.cli.main.list_reg_cmd.execute")
+def test_refresh(mock_list_reg_execute: MagicMock) -> None:
+    # Test setup
+    mock_platform = MagicMock()
+    mock_platform.refresh_registries = False
+    main.platform = mock_platform
+
+    # Run unit under test
+    result = runner.invoke(main.typer_cli, ["--refresh", "list-reg"])
+
+    # Check expectations
+    assert result.exit_code == 0
+    assert mock_platform.refresh_registries is True
+
+    mock_list_reg_execute.assert_called_once_with(mock_platform)
+
+@patch("dem.cli.main.list_reg_cmd.execute")
+def test_incremental(mock_list_reg_execute: MagicMock) -> None:
+    # Test setup
+    mock_platform = MagicMock()
+    mock_platform.refresh_registries = False
+    mock_platform.incremental_registry_refresh = False
+    main.platform = mock_platform
+
+    # Run unit under test
+    result = runner.invoke(main.typer_cli, ["--incremental", "list-reg"])
+
+    # Check expectations
+    assert result.exit_code == 0
+    assert mock_platform.incremental_registry_refresh is True
+    assert mock_platform.refresh_registries is False
+
+    mock_list_reg_execute.assert_called_once_with(mock_platform)
+
 @patch("dem.cli.main.init_cmd.execute")
 def test_init_execute(mock_init_execute: MagicMock) -> None:
     # Test setup
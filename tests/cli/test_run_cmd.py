@@ -11,6 +11,7 @@ from typer.testing import CliRunner
 from unittest.mock import patch, MagicMock, call
 
 import typer
+from dem.core.exceptions import PlatformError
 
 ## Global test variables
 
@@ -108,6 +109,7 @@ def test_execute(mock_handle_missing_tool_images):
     main.platform = mock_platform
     mock_dev_env_local = MagicMock()
     mock_platform.get_dev_env_by_name.return_value = mock_dev_env_local
+    mock_platform.get_cache_volume_mounts.return_value = []
 
     mock_dev_env_local.tool_image_descriptors = [
         {
@@ -134,4 +136,80 @@ def test_execute(mock_handle_missing_tool_images):
     mock_handle_missing_tool_images.assert_called_once_with(expected_missing_tool_image, 
                                                             mock_dev_env_local, 
                                                             mock_platform)
-    mock_platform.container_engine.run.assert_called_once_with(test_args[2:])
\ No newline at end of file
+    mock_platform.get_cache_volume_mounts.assert_called_once_with(mock_dev_env_local)
+    mock_platform.container_engine.run.assert_called_once_with(test_args[2:], [])
+    mock_platform.get_cache_volume_sizes.assert_not_called()
+
+@patch("dem.cli.command.run_cmd.stdout.print")
+def test_execute_cache_volumes(mock_stdout_print: MagicMock) -> None:
+    # Test setup
+    test_dev_env_name = "test_dev_env_name"
+    test_args = ["run", test_dev_env_name, "test_image_name:test_image_version", "make"]
+    test_cache_volume_mounts = ["dem_test_dev_env_name_cache_ccache:/root/.ccache"]
+
+    mock_platform = MagicMock()
+    mock_platform.tool_images.get_local_ones.return_value = {
+        "test_image_name:test_image_version": MagicMock()
+    }
+    main.platform = mock_platform
+    mock_dev_env_local = MagicMock()
+    mock_dev_env_local.tool_image_descriptors = [
+        {
+            "image_name": "test_image_name",
+            "image_version": "test_image_version",
+        },
+    ]
+    mock_platform.get_dev_env_by_name.return_value = mock_dev_env_local
+    mock_platform.get_cache_volume_mounts.return_value = test_cache_volume_mounts
+    mock_platform.get_cache_volume_sizes.return_value = {
+        "ccache": 123456789,
+        "build": None,
+    }
+
+    # Run unit under test
+    runner_result = runner.invoke(main.typer_cli, test_args, color=True)
+
+    # Check expectations
+    assert 0 == runner_result.exit_code
+
+    mock_platform.container_engine.run.assert_called_once_with(test_args[2:], 
+                                                               test_cache_volume_mounts)
+    mock_platform.get_cache_volume_sizes.assert_called_once_with(mock_dev_env_local)
+    mock_stdout_print.assert_has_calls([
+        call("The ccache cache volume uses 123.5 MB."),
+        call("The build cache volume uses unknown."),
+    ])
+
+@patch("dem.cli.command.run_cmd.stderr.print")
+def test_execute_cache_volumes_PlatformError(mock_stderr_print: MagicMock) -> None:
+    # Test setup
+    test_dev_env_name = "test_dev_env_name"
+    test_exception_text = "test_exception_text"
+
+    mock_platform = MagicMock()
+    mock_dev_env_local = MagicMock()
+    mock_dev_env_local.tool_image_descriptors = []
+    mock_platform.get_dev_env_by_name.return_value = mock_dev_env_local
+    mock_platform.get_cache_volume_mounts.side_effect = PlatformError(test_exception_text)
+
+    # Run unit under test
+    with pytest.raises(typer.Abort):
+        run_cmd.execute(mock_platform, test_dev_env_name, ["test_image_name:test_image_version"])
+
+    # Check expectations
+    mock_stderr_print.assert_called_once_with(f"[red]Platform error: {test_exception_text}[/]")
+    mock_platform.container_engine.run.assert_not_called()
+
+@patch("dem.cli.command.run_cmd.stderr.print")
+def test_print_cache_volume_sizes_PlatformError(mock_stderr_print: MagicMock) -> None:
+    # Test setup
+    test_exception_text = "test_exception_text"
+    mock_platform = MagicMock()
+    mock_dev_env_local = MagicMock()
+    mock_platform.get_cache_volume_sizes.side_effect = PlatformError(test_exception_text)
+
+    # Run unit under test
+    run_cmd.print_cache_volume_sizes(mock_platform, mock_dev_env_local)
+
+    # Check expectations
+    mock_stderr_print.assert_called_once_with(f"[yellow]Platform error: {test_exception_text}[/]")
\ No newline at end of file
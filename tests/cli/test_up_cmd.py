@@ -0,0 +1,72 @@
+"""Tests for the up command."""
+
+# Unit under test:
+import dem.cli.main as main
+import dem.cli.command.up_cmd as up_cmd
+
+# Test framework
+from typer.testing import CliRunner
+from unittest.mock import patch, MagicMock
+
+from dem.core.exceptions import PlatformError
+
+## Global test variables
+runner = CliRunner()
+
+@patch("dem.cli.command.up_cmd.stdout.print")
+def test_up(mock_stdout_print: MagicMock) -> None:
+    # Setup
+    mock_platform = MagicMock()
+    main.platform = mock_platform
+    mock_dev_env = MagicMock()
+    mock_platform.get_dev_env_by_name.return_value = mock_dev_env
+    test_dev_env_name = "test_dev_env_name"
+
+    # Run the test
+    runner_result = runner.invoke(main.typer_cli, ["up", test_dev_env_name, "--idle-timeout", "60",
+                                                   "-v", "/dev/bus/usb:/dev/bus/usb", 
+                                                   "--privileged"])
+
+    # Check the result
+    assert runner_result.exit_code == 0
+
+    mock_platform.get_dev_env_by_name.assert_called_once_with(test_dev_env_name)
+    mock_platform.up_dev_env.assert_called_once_with(mock_dev_env, 60, 
+                                                     ["/dev/bus/usb:/dev/bus/usb"], True)
+    mock_stdout_print.assert_called_once_with(f"[green]The {test_dev_env_name} is up![/]")
+
+@patch("dem.cli.command.up_cmd.stderr.print")
+def test_up_invalid_name(mock_stderr_print: MagicMock) -> None:
+    # Setup
+    mock_platform = MagicMock()
+    main.platform = mock_platform
+    mock_platform.get_dev_env_by_name.return_value = None
+    test_dev_env_name = "test_dev_env_name"
+
+    # Run the test
+    runner_result = runner.invoke(main.typer_cli, ["up", test_dev_env_name])
+
+    # Check the result
+    assert runner_result.exit_code == 0
+
+    mock_stderr_print.assert_called_once_with(f"[red]Error: The {test_dev_env_name} Development Environment does not exist.[/]")
+    mock_platform.up_dev_env.assert_not_called()
+
+@patch("dem.cli.command.up_cmd.stderr.print")
+def test_up_PlatformError(mock_stderr_print: MagicMock) -> None:
+    # Setup
+    mock_platform = MagicMock()
+    main.platform = mock_platform
+    mock_dev_env = MagicMock()
+    mock_platform.get_dev_env_by_name.return_value = mock_dev_env
+    test_exception_text = "test_exception_text"
+    mock_platform.up_dev_env.side_effect = PlatformError(test_exception_text)
+
+    # Run the test
+    runner_result = runner.invoke(main.typer_cli, ["up", "test_dev_env_name"])
+
+    # Check the result
+    assert runner_result.exit_code == 0
+
+    mock_platform.up_dev_env.assert_called_once_with(mock_dev_env, None, [], False)
+    mock_stderr_print.assert_called_once_with(f"[red]Platform error: {test_exception_text}[/]")
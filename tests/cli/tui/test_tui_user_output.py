@@ -10,141 +10,159 @@ from unittest.mock import patch, MagicMock, call
 
 from typing import Generator
 
-def test_PullProgressBar__update_progress_bar():
+def test_PullProgressBar__process_layer_events():
     # Test setup
-    test_generator = MagicMock()
-    test_id = "test_id"
-    test_current = 10
-    test_total = 100
-    test_item = {
-        "progressDetail": {
-            "current": test_current,
-            "total": test_total,
-        }
-    }
-    test_status = "test_status"
-    test_task_id = 0
-
-    pull_progress_bar = tui_user_output.PullProgressBar(test_generator)
-    pull_progress_bar.progress = MagicMock()
-
-    pull_progress_bar.progress.add_task.return_value = test_task_id
+    test_image = "test_image:latest"
+    pull_progress_bar = tui_user_output.PullProgressBar(MagicMock())
 
     # Run unit under test
-    pull_progress_bar._update_progress_bar(test_id, test_item, test_status)
+    for test_item in [
+        {"status": "Pulling fs layer", "progressDetail": {}, "id": "layer1", "image": test_image},
+        {"status": "Pulling fs layer", "progressDetail": {}, "id": "layer2", "image": test_image},
+        {"status": "Already exists", "progressDetail": {}, "id": "layer3", "image": test_image},
+        {"status": "Downloading", "progressDetail": {"current": 10, "total": 100}, "id": "layer1", 
+         "image": test_image},
+        {"status": "Downloading", "progressDetail": {"current": 20, "total": 50}, "id": "layer2", 
+         "image": test_image},
+        {"status": "Extracting", "progressDetail": {"current": 5, "total": 50}, "id": "layer2", 
+         "image": test_image},
+    ]:
+        pull_progress_bar._process(test_item)
 
     # Check expectations
-    assert pull_progress_bar.tasks[test_id] is test_task_id
-
-    pull_progress_bar.progress.add_task.assert_called_once_with(str(test_id), id=test_id)
-    pull_progress_bar.progress.update.assert_called_once_with(test_task_id, 
-                                                              description=str(test_status),
-                                                              total=float(test_total),
-                                                              completed=float(test_current))
-
-@patch.object(tui_user_output.PullProgressBar, "_update_progress_bar")
-def test_PullProgressBar__process(mock__update_progress_bar):
-    # Test setup
-    test_generator = MagicMock()
-    test_status = "test_status"
-    test_id = "test_id"
-    test_item = {
-        "status": test_status,
-        "id": test_id,
-        "progressDetail": MagicMock(),
+    assert pull_progress_bar.layers == {
+        test_image: {
+            "layer1": [10.0, 100.0],
+            "layer2": [50.0, 50.0],
+            "layer3": [0.0, 0.0],
+        }
     }
+    assert pull_progress_bar.is_changed is True
+    assert pull_progress_bar._get_image_progress(test_image) == (60.0, 150.0)
 
-    pull_progress_bar = tui_user_output.PullProgressBar(test_generator)
+@patch("dem.cli.tui.tui_user_output.stdout")
+def test_PullProgressBar__process_messages(mock_stdout: MagicMock):
+    # Test setup
+    pull_progress_bar = tui_user_output.PullProgressBar(MagicMock())
 
     # Run unit under test
-    pull_progress_bar._process(test_item)
+    pull_progress_bar._process({"status": "Pulling from axem/test", "id": "latest", 
+                                "image": "axem/test:latest"})
+    pull_progress_bar._process({"status": "test_status"})
+    pull_progress_bar._process({"id": "test_id"})
 
     # Check expectations
-    mock__update_progress_bar.assert_called_once_with(test_id, test_item, test_status)
+    assert pull_progress_bar.layers == {}
+    mock_stdout.print.assert_has_calls([call("axem/test:latest: latest: Pulling from axem/test"), 
+                                        call("test_status")])
+    assert mock_stdout.print.call_count == 2
 
-def test_PullProgressBar__process_no_progressDetail():
+@patch("dem.cli.tui.tui_user_output.time.monotonic")
+def test_PullProgressBar__render_throttled(mock_monotonic: MagicMock):
     # Test setup
-    test_generator = MagicMock()
-    test_status = "test_status"
-    test_id = "test_id"
-    test_item = {
-        "status": test_status,
-        "id": test_id,
-    }
-
-    pull_progress_bar = tui_user_output.PullProgressBar(test_generator)
+    pull_progress_bar = tui_user_output.PullProgressBar(MagicMock())
     pull_progress_bar.progress = MagicMock()
-
-    # Run unit under test
-    pull_progress_bar._process(test_item)
-
-    # Check expectations
-    pull_progress_bar.progress.console.print.assert_called_once_with(str(test_id) + ": " + str(test_status))
-
-def test_PullProgressBar__progress_no_id():
+    pull_progress_bar._update_progress_bars = MagicMock()
+    pull_progress_bar.rendered_at = 100.0
+
+    # Run unit under test and check expectations
+    mock_monotonic.return_value = 100.05
+    pull_progress_bar.is_changed = True
+    pull_progress_bar._render()
+    pull_progress_bar._update_progress_bars.assert_not_called()
+
+    mock_monotonic.return_value = 100.2
+    pull_progress_bar._render()
+    pull_progress_bar._update_progress_bars.assert_called_once()
+    assert pull_progress_bar.is_changed is False
+
+    # Nothing changed since the last render.
+    mock_monotonic.return_value = 101.0
+    pull_progress_bar._render(force=True)
+    pull_progress_bar._update_progress_bars.assert_called_once()
+
+    pull_progress_bar.is_changed = True
+    pull_progress_bar._render(force=True)
+    assert pull_progress_bar._update_progress_bars.call_count == 2
+
+def test_PullProgressBar__update_progress_bars():
     # Test setup
-    test_generator = MagicMock()
-    test_status = "test_status"
-    test_item = {
-        "status": test_status,
-    }
-
-    pull_progress_bar = tui_user_output.PullProgressBar(test_generator)
+    pull_progress_bar = tui_user_output.PullProgressBar(MagicMock())
     pull_progress_bar.progress = MagicMock()
+    pull_progress_bar.progress.add_task.side_effect = [0, 1, 2]
+    pull_progress_bar.layers = {
+        "test_image1": {"layer1": [10.0, 100.0]},
+        "test_image2": {"layer2": [20.0, 50.0], "layer3": [0.0, 0.0]},
+    }
 
     # Run unit under test
-    pull_progress_bar._process(test_item)
+    pull_progress_bar._update_progress_bars()
 
     # Check expectations
-    pull_progress_bar.progress.console.print.assert_called_once_with(str(test_status))
+    assert pull_progress_bar.tasks == {"test_image1": 0, "test_image2": 1, None: 2}
+    pull_progress_bar.progress.add_task.assert_has_calls([call("test_image1"), call("test_image2"),
+                                                          call("Total")])
+    pull_progress_bar.progress.update.assert_has_calls([call(0, completed=10.0, total=100.0),
+                                                        call(1, completed=20.0, total=50.0),
+                                                        call(2, completed=30.0, total=150.0)])
+    pull_progress_bar.progress.refresh.assert_called_once()
 
-@patch.object(tui_user_output.PullProgressBar, "_process")
 @patch("dem.cli.tui.tui_user_output.stdout")
-@patch("dem.cli.tui.tui_user_output.TaskProgressColumn")
+@patch("dem.cli.tui.tui_user_output.TimeRemainingColumn")
+@patch("dem.cli.tui.tui_user_output.TransferSpeedColumn")
+@patch("dem.cli.tui.tui_user_output.DownloadColumn")
 @patch("dem.cli.tui.tui_user_output.BarColumn")
 @patch("dem.cli.tui.tui_user_output.TextColumn")
 @patch("dem.cli.tui.tui_user_output.Progress")
 def test_PullProgressBar_run_generator(mock_Progress: MagicMock, mock_TextColumn: MagicMock,
-                                       mock_BarColumn: MagicMock, 
-                                       mock_TaskProgressColumn: MagicMock, mock_stdout: MagicMock,
-                                       mock__process: MagicMock):
+                                       mock_BarColumn: MagicMock, mock_DownloadColumn: MagicMock,
+                                       mock_TransferSpeedColumn: MagicMock, 
+                                       mock_TimeRemainingColumn: MagicMock, mock_stdout: MagicMock):
     # Test setup
-    mock_text_column_layer_id = MagicMock()
-    mock_text_column_description = MagicMock()
-    mock_bar_column = MagicMock()
-    mock_task_progress_column = MagicMock()
-
-    mock_TextColumn.side_effect = [mock_text_column_layer_id, mock_text_column_description]
-    mock_BarColumn.return_value = mock_bar_column
-    mock_TaskProgressColumn.return_value = mock_task_progress_column
-
-    test_items = [MagicMock(), MagicMock()]
-    def mock_generator() -> Generator:
-        for item in test_items:
-            yield item
+    mock_stdout.is_terminal = True
+    mock_progress = MagicMock()
+    mock_Progress.return_value.__enter__.return_value = mock_progress
+    test_items = [
+        {"status": "Downloading", "progressDetail": {"current": i, "total": 100}, "id": "layer1", 
+         "image": "test_image"} for i in range(1, 101)
+    ]
 
-    pull_progress_bar = tui_user_output.PullProgressBar(mock_generator())
+    pull_progress_bar = tui_user_output.PullProgressBar(iter(test_items))
 
     # Run unit under test
     pull_progress_bar.run_generator()
 
     # Check expectations
-    calls = [
-        call("[progress.layer_id]{task.fields[id]}"),
-        call("[progress.description]{task.description}"),
+    mock_TextColumn.assert_called_once_with("[progress.description]{task.description}")
+    mock_Progress.assert_called_once_with(mock_TextColumn.return_value, mock_BarColumn.return_value,
+                                          mock_DownloadColumn.return_value, 
+                                          mock_TransferSpeedColumn.return_value,
+                                          mock_TimeRemainingColumn.return_value, 
+                                          console=mock_stdout, auto_refresh=False)
+    # The events are coalesced, the display is not updated for each of them.
+    assert mock_progress.refresh.call_count < len(test_items)
+    mock_progress.update.assert_called_with(mock_progress.add_task.return_value, completed=100.0, 
+                                            total=100.0)
+
+@patch("dem.cli.tui.tui_user_output.Progress")
+@patch("dem.cli.tui.tui_user_output.stdout")
+def test_PullProgressBar_run_generator_not_terminal(mock_stdout: MagicMock, 
+                                                    mock_Progress: MagicMock):
+    # Test setup
+    mock_stdout.is_terminal = False
+    test_items = [
+        {"status": "Downloading", "progressDetail": {"current": i * 1000, "total": 100000}, 
+         "id": "layer1", "image": "test_image"} for i in range(1, 101)
     ]
-    mock_TextColumn.assert_has_calls(calls)
-    mock_BarColumn.assert_called_once()
-    mock_TaskProgressColumn.assert_called_once()
 
-    mock_Progress.assert_called_once_with(mock_text_column_layer_id, mock_text_column_description,
-                                          mock_bar_column, mock_task_progress_column, 
-                                          console=mock_stdout)
+    pull_progress_bar = tui_user_output.PullProgressBar(iter(test_items))
 
-    calls = []
-    for item in test_items:
-        calls.append(call(item))
-    mock__process.assert_has_calls(calls)
+    # Run unit under test
+    pull_progress_bar.run_generator()
+
+    # Check expectations
+    mock_Progress.assert_not_called()
+    mock_stdout.print.assert_called_once_with("test_image: 100.0 kB / 100.0 kB (100%)")
 
 @patch("dem.cli.tui.tui_user_output.stdout.print")
 def test_TUIUserOutput_msg(mock_stdout_print: MagicMock):
@@ -159,6 +177,22 @@ def test_TUIUserOutput_msg(mock_stdout_print: MagicMock):
     # Check expectations
     mock_stdout_print.assert_called_once_with(test_text)
 
+@patch("dem.cli.tui.tui_user_output.stderr.print")
+@patch("dem.cli.tui.tui_user_output.stdout.print")
+def test_TUIUserOutput_msg_on_stderr(mock_stdout_print: MagicMock, mock_stderr_print: MagicMock):
+    # Test setup
+    test_text = "test_text"
+
+    test_tui_user_output = tui_user_output.TUIUserOutput()
+    test_tui_user_output.is_msg_on_stderr = True
+
+    # Run unit under test
+    test_tui_user_output.msg(test_text)
+
+    # Check expectations
+    mock_stdout_print.assert_not_called()
+    mock_stderr_print.assert_called_once_with(test_text)
+
 @patch("dem.cli.tui.tui_user_output.stdout.rule")
 def test_TUIUserOutput_msg_is_title(mock_stdout_rule: MagicMock):
     # Test setup
@@ -8,76 +8,278 @@ import dem.core.container_engine as container_engine
 import pytest
 from unittest.mock import patch, MagicMock, call
 
-class mockImage:
-    def __init__(self, tags: list[str]) -> None:
-        self.tags = tags
-
-def _get_test_image_tags_as_images(test_image_tags):
-    test_images = []
-    for test_image_tag in test_image_tags:
-        test_images.append(mockImage(test_image_tag))
-    return test_images
-
-@patch("docker.from_env")
-def test_get_local_tool_images(mock_docker_from_env):
-    # Test setup
-    test_image_tags = [
-    ["alpine:latest"],
-    [""],
-    ["axemsolutions/make_gnu_arm:v1.0.0"],
-    ["axemsolutions/stlink_org:latest", "axemsolutions/stlink_org:v1.0.0"],
-    ["axemsolutions/cpputest:latest"],
-    ["axemsolutions/make_gnu_arm:latest", "axemsolutions/make_gnu_arm:v0.1.0", "axemsolutions/make_gnu_arm:v1.1.0"],
-    ["debian:latest"],
-    ["ubuntu:latest"],
-    ["hello-world:latest"],
-    [""],
-    ]
-    expected_image_tags = [
-    "alpine:latest",
-    "axemsolutions/make_gnu_arm:v1.0.0",
-    "axemsolutions/stlink_org:latest", 
-    "axemsolutions/stlink_org:v1.0.0",
-    "axemsolutions/cpputest:latest",
-    "axemsolutions/make_gnu_arm:latest", 
-    "axemsolutions/make_gnu_arm:v0.1.0", 
-    "axemsolutions/make_gnu_arm:v1.1.0",
-    "debian:latest",
-    "ubuntu:latest",
-    "hello-world:latest",
+@pytest.fixture(autouse=True)
+def mock_DockerAPIVersionsJSON():
+    """ Don't access the real API version cache. The API version gets negotiated by default."""
+    with patch("dem.core.container_engine.DockerAPIVersionsJSON") as mock_DockerAPIVersionsJSON:
+        mock_DockerAPIVersionsJSON.return_value.get_api_versions.return_value = {}
+        yield mock_DockerAPIVersionsJSON
+
+def get_test_daemon_index(images: dict | None = None, last_event: dict | None = None,
+                          last_sync_time: int | None = None, image_count: int | None = None,
+                          image_layers: dict | None = None) -> dict:
+    return {
+        "images": images,
+        "last_event": last_event,
+        "last_sync_time": last_sync_time,
+        "image_count": image_count,
+        "image_layers": image_layers or {},
+    }
+
+@patch.dict("dem.core.container_engine.os.environ", {"DOCKER_HOST": "tcp://test_host:2375"})
+@patch("dem.core.container_engine.time.time")
+@patch("dem.core.container_engine.LocalImageIndexJSON")
+@patch("docker.from_env")
+def test_get_local_tool_images(mock_docker_from_env: MagicMock, mock_LocalImageIndexJSON: MagicMock,
+                               mock_time: MagicMock) -> None:
+    # Test setup
+    mock_time.return_value = 1000.5
+    mock_local_image_index = MagicMock()
+    test_daemon_index = get_test_daemon_index()
+    mock_local_image_index.get_daemon_index.return_value = test_daemon_index
+    mock_LocalImageIndexJSON.return_value = mock_local_image_index
+    test_images = [
+        {"Id": "sha256:1", "Size": 10, "Created": 100, "RepoTags": ["alpine:latest"]},
+        {"Id": "sha256:2", "Size": 20, "Created": 200, "RepoTags": None},
+        {"Id": "sha256:3", "Size": 30, "Created": 300, "RepoTags": ["<none>:<none>"]},
+        {"Id": "sha256:4", "Size": 40, "Created": 400, 
+         "RepoTags": ["axemsolutions/stlink_org:latest", "axemsolutions/stlink_org:v1.0.0"]},
+        {"Id": "sha256:5", "Size": 50, "Created": 500},
     ]
     mock_docker_client = MagicMock()
-    mock_docker_client.images.list.return_value = _get_test_image_tags_as_images(test_image_tags)
+    mock_docker_client.api.info.return_value = {"ID": "test_daemon_id", "Images": 5}
+    mock_docker_client.api.images.return_value = test_images
     mock_docker_from_env.return_value = mock_docker_client
 
-    # Run unit under test
     container_engine_obj = container_engine.ContainerEngine()
+
+    # Run unit under test
     actual_image_tags = container_engine_obj.get_local_tool_images()
+    actual_filtered_image_tags = container_engine_obj.get_local_tool_images(["axemsolutions/*"])
 
     # Check expectations
-    assert expected_image_tags == actual_image_tags
+    assert actual_image_tags == {"alpine:latest", "axemsolutions/stlink_org:latest", 
+                                 "axemsolutions/stlink_org:v1.0.0"}
+    assert actual_filtered_image_tags == {"axemsolutions/stlink_org:latest", 
+                                          "axemsolutions/stlink_org:v1.0.0"}
+    assert test_daemon_index == get_test_daemon_index({
+        "alpine:latest": {"id": "sha256:1", "size": 10, "created": 100},
+        "axemsolutions/stlink_org:latest": {"id": "sha256:4", "size": 40, "created": 400},
+        "axemsolutions/stlink_org:v1.0.0": {"id": "sha256:4", "size": 40, "created": 400},
+    }, None, 1000, 5)
 
-    mock_docker_from_env.assert_called_once()
-    mock_docker_client.images.list.assert_called_once()
+    # The index gets built once per process.
+    mock_local_image_index.get_daemon_index.assert_called_once_with("tcp://test_host:2375", 
+                                                                    "test_daemon_id")
+    mock_docker_client.api.images.assert_called_once_with()
+    mock_docker_client.images.list.assert_not_called()
+    mock_docker_client.api.events.assert_not_called()
+    mock_local_image_index.update.assert_called_once()
+    mock_local_image_index.flush.assert_called_once()
 
+@patch("dem.core.container_engine.time.time")
+@patch("dem.core.container_engine.LocalImageIndexJSON")
 @patch("docker.from_env")
-def test_get_local_tool_images_when_none_available(mock_docker_from_env):
+def test_local_image_layers(mock_docker_from_env: MagicMock, mock_LocalImageIndexJSON: MagicMock,
+                            mock_time: MagicMock) -> None:
     # Test setup
-    test_image_tags = []
-    expected_image_tags = []
-    fake_docker_client = MagicMock()
-    mock_docker_from_env.return_value = fake_docker_client
-    fake_docker_client.images.list.return_value = _get_test_image_tags_as_images(test_image_tags)
+    mock_time.return_value = 1000
+    mock_local_image_index = MagicMock()
+    test_daemon_index = get_test_daemon_index(image_layers={
+        "sha256:1": [["sha256:layer1", 10]],
+        "sha256:deleted": [["sha256:layer2", 20]],
+    })
+    mock_local_image_index.get_daemon_index.return_value = test_daemon_index
+    mock_LocalImageIndexJSON.return_value = mock_local_image_index
+    mock_docker_client = MagicMock()
+    mock_docker_client.api.info.return_value = {"ID": "test_daemon_id", "Images": 2}
+    mock_docker_client.api.images.return_value = [
+        {"Id": "sha256:1", "Size": 10, "Created": 100, "RepoTags": ["alpine:latest"]},
+        {"Id": "sha256:2", "Size": 20, "Created": 200, "RepoTags": ["ubuntu:latest"]},
+    ]
+    mock_docker_from_env.return_value = mock_docker_client
+
+    test_container_engine = container_engine.ContainerEngine()
 
     # Run unit under test
+    actual_stored_layers = test_container_engine.get_local_image_layers(["alpine:latest", 
+                                                                         "ubuntu:latest", 
+                                                                         "missing:latest"])
+    test_container_engine.set_local_image_layers({
+        "ubuntu:latest": [("sha256:layer3", 30)],
+        "missing:latest": [("sha256:layer4", 40)],
+        "alpine:latest": [],
+    })
+    actual_layers = test_container_engine.get_local_image_layers(["alpine:latest", 
+                                                                  "ubuntu:latest"])
+
+    # Check expectations
+    assert actual_stored_layers == {"alpine:latest": [["sha256:layer1", 10]]}
+    assert actual_layers == {
+        "alpine:latest": [["sha256:layer1", 10]],
+        "ubuntu:latest": [["sha256:layer3", 30]],
+    }
+    # The layers are stored by image ID, the layers of the deleted images are dropped.
+    assert test_daemon_index["image_layers"] == {
+        "sha256:1": [["sha256:layer1", 10]],
+        "sha256:2": [["sha256:layer3", 30]],
+    }
+
+    assert mock_local_image_index.flush.call_count == 2
+
+@patch("dem.core.container_engine.time.time")
+@patch("dem.core.container_engine.LocalImageIndexJSON")
+@patch("docker.from_env")
+def test_is_local_tool_image_replay_events(mock_docker_from_env: MagicMock, 
+                                           mock_LocalImageIndexJSON: MagicMock,
+                                           mock_time: MagicMock) -> None:
+    # Test setup
+    mock_time.return_value = 2000
+    mock_local_image_index = MagicMock()
+    test_last_event = {"time_nano": 1000_000000500, "type": "container", "action": "start", 
+                       "actor_id": "test_container_id"}
+    test_daemon_index = get_test_daemon_index({
+        "deleted:latest": {"id": "sha256:deleted", "size": 10, "created": 100},
+        "moved:latest": {"id": "sha256:old", "size": 20, "created": 200},
+        "old:latest": {"id": "sha256:old", "size": 20, "created": 200},
+        "unchanged:latest": {"id": "sha256:unchanged", "size": 30, "created": 300},
+        "replayed:latest": {"id": "sha256:replayed", "size": 50, "created": 500},
+    }, test_last_event, 1500, 4)
+    mock_local_image_index.get_daemon_index.return_value = test_daemon_index
+    mock_LocalImageIndexJSON.return_value = mock_local_image_index
+    mock_docker_client = MagicMock()
+    mock_docker_client.api.info.return_value = {"ID": "test_daemon_id", "Images": 4}
+    mock_docker_client.api.events.return_value = iter([
+        # Already applied at the last sync.
+        {"Type": "image", "Action": "delete", "Actor": {"ID": "sha256:replayed"}, 
+         "timeNano": 1000_000000100},
+        {"Type": "container", "Action": "start", "Actor": {"ID": "test_container_id"}, 
+         "timeNano": 1000_000000500},
+        {"status": "pull", "id": "pulled:latest", "Type": "image", "Action": "pull", 
+         "timeNano": 1100_000000000},
+        {"status": "untag", "id": "sha256:old", "Type": "image", "Action": "untag", 
+         "timeNano": 1200_000000000},
+        {"Type": "container", "Action": "exec_start", "Actor": {"ID": "test_container_id"}, 
+         "timeNano": 1250_000000000},
+        {"status": "tag", "id": "sha256:pulled", "Type": "image", "Action": "tag", 
+         "timeNano": 1300_000000000},
+        {"Type": "image", "Action": "delete", "Actor": {"ID": "sha256:deleted"}, 
+         "timeNano": 1400_000000000},
+    ])
+    test_inspected_images = {
+        "pulled:latest": {"Id": "sha256:pulled", "Size": 40, "Created": "2024-01-01T00:00:00.123456789Z", 
+                          "RepoTags": ["pulled:latest"]},
+        "sha256:pulled": {"Id": "sha256:pulled", "Size": 40, "Created": "2024-01-01T00:00:00.123456789Z", 
+                          "RepoTags": ["pulled:latest", "moved:latest"]},
+        "sha256:old": {"Id": "sha256:old", "Size": 20, "Created": "1970-01-01T00:03:20Z", 
+                       "RepoTags": ["old:latest"]},
+    }
+    def inspect_image(reference: str) -> dict:
+        if reference not in test_inspected_images:
+            raise container_engine.docker.errors.NotFound("not found")
+        return test_inspected_images[reference]
+    mock_docker_client.api.inspect_image.side_effect = inspect_image
+    mock_docker_from_env.return_value = mock_docker_client
+
     container_engine_obj = container_engine.ContainerEngine()
-    actual_image_tags = container_engine_obj.get_local_tool_images()
+
+    # Run unit under test
+    assert container_engine_obj.is_local_tool_image("pulled:latest") is True
+    assert container_engine_obj.is_local_tool_image("deleted:latest") is False
 
     # Check expectations
-    assert expected_image_tags == actual_image_tags
+    assert test_daemon_index == get_test_daemon_index({
+        "moved:latest": {"id": "sha256:pulled", "size": 40, "created": 1704067200},
+        "old:latest": {"id": "sha256:old", "size": 20, "created": 200},
+        "pulled:latest": {"id": "sha256:pulled", "size": 40, "created": 1704067200},
+        "unchanged:latest": {"id": "sha256:unchanged", "size": 30, "created": 300},
+        "replayed:latest": {"id": "sha256:replayed", "size": 50, "created": 500},
+    }, {"time_nano": 1400_000000000, "type": "image", "action": "delete", 
+        "actor_id": "sha256:deleted"}, 2000, 4)
 
-    mock_docker_from_env.assert_called_once()
-    fake_docker_client.images.list.assert_called_once()
+    # The events are replayed from the last seen event, without filtering.
+    mock_docker_client.api.events.assert_called_once_with(since=1000, until=2000, decode=True)
+    mock_docker_client.api.images.assert_not_called()
+    mock_local_image_index.flush.assert_called_once()
+
+@pytest.mark.parametrize("test_last_event, test_events, test_image_count", [
+    # The last seen event has been dropped from the buffer of the Docker Engine (e.g. it has been
+    # restarted).
+    ({"time_nano": 1000_000000000, "type": "image", "action": "pull", "actor_id": "stale:latest"},
+     [{"Type": "image", "Action": "pull", "id": "new:latest", "timeNano": 1500_000000000}], 1),
+    # The buffer is full of container events, the image events might have been pushed out.
+    (None, [{"Type": "container", "Action": "exec_start", "Actor": {"ID": "test_container_id"}, 
+             "timeNano": 1000_000000000 + i} 
+            for i in range(container_engine.ContainerEngine._event_buffer_size)], 1),
+    # The number of images has changed without any image event.
+    (None, [], 2),
+])
+@patch("dem.core.container_engine.time.time")
+@patch("dem.core.container_engine.LocalImageIndexJSON")
+@patch("docker.from_env")
+def test_is_local_tool_image_lost_events(mock_docker_from_env: MagicMock, 
+                                         mock_LocalImageIndexJSON: MagicMock,
+                                         mock_time: MagicMock, test_last_event: dict | None,
+                                         test_events: list[dict], test_image_count: int) -> None:
+    # Test setup
+    mock_time.return_value = 2000
+    mock_local_image_index = MagicMock()
+    test_daemon_index = get_test_daemon_index({
+        "stale:latest": {"id": "sha256:stale", "size": 10, "created": 100},
+    }, test_last_event, 1000, 1)
+    mock_local_image_index.get_daemon_index.return_value = test_daemon_index
+    mock_LocalImageIndexJSON.return_value = mock_local_image_index
+    mock_docker_client = MagicMock()
+    mock_docker_client.api.info.return_value = {"ID": "test_daemon_id", "Images": test_image_count}
+    mock_docker_client.api.events.return_value = iter(test_events)
+    mock_docker_client.api.images.return_value = [
+        {"Id": "sha256:new", "Size": 20, "Created": 200, "RepoTags": ["new:latest"]},
+    ]
+    mock_docker_from_env.return_value = mock_docker_client
+
+    container_engine_obj = container_engine.ContainerEngine()
+
+    # Run unit under test
+    actual_is_local = container_engine_obj.is_local_tool_image("new:latest")
+
+    # Check expectations
+    assert actual_is_local is True
+    assert test_daemon_index["images"] == {
+        "new:latest": {"id": "sha256:new", "size": 20, "created": 200},
+    }
+    assert test_daemon_index["image_count"] == test_image_count
+    if test_events:
+        assert test_daemon_index["last_event"]["time_nano"] == test_events[-1]["timeNano"]
+    else:
+        assert test_daemon_index["last_event"] is None
+
+    mock_docker_client.api.images.assert_called_once_with()
+    mock_docker_client.api.inspect_image.assert_not_called()
+
+@patch("dem.core.container_engine.LocalImageIndexJSON")
+@patch("docker.from_env")
+def test_get_local_tool_images_APIError(mock_docker_from_env: MagicMock, 
+                                        mock_LocalImageIndexJSON: MagicMock) -> None:
+    # Test setup
+    mock_local_image_index = MagicMock()
+    mock_local_image_index.get_daemon_index.return_value = get_test_daemon_index()
+    mock_LocalImageIndexJSON.return_value = mock_local_image_index
+    mock_docker_client = MagicMock()
+    mock_docker_client.api.info.return_value = {"ID": "test_daemon_id", "Images": 0}
+    test_exception_text = "test_exception_text"
+    mock_docker_client.api.images.side_effect = container_engine.docker.errors.APIError(test_exception_text)
+    mock_docker_from_env.return_value = mock_docker_client
+
+    container_engine_obj = container_engine.ContainerEngine()
+
+    # Run unit under test
+    with pytest.raises(container_engine.ContainerEngineError) as exported_exception_info:
+        container_engine_obj.get_local_tool_images()
+
+    # Check expectations
+    assert str(exported_exception_info.value) == "Container engine error: " + test_exception_text
+
+    mock_local_image_index.flush.assert_not_called()
 
 @patch.object(container_engine.Core, "user_output")
 @patch("dem.core.container_engine.docker.from_env")
@@ -100,6 +302,121 @@ def test_pull(mock_docker_from_env, mock_user_output):
                                                         decode=True)
     mock_user_output.progress_generator.assert_called_once_with(mock_response)
 
+@patch.dict("dem.core.container_engine.os.environ", {"DOCKER_HOST": "unix:///var/run/docker.sock"})
+@patch("dem.core.container_engine.shutil.disk_usage")
+@patch("docker.from_env")
+def test_get_free_space(mock_docker_from_env: MagicMock, mock_disk_usage: MagicMock) -> None:
+    # Test setup
+    mock_docker_client = MagicMock()
+    mock_docker_from_env.return_value = mock_docker_client
+    mock_docker_client.info.return_value = {"DockerRootDir": "/var/lib/docker"}
+    mock_disk_usage.return_value.free = 1000
+
+    test_container_engine = container_engine.ContainerEngine()
+
+    # Run unit under test
+    actual_free_space = test_container_engine.get_free_space()
+
+    # Check expectations
+    assert actual_free_space == 1000
+
+    mock_disk_usage.assert_called_once_with("/var/lib/docker")
+
+@patch.dict("dem.core.container_engine.os.environ", {"DOCKER_HOST": ""})
+@patch("dem.core.container_engine.shutil.disk_usage")
+@patch("docker.from_env")
+def test_get_free_space_not_accessible(mock_docker_from_env: MagicMock, 
+                                       mock_disk_usage: MagicMock) -> None:
+    # Test setup
+    mock_docker_client = MagicMock()
+    mock_docker_from_env.return_value = mock_docker_client
+    mock_docker_client.info.return_value = {"DockerRootDir": "/var/lib/docker"}
+    mock_disk_usage.side_effect = FileNotFoundError()
+
+    test_container_engine = container_engine.ContainerEngine()
+
+    # Run unit under test
+    actual_free_space = test_container_engine.get_free_space()
+
+    # Check expectations
+    assert actual_free_space is None
+
+@patch.dict("dem.core.container_engine.os.environ", {"DOCKER_HOST": "tcp://test_host:2375"})
+@patch("dem.core.container_engine.shutil.disk_usage")
+@patch("docker.from_env")
+def test_get_free_space_remote(mock_docker_from_env: MagicMock, mock_disk_usage: MagicMock) -> None:
+    # Test setup
+    mock_docker_client = MagicMock()
+    mock_docker_from_env.return_value = mock_docker_client
+    mock_docker_client.info.return_value = {"DockerRootDir": "/var/lib/docker"}
+    mock_disk_usage.return_value.free = 1000
+
+    test_container_engine = container_engine.ContainerEngine()
+
+    # Run unit under test
+    actual_free_space = test_container_engine.get_free_space()
+
+    # Check expectations
+    # The local /var/lib/docker is not the data root of the remote Docker Engine.
+    assert actual_free_space is None
+
+    mock_disk_usage.assert_not_called()
+
+@patch.dict("dem.core.container_engine.os.environ", {"DOCKER_HOST": ""})
+@patch("docker.from_env")
+def test_get_free_space_APIError(mock_docker_from_env: MagicMock) -> None:
+    # Test setup
+    mock_docker_client = MagicMock()
+    mock_docker_from_env.return_value = mock_docker_client
+    test_exception_text = "test_exception_text"
+    mock_docker_client.info.side_effect = container_engine.docker.errors.APIError(test_exception_text)
+
+    test_container_engine = container_engine.ContainerEngine()
+
+    # Run unit under test
+    with pytest.raises(container_engine.ContainerEngineError) as exported_exception_info:
+        test_container_engine.get_free_space()
+
+    # Check expectations
+    assert str(exported_exception_info.value) == "Container engine error: " + test_exception_text
+
+@patch("docker.from_env")
+def test_iter_pull(mock_docker_from_env: MagicMock) -> None:
+    # Test setup
+    mock_docker_client = MagicMock()
+    mock_docker_from_env.return_value = mock_docker_client
+    test_image_to_pull = "test_image:latest"
+    test_items = [{"status": "Pulling from test_image"}, {"id": "layer", "status": "Downloading"}]
+    mock_docker_client.api.pull.return_value = iter(test_items)
+
+    test_container_engine = container_engine.ContainerEngine()
+
+    # Run unit under test
+    actual_items = list(test_container_engine.iter_pull(test_image_to_pull))
+
+    # Check expectations
+    assert actual_items == test_items
+
+    mock_docker_client.api.pull.assert_called_once_with(test_image_to_pull, stream=True, 
+                                                        decode=True)
+
+@patch("docker.from_env")
+def test_iter_pull_error(mock_docker_from_env: MagicMock) -> None:
+    # Test setup
+    mock_docker_client = MagicMock()
+    mock_docker_from_env.return_value = mock_docker_client
+    test_error = "manifest unknown"
+    mock_docker_client.api.pull.return_value = iter([{"status": "Pulling"}, {"error": test_error}])
+
+    test_container_engine = container_engine.ContainerEngine()
+
+    # Run unit under test
+    with pytest.raises(container_engine.ContainerEngineError) as exported_exception_info:
+        list(test_container_engine.iter_pull("test_image:latest"))
+
+    # Check expectations
+    assert str(exported_exception_info.value) == "Container engine error: " + test_error
+
 @patch.object(container_engine.Core, "user_output")
 @patch("docker.from_env")
 def test_run(mock_from_env, mock_user_output):
@@ -320,4 +637,405 @@ def test_search(mock_from_env):
     mock_docker_client.images.search.assert_called_once_with(test_registry)
 
     expected_registry_image_list = ["repo1", "repo2"]
-    assert actual_registry_image_list == expected_registry_image_list
\ No newline at end of file
+    assert actual_registry_image_list == expected_registry_image_list
+@patch.dict("dem.core.container_engine.os.environ", {"DOCKER_HOST": "tcp://test_host:2375"})
+@patch("docker.from_env")
+def test_ContainerEngine_api_version_negotiated(mock_docker_from_env: MagicMock,
+                                               mock_DockerAPIVersionsJSON: MagicMock) -> None:
+    # Test setup
+    mock_docker_client = MagicMock()
+    mock_docker_client.api.api_version = "1.45"
+    mock_docker_from_env.return_value = mock_docker_client
+    test_api_versions = {}
+    mock_DockerAPIVersionsJSON.return_value.get_api_versions.return_value = test_api_versions
+
+    # Run unit under test
+    test_container_engine = container_engine.ContainerEngine()
+
+    # Check expectations
+    assert test_container_engine._docker_client is mock_docker_client
+    assert test_api_versions == {"tcp://test_host:2375": "1.45"}
+
+    mock_docker_from_env.assert_called_once_with()
+    mock_DockerAPIVersionsJSON.return_value.update.assert_called_once()
+    mock_DockerAPIVersionsJSON.return_value.flush.assert_called_once()
+
+@patch.dict("dem.core.container_engine.os.environ", {"DOCKER_HOST": "tcp://test_host:2375"})
+@patch("docker.from_env")
+def test_ContainerEngine_api_version_cached(mock_docker_from_env: MagicMock,
+                                           mock_DockerAPIVersionsJSON: MagicMock) -> None:
+    # Test setup
+    mock_DockerAPIVersionsJSON.return_value.get_api_versions.return_value = {
+        "tcp://test_host:2375": "1.45"
+    }
+
+    # Run unit under test
+    test_container_engine = container_engine.ContainerEngine()
+
+    # Check expectations
+    assert test_container_engine._docker_client is mock_docker_from_env.return_value
+
+    mock_docker_from_env.assert_called_once_with(version="1.45")
+    mock_DockerAPIVersionsJSON.return_value.flush.assert_not_called()
+
+@patch.dict("dem.core.container_engine.os.environ", {"DOCKER_HOST": "unix:///test/docker.sock"})
+@patch("docker.from_env")
+def test_ContainerEngine_api_version_rejected(mock_docker_from_env: MagicMock,
+                                             mock_DockerAPIVersionsJSON: MagicMock) -> None:
+    # Test setup
+    test_api_versions = {"unix:///test/docker.sock": "1.47"}
+    mock_DockerAPIVersionsJSON.return_value.get_api_versions.return_value = test_api_versions
+    mock_rejected_docker_client = MagicMock()
+    mock_rejected_docker_client.info.side_effect = container_engine.docker.errors.APIError(
+        "400 Client Error: Bad Request (\"client version 1.47 is too new. Maximum supported API "
+        "version is 1.43\")")
+    mock_docker_client = MagicMock()
+    mock_docker_client.api.api_version = "1.43"
+    mock_docker_client.info.return_value = {}
+    mock_docker_from_env.side_effect = [mock_rejected_docker_client, mock_docker_client]
+
+    test_container_engine = container_engine.ContainerEngine()
+
+    # Run unit under test
+    actual_free_space = test_container_engine.get_free_space()
+
+    # Check expectations
+    assert actual_free_space is None
+    assert test_container_engine._docker_client is mock_docker_client
+    assert test_api_versions == {"unix:///test/docker.sock": "1.43"}
+
+    mock_docker_from_env.assert_has_calls([call(version="1.47"), call()])
+    mock_DockerAPIVersionsJSON.return_value.flush.assert_called_once()
+
+@patch.dict("dem.core.container_engine.os.environ", {"DOCKER_HOST": ""})
+@patch("docker.from_env")
+def test_ContainerEngine_api_error_not_retried(mock_docker_from_env: MagicMock,
+                                              mock_DockerAPIVersionsJSON: MagicMock) -> None:
+    # Test setup
+    mock_DockerAPIVersionsJSON.return_value.get_api_versions.return_value = {"": "1.45"}
+    mock_docker_from_env.return_value.info.side_effect = container_engine.docker.errors.APIError(
+        "test_exception_text")
+
+    test_container_engine = container_engine.ContainerEngine()
+
+    # Run unit under test
+    with pytest.raises(container_engine.ContainerEngineError):
+        test_container_engine.get_free_space()
+
+    # Check expectations
+    mock_docker_from_env.assert_called_once_with(version="1.45")
+    mock_docker_from_env.return_value.info.assert_called_once()
+
+def test_ContainerEngine_daemon_not_reachable(mock_DockerAPIVersionsJSON: MagicMock, 
+                                             tmp_path) -> None:
+    # Test setup
+    test_docker_host = "unix://" + str(tmp_path / "docker.sock")
+    mock_DockerAPIVersionsJSON.return_value.get_api_versions.return_value = {
+        test_docker_host: "1.45"
+    }
+
+    with patch.dict("dem.core.container_engine.os.environ", {"DOCKER_HOST": test_docker_host}):
+        # The cached API version doesn't need the Docker Engine to create the client.
+        test_container_engine = container_engine.ContainerEngine()
+
+    # Run unit under test
+    with pytest.raises(container_engine.ContainerEngineError) as exported_exception_info:
+        test_container_engine.get_free_space()
+
+    # Check expectations
+    assert str(exported_exception_info.value).startswith("Container engine error: Error while "
+                                                         "connecting to the Docker Engine: ")
+    assert isinstance(exported_exception_info.value.__cause__, 
+                      container_engine.requests.exceptions.ConnectionError)
+
+@patch("docker.from_env")
+def test_iter_pull_daemon_not_reachable(mock_docker_from_env: MagicMock) -> None:
+    # Test setup
+    mock_docker_client = MagicMock()
+    mock_docker_from_env.return_value = mock_docker_client
+    mock_docker_client.api.pull.side_effect = container_engine.requests.exceptions.ConnectionError(
+        "test_exception_text")
+
+    test_container_engine = container_engine.ContainerEngine()
+
+    # Run unit under test
+    with pytest.raises(container_engine.ContainerEngineError) as exported_exception_info:
+        list(test_container_engine.iter_pull("test_repo"))
+
+    # Check expectations
+    assert str(exported_exception_info.value) == "Container engine error: Error while connecting " \
+                                                 "to the Docker Engine: test_exception_text"
+
+@patch("docker.from_env")
+def test_run_additional_volumes(mock_docker_from_env: MagicMock) -> None:
+    # Test setup
+    mock_docker_client = MagicMock()
+    mock_docker_from_env.return_value = mock_docker_client
+    test_volumes = ["dem_test_dev_env_cache_ccache:/root/.ccache"]
+
+    test_container_engine = container_engine.ContainerEngine()
+
+    # Run unit under test
+    test_container_engine.run(["-d", "-v", "/workspace:/workspace", "test_image:latest", "make"],
+                              test_volumes)
+
+    # Check expectations
+    mock_docker_client.containers.run.assert_called_once_with("test_image:latest", command="make",
+                                                              auto_remove=False, privileged=False,
+                                                              volumes=[
+                                                                  "dem_test_dev_env_cache_ccache:/root/.ccache",
+                                                                  "/workspace:/workspace",
+                                                              ],
+                                                              ports={}, name="", stderr=True,
+                                                              detach=True)
+    assert test_volumes == ["dem_test_dev_env_cache_ccache:/root/.ccache"]
+
+@patch("docker.from_env")
+def test_create_volume(mock_docker_from_env: MagicMock) -> None:
+    # Test setup
+    mock_docker_client = MagicMock()
+    mock_docker_from_env.return_value = mock_docker_client
+    mock_docker_client.api.inspect_volume.side_effect = container_engine.docker.errors.NotFound("not found")
+    test_labels = {"dem.dev_env": "test_dev_env"}
+
+    test_container_engine = container_engine.ContainerEngine()
+
+    # Run unit under test
+    test_container_engine.create_volume("test_volume", test_labels)
+
+    # Check expectations
+    mock_docker_client.api.inspect_volume.assert_called_once_with("test_volume")
+    mock_docker_client.api.create_volume.assert_called_once_with(name="test_volume", 
+                                                                 labels=test_labels)
+
+@patch("docker.from_env")
+def test_create_volume_existing(mock_docker_from_env: MagicMock) -> None:
+    # Test setup
+    mock_docker_client = MagicMock()
+    mock_docker_from_env.return_value = mock_docker_client
+
+    test_container_engine = container_engine.ContainerEngine()
+
+    # Run unit under test
+    test_container_engine.create_volume("test_volume", {})
+
+    # Check expectations
+    mock_docker_client.api.inspect_volume.assert_called_once_with("test_volume")
+    mock_docker_client.api.create_volume.assert_not_called()
+
+@patch("docker.from_env")
+def test_create_volume_APIError(mock_docker_from_env: MagicMock) -> None:
+    # Test setup
+    mock_docker_client = MagicMock()
+    mock_docker_from_env.return_value = mock_docker_client
+    mock_docker_client.api.inspect_volume.side_effect = container_engine.docker.errors.NotFound("not found")
+    test_error = "test_error"
+    mock_docker_client.api.create_volume.side_effect = container_engine.docker.errors.APIError(test_error)
+
+    test_container_engine = container_engine.ContainerEngine()
+
+    # Run unit under test
+    with pytest.raises(container_engine.ContainerEngineError) as exported_exception_info:
+        test_container_engine.create_volume("test_volume", {})
+
+    # Check expectations
+    assert str(exported_exception_info.value) == "Container engine error: " + test_error
+
+@patch("docker.from_env")
+def test_get_volume_sizes(mock_docker_from_env: MagicMock) -> None:
+    # Test setup
+    mock_docker_client = MagicMock()
+    mock_docker_from_env.return_value = mock_docker_client
+    # The URL is built from the attributes of the real API client.
+    mock_docker_client.api = container_engine.docker.APIClient(base_url="tcp://127.0.0.1:2375",
+                                                               version="1.43")
+    mock_response = MagicMock()
+    mock_response.json.return_value = {
+        "Volumes": [
+            {"Name": "test_volume_1", "UsageData": {"Size": 1000, "RefCount": 0}},
+            {"Name": "test_volume_2", "UsageData": {"Size": -1, "RefCount": 0}},
+            {"Name": "other_volume", "UsageData": {"Size": 2000, "RefCount": 1}},
+        ]
+    }
+
+    test_container_engine = container_engine.ContainerEngine()
+
+    # Run unit under test
+    with patch.object(mock_docker_client.api, "get", return_value=mock_response) as mock_get, \
+         patch.object(mock_docker_client.api, "df") as mock_df:
+        actual_volume_sizes = test_container_engine.get_volume_sizes(["test_volume_1", 
+                                                                      "test_volume_2", 
+                                                                      "test_volume_3"])
+
+    # Check expectations
+    assert actual_volume_sizes == {"test_volume_1": 1000}
+    mock_get.assert_called_once_with("http://127.0.0.1:2375/v1.43/system/df", 
+                                     params={"type": "volume"})
+    mock_response.raise_for_status.assert_called_once_with()
+    mock_df.assert_not_called()
+
+@patch("docker.from_env")
+def test_get_volume_sizes_api_error(mock_docker_from_env: MagicMock) -> None:
+    # Test setup
+    mock_docker_client = MagicMock()
+    mock_docker_from_env.return_value = mock_docker_client
+    mock_docker_client.api.api_version = "1.43"
+    test_response = container_engine.requests.Response()
+    test_response.status_code = 500
+    test_response._content = b'{"message": "test_error"}'
+    mock_docker_client.api.get.return_value = test_response
+
+    test_container_engine = container_engine.ContainerEngine()
+
+    # Run unit under test
+    with pytest.raises(container_engine.ContainerEngineError) as exported_exception_info:
+        test_container_engine.get_volume_sizes(["test_volume_1"])
+
+    # Check expectations
+    assert "test_error" in str(exported_exception_info.value)
+
+@patch("docker.from_env")
+def test_get_volume_sizes_old_api_version(mock_docker_from_env: MagicMock) -> None:
+    # Test setup
+    mock_docker_client = MagicMock()
+    mock_docker_from_env.return_value = mock_docker_client
+    mock_docker_client.api.api_version = "1.41"
+
+    test_container_engine = container_engine.ContainerEngine()
+
+    # Run unit under test
+    actual_volume_sizes = test_container_engine.get_volume_sizes(["test_volume_1"])
+
+    # Check expectations
+    # The disk usage of all the images and containers would be computed, so it's not queried.
+    assert actual_volume_sizes == {}
+    mock_docker_client.api.get.assert_not_called()
+    mock_docker_client.api.df.assert_not_called()
+
+@patch("docker.from_env")
+def test_get_running_container_labels(mock_docker_from_env: MagicMock) -> None:
+    # Test setup
+    mock_docker_client = MagicMock()
+    mock_docker_from_env.return_value = mock_docker_client
+    test_labels = {"dem.dev_env": "test_dev_env"}
+    test_containers = {
+        "running": {"State": {"Running": True}, "Config": {"Labels": test_labels}},
+        "stopped": {"State": {"Running": False}, "Config": {"Labels": test_labels}},
+    }
+    def inspect_container(name: str) -> dict:
+        if name not in test_containers:
+            raise container_engine.docker.errors.NotFound("not found")
+        return test_containers[name]
+    mock_docker_client.api.inspect_container.side_effect = inspect_container
+
+    test_container_engine = container_engine.ContainerEngine()
+
+    # Run unit under test and check expectations
+    assert test_container_engine.get_running_container_labels("running") == test_labels
+    assert test_container_engine.get_running_container_labels("stopped") is None
+    assert test_container_engine.get_running_container_labels("missing") is None
+
+@patch("docker.from_env")
+def test_start_warm_container(mock_docker_from_env: MagicMock) -> None:
+    # Test setup
+    mock_docker_client = MagicMock()
+    mock_docker_from_env.return_value = mock_docker_client
+    mock_docker_client.api.remove_container.side_effect = container_engine.docker.errors.NotFound("not found")
+    test_labels = {"dem.dev_env": "test_dev_env"}
+
+    test_container_engine = container_engine.ContainerEngine()
+
+    # Run unit under test
+    test_container_engine.start_warm_container("test_name", "test_image:latest", test_labels, 60,
+                                               ["/workspace:/workspace"], True, "/workspace")
+
+    # Check expectations
+    mock_docker_client.api.remove_container.assert_called_once_with("test_name", force=True)
+    mock_docker_client.containers.run.assert_called_once_with(
+        "test_image:latest", command=[container_engine.ContainerEngine._warm_container_script, "sh", "60"],
+        entrypoint=["sh", "-c"], name="test_name", labels=test_labels, 
+        volumes=["/workspace:/workspace"], privileged=True, working_dir="/workspace", 
+        auto_remove=True, detach=True)
+
+@patch("docker.from_env")
+def test_start_warm_container_error(mock_docker_from_env: MagicMock) -> None:
+    # Test setup
+    mock_docker_client = MagicMock()
+    mock_docker_from_env.return_value = mock_docker_client
+    test_exception_text = "test_exception_text"
+    mock_docker_client.containers.run.side_effect = container_engine.docker.errors.ImageNotFound(test_exception_text)
+
+    test_container_engine = container_engine.ContainerEngine()
+
+    # Run unit under test
+    with pytest.raises(container_engine.ContainerEngineError) as exported_exception_info:
+        test_container_engine.start_warm_container("test_name", "test_image:latest", {}, 60)
+
+    # Check expectations
+    assert str(exported_exception_info.value) == "Container engine error: " + test_exception_text
+
+@patch.object(container_engine.Core, "user_output")
+@patch("docker.from_env")
+def test_exec(mock_docker_from_env: MagicMock, mock_user_output: MagicMock) -> None:
+    # Test setup
+    mock_docker_client = MagicMock()
+    mock_docker_from_env.return_value = mock_docker_client
+    mock_docker_client.api.exec_create.return_value = {"Id": "test_exec_id"}
+    mock_docker_client.api.exec_start.return_value = iter([b"first li", b"ne\r\nsecond line\n", 
+                                                           b"no newline"])
+    mock_docker_client.api.exec_inspect.return_value = {"ExitCode": 2}
+
+    test_container_engine = container_engine.ContainerEngine()
+
+    # Run unit under test
+    actual_exit_code = test_container_engine.exec("test_name", ["make", "-j4"], "/workspace")
+
+    # Check expectations
+    assert actual_exit_code == 2
+
+    mock_docker_client.api.exec_create.assert_called_once_with(
+        "test_name", ["sh", "-c", container_engine.ContainerEngine._exec_script, "sh", "make", "-j4"],
+        workdir="/workspace")
+    mock_docker_client.api.exec_start.assert_called_once_with("test_exec_id", stream=True)
+    mock_user_output.msg.assert_has_calls([call("first line"), call("second line"), 
+                                           call("no newline")])
+    assert mock_user_output.msg.call_count == 3
+
+@patch("docker.from_env")
+def test_exec_APIError(mock_docker_from_env: MagicMock) -> None:
+    # Test setup
+    mock_docker_client = MagicMock()
+    mock_docker_from_env.return_value = mock_docker_client
+    test_exception_text = "test_exception_text"
+    mock_docker_client.api.exec_create.side_effect = container_engine.docker.errors.APIError(test_exception_text)
+
+    test_container_engine = container_engine.ContainerEngine()
+
+    # Run unit under test
+    with pytest.raises(container_engine.ContainerEngineError) as exported_exception_info:
+        test_container_engine.exec("test_name", ["make"])
+
+    # Check expectations
+    assert str(exported_exception_info.value) == "Container engine error: " + test_exception_text
+
+@patch("docker.from_env")
+def test_stop_containers(mock_docker_from_env: MagicMock) -> None:
+    # Test setup
+    mock_docker_client = MagicMock()
+    mock_docker_from_env.return_value = mock_docker_client
+    mock_docker_client.api.containers.return_value = [
+        {"Id": "test_id1", "Names": ["/test_name1"]},
+        {"Id": "test_id2", "Names": ["/test_name2"]},
+    ]
+
+    test_container_engine = container_engine.ContainerEngine()
+
+    # Run unit under test
+    actual_names = test_container_engine.stop_containers({"dem.dev_env": "test_dev_env"})
+
+    # Check expectations
+    assert actual_names == ["test_name1", "test_name2"]
+
+    mock_docker_client.api.containers.assert_called_once_with(filters={"label": ["dem.dev_env=test_dev_env"]})
+    mock_docker_client.api.stop.assert_has_calls([call("test_id1", timeout=10), 
+                                                  call("test_id2", timeout=10)])
@@ -5,7 +5,7 @@
 import dem.core.core as core
 
 # Test framework
-from unittest.mock import MagicMock, patch
+from unittest.mock import MagicMock, patch, call
 import pytest
 
 @pytest.fixture
@@ -28,4 +28,35 @@ def test_Core(tear_down_test) -> None:
     core.Core.set_user_output(mock_user_output)
 
     # Check expectations
-    assert test_core.user_output is mock_user_output
\ No newline at end of file
+    assert test_core.user_output is mock_user_output
+
+@patch.object(core.Core, "_http_session", None)
+@patch.object(core.Core, "config_file")
+@patch("dem.core.core.requests.Session")
+@patch("dem.core.core.HTTPAdapter")
+def test_Core_http_session(mock_HTTPAdapter: MagicMock, mock_Session: MagicMock, 
+                           mock_config_file: MagicMock) -> None:
+    # Test setup
+    mock_config_file.http_pool_size = 16
+    mock_http_adapter = MagicMock()
+    mock_HTTPAdapter.return_value = mock_http_adapter
+    mock_session = MagicMock()
+    mock_Session.return_value = mock_session
+
+    test_core = core.Core()
+    other_test_core = core.Core()
+
+    # Run unit under test
+    actual_http_session = test_core.http_session
+    other_actual_http_session = other_test_core.http_session
+
+    # Check expectations
+    assert actual_http_session is mock_session
+    assert other_actual_http_session is mock_session
+
+    mock_HTTPAdapter.assert_called_once_with(pool_maxsize=mock_config_file.http_pool_size)
+    mock_Session.assert_called_once()
+    mock_session.mount.assert_has_calls([
+        call("http://", mock_http_adapter),
+        call("https://", mock_http_adapter),
+    ])
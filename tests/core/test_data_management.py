@@ -193,7 +193,19 @@ def test_ConfigFile(mock_PurePath: MagicMock):
         }
     ],
     "hosts": [],
-    "http_request_timeout_s": 2
+    "http_request_timeout_s": 2,
+    "max_workers": 8,
+    "registry_cache_ttl_s": 3600,
+    "http_pool_size": 10,
+    "http_rate_limit_per_s": 10,
+    "http_max_retries": 5,
+    "circuit_breaker_threshold": 3,
+    "circuit_breaker_cooldown_s": 300,
+    "registry_crawl_deadline_s": 120,
+    "registry_token_cache_on_disk": false,
+    "registry_cache_max_staleness_s": 86400,
+    "pull_max_workers": 4,
+    "warm_container_idle_timeout_s": 1800
 }"""
 
     mock_PurePath.assert_called_once_with(test_path + "/config.json")
@@ -206,11 +218,35 @@ def test_ConfigFile_update(mock_update: MagicMock) -> None:
     test_catalog = MagicMock()
     test_host = MagicMock()
     test_http_request_timeout_s = 2
+    test_max_workers = 16
+    test_registry_cache_ttl_s = 60
+    test_http_pool_size = 32
+    test_http_rate_limit_per_s = 2.5
+    test_http_max_retries = 3
+    test_circuit_breaker_threshold = 5
+    test_circuit_breaker_cooldown_s = 60
+    test_registry_crawl_deadline_s = 30
+    test_registry_token_cache_on_disk = True
+    test_registry_cache_max_staleness_s = 600
+    test_pull_max_workers = 2
+    test_warm_container_idle_timeout_s = 60
     test_config_file.deserialized = {
         "registries": [test_registry],
         "catalogs": [test_catalog],
         "hosts": [test_host],
-        "http_request_timeout_s": test_http_request_timeout_s
+        "http_request_timeout_s": test_http_request_timeout_s,
+        "max_workers": test_max_workers,
+        "registry_cache_ttl_s": test_registry_cache_ttl_s,
+        "http_pool_size": test_http_pool_size,
+        "http_rate_limit_per_s": test_http_rate_limit_per_s,
+        "http_max_retries": test_http_max_retries,
+        "circuit_breaker_threshold": test_circuit_breaker_threshold,
+        "circuit_breaker_cooldown_s": test_circuit_breaker_cooldown_s,
+        "registry_crawl_deadline_s": test_registry_crawl_deadline_s,
+        "registry_token_cache_on_disk": test_registry_token_cache_on_disk,
+        "registry_cache_max_staleness_s": test_registry_cache_max_staleness_s,
+        "pull_max_workers": test_pull_max_workers,
+        "warm_container_idle_timeout_s": test_warm_container_idle_timeout_s
     }
 
     # Run unit under test
@@ -221,6 +257,45 @@ def test_ConfigFile_update(mock_update: MagicMock) -> None:
     assert test_catalog in test_config_file.catalogs
     assert test_host in test_config_file.hosts
     assert test_config_file.http_request_timeout_s == test_http_request_timeout_s
+    assert test_config_file.max_workers == test_max_workers
+    assert test_config_file.registry_cache_ttl_s == test_registry_cache_ttl_s
+    assert test_config_file.http_pool_size == test_http_pool_size
+    assert test_config_file.http_rate_limit_per_s == test_http_rate_limit_per_s
+    assert test_config_file.http_max_retries == test_http_max_retries
+    assert test_config_file.circuit_breaker_threshold == test_circuit_breaker_threshold
+    assert test_config_file.circuit_breaker_cooldown_s == test_circuit_breaker_cooldown_s
+    assert test_config_file.registry_crawl_deadline_s == test_registry_crawl_deadline_s
+    assert test_config_file.registry_token_cache_on_disk == test_registry_token_cache_on_disk
+    assert test_config_file.registry_cache_max_staleness_s == test_registry_cache_max_staleness_s
+    assert test_config_file.pull_max_workers == test_pull_max_workers
+    assert test_config_file.warm_container_idle_timeout_s == test_warm_container_idle_timeout_s
+
+    mock_update.assert_called_once()
+
+@patch.object(data_management.BaseJSON, "update")
+def test_ConfigFile_update_default_max_workers(mock_update: MagicMock) -> None:
+    # Test setup
+    test_config_file = data_management.ConfigFile()
+    test_config_file.deserialized = {
+        "http_request_timeout_s": 2
+    }
+
+    # Run unit under test
+    test_config_file.update()
+
+    # Check expectations
+    assert test_config_file.max_workers == data_management.ConfigFile._default_max_workers
+    assert test_config_file.registry_cache_ttl_s == data_management.ConfigFile._default_registry_cache_ttl_s
+    assert test_config_file.http_pool_size == data_management.ConfigFile._default_http_pool_size
+    assert test_config_file.http_rate_limit_per_s == data_management.ConfigFile._default_http_rate_limit_per_s
+    assert test_config_file.http_max_retries == data_management.ConfigFile._default_http_max_retries
+    assert test_config_file.circuit_breaker_threshold == data_management.ConfigFile._default_circuit_breaker_threshold
+    assert test_config_file.circuit_breaker_cooldown_s == data_management.ConfigFile._default_circuit_breaker_cooldown_s
+    assert test_config_file.registry_crawl_deadline_s == data_management.ConfigFile._default_registry_crawl_deadline_s
+    assert test_config_file.registry_token_cache_on_disk == data_management.ConfigFile._default_registry_token_cache_on_disk
+    assert test_config_file.registry_cache_max_staleness_s == data_management.ConfigFile._default_registry_cache_max_staleness_s
+    assert test_config_file.pull_max_workers == data_management.ConfigFile._default_pull_max_workers
+    assert test_config_file.warm_container_idle_timeout_s == data_management.ConfigFile._default_warm_container_idle_timeout_s
 
     mock_update.assert_called_once()
 
@@ -259,4 +334,257 @@ def test_ConfigFile_update_JSONDecodeError(mock_update: MagicMock) -> None:
     # Check expectations
     assert "Invalid file: The config.json file is corrupted.\ntest_msg: line 1 column 1 (char 0)" == str(e.value)
 
-    mock_update.assert_called_once()
\ No newline at end of file
+    mock_update.assert_called_once()
+
+@patch("dem.core.data_management.PurePath")
+def test_RegistryCacheJSON(mock_PurePath: MagicMock):
+    # Test setup
+    mock_pure_path = MagicMock()
+    mock_PurePath.return_value = mock_pure_path
+
+    test_path = "test_path"
+    data_management.BaseJSON._config_dir = test_path
+
+    # Run unit under test
+    test_registry_cache_json = data_management.RegistryCacheJSON()
+
+    # Check expectations
+    assert test_registry_cache_json._path is mock_pure_path
+    assert test_registry_cache_json._default_json == """{
+    "version": "0.1",
+    "registries": {},
+    "repo_listings": {},
+    "circuit_breakers": {},
+    "bearer_tokens": {}
+}
+"""
+
+    mock_PurePath.assert_called_once_with(test_path + "/registry_cache.json")
+
+@patch("dem.core.data_management.PurePath")
+def test_LocalImageIndexJSON(mock_PurePath: MagicMock):
+    # Test setup
+    mock_pure_path = MagicMock()
+    mock_PurePath.return_value = mock_pure_path
+
+    test_path = "test_path"
+    data_management.BaseJSON._config_dir = test_path
+
+    # Run unit under test
+    test_local_image_index_json = data_management.LocalImageIndexJSON()
+
+    # Check expectations
+    assert test_local_image_index_json._path is mock_pure_path
+    assert test_local_image_index_json._default_json == """{
+    "version": "0.2",
+    "daemons": {}
+}
+"""
+
+    mock_PurePath.assert_called_once_with(test_path + "/local_image_index.json")
+
+@patch.object(data_management.LocalImageIndexJSON, "restore")
+@patch.object(data_management.CacheJSON, "update")
+def test_LocalImageIndexJSON_update_old_version(mock_update: MagicMock, 
+                                                mock_restore: MagicMock) -> None:
+    # Test setup
+    test_local_image_index_json = data_management.LocalImageIndexJSON()
+    def update() -> None:
+        test_local_image_index_json.deserialized = {"version": "0.1", "last_event_time": 1000, 
+                                                    "images": {}}
+    mock_update.side_effect = update
+
+    # Run unit under test
+    test_local_image_index_json.update()
+
+    # Check expectations
+    mock_update.assert_called_once()
+    mock_restore.assert_called_once()
+
+def test_LocalImageIndexJSON_get_daemon_index() -> None:
+    # Test setup
+    test_local_image_index_json = data_management.LocalImageIndexJSON()
+    test_local_image_index_json.deserialized = {"version": "0.2"}
+
+    # Run unit under test
+    actual_daemon_index = test_local_image_index_json.get_daemon_index("test_host", "test_id")
+    actual_daemon_index["images"] = {}
+    actual_other_daemon_index = test_local_image_index_json.get_daemon_index("test_host", 
+                                                                             "other_id")
+
+    # Check expectations
+    assert actual_other_daemon_index["images"] is None
+    assert test_local_image_index_json.deserialized["daemons"] == {
+        "test_host": {
+            "test_id": {
+                "images": {},
+                "last_event": None,
+                "last_sync_time": None,
+                "image_count": None,
+                "image_layers": {},
+            },
+            "other_id": {
+                "images": None,
+                "last_event": None,
+                "last_sync_time": None,
+                "image_count": None,
+                "image_layers": {},
+            },
+        }
+    }
+
+@patch("dem.core.data_management.PurePath")
+def test_DockerAPIVersionsJSON(mock_PurePath: MagicMock):
+    # Test setup
+    mock_pure_path = MagicMock()
+    mock_PurePath.return_value = mock_pure_path
+
+    test_path = "test_path"
+    data_management.BaseJSON._config_dir = test_path
+
+    # Run unit under test
+    test_docker_api_versions_json = data_management.DockerAPIVersionsJSON()
+
+    # Check expectations
+    assert test_docker_api_versions_json._path is mock_pure_path
+    assert test_docker_api_versions_json._default_json == """{
+    "version": "0.1",
+    "api_versions": {}
+}
+"""
+
+    mock_PurePath.assert_called_once_with(test_path + "/docker_api_versions.json")
+
+def test_DockerAPIVersionsJSON_get_api_versions() -> None:
+    # Test setup
+    test_docker_api_versions_json = data_management.DockerAPIVersionsJSON()
+    test_docker_api_versions_json.deserialized = {"version": "0.1"}
+
+    # Run unit under test
+    actual_api_versions = test_docker_api_versions_json.get_api_versions()
+    actual_api_versions["test_host"] = "1.45"
+
+    # Check expectations
+    assert test_docker_api_versions_json.deserialized["api_versions"] == {"test_host": "1.45"}
+
+@patch.object(data_management.BaseJSON, "restore")
+@patch.object(data_management.BaseJSON, "update")
+def test_RegistryCacheJSON_update_JSONDecodeError(mock_update: MagicMock, 
+                                                  mock_restore: MagicMock) -> None:
+    # Test setup
+    test_registry_cache_json = data_management.RegistryCacheJSON()
+    mock_update.side_effect = json.decoder.JSONDecodeError("test_msg", "test_doc", 0)
+
+    # Run unit under test
+    test_registry_cache_json.update()
+
+    # Check expectations
+    mock_update.assert_called_once()
+    mock_restore.assert_called_once()
+
+@patch("dem.core.data_management.os.getpid")
+@patch("dem.core.data_management.os.replace")
+@patch("dem.core.data_management.open")
+@patch("dem.core.data_management.json.dump")
+def test_RegistryCacheJSON_flush(mock_json_dump: MagicMock, mock_open: MagicMock, 
+                                 mock_replace: MagicMock, mock_getpid: MagicMock) -> None:
+    # Test setup
+    mock_opened_file = MagicMock()
+    mock_open.return_value.__enter__.return_value = mock_opened_file
+    mock_getpid.return_value = 1234
+    fake_json_deserialized = MagicMock()
+
+    test_registry_cache_json = data_management.RegistryCacheJSON()
+    test_registry_cache_json.deserialized = fake_json_deserialized
+    test_tmp_path = str(test_registry_cache_json._path) + ".1234.tmp"
+
+    # Run unit under test
+    test_registry_cache_json.flush()
+
+    # Check expectations
+    mock_open.assert_called_once_with(test_tmp_path, "w")
+    mock_json_dump.assert_called_once_with(fake_json_deserialized, mock_opened_file, indent=4)
+    mock_replace.assert_called_once_with(test_tmp_path, test_registry_cache_json._path)
+
+def test_RegistryCacheJSON_get_registry_cache() -> None:
+    # Test setup
+    test_registry_cache_json = data_management.RegistryCacheJSON()
+    test_registry_url = "test_registry_url"
+    test_entries = {
+        "test_repo": {
+            "tags": ["latest"]
+        }
+    }
+    test_registry_cache_json.deserialized = {
+        "registries": {
+            test_registry_url: test_entries
+        }
+    }
+
+    # Run unit under test
+    actual_entries = test_registry_cache_json.get_registry_cache(test_registry_url)
+    actual_new_entries = test_registry_cache_json.get_registry_cache("new_registry_url")
+
+    # Check expectations
+    assert actual_entries is test_entries
+    assert actual_new_entries == {}
+    assert test_registry_cache_json.deserialized["registries"]["new_registry_url"] is actual_new_entries
+
+def test_RegistryCacheJSON_get_repo_listing() -> None:
+    # Test setup
+    test_registry_cache_json = data_management.RegistryCacheJSON()
+    test_registry_url = "test_registry_url"
+    test_listing = {
+        "repos": ["test_repo"],
+        "repo_versions": {},
+        "timestamp": 1000.0
+    }
+    test_registry_cache_json.deserialized = {
+        "repo_listings": {
+            test_registry_url: test_listing
+        }
+    }
+
+    # Run unit under test
+    actual_listing = test_registry_cache_json.get_repo_listing(test_registry_url)
+    actual_new_listing = test_registry_cache_json.get_repo_listing("new_registry_url")
+
+    # Check expectations
+    assert actual_listing is test_listing
+    assert actual_new_listing == {}
+    assert test_registry_cache_json.deserialized["repo_listings"]["new_registry_url"] is actual_new_listing
+
+def test_RegistryCacheJSON_get_circuit_breaker() -> None:
+    # Test setup
+    test_registry_cache_json = data_management.RegistryCacheJSON()
+    test_registry_url = "test_registry_url"
+    test_state = {
+        "failures": 3,
+        "opened_at": 1000.0
+    }
+    test_registry_cache_json.deserialized = {
+        "circuit_breakers": {
+            test_registry_url: test_state
+        }
+    }
+
+    # Run unit under test
+    actual_state = test_registry_cache_json.get_circuit_breaker(test_registry_url)
+    actual_new_state = test_registry_cache_json.get_circuit_breaker("new_registry_url")
+
+    # Check expectations
+    assert actual_state is test_state
+    assert actual_new_state == {"failures": 0, "opened_at": 0.0}
+    assert test_registry_cache_json.deserialized["circuit_breakers"]["new_registry_url"] is actual_new_state
+
+def test_RegistryCacheJSON_get_bearer_tokens() -> None:
+    # Test setup
+    test_registry_cache_json = data_management.RegistryCacheJSON()
+    test_registry_cache_json.deserialized = {}
+
+    # Run unit under test
+    actual_tokens = test_registry_cache_json.get_bearer_tokens()
+
+    # Check expectations
+    assert actual_tokens == {}
+    assert test_registry_cache_json.deserialized["bearer_tokens"] is actual_tokens
@@ -24,6 +24,7 @@ def test_DevEnv() -> None:
     # Check expectations
     assert test_dev_env.name is test_descriptor["name"]
     assert test_dev_env.tool_image_descriptors is test_descriptor["tools"]
+    assert test_dev_env.cache_volume_descriptors == []
 
 @patch("dem.core.dev_env.json.load")
 @patch("dem.core.dev_env.open")
@@ -232,6 +233,32 @@ def test_DevEnv_get_deserialized_is_installed_true() -> None:
     # Check expectations
     assert test_descriptor == actual_deserialized_dev_env
 
+def test_DevEnv_get_deserialized_cache_volumes() -> None:
+    # Test setup
+    test_descriptor: dict[str, Any] = {
+        "name": "test_name",
+        "tools": [
+            {
+                "image_name": "test_image_name1",
+                "image_version": "test_image_tag1"
+            },
+        ],
+        "cache_volumes": [
+            {
+                "name": "ccache",
+                "path": "/root/.ccache"
+            },
+        ]
+    }
+    test_dev_env = dev_env.DevEnv(test_descriptor)
+
+    # Run unit under test
+    actual_deserialized_dev_env: dict[str, Any] = test_dev_env.get_deserialized(True)
+
+    # Check expectations
+    assert test_dev_env.cache_volume_descriptors is test_descriptor["cache_volumes"]
+    assert test_descriptor == actual_deserialized_dev_env
+
 def test_DevEnv_get_deserialized_is_installed_false() -> None:
     # Test setup
     test_descriptor: dict[str, Any] = {
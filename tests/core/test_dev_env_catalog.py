@@ -10,14 +10,14 @@ import pytest
 
 @patch.object(dev_env_catalog.Core, "config_file")
 @patch("dem.core.dev_env_catalog.DevEnv")
-@patch("dem.core.dev_env_catalog.requests")
-def test_DevEnvCatalog_request_dev_envs(mock_requests: MagicMock, mock_DevEnv: MagicMock, 
+@patch.object(dev_env_catalog.Core, "_http_session")
+def test_DevEnvCatalog_request_dev_envs(mock_http_session: MagicMock, mock_DevEnv: MagicMock, 
                        mock_config_file: MagicMock) -> None:
     # Test setup
     mock_response = MagicMock()
     mock_response.status_code = dev_env_catalog.requests.codes.ok
 
-    mock_requests.get.return_value = mock_response
+    mock_http_session.get.return_value = mock_response
     test_dev_env_descriptors = [MagicMock()] * 5
     mock_json = {
         "development_environments": test_dev_env_descriptors
@@ -44,19 +44,19 @@ def test_DevEnvCatalog_request_dev_envs(mock_requests: MagicMock, mock_DevEnv: M
     # Check expectations
     assert test_dev_env_catalog.dev_envs == test_dev_envs
 
-    mock_requests.get.assert_called_once_with(test_url, timeout=test_http_request_timeout_s)
+    mock_http_session.get.assert_called_once_with(test_url, timeout=test_http_request_timeout_s)
     mock_response.json.assert_called_once()
 
     calls = [call(descriptor=test_dev_env_descriptor) for test_dev_env_descriptor in test_dev_env_descriptors]
     mock_DevEnv.assert_has_calls(calls)
 
 @patch.object(dev_env_catalog.Core, "config_file")
-@patch("dem.core.dev_env_catalog.requests")
-def test_DevEnvCatalog_request_dev_envs_exception_from_get(mock_requests: MagicMock, 
+@patch.object(dev_env_catalog.Core, "_http_session")
+def test_DevEnvCatalog_request_dev_envs_exception_from_get(mock_http_session: MagicMock, 
                                                            mock_config_file: MagicMock) -> None:
     # Test setup
     test_exception_text = "test_exception_text"
-    mock_requests.get.side_effect = Exception(test_exception_text)
+    mock_http_session.get.side_effect = Exception(test_exception_text)
 
     test_catalog_config = {
         "url": "test_url",
@@ -75,17 +75,17 @@ def test_DevEnvCatalog_request_dev_envs_exception_from_get(mock_requests: MagicM
     # Check expectations
     assert str(e.value) == f"Catalog error: Error in communication with the [bold]{test_catalog_config['name']}[/bold] Development Environment Catalog.\n{test_exception_text}"
 
-    mock_requests.get.assert_called_once_with(test_catalog_config["url"], 
+    mock_http_session.get.assert_called_once_with(test_catalog_config["url"], 
                                               timeout=test_http_request_timeout_s)
 
 @patch.object(dev_env_catalog.Core, "config_file")
-@patch("dem.core.dev_env_catalog.requests")
-def test_DevEnvCatalog_request_dev_envs_status_code_not_ok(mock_requests: MagicMock, 
+@patch.object(dev_env_catalog.Core, "_http_session")
+def test_DevEnvCatalog_request_dev_envs_status_code_not_ok(mock_http_session: MagicMock, 
                                                            mock_config_file: MagicMock) -> None:
     # Test setup
     mock_deser_json_response = MagicMock()
     mock_deser_json_response.status_code = dev_env_catalog.requests.codes.not_found
-    mock_requests.get.return_value = mock_deser_json_response
+    mock_http_session.get.return_value = mock_deser_json_response
 
     test_catalog_config = {
         "url": "test_url",
@@ -107,19 +107,19 @@ def test_DevEnvCatalog_request_dev_envs_status_code_not_ok(mock_requests: MagicM
                                   "\nResponse status code: " + str(mock_deser_json_response.status_code) + 
                                   "\nDoes the URL point to a valid Development Environment Catalog?\n")
 
-    mock_requests.get.assert_called_once_with(test_catalog_config["url"], 
+    mock_http_session.get.assert_called_once_with(test_catalog_config["url"], 
                                               timeout=test_http_request_timeout_s)
 
 @patch.object(dev_env_catalog.Core, "config_file")
 @patch("dem.core.dev_env_catalog.DevEnv")
-@patch("dem.core.dev_env_catalog.requests")
-def test_DevEnvCatalog_request_dev_envs_corrupted_dev_env(mock_requests: MagicMock, 
+@patch.object(dev_env_catalog.Core, "_http_session")
+def test_DevEnvCatalog_request_dev_envs_corrupted_dev_env(mock_http_session: MagicMock, 
                                                           mock_DevEnv: MagicMock, 
                                                           mock_config_file: MagicMock) -> None:
     # Test setup
     mock_deser_json_response = MagicMock()
     mock_deser_json_response.status_code = dev_env_catalog.requests.codes.ok
-    mock_requests.get.return_value = mock_deser_json_response
+    mock_http_session.get.return_value = mock_deser_json_response
 
     mock_dev_env_descriptor = MagicMock()
     mock_deser_json_response.json.return_value = {
@@ -146,7 +146,7 @@ def test_DevEnvCatalog_request_dev_envs_corrupted_dev_env(mock_requests: MagicMo
     # Check expectations
     assert str(e.value) == (f"Catalog error: The {test_catalog_config['name']} Development Environment Catalog is corrupted.\n{test_exception_text}")
 
-    mock_requests.get.assert_called_once_with(test_catalog_config["url"], 
+    mock_http_session.get.assert_called_once_with(test_catalog_config["url"], 
                                               timeout=test_http_request_timeout_s)
     mock_deser_json_response.json.assert_called_once()
     mock_DevEnv.assert_called_once_with(descriptor=mock_dev_env_descriptor)
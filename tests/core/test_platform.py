@@ -10,6 +10,7 @@ from unittest.mock import patch, MagicMock, call
 
 from dem.core.exceptions import DataStorageError
 from typing import Any
+import requests
 
 @patch("dem.core.platform.DevEnv")
 @patch("dem.core.platform.LocalDevEnvJSON")
@@ -78,6 +79,47 @@ def test_assign_tool_image_instances_to_all_dev_envs() -> None:
     # Check expectations
     mock_dev_env.assign_tool_image_instances.assert_called_once_with(mock_tool_images)
 
+@patch("dem.core.platform.ToolImages")
+@patch.object(platform.Platform, "__init__")
+def test_Platform_resolve_tool_image_instances(mock___init__: MagicMock, 
+                                               mock_ToolImages: MagicMock) -> None:
+    # Test setup
+    mock___init__.return_value = None
+
+    mock_container_engine = MagicMock()
+    mock_registries = MagicMock()
+
+    test_platform = platform.Platform()
+    test_platform._container_engine = mock_container_engine
+    test_platform._registries = mock_registries
+    test_platform._tool_images = None
+
+    mock_tool_images = MagicMock()
+    mock_ToolImages.return_value = mock_tool_images
+    mock_dev_env = MagicMock()
+    mock_dev_env.tool_image_descriptors = [
+        {
+            "image_name": "test_image_name1",
+            "image_version": "test_image_version1"
+        },
+        {
+            "image_name": "test_image_name2",
+            "image_version": "test_image_version2"
+        },
+    ]
+
+    # Run unit under test
+    test_platform.resolve_tool_image_instances(mock_dev_env, True)
+
+    # Check expectations
+    assert test_platform._tool_images is mock_tool_images
+
+    mock_ToolImages.assert_called_once_with(mock_container_engine, mock_registries)
+    mock_tool_images.update.assert_not_called()
+    mock_tool_images.resolve.assert_called_once_with(["test_image_name1:test_image_version1",
+                                                      "test_image_name2:test_image_version2"], True)
+    mock_dev_env.assign_tool_image_instances.assert_called_once_with(mock_tool_images)
+
 @patch("dem.core.platform.ToolImages")
 @patch.object(platform.Platform, "__init__")
 def test_Platform_tool_images(mock___init__: MagicMock, mock_ToolImages: MagicMock) -> None:
@@ -93,6 +135,14 @@ def test_Platform_tool_images(mock___init__: MagicMock, mock_ToolImages: MagicMo
     test_platform._tool_images = None
     test_platform.disable_tool_update = False
     test_platform.local_only = False
+    test_platform.refresh_registries = True
+    test_platform.incremental_registry_refresh = False
+    mock_dev_env1 = MagicMock()
+    mock_dev_env1.tool_image_descriptors = [{"image_name": "axem/repo1", "image_version": "latest"},
+                                            {"image_name": "axem/repo2", "image_version": "latest"}]
+    mock_dev_env2 = MagicMock()
+    mock_dev_env2.tool_image_descriptors = [{"image_name": "axem/repo2", "image_version": "v1"}]
+    test_platform.local_dev_envs = [mock_dev_env1, mock_dev_env2]
 
     mock_tool_images = MagicMock()
     mock_ToolImages.return_value = mock_tool_images
@@ -106,7 +156,10 @@ def test_Platform_tool_images(mock___init__: MagicMock, mock_ToolImages: MagicMo
 
     mock___init__.assert_called_once()
     mock_ToolImages.assert_called_once_with(mock_container_engine, mock_registries)
-    mock_tool_images.update.assert_called_once_with(local_only=test_platform.local_only)
+    mock_tool_images.update.assert_called_once_with(local_only=test_platform.local_only, 
+                                                    refresh=test_platform.refresh_registries,
+                                                    incremental=test_platform.incremental_registry_refresh,
+                                                    priority_repos=["axem/repo1", "axem/repo2"])
 
 @patch("dem.core.platform.ContainerEngine")
 @patch.object(platform.Platform, "__init__")
@@ -280,15 +333,21 @@ def test_Platform_get_dev_env_by_name_no_match(mock___init__: MagicMock) -> None
 
     mock___init__.assert_called_once()
 
+@patch.object(platform.Platform, "registries")
+@patch.object(platform.Platform, "config_file")
 @patch.object(platform.Platform, "flush_descriptors")
 @patch.object(platform.Platform, "container_engine")
 @patch.object(platform.Platform, "user_output")
 @patch.object(platform.Platform, "__init__")
 def test_Platform_install_dev_env_succes(mock___init__: MagicMock, mock_user_input: MagicMock, 
                                          mock_container_engine: MagicMock, 
-                                         mock_flush_descriptors: MagicMock) -> None:
+                                         mock_flush_descriptors: MagicMock,
+                                         mock_config_file: MagicMock, mock_registries: MagicMock) -> None:
     # Test setup
     mock___init__.return_value = None
+    mock_registries.get_tool_image_layers.return_value = {}
+    mock_container_engine.get_free_space.return_value = None
+    mock_config_file.pull_max_workers = 2
 
     mock_dev_env = MagicMock()    
     mock_tool_image0 = MagicMock()
@@ -306,7 +365,13 @@ def test_Platform_install_dev_env_succes(mock___init__: MagicMock, mock_user_inp
     mock_dev_env.tool_images = [mock_tool_image0, mock_tool_image1, 
                                  mock_tool_image2, mock_tool_image3]
 
+    mock_container_engine.iter_pull.side_effect = lambda tool_image_name: iter([{"id": tool_image_name, 
+                                                                               "status": "Pulled"}])
+    actual_progress_items = []
+    mock_user_input.progress_generator.side_effect = lambda generator: actual_progress_items.extend(generator)
+
     test_platform = platform.Platform()
+    test_platform.local_dev_envs = []
 
     # Run unit under test
     test_platform.install_dev_env(mock_dev_env)
@@ -316,34 +381,58 @@ def test_Platform_install_dev_env_succes(mock___init__: MagicMock, mock_user_inp
 
     expected_registry_only_tool_images: list[str] = ["test_image_name1:test_image_version1", 
                                                      "test_image_name2:test_image_version2"]
-    mock_user_input.msg.assert_has_calls([
-        call(f"\nPulling image {expected_registry_only_tool_images[0]}", is_title=True),
-        call(f"\nPulling image {expected_registry_only_tool_images[1]}", is_title=True)
-    ])
-    mock_container_engine.pull.assert_has_calls([
+    # The progress of the pulls is shown together.
+    mock_user_input.msg.assert_called_once_with("\nPulling the tool images", is_title=True)
+    mock_user_input.progress_generator.assert_called_once()
+    assert len(actual_progress_items) == 2
+    for expected_tool_image in expected_registry_only_tool_images:
+        assert {"id": expected_tool_image, "status": "Pulled", 
+                "image": expected_tool_image} in actual_progress_items
+
+    mock_container_engine.iter_pull.assert_has_calls([
         call(expected_registry_only_tool_images[0]),
         call(expected_registry_only_tool_images[1])
-    ])
+    ], any_order=True)
+    mock_container_engine.pull.assert_not_called()
+    assert mock_dev_env.is_installed is True
     mock_flush_descriptors.assert_called_once()
 
+@patch.object(platform.Platform, "registries")
+@patch.object(platform.Platform, "config_file")
+@patch.object(platform.Platform, "flush_descriptors")
 @patch.object(platform.Platform, "container_engine")
 @patch.object(platform.Platform, "user_output")
 @patch.object(platform.Platform, "__init__")
 def test_Platform_install_dev_env_pull_failure(mock___init__: MagicMock, mock_user_output: MagicMock,
-                                               mock_container_engine: MagicMock) -> None:
+                                               mock_container_engine: MagicMock, 
+                                               mock_flush_descriptors: MagicMock,
+                                               mock_config_file: MagicMock, mock_registries: MagicMock) -> None:
     # Test setup
     mock___init__.return_value = None
+    mock_registries.get_tool_image_layers.return_value = {}
+    mock_container_engine.get_free_space.return_value = None
+    # A single worker, so the first pull finishes before the second one starts.
+    mock_config_file.pull_max_workers = 1
 
     mock_dev_env = MagicMock()
-    mock_tool_image = MagicMock()
-    mock_tool_image.name = "test_image_name1:test_image_version1"
-    mock_tool_image.availability = platform.ToolImage.REGISTRY_ONLY
-    mock_dev_env.tool_images = [mock_tool_image]
+    mock_tool_image1 = MagicMock()
+    mock_tool_image1.name = "test_image_name1:test_image_version1"
+    mock_tool_image1.availability = platform.ToolImage.REGISTRY_ONLY
+    mock_tool_image2 = MagicMock()
+    mock_tool_image2.name = "test_image_name2:test_image_version2"
+    mock_tool_image2.availability = platform.ToolImage.REGISTRY_ONLY
+    mock_dev_env.tool_images = [mock_tool_image1, mock_tool_image2]
 
     test_exception_text = "test_exception_text"
-    mock_container_engine.pull.side_effect = platform.ContainerEngineError(test_exception_text)
+    def iter_pull(tool_image_name: str):
+        yield {"id": tool_image_name, "status": "Downloading"}
+        if tool_image_name == mock_tool_image2.name:
+            raise platform.ContainerEngineError(test_exception_text)
+    mock_container_engine.iter_pull.side_effect = iter_pull
+    mock_user_output.progress_generator.side_effect = lambda generator: list(generator)
 
     test_platform = platform.Platform()
+    test_platform.local_dev_envs = []
 
     # Run unit under test
     with pytest.raises(platform.PlatformError) as exported_exception_info:
@@ -355,10 +444,351 @@ def test_Platform_install_dev_env_pull_failure(mock___init__: MagicMock, mock_us
 
     mock___init__.assert_called_once()
 
-    expected_registry_only_tool_image = "test_image_name1:test_image_version1"
-    mock_user_output.msg.assert_called_once_with(f"\nPulling image {expected_registry_only_tool_image}", 
-                                                 is_title=True)
-    mock_container_engine.pull.assert_called_once_with(expected_registry_only_tool_image)
+    mock_user_output.msg.assert_has_calls([
+        call("\nPulling the tool images", is_title=True),
+        call("The successfully pulled images: " + mock_tool_image1.name)
+    ])
+    mock_container_engine.iter_pull.assert_has_calls([call(mock_tool_image1.name), 
+                                                      call(mock_tool_image2.name)])
+    mock_flush_descriptors.assert_not_called()
+
+@patch.object(platform.Platform, "registries")
+@patch.object(platform.Platform, "container_engine")
+@patch.object(platform.Platform, "__init__")
+def test_Platform_get_install_plan(mock___init__: MagicMock, mock_container_engine: MagicMock,
+                                   mock_registries: MagicMock) -> None:
+    # Test setup
+    mock___init__.return_value = None
+    mock_container_engine.is_local_tool_image.side_effect = lambda tool_image_name: \
+        tool_image_name in {"local:tag", "installed:tag"}
+    mock_container_engine.get_free_space.return_value = 1000
+    test_layers_per_image = {
+        "missing1:tag": [("sha256:base", 100), ("sha256:shared", 200), ("sha256:own1", 10)],
+        "missing2:tag": [("sha256:shared", 200), ("sha256:own2", 20)],
+        "unknown:tag": [],
+        "local:tag": [("sha256:base", 100)],
+        "local_only:tag": [],
+    }
+    # The layers of the installed image are already stored in the local image index.
+    mock_container_engine.get_local_image_layers.return_value = {
+        "installed:tag": [["sha256:own2", 20]],
+    }
+    mock_registries.get_tool_image_layers.side_effect = lambda tool_image_names: {
+        tool_image_name: test_layers_per_image[tool_image_name] 
+        for tool_image_name in tool_image_names
+    }
+
+    mock_dev_env = MagicMock()
+    mock_tool_images = []
+    for tool_image_name, availability in [("missing1:tag", platform.ToolImage.REGISTRY_ONLY),
+                                          ("missing2:tag", platform.ToolImage.REGISTRY_ONLY),
+                                          ("unknown:tag", platform.ToolImage.REGISTRY_ONLY),
+                                          ("local:tag", platform.ToolImage.LOCAL_AND_REGISTRY),
+                                          ("local_only:tag", platform.ToolImage.LOCAL_ONLY)]:
+        mock_tool_image = MagicMock()
+        mock_tool_image.name = tool_image_name
+        mock_tool_image.availability = availability
+        mock_tool_images.append(mock_tool_image)
+    mock_dev_env.tool_images = mock_tool_images
+    mock_installed_dev_env = MagicMock()
+    mock_installed_dev_env.is_installed = True
+    mock_installed_dev_env.tool_image_descriptors = [
+        {"image_name": "installed", "image_version": "tag"},
+        {"image_name": "removed", "image_version": "tag"},
+    ]
+    mock_not_installed_dev_env = MagicMock()
+    mock_not_installed_dev_env.is_installed = False
+
+    test_platform = platform.Platform()
+    test_platform.local_dev_envs = [mock_installed_dev_env, mock_not_installed_dev_env]
+
+    # Run unit under test
+    actual_install_plan = test_platform.get_install_plan(mock_dev_env)
+
+    # Check expectations
+    assert actual_install_plan == {
+        "tool_images": {
+            "missing1:tag": 210,
+            "missing2:tag": 0,
+            "unknown:tag": None,
+        },
+        "layers": {
+            "missing1:tag": test_layers_per_image["missing1:tag"],
+            "missing2:tag": test_layers_per_image["missing2:tag"],
+            "unknown:tag": [],
+        },
+        "download_size": 210,
+        "free_space": 1000,
+    }
+
+    mock_registries.get_tool_image_layers.assert_has_calls([
+        call(["missing1:tag", "missing2:tag", "unknown:tag"]),
+        call(["local:tag", "local_only:tag"]),
+    ])
+    mock_container_engine.get_local_image_layers.assert_called_once_with({"installed:tag", 
+                                                                          "local:tag", 
+                                                                          "local_only:tag"})
+    mock_container_engine.set_local_image_layers.assert_called_once_with({
+        "local:tag": test_layers_per_image["local:tag"],
+        "local_only:tag": [],
+    })
+    mock_container_engine.get_local_tool_images.assert_not_called()
+
+@patch.object(platform.Platform, "registries")
+@patch.object(platform.Platform, "container_engine")
+@patch.object(platform.Platform, "__init__")
+def test_Platform_get_install_plan_stored_local_layers(mock___init__: MagicMock, 
+                                                       mock_container_engine: MagicMock,
+                                                       mock_registries: MagicMock) -> None:
+    # Test setup
+    mock___init__.return_value = None
+    mock_container_engine.get_free_space.return_value = None
+    mock_container_engine.get_local_image_layers.return_value = {
+        "local:tag": [["sha256:base", 200]],
+    }
+    mock_registries.get_tool_image_layers.return_value = {
+        "missing:tag": [("sha256:base", 200), ("sha256:own", 50)],
+    }
+
+    mock_dev_env = MagicMock()
+    mock_tool_images = []
+    for tool_image_name, availability in [("missing:tag", platform.ToolImage.REGISTRY_ONLY),
+                                          ("local:tag", platform.ToolImage.LOCAL_AND_REGISTRY)]:
+        mock_tool_image = MagicMock()
+        mock_tool_image.name = tool_image_name
+        mock_tool_image.availability = availability
+        mock_tool_images.append(mock_tool_image)
+    mock_dev_env.tool_images = mock_tool_images
+
+    test_platform = platform.Platform()
+    test_platform.local_dev_envs = []
+
+    # Run unit under test
+    actual_install_plan = test_platform.get_install_plan(mock_dev_env)
+
+    # Check expectations
+    assert actual_install_plan["download_size"] == 50
+
+    # The manifests of the local images are not requested again.
+    mock_registries.get_tool_image_layers.assert_called_once_with(["missing:tag"])
+    mock_container_engine.set_local_image_layers.assert_not_called()
+
+
+@patch.object(platform.Platform, "registries")
+@patch.object(platform.Platform, "container_engine")
+@patch.object(platform.Platform, "__init__")
+def test_Platform_get_install_plan_local_first(mock___init__: MagicMock, 
+                                               mock_container_engine: MagicMock,
+                                               mock_registries: MagicMock) -> None:
+    # Test setup
+    mock___init__.return_value = None
+    mock_container_engine.get_free_space.return_value = 250
+    test_layers_per_image = {
+        "missing:tag": [("sha256:base", 200), ("sha256:own", 50)],
+        "local:tag": [("sha256:base", 200)],
+    }
+    mock_registries.get_tool_image_layers.side_effect = lambda tool_image_names: {
+        tool_image_name: test_layers_per_image[tool_image_name] 
+        for tool_image_name in tool_image_names
+    }
+
+    # The install command resolves the tool images local first, so the local image of the Dev 
+    # Env is LOCAL_ONLY.
+    mock_dev_env = MagicMock()
+    mock_tool_images = []
+    for tool_image_name, availability in [("missing:tag", platform.ToolImage.REGISTRY_ONLY),
+                                          ("local:tag", platform.ToolImage.LOCAL_ONLY)]:
+        mock_tool_image = MagicMock()
+        mock_tool_image.name = tool_image_name
+        mock_tool_image.availability = availability
+        mock_tool_images.append(mock_tool_image)
+    mock_dev_env.tool_images = mock_tool_images
+
+    mock_container_engine.get_local_image_layers.return_value = {}
+
+    test_platform = platform.Platform()
+    test_platform.local_dev_envs = []
+
+    # Run unit under test
+    actual_install_plan = test_platform.get_install_plan(mock_dev_env)
+
+    # Check expectations
+    # The base layer is already present locally, so only the own layer gets downloaded.
+    assert actual_install_plan["tool_images"] == {"missing:tag": 50}
+    assert actual_install_plan["download_size"] == 50
+    mock_registries.get_tool_image_layers.assert_has_calls([call(["missing:tag"]), 
+                                                            call(["local:tag"])])
+
+@patch.object(platform.Platform, "registries")
+@patch.object(platform.Platform, "container_engine")
+@patch.object(platform.Platform, "__init__")
+def test_Platform_get_install_plan_nothing_to_pull(mock___init__: MagicMock, 
+                                                   mock_container_engine: MagicMock,
+                                                   mock_registries: MagicMock) -> None:
+    # Test setup
+    mock___init__.return_value = None
+    mock_dev_env = MagicMock()
+    mock_tool_image = MagicMock()
+    mock_tool_image.name = "local:tag"
+    mock_tool_image.availability = platform.ToolImage.LOCAL_AND_REGISTRY
+    mock_dev_env.tool_images = [mock_tool_image]
+
+    test_platform = platform.Platform()
+
+    # Run unit under test
+    actual_install_plan = test_platform.get_install_plan(mock_dev_env)
+
+    # Check expectations
+    assert actual_install_plan == {
+        "tool_images": {},
+        "layers": {},
+        "download_size": 0,
+        "free_space": None,
+    }
+
+    mock_registries.get_tool_image_layers.assert_not_called()
+    mock_container_engine.get_free_space.assert_not_called()
+
+@patch.object(platform.Platform, "flush_descriptors")
+@patch.object(platform.Platform, "container_engine")
+@patch.object(platform.Platform, "user_output")
+@patch.object(platform.Platform, "__init__")
+def test_Platform_install_dev_env_not_enough_disk_space(mock___init__: MagicMock, 
+                                                        mock_user_output: MagicMock,
+                                                        mock_container_engine: MagicMock,
+                                                        mock_flush_descriptors: MagicMock) -> None:
+    # Test setup
+    mock___init__.return_value = None
+    mock_dev_env = MagicMock()
+    test_install_plan = {
+        "tool_images": {"missing:tag": 2500000},
+        "layers": {"missing:tag": [("sha256:layer", 2500000)]},
+        "download_size": 2500000,
+        "free_space": 1000000,
+    }
+
+    test_platform = platform.Platform()
+
+    # Run unit under test
+    with pytest.raises(platform.PlatformError) as exported_exception_info:
+        test_platform.install_dev_env(mock_dev_env, test_install_plan)
+
+    # Check expectations
+    assert str(exported_exception_info.value) == "Platform error: Not enough disk space to install " + \
+                                                 "the Dev Env. The download size is 2.5 MB, but " + \
+                                                 "only 1.0 MB is free."
+
+    mock_container_engine.iter_pull.assert_not_called()
+    mock_flush_descriptors.assert_not_called()
+
+@patch.object(platform.Platform, "__init__")
+def test_Platform__schedule_pulls(mock___init__: MagicMock) -> None:
+    # Test setup
+    mock___init__.return_value = None
+    test_layers_per_image = {
+        "independent:tag": [("sha256:own1", 500)],
+        "small_base:tag": [("sha256:base", 100), ("sha256:own2", 10)],
+        "big_base:tag": [("sha256:base", 100), ("sha256:toolchain", 300), ("sha256:own3", 10)],
+        "toolchain:tag": [("sha256:base", 100), ("sha256:toolchain", 300), ("sha256:own4", 10)],
+        "unknown:tag": [],
+    }
+    test_tool_image_names = ["independent:tag", "small_base:tag", "big_base:tag", "toolchain:tag", 
+                             "unknown:tag"]
+
+    test_platform = platform.Platform()
+
+    # Run unit under test
+    actual_order, actual_dependencies = test_platform._schedule_pulls(test_tool_image_names, 
+                                                                      test_layers_per_image)
+
+    # Check expectations
+    assert actual_order == ["big_base:tag", "toolchain:tag", "small_base:tag", "independent:tag", 
+                            "unknown:tag"]
+    assert actual_dependencies == {
+        "big_base:tag": set(),
+        "toolchain:tag": {"big_base:tag"},
+        "small_base:tag": {"big_base:tag"},
+        "independent:tag": set(),
+        "unknown:tag": set(),
+    }
+
+@patch.object(platform.Platform, "config_file")
+@patch.object(platform.Platform, "container_engine")
+@patch.object(platform.Platform, "__init__")
+def test_Platform__iter_pulls_dependencies(mock___init__: MagicMock, 
+                                           mock_container_engine: MagicMock,
+                                           mock_config_file: MagicMock) -> None:
+    # Test setup
+    mock___init__.return_value = None
+    mock_config_file.pull_max_workers = 4
+    test_started_pulls = []
+    def iter_pull(tool_image_name: str):
+        test_started_pulls.append(tool_image_name)
+        yield {"id": "layer", "status": "Downloading"}
+    mock_container_engine.iter_pull.side_effect = iter_pull
+
+    test_platform = platform.Platform()
+    pulled_tool_image_names = []
+
+    # Run unit under test
+    list(test_platform._iter_pulls(["base:tag", "dependent:tag"], pulled_tool_image_names, 
+                                   {"base:tag": set(), "dependent:tag": {"base:tag"}}))
+
+    # Check expectations
+    # The dependent image only starts after the base image has been pulled.
+    assert test_started_pulls == ["base:tag", "dependent:tag"]
+    assert pulled_tool_image_names == ["base:tag", "dependent:tag"]
+
+@patch.object(platform.Platform, "config_file")
+@patch.object(platform.Platform, "container_engine")
+@patch.object(platform.Platform, "__init__")
+def test_Platform__iter_pulls_cancel(mock___init__: MagicMock, mock_container_engine: MagicMock,
+                                     mock_config_file: MagicMock) -> None:
+    # Test setup
+    mock___init__.return_value = None
+    mock_config_file.pull_max_workers = 2
+    test_items = [{"id": "layer" + str(i), "status": "Downloading"} for i in range(100)]
+    mock_container_engine.iter_pull.side_effect = lambda tool_image_name: iter(test_items)
+
+    test_platform = platform.Platform()
+    pulled_tool_image_names = []
+
+    # Run unit under test
+    test_generator = test_platform._iter_pulls(["test_image1:tag", "test_image2:tag"], 
+                                               pulled_tool_image_names)
+    next(test_generator)
+    test_generator.close()
+
+    # Check expectations
+    # The running pulls have stopped by the time the generator is closed.
+    assert pulled_tool_image_names == []
+
+@patch.object(platform.Platform, "config_file")
+@patch.object(platform.Platform, "container_engine")
+@patch.object(platform.Platform, "__init__")
+def test_Platform__iter_pulls_stream_error(mock___init__: MagicMock, 
+                                           mock_container_engine: MagicMock,
+                                           mock_config_file: MagicMock) -> None:
+    # Test setup
+    mock___init__.return_value = None
+    mock_config_file.pull_max_workers = 1
+    def iter_pull(tool_image_name: str):
+        yield {"id": "layer", "status": "Downloading"}
+        if tool_image_name == "broken:tag":
+            raise requests.exceptions.ConnectionError("Connection aborted.")
+    mock_container_engine.iter_pull.side_effect = iter_pull
+
+    test_platform = platform.Platform()
+    pulled_tool_image_names = []
+
+    # Run unit under test
+    with pytest.raises(platform.ContainerEngineError) as exported_exception_info:
+        list(test_platform._iter_pulls(["ok:tag", "broken:tag"], pulled_tool_image_names))
+
+    # Check expectations
+    assert str(exported_exception_info.value) == "Container engine error: The pull of " + \
+                                                 "broken:tag failed: Connection aborted."
+    assert pulled_tool_image_names == ["ok:tag"]
 
 @patch.object(platform.Platform, "tool_images")
 @patch.object(platform.Platform, "container_engine")
@@ -769,4 +1199,339 @@ def test_Platform_init_project_file_not_exist(mock___init__: MagicMock, mock_get
 
         # Check expectations
         mock_path_exists.assert_called_once_with(f"{test_project_path}/.axem/dev_env_descriptor.json")
-        assert str(exported_exception_info.value) == f"The {test_project_path}/.axem/dev_env_descriptor.json file does not exist."
\ No newline at end of file
+        assert str(exported_exception_info.value) == f"The {test_project_path}/.axem/dev_env_descriptor.json file does not exist."
+def test_Platform__get_warm_container_name() -> None:
+    # Run unit under test
+    actual_name = platform.Platform._get_warm_container_name("test dev env", 
+                                                             "localhost:5000/axem/tool:v1.0")
+
+    # Check expectations
+    assert actual_name == "dem_test_dev_env_localhost_5000_axem_tool_v1.0"
+
+@patch("dem.core.platform.os.getcwd")
+@patch.object(platform.Platform, "config_file")
+@patch.object(platform.Platform, "container_engine")
+@patch.object(platform.Platform, "user_output")
+@patch.object(platform.Platform, "__init__")
+def test_Platform_up_dev_env(mock___init__: MagicMock, mock_user_output: MagicMock,
+                             mock_container_engine: MagicMock, mock_config_file: MagicMock,
+                             mock_getcwd: MagicMock) -> None:
+    # Test setup
+    mock___init__.return_value = None
+    mock_getcwd.return_value = "/workspace"
+    mock_config_file.warm_container_idle_timeout_s = 1800
+    mock_container_engine.get_running_container_labels.side_effect = \
+        lambda name: {} if name == "dem_test_dev_env_axem_running_latest" else None
+    mock_container_engine.is_local_tool_image.return_value = True
+    mock_dev_env = MagicMock()
+    mock_dev_env.name = "test_dev_env"
+    mock_dev_env.tool_image_descriptors = [
+        {"image_name": "axem/running", "image_version": "latest"},
+        {"image_name": "axem/stopped", "image_version": "latest"},
+    ]
+    mock_dev_env.cache_volume_descriptors = [{"name": "ccache", "path": "/root/.ccache"}]
+
+    test_platform = platform.Platform()
+
+    # Run unit under test
+    test_platform.up_dev_env(mock_dev_env, volumes=["/dev/bus/usb:/dev/bus/usb"], privileged=True)
+
+    # Check expectations
+    mock_container_engine.start_warm_container.assert_called_once_with(
+        "dem_test_dev_env_axem_stopped_latest", "axem/stopped:latest", {
+            "dem.dev_env": "test_dev_env",
+            "dem.tool_image": "axem/stopped:latest",
+            "dem.workspace": "/workspace",
+        }, 1800, ["/workspace:/workspace", "dem_test_dev_env_cache_ccache:/root/.ccache", 
+                  "/dev/bus/usb:/dev/bus/usb"], True, "/workspace")
+    mock_user_output.msg.assert_has_calls([
+        call("The axem/running:latest container is already running."),
+        call("Started the axem/stopped:latest container."),
+    ])
+
+@patch.object(platform.Platform, "container_engine")
+@patch.object(platform.Platform, "user_output")
+@patch.object(platform.Platform, "__init__")
+def test_Platform_up_dev_env_not_installed(mock___init__: MagicMock, mock_user_output: MagicMock,
+                                           mock_container_engine: MagicMock) -> None:
+    # Test setup
+    mock___init__.return_value = None
+    mock_container_engine.get_running_container_labels.return_value = None
+    mock_container_engine.is_local_tool_image.return_value = False
+    mock_dev_env = MagicMock()
+    mock_dev_env.name = "test_dev_env"
+    mock_dev_env.tool_image_descriptors = [{"image_name": "axem/tool", "image_version": "latest"}]
+
+    test_platform = platform.Platform()
+
+    # Run unit under test
+    with pytest.raises(platform.PlatformError) as exported_exception_info:
+        test_platform.up_dev_env(mock_dev_env, 60)
+
+    # Check expectations
+    assert str(exported_exception_info.value) == "Platform error: The axem/tool:latest image is " + \
+                                                 "not available locally. Install the " + \
+                                                 "test_dev_env Dev Env first."
+    mock_container_engine.start_warm_container.assert_not_called()
+
+@patch.object(platform.Platform, "container_engine")
+@patch.object(platform.Platform, "user_output")
+@patch.object(platform.Platform, "__init__")
+def test_Platform_up_dev_env_start_failure(mock___init__: MagicMock, mock_user_output: MagicMock,
+                                           mock_container_engine: MagicMock) -> None:
+    # Test setup
+    mock___init__.return_value = None
+    mock_container_engine.get_running_container_labels.return_value = None
+    mock_container_engine.is_local_tool_image.return_value = True
+    test_exception_text = "test_exception_text"
+    mock_container_engine.start_warm_container.side_effect = platform.ContainerEngineError(test_exception_text)
+    mock_dev_env = MagicMock()
+    mock_dev_env.name = "test_dev_env"
+    mock_dev_env.tool_image_descriptors = [{"image_name": "axem/tool", "image_version": "latest"}]
+
+    test_platform = platform.Platform()
+
+    # Run unit under test
+    with pytest.raises(platform.PlatformError) as exported_exception_info:
+        test_platform.up_dev_env(mock_dev_env, 60)
+
+    # Check expectations
+    assert str(exported_exception_info.value) == "Platform error: Dev Env up failed. --> " + \
+                                                 f"Container engine error: {test_exception_text}"
+
+@pytest.mark.parametrize("test_cwd, expected_workdir", [
+    ("/workspace/project/build", "/workspace/project/build"),
+    ("/workspace/project", "/workspace/project"),
+    ("/workspace/project2", "/workspace/project"),
+])
+@patch("dem.core.platform.os.getcwd")
+@patch.object(platform.Platform, "container_engine")
+@patch.object(platform.Platform, "__init__")
+def test_Platform_exec_in_dev_env(mock___init__: MagicMock, mock_container_engine: MagicMock,
+                                  mock_getcwd: MagicMock, test_cwd: str, 
+                                  expected_workdir: str) -> None:
+    # Test setup
+    mock___init__.return_value = None
+    mock_getcwd.return_value = test_cwd
+    mock_container_engine.get_running_container_labels.return_value = {
+        "dem.workspace": "/workspace/project"
+    }
+    mock_container_engine.exec.return_value = 2
+    mock_dev_env = MagicMock()
+    mock_dev_env.name = "test_dev_env"
+    mock_dev_env.tool_image_descriptors = [
+        {"image_name": "axem/make_gnu_arm", "image_version": "latest"},
+        {"image_name": "axem/stlink_org", "image_version": "latest"},
+    ]
+
+    test_platform = platform.Platform()
+
+    # Run unit under test
+    actual_exit_code = test_platform.exec_in_dev_env(mock_dev_env, ["make", "-j4"], "make_gnu_arm")
+
+    # Check expectations
+    assert actual_exit_code == 2
+
+    mock_container_engine.get_running_container_labels.assert_called_once_with(
+        "dem_test_dev_env_axem_make_gnu_arm_latest")
+    mock_container_engine.exec.assert_called_once_with("dem_test_dev_env_axem_make_gnu_arm_latest",
+                                                       ["make", "-j4"], expected_workdir)
+
+@pytest.mark.parametrize("test_tool", ["", "unknown"])
+@patch.object(platform.Platform, "container_engine")
+@patch.object(platform.Platform, "__init__")
+def test_Platform_exec_in_dev_env_tool_not_selected(mock___init__: MagicMock, 
+                                                    mock_container_engine: MagicMock,
+                                                    test_tool: str) -> None:
+    # Test setup
+    mock___init__.return_value = None
+    mock_dev_env = MagicMock()
+    mock_dev_env.name = "test_dev_env"
+    mock_dev_env.tool_image_descriptors = [
+        {"image_name": "axem/make_gnu_arm", "image_version": "latest"},
+        {"image_name": "axem/stlink_org", "image_version": "latest"},
+    ]
+
+    test_platform = platform.Platform()
+
+    # Run unit under test
+    with pytest.raises(platform.PlatformError) as exported_exception_info:
+        test_platform.exec_in_dev_env(mock_dev_env, ["make"], test_tool)
+
+    # Check expectations
+    assert str(exported_exception_info.value) == "Platform error: Select one of the tool images " + \
+                                                 "of the test_dev_env Dev Env with --tool: " + \
+                                                 "axem/make_gnu_arm, axem/stlink_org"
+    mock_container_engine.exec.assert_not_called()
+
+@patch.object(platform.Platform, "container_engine")
+@patch.object(platform.Platform, "__init__")
+def test_Platform_exec_in_dev_env_not_running(mock___init__: MagicMock, 
+                                              mock_container_engine: MagicMock) -> None:
+    # Test setup
+    mock___init__.return_value = None
+    mock_container_engine.get_running_container_labels.return_value = None
+    mock_dev_env = MagicMock()
+    mock_dev_env.name = "test_dev_env"
+    mock_dev_env.tool_image_descriptors = [{"image_name": "axem/tool", "image_version": "latest"}]
+
+    test_platform = platform.Platform()
+
+    # Run unit under test
+    with pytest.raises(platform.PlatformError) as exported_exception_info:
+        test_platform.exec_in_dev_env(mock_dev_env, ["make"])
+
+    # Check expectations
+    assert str(exported_exception_info.value) == "Platform error: The axem/tool:latest container " + \
+                                                 "is not running. Start it with: dem up test_dev_env"
+    mock_container_engine.exec.assert_not_called()
+
+@patch.object(platform.Platform, "container_engine")
+@patch.object(platform.Platform, "__init__")
+def test_Platform_down_dev_env(mock___init__: MagicMock, mock_container_engine: MagicMock) -> None:
+    # Test setup
+    mock___init__.return_value = None
+    mock_container_engine.stop_containers.return_value = ["test_name"]
+    mock_dev_env = MagicMock()
+    mock_dev_env.name = "test_dev_env"
+
+    test_platform = platform.Platform()
+
+    # Run unit under test
+    actual_names = test_platform.down_dev_env(mock_dev_env)
+
+    # Check expectations
+    assert actual_names == ["test_name"]
+    mock_container_engine.stop_containers.assert_called_once_with({"dem.dev_env": "test_dev_env"})
+
+def test_Platform__get_cache_volume_name() -> None:
+    # Run unit under test
+    actual_name = platform.Platform._get_cache_volume_name("test dev env", "c/make")
+
+    # Check expectations
+    assert actual_name == "dem_test_dev_env_cache_c_make"
+
+@patch.object(platform.Platform, "container_engine")
+@patch.object(platform.Platform, "__init__")
+def test_Platform_get_cache_volume_mounts(mock___init__: MagicMock, 
+                                          mock_container_engine: MagicMock) -> None:
+    # Test setup
+    mock___init__.return_value = None
+    mock_dev_env = MagicMock()
+    mock_dev_env.name = "test_dev_env"
+    mock_dev_env.cache_volume_descriptors = [
+        {"name": "ccache", "path": "/root/.ccache"},
+        {"name": "build", "path": "/workspace/build"},
+    ]
+
+    test_platform = platform.Platform()
+
+    # Run unit under test
+    actual_mounts = test_platform.get_cache_volume_mounts(mock_dev_env)
+
+    # Check expectations
+    assert actual_mounts == [
+        "dem_test_dev_env_cache_ccache:/root/.ccache",
+        "dem_test_dev_env_cache_build:/workspace/build",
+    ]
+    mock_container_engine.create_volume.assert_has_calls([
+        call("dem_test_dev_env_cache_ccache", {"dem.dev_env": "test_dev_env", 
+                                               "dem.cache_volume": "ccache"}),
+        call("dem_test_dev_env_cache_build", {"dem.dev_env": "test_dev_env", 
+                                              "dem.cache_volume": "build"}),
+    ])
+
+@pytest.mark.parametrize("test_cache_volume_descriptor", [
+    {"name": "ccache"},
+    {"name": "ccache", "path": "relative/path"},
+    {"path": "/root/.ccache"},
+])
+@patch.object(platform.Platform, "container_engine")
+@patch.object(platform.Platform, "__init__")
+def test_Platform_get_cache_volume_mounts_invalid(mock___init__: MagicMock, 
+                                                  mock_container_engine: MagicMock,
+                                                  test_cache_volume_descriptor: dict) -> None:
+    # Test setup
+    mock___init__.return_value = None
+    mock_dev_env = MagicMock()
+    mock_dev_env.name = "test_dev_env"
+    mock_dev_env.cache_volume_descriptors = [test_cache_volume_descriptor]
+
+    test_platform = platform.Platform()
+
+    # Run unit under test
+    with pytest.raises(platform.PlatformError) as exported_exception_info:
+        test_platform.get_cache_volume_mounts(mock_dev_env)
+
+    # Check expectations
+    assert str(exported_exception_info.value) == "Platform error: The test_dev_env Dev Env has " + \
+                                                 "an invalid cache volume: " + \
+                                                 f"{test_cache_volume_descriptor}. The name and " + \
+                                                 "the absolute path in the container are required."
+    mock_container_engine.create_volume.assert_not_called()
+
+@patch.object(platform.Platform, "container_engine")
+@patch.object(platform.Platform, "__init__")
+def test_Platform_get_cache_volume_mounts_ContainerEngineError(mock___init__: MagicMock, 
+                                                               mock_container_engine: MagicMock) -> None:
+    # Test setup
+    mock___init__.return_value = None
+    mock_dev_env = MagicMock()
+    mock_dev_env.name = "test_dev_env"
+    mock_dev_env.cache_volume_descriptors = [{"name": "ccache", "path": "/root/.ccache"}]
+    test_exception_text = "test_exception_text"
+    mock_container_engine.create_volume.side_effect = platform.ContainerEngineError(test_exception_text)
+
+    test_platform = platform.Platform()
+
+    # Run unit under test
+    with pytest.raises(platform.PlatformError) as exported_exception_info:
+        test_platform.get_cache_volume_mounts(mock_dev_env)
+
+    # Check expectations
+    assert str(exported_exception_info.value) == "Platform error: The ccache cache volume can't " + \
+                                                 "be created. --> Container engine error: " + \
+                                                 test_exception_text
+
+@patch.object(platform.Platform, "container_engine")
+@patch.object(platform.Platform, "__init__")
+def test_Platform_get_cache_volume_sizes(mock___init__: MagicMock, 
+                                         mock_container_engine: MagicMock) -> None:
+    # Test setup
+    mock___init__.return_value = None
+    mock_dev_env = MagicMock()
+    mock_dev_env.name = "test_dev_env"
+    mock_dev_env.cache_volume_descriptors = [
+        {"name": "ccache", "path": "/root/.ccache"},
+        {"name": "build", "path": "/workspace/build"},
+    ]
+    mock_container_engine.get_volume_sizes.return_value = {"dem_test_dev_env_cache_ccache": 1000}
+
+    test_platform = platform.Platform()
+
+    # Run unit under test
+    actual_sizes = test_platform.get_cache_volume_sizes(mock_dev_env)
+
+    # Check expectations
+    assert actual_sizes == {"ccache": 1000, "build": None}
+    mock_container_engine.get_volume_sizes.assert_called_once_with([
+        "dem_test_dev_env_cache_ccache", "dem_test_dev_env_cache_build"
+    ])
+
+@patch.object(platform.Platform, "container_engine")
+@patch.object(platform.Platform, "__init__")
+def test_Platform_get_cache_volume_sizes_no_cache_volumes(mock___init__: MagicMock, 
+                                                          mock_container_engine: MagicMock) -> None:
+    # Test setup
+    mock___init__.return_value = None
+    mock_dev_env = MagicMock()
+    mock_dev_env.cache_volume_descriptors = []
+
+    test_platform = platform.Platform()
+
+    # Run unit under test
+    actual_sizes = test_platform.get_cache_volume_sizes(mock_dev_env)
+
+    # Check expectations
+    assert actual_sizes == {}
+    mock_container_engine.get_volume_sizes.assert_not_called()
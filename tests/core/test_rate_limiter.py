@@ -0,0 +1,126 @@
+"""Unit tests for the rate_limiter."""
+# tests/core/test_rate_limiter.py
+
+# Unit under test:
+import dem.core.rate_limiter as rate_limiter
+
+# Test framework
+from unittest.mock import patch, MagicMock, call
+
+@patch("dem.core.rate_limiter.time.sleep")
+@patch("dem.core.rate_limiter.time.monotonic")
+def test_TokenBucket_acquire(mock_monotonic: MagicMock, mock_sleep: MagicMock) -> None:
+    # Test setup
+    test_time = [100.0]
+    mock_monotonic.side_effect = lambda: test_time[0]
+    def advance(wait_s: float) -> None:
+        test_time[0] += wait_s
+    mock_sleep.side_effect = advance
+
+    test_token_bucket = rate_limiter.TokenBucket(2, 2)
+
+    # Run unit under test
+    for _ in range(3):
+        test_token_bucket.acquire()
+
+    # Check expectations
+    # The burst is served immediately, the third request waits for a token.
+    mock_sleep.assert_called_once_with(0.5)
+
+@patch("dem.core.rate_limiter.time.sleep")
+@patch("dem.core.rate_limiter.time.monotonic")
+def test_TokenBucket_acquire_timeout(mock_monotonic: MagicMock, mock_sleep: MagicMock) -> None:
+    # Test setup
+    test_time = [100.0]
+    mock_monotonic.side_effect = lambda: test_time[0]
+    def advance(wait_s: float) -> None:
+        test_time[0] += wait_s
+    mock_sleep.side_effect = advance
+
+    test_token_bucket = rate_limiter.TokenBucket(8, 8)
+    test_token_bucket.pause(60)
+
+    # Run unit under test
+    actual_short_result = test_token_bucket.acquire(5)
+    actual_long_result = test_token_bucket.acquire(120)
+
+    # Check expectations
+    # The pause is longer than the first timeout, so it gives up without waiting.
+    assert actual_short_result is False
+    assert actual_long_result is True
+    mock_sleep.assert_has_calls([call(60), call(0.125)])
+
+@patch("dem.core.rate_limiter.time.sleep")
+@patch("dem.core.rate_limiter.time.monotonic")
+def test_TokenBucket_pause(mock_monotonic: MagicMock, mock_sleep: MagicMock) -> None:
+    # Test setup
+    test_time = [100.0]
+    mock_monotonic.side_effect = lambda: test_time[0]
+    def advance(wait_s: float) -> None:
+        test_time[0] += wait_s
+    mock_sleep.side_effect = advance
+
+    test_token_bucket = rate_limiter.TokenBucket(8, 8)
+
+    # Run unit under test
+    test_token_bucket.pause(5)
+    test_token_bucket.pause(1)
+    test_token_bucket.acquire()
+
+    # Check expectations
+    # A shorter pause doesn't cancel the longer one. After the pause the bucket starts empty.
+    mock_sleep.assert_has_calls([call(5), call(0.125)])
+    assert mock_sleep.call_count == 2
+
+@patch("dem.core.rate_limiter.time.sleep")
+@patch("dem.core.rate_limiter.time.monotonic")
+def test_TokenBucket_update_quota(mock_monotonic: MagicMock, mock_sleep: MagicMock) -> None:
+    # Test setup
+    test_time = [100.0]
+    mock_monotonic.side_effect = lambda: test_time[0]
+    def advance(wait_s: float) -> None:
+        test_time[0] += wait_s
+    mock_sleep.side_effect = advance
+
+    test_token_bucket = rate_limiter.TokenBucket(10, 10)
+
+    # Run unit under test
+    test_token_bucket.update_quota(2, 4)
+    for _ in range(3):
+        test_token_bucket.acquire()
+
+    # Check expectations
+    # Only 2 tokens are left, and the remaining quota is spread over the window: 0.5 request/s
+    mock_sleep.assert_called_once_with(2)
+
+@patch("dem.core.rate_limiter.time.sleep")
+@patch("dem.core.rate_limiter.time.monotonic")
+def test_TokenBucket_update_quota_exhausted(mock_monotonic: MagicMock,
+                                            mock_sleep: MagicMock) -> None:
+    # Test setup
+    test_time = [100.0]
+    mock_monotonic.side_effect = lambda: test_time[0]
+    def advance(wait_s: float) -> None:
+        test_time[0] += wait_s
+    mock_sleep.side_effect = advance
+
+    test_token_bucket = rate_limiter.TokenBucket(8, 8)
+
+    # Run unit under test
+    test_token_bucket.update_quota(0, 30)
+    test_token_bucket.acquire()
+
+    # Check expectations
+    mock_sleep.assert_has_calls([call(30), call(0.125)])
+    assert mock_sleep.call_count == 2
+
+def test_TokenBucket_update_quota_unknown() -> None:
+    # Test setup
+    test_token_bucket = rate_limiter.TokenBucket(10, 10)
+
+    # Run unit under test
+    test_token_bucket.update_quota(None, None)
+
+    # Check expectations
+    assert test_token_bucket._rate == 10
+    assert test_token_bucket._tokens == 10
@@ -9,6 +9,7 @@ import pytest
 from unittest.mock import patch, MagicMock, call, PropertyMock
 
 import requests
+import threading
 from typing import Generator
 
 class HelperRegistry(registry.Registry):
@@ -20,15 +21,24 @@ class HelperRegistry(registry.Registry):
     
     def _get_tag_endpoint_url(self, repo_name: str) -> str:
         return super()._get_tag_endpoint_url(repo_name)
+
+    def _get_next_page_url(self, response: requests.Response, endpoint_response: dict) -> str | None:
+        return super()._get_next_page_url(response, endpoint_response)
     
     def _list_repos_in_registry(self) -> Generator:
         return super()._list_repos_in_registry()
 
+    def _search(self, report_errors: bool = True) -> Generator:
+        return super()._search(report_errors)
+
+@patch.object(registry.Registry, "_record_request_result", MagicMock())
+@patch.object(registry.Registry, "_is_circuit_open", MagicMock(return_value=False))
+@patch.object(registry.Registry, "_get_token_bucket", MagicMock())
 @patch.object(registry.Core, "config_file")
 @patch.object(registry.Registry, "_append_repo_with_tag")
 @patch.object(registry.Registry, "_get_tag_endpoint_url")
-@patch("dem.core.registry.requests.get")
-def test_Registry__list_tags(mock_requests_get: MagicMock, mock__get_tag_endpoint_url: MagicMock,
+@patch.object(registry.Core, "_http_session")
+def test_Registry__list_tags(mock_http_session: MagicMock, mock__get_tag_endpoint_url: MagicMock,
                              mock__append_repo_with_tag: MagicMock, mock_config_file: MagicMock) -> None:
     # Test setup
     mock_container_engine = MagicMock()
@@ -39,7 +49,7 @@ def test_Registry__list_tags(mock_requests_get: MagicMock, mock__get_tag_endpoin
     mock_response.status_code = requests.codes.ok
     test_endpoint_response = "test"
     mock_response.json.return_value = test_endpoint_response
-    mock_requests_get.return_value = mock_response
+    mock_http_session.get.return_value = mock_response
     test_tag_endpoint_url = "test_tag_endpoint_url"
     mock__get_tag_endpoint_url.return_value = test_tag_endpoint_url
 
@@ -53,15 +63,19 @@ def test_Registry__list_tags(mock_requests_get: MagicMock, mock__get_tag_endpoin
 
     # Check expectations
     mock__get_tag_endpoint_url.assert_called_once_with(test_repo)
-    mock_requests_get.assert_called_once_with(test_tag_endpoint_url, timeout=test_http_request_timeout_s)
+    mock_http_session.get.assert_called_once_with(test_tag_endpoint_url, headers={}, 
+                                              timeout=test_http_request_timeout_s)
     mock_response.json.assert_called_once()
     mock__append_repo_with_tag.assert_called_once_with(test_endpoint_response, test_repo)
 
+@patch.object(registry.Registry, "_record_request_result", MagicMock())
+@patch.object(registry.Registry, "_is_circuit_open", MagicMock(return_value=False))
+@patch.object(registry.Registry, "_get_token_bucket", MagicMock())
 @patch.object(registry.Core, "config_file")
 @patch.object(registry.Core, "user_output")
 @patch.object(registry.Registry, "_get_tag_endpoint_url")
-@patch("dem.core.registry.requests.get")
-def test_Registry__list_tags_MissingSchema(mock_requests_get: MagicMock, 
+@patch.object(registry.Core, "_http_session")
+def test_Registry__list_tags_MissingSchema(mock_http_session: MagicMock, 
                                            mock__get_tag_endpoint_url: MagicMock,
                                            mock_user_output: MagicMock, mock_config_file: MagicMock) -> None:
     # Test setup
@@ -70,7 +84,7 @@ def test_Registry__list_tags_MissingSchema(mock_requests_get: MagicMock,
 
     test_repo = "test_repo"
     test_exception_text = "test_exception_text"
-    mock_requests_get.side_effect = registry.requests.exceptions.MissingSchema(test_exception_text)
+    mock_http_session.get.side_effect = registry.requests.exceptions.MissingSchema(test_exception_text)
     test_tag_endpoint_url = "test_tag_endpoint_url"
     mock__get_tag_endpoint_url.return_value = test_tag_endpoint_url
 
@@ -84,15 +98,19 @@ def test_Registry__list_tags_MissingSchema(mock_requests_get: MagicMock,
 
     # Check expectations
     mock__get_tag_endpoint_url.assert_called_once_with(test_repo)
-    mock_requests_get.assert_called_once_with(test_tag_endpoint_url, timeout=test_http_request_timeout_s)
-    mock_user_output.error.assert_called_once_with(test_exception_text)
+    mock_http_session.get.assert_called_once_with(test_tag_endpoint_url, headers={}, 
+                                              timeout=test_http_request_timeout_s)
+    mock_user_output.error.assert_called_once_with("Registry error: " + test_exception_text)
     mock_user_output.msg.assert_called_once_with("Skipping repository: " + test_repo)
 
+@patch.object(registry.Registry, "_record_request_result", MagicMock())
+@patch.object(registry.Registry, "_is_circuit_open", MagicMock(return_value=False))
+@patch.object(registry.Registry, "_get_token_bucket", MagicMock())
 @patch.object(registry.Core, "config_file")
 @patch.object(registry.Core, "user_output")
 @patch.object(registry.Registry, "_get_tag_endpoint_url")
-@patch("dem.core.registry.requests.get")
-def test_Registry__list_tags_invalid_status(mock_requests_get: MagicMock, 
+@patch.object(registry.Core, "_http_session")
+def test_Registry__list_tags_invalid_status(mock_http_session: MagicMock, 
                                             mock__get_tag_endpoint_url: MagicMock,
                                             mock_user_output: MagicMock, 
                                             mock_config_file: MagicMock) -> None:
@@ -103,7 +121,7 @@ def test_Registry__list_tags_invalid_status(mock_requests_get: MagicMock,
     test_repo = "test_repo"
     mock_response = MagicMock()
     mock_response.status_code = 0
-    mock_requests_get.return_value = mock_response
+    mock_http_session.get.return_value = mock_response
     test_tag_endpoint_url = "test_tag_endpoint_url"
     mock__get_tag_endpoint_url.return_value = test_tag_endpoint_url
 
@@ -117,8 +135,675 @@ def test_Registry__list_tags_invalid_status(mock_requests_get: MagicMock,
 
     # Check expectations
     mock__get_tag_endpoint_url.assert_called_once_with(test_repo)
-    mock_requests_get.assert_called_once_with(test_tag_endpoint_url, timeout=test_http_request_timeout_s)
-    mock_user_output.error.assert_called_once_with("Error in communication with the registry. Failed to retrieve tags. Response status code: " + str(mock_response.status_code))
+    mock_http_session.get.assert_called_once_with(test_tag_endpoint_url, headers={}, 
+                                              timeout=test_http_request_timeout_s)
+    mock_user_output.error.assert_called_once_with("Registry error: Error in communication with the registry. Response status code: " + str(mock_response.status_code))
+    mock_user_output.msg.assert_called_once_with("Skipping repository: " + test_repo)
+
+@patch.object(registry.Core, "config_file")
+@patch("dem.core.registry.time.time")
+@patch.object(registry.Core, "_http_session")
+def test_Registry__list_tags_fresh_cache(mock_http_session: MagicMock, mock_time: MagicMock,
+                                         mock_config_file: MagicMock) -> None:
+    # Test setup
+    test_registry_config = {}
+    test_repo = "test_repo"
+    test_tags = ["latest", "v0.0.1"]
+    mock_config_file.registry_cache_ttl_s = 100
+    mock_time.return_value = 1050
+
+    test_registry = HelperRegistry(MagicMock(), test_registry_config)
+    test_registry._cache = {
+        test_repo: {
+            "tags": test_tags,
+            "timestamp": 1000,
+        }
+    }
+
+    # Run unit under test
+    test_registry._list_tags(test_repo)
+
+    # Check expectations
+    assert test_registry._tags[test_repo] == test_tags
+
+    mock_http_session.get.assert_not_called()
+
+@patch.object(registry.Registry, "_record_request_result", MagicMock())
+@patch.object(registry.Registry, "_is_circuit_open", MagicMock(return_value=False))
+@patch.object(registry.Registry, "_get_token_bucket", MagicMock())
+@patch.object(registry.Core, "config_file")
+@patch("dem.core.registry.time.time")
+@patch.object(registry.Registry, "_append_repo_with_tag")
+@patch.object(registry.Registry, "_get_tag_endpoint_url")
+@patch.object(registry.Core, "_http_session")
+def test_Registry__list_tags_not_modified(mock_http_session: MagicMock, 
+                                          mock__get_tag_endpoint_url: MagicMock,
+                                          mock__append_repo_with_tag: MagicMock, 
+                                          mock_time: MagicMock, mock_config_file: MagicMock) -> None:
+    # Test setup
+    test_registry_config = {
+        "cache_ttl_s": 10
+    }
+    test_repo = "test_repo"
+    test_tags = ["latest"]
+    test_etag = "test_etag"
+    test_last_modified = "test_last_modified"
+    mock_config_file.registry_cache_ttl_s = 100
+    mock_config_file.http_request_timeout_s = 2
+    mock_time.return_value = 1050
+
+    mock_response = MagicMock()
+    mock_response.status_code = requests.codes.not_modified
+    mock_http_session.get.return_value = mock_response
+    test_tag_endpoint_url = "test_tag_endpoint_url"
+    mock__get_tag_endpoint_url.return_value = test_tag_endpoint_url
+
+    test_registry = HelperRegistry(MagicMock(), test_registry_config)
+    test_registry._cache = {
+        test_repo: {
+            "tags": test_tags,
+            "timestamp": 1000,
+            "etag": test_etag,
+            "last_modified": test_last_modified,
+        }
+    }
+
+    # Run unit under test
+    test_registry._list_tags(test_repo)
+
+    # Check expectations
+    assert test_registry._tags[test_repo] == test_tags
+    assert test_registry._cache[test_repo]["timestamp"] == 1050
+
+    mock_http_session.get.assert_called_once_with(test_tag_endpoint_url, 
+                                              headers={
+                                                  "If-None-Match": test_etag,
+                                                  "If-Modified-Since": test_last_modified,
+                                              },
+                                              timeout=mock_config_file.http_request_timeout_s)
+    mock__append_repo_with_tag.assert_not_called()
+
+@patch.object(registry.Registry, "_record_request_result", MagicMock())
+@patch.object(registry.Registry, "_is_circuit_open", MagicMock(return_value=False))
+@patch.object(registry.Registry, "_get_token_bucket", MagicMock())
+@patch.object(registry.Core, "config_file")
+@patch("dem.core.registry.time.time")
+@patch.object(registry.DockerRegistry, "_get_tag_endpoint_url")
+@patch.object(registry.Core, "_http_session")
+def test_Registry__list_tags_refresh(mock_http_session: MagicMock, 
+                                     mock__get_tag_endpoint_url: MagicMock, mock_time: MagicMock, 
+                                     mock_config_file: MagicMock) -> None:
+    # Test setup
+    test_repo = "test_repo"
+    test_etag = "new_etag"
+    mock_config_file.registry_cache_ttl_s = 100
+    mock_config_file.http_request_timeout_s = 2
+    mock_time.return_value = 1050
+
+    mock_response = MagicMock()
+    mock_response.status_code = requests.codes.ok
+    mock_response.json.return_value = {
+        "tags": ["latest", "v0.0.2"]
+    }
+    mock_response.headers = {
+        "ETag": test_etag
+    }
+    mock_response.links = {}
+    mock_http_session.get.return_value = mock_response
+    test_tag_endpoint_url = "test_tag_endpoint_url"
+    mock__get_tag_endpoint_url.return_value = test_tag_endpoint_url
+
+    test_registry = registry.DockerRegistry(MagicMock(), {})
+    test_registry.refresh = True
+    test_registry._cache = {
+        test_repo: {
+            "tags": ["latest"],
+            "timestamp": 1040,
+            "etag": "old_etag",
+        }
+    }
+
+    # Run unit under test
+    test_registry._list_tags(test_repo)
+
+    # Check expectations
+    assert test_registry._tags[test_repo] == ["latest", "v0.0.2"]
+    assert test_registry._cache[test_repo] == {
+        "tags": ["latest", "v0.0.2"],
+        "timestamp": 1050,
+        "etag": test_etag,
+        "last_modified": None,
+        "last_updated": None,
+    }
+
+    mock_http_session.get.assert_called_once_with(test_tag_endpoint_url, headers={}, 
+                                              timeout=mock_config_file.http_request_timeout_s)
+
+@patch.object(registry.Core, "config_file")
+def test_Registry__list_tags_of_repos_uses_registry_cache(mock_config_file: MagicMock) -> None:
+    # Test setup
+    mock_config_file.max_workers = 1
+    test_registry_config = {
+        "url": "test_url"
+    }
+    mock_registry_cache = MagicMock()
+    test_cache = {}
+    mock_registry_cache.get_registry_cache.return_value = test_cache
+
+    test_registry = HelperRegistry(MagicMock(), test_registry_config, mock_registry_cache)
+
+    # Run unit under test
+    list(test_registry._list_tags_of_repos([]))
+
+    # Check expectations
+    assert test_registry._cache is test_cache
+
+    mock_registry_cache.get_registry_cache.assert_called_once_with(test_registry_config["url"])
+
+@patch.object(registry.Registry, "_record_request_result", MagicMock())
+@patch.object(registry.Registry, "_is_circuit_open", MagicMock(return_value=False))
+@patch.object(registry.Registry, "_get_token_bucket", MagicMock())
+@patch.object(registry.Core, "config_file")
+@patch.object(registry.Registry, "_get_next_page_url")
+@patch.object(registry.Core, "_http_session")
+def test_Registry__iter_pages(mock_http_session: MagicMock, mock__get_next_page_url: MagicMock,
+                              mock_config_file: MagicMock) -> None:
+    # Test setup
+    mock_config_file.http_request_timeout_s = 2
+    test_url = "test_url"
+    test_next_url = "test_next_url"
+    test_headers = {
+        "If-None-Match": "test_etag"
+    }
+
+    mock_responses = [MagicMock(), MagicMock()]
+    for mock_response in mock_responses:
+        mock_response.status_code = requests.codes.ok
+    mock_http_session.get.side_effect = mock_responses
+    mock__get_next_page_url.side_effect = [test_next_url, None]
+
+    test_registry = HelperRegistry(MagicMock(), {})
+
+    # Run unit under test
+    actual_pages = list(test_registry._iter_pages(test_url, test_headers))
+
+    # Check expectations
+    assert actual_pages == [(mock_response, mock_response.json.return_value) 
+                            for mock_response in mock_responses]
+
+    mock_http_session.get.assert_has_calls([
+        call(test_url, headers=test_headers, timeout=mock_config_file.http_request_timeout_s),
+        call(test_next_url, headers={}, timeout=mock_config_file.http_request_timeout_s),
+    ])
+    mock__get_next_page_url.assert_has_calls([
+        call(mock_response, mock_response.json.return_value) for mock_response in mock_responses
+    ])
+
+@patch.object(registry.Registry, "_record_request_result", MagicMock())
+@patch.object(registry.Registry, "_is_circuit_open", MagicMock(return_value=False))
+@patch.object(registry.Registry, "_get_token_bucket", MagicMock())
+@patch.object(registry.Core, "config_file")
+@patch.object(registry.Registry, "_get_next_page_url")
+@patch.object(registry.Core, "_http_session")
+def test_Registry__iter_pages_not_modified(mock_http_session: MagicMock, 
+                                           mock__get_next_page_url: MagicMock,
+                                           mock_config_file: MagicMock) -> None:
+    # Test setup
+    mock_response = MagicMock()
+    mock_response.status_code = requests.codes.not_modified
+    mock_http_session.get.return_value = mock_response
+
+    test_registry = HelperRegistry(MagicMock(), {})
+
+    # Run unit under test
+    actual_pages = list(test_registry._iter_pages("test_url"))
+
+    # Check expectations
+    assert actual_pages == [(mock_response, None)]
+
+    mock_response.json.assert_not_called()
+    mock__get_next_page_url.assert_not_called()
+
+@patch.object(registry.Registry, "_record_request_result", MagicMock())
+@patch.object(registry.Registry, "_is_circuit_open", MagicMock(return_value=False))
+@patch.object(registry.Registry, "_get_token_bucket", MagicMock())
+@patch.object(registry.Core, "config_file")
+@patch.object(registry.Registry, "_get_next_page_url")
+@patch.object(registry.Core, "_http_session")
+def test_Registry__iter_pages_failed_page(mock_http_session: MagicMock, 
+                                          mock__get_next_page_url: MagicMock,
+                                          mock_config_file: MagicMock) -> None:
+    # Test setup
+    mock_first_response = MagicMock()
+    mock_first_response.status_code = requests.codes.ok
+    mock_second_response = MagicMock()
+    mock_second_response.status_code = requests.codes.internal_server_error
+    mock_http_session.get.side_effect = [mock_first_response, mock_second_response]
+    mock__get_next_page_url.return_value = "test_next_url"
+
+    test_registry = HelperRegistry(MagicMock(), {})
+    test_pages = test_registry._iter_pages("test_url")
+
+    # Run unit under test
+    actual_first_page = next(test_pages)
+    with pytest.raises(registry.RegistryError) as e:
+        next(test_pages)
+
+    # Check expectations
+    assert actual_first_page == (mock_first_response, mock_first_response.json.return_value)
+    assert str(e.value) == "Registry error: Error in communication with the registry. Response status code: 500"
+
+@patch.object(registry.Registry, "_record_request_result", MagicMock())
+@patch.object(registry.Registry, "_is_circuit_open", MagicMock(return_value=False))
+@patch.object(registry.Registry, "_get_retry_delay")
+@patch.object(registry.Registry, "_get_token_bucket")
+@patch.object(registry.Core, "config_file")
+@patch.object(registry.Registry, "_get_next_page_url")
+@patch.object(registry.Core, "_http_session")
+def test_Registry__iter_pages_throttled(mock_http_session: MagicMock, 
+                                       mock__get_next_page_url: MagicMock,
+                                       mock_config_file: MagicMock,
+                                       mock__get_token_bucket: MagicMock,
+                                       mock__get_retry_delay: MagicMock) -> None:
+    # Test setup
+    mock_config_file.http_max_retries = 2
+    mock_throttled_response = MagicMock()
+    mock_throttled_response.status_code = requests.codes.too_many_requests
+    mock_throttled_response.headers = {}
+    mock_response = MagicMock()
+    mock_response.status_code = requests.codes.ok
+    mock_response.headers = {
+        "X-RateLimit-Remaining": "50",
+    }
+    mock_http_session.get.side_effect = [mock_throttled_response, mock_response]
+    mock__get_next_page_url.return_value = None
+    mock_token_bucket = MagicMock()
+    mock__get_token_bucket.return_value = mock_token_bucket
+    test_delay_s = 1.5
+    mock__get_retry_delay.return_value = test_delay_s
+
+    test_registry = HelperRegistry(MagicMock(), {})
+
+    # Run unit under test
+    actual_pages = list(test_registry._iter_pages("test_url"))
+
+    # Check expectations
+    assert actual_pages == [(mock_response, mock_response.json.return_value)]
+
+    mock__get_token_bucket.assert_called_once_with("test_url")
+    assert mock_token_bucket.acquire.call_count == 2
+    mock_token_bucket.update_quota.assert_has_calls([call(None, None), call(50.0, None)])
+    mock__get_retry_delay.assert_called_once_with(mock_throttled_response, 0)
+    mock_token_bucket.pause.assert_called_once_with(test_delay_s)
+    mock_http_session.get.assert_has_calls([
+        call("test_url", headers={}, timeout=mock_config_file.http_request_timeout_s),
+        call("test_url", headers={}, timeout=mock_config_file.http_request_timeout_s),
+    ])
+
+@patch.object(registry.Registry, "_record_request_result", MagicMock())
+@patch.object(registry.Registry, "_is_circuit_open", MagicMock(return_value=False))
+@patch.object(registry.Registry, "_get_retry_delay", MagicMock(return_value=0))
+@patch.object(registry.Registry, "_get_token_bucket", MagicMock())
+@patch.object(registry.Core, "config_file")
+@patch.object(registry.Core, "_http_session")
+def test_Registry__iter_pages_throttled_retries_exhausted(mock_http_session: MagicMock, 
+                                                         mock_config_file: MagicMock) -> None:
+    # Test setup
+    mock_config_file.http_max_retries = 2
+    mock_throttled_response = MagicMock()
+    mock_throttled_response.status_code = requests.codes.too_many_requests
+    mock_throttled_response.headers = {}
+    mock_http_session.get.return_value = mock_throttled_response
+
+    test_registry = HelperRegistry(MagicMock(), {})
+
+    # Run unit under test
+    with pytest.raises(registry.RegistryError) as e:
+        list(test_registry._iter_pages("test_url"))
+
+    # Check expectations
+    assert str(e.value) == "Registry error: Error in communication with the registry. Response status code: 429"
+    assert mock_http_session.get.call_count == 3
+
+@patch.object(registry.Core, "config_file")
+def test_Registry__get_token_bucket(mock_config_file: MagicMock) -> None:
+    # Test setup
+    mock_config_file.http_rate_limit_per_s = 5
+
+    test_registry = HelperRegistry(MagicMock(), {})
+
+    with patch.object(registry.Registry, "_token_buckets", {}):
+        # Run unit under test
+        actual_token_bucket = test_registry._get_token_bucket("https://test_host/v2/test_repo")
+        other_actual_token_bucket = test_registry._get_token_bucket("https://test_host/v2/other")
+        another_host_token_bucket = test_registry._get_token_bucket("https://other_host/v2/test")
+
+    # Check expectations
+    assert isinstance(actual_token_bucket, registry.TokenBucket)
+    assert actual_token_bucket is other_actual_token_bucket
+    assert actual_token_bucket is not another_host_token_bucket
+
+@patch("dem.core.registry.time.time")
+def test_Registry__get_rate_limit_quota(mock_time: MagicMock) -> None:
+    # Test setup
+    mock_time.return_value = 1700000000
+    test_registry = HelperRegistry(MagicMock(), {})
+    mock_response = MagicMock()
+    mock_response.headers = {
+        "X-RateLimit-Remaining": "10",
+        "X-RateLimit-Reset": "1700000060",
+    }
+    mock_other_response = MagicMock()
+    mock_other_response.headers = {
+        "RateLimit-Remaining": "76;w=21600",
+        "RateLimit-Reset": "30",
+    }
+    mock_invalid_response = MagicMock()
+    mock_invalid_response.headers = {
+        "X-RateLimit-Remaining": "invalid",
+    }
+
+    # Run unit under test and check expectations
+    assert test_registry._get_rate_limit_quota(mock_response) == (10, 60)
+    assert test_registry._get_rate_limit_quota(mock_other_response) == (76, 30)
+    assert test_registry._get_rate_limit_quota(mock_invalid_response) == (None, None)
+
+@patch("dem.core.registry.random.uniform")
+@patch("dem.core.registry.time.time")
+def test_Registry__get_retry_delay(mock_time: MagicMock, mock_uniform: MagicMock) -> None:
+    # Test setup
+    mock_time.return_value = 1700000000
+    test_registry = HelperRegistry(MagicMock(), {})
+
+    mock_retry_after_response = MagicMock()
+    mock_retry_after_response.headers = {
+        "Retry-After": "12",
+    }
+    mock_retry_after_date_response = MagicMock()
+    mock_retry_after_date_response.headers = {
+        "Retry-After": "Tue, 14 Nov 2023 22:14:00 GMT",
+    }
+    mock_quota_response = MagicMock()
+    mock_quota_response.headers = {
+        "X-RateLimit-Remaining": "0",
+        "X-RateLimit-Reset": "1700000030",
+    }
+    mock_no_hint_response = MagicMock()
+    mock_no_hint_response.headers = {}
+    mock_uniform.return_value = 3
+
+    # Run unit under test and check expectations
+    assert test_registry._get_retry_delay(mock_retry_after_response, 0) == 12
+    assert test_registry._get_retry_delay(mock_retry_after_date_response, 0) == 1700000040 - 1700000000
+    assert test_registry._get_retry_delay(mock_quota_response, 0) == 30
+    assert test_registry._get_retry_delay(mock_no_hint_response, 3) == 3
+
+    mock_uniform.assert_called_once_with(0, 8)
+
+@pytest.mark.parametrize("test_headers", [
+    {"Retry-After": "3600"},
+    {"X-RateLimit-Remaining": "0", "X-RateLimit-Reset": str(1700000000 + 6 * 3600)},
+])
+@patch("dem.core.registry.time.time")
+def test_Registry__get_retry_delay_too_long(mock_time: MagicMock, test_headers: dict) -> None:
+    # Test setup
+    mock_time.return_value = 1700000000
+    test_registry = HelperRegistry(MagicMock(), {})
+    mock_response = MagicMock()
+    mock_response.headers = test_headers
+
+    # Run unit under test
+    with pytest.raises(registry.RegistryError) as exported_exception_info:
+        test_registry._get_retry_delay(mock_response, 0)
+
+    # Check expectations
+    assert str(exported_exception_info.value).startswith("Registry error: The registry is " 
+                                                         "throttling the requests, it asked to "
+                                                         "retry in ")
+
+@patch("dem.core.registry.random.uniform")
+@patch("dem.core.registry.time.monotonic")
+def test_Registry__get_retry_delay_deadline(mock_monotonic: MagicMock, 
+                                            mock_uniform: MagicMock) -> None:
+    # Test setup
+    mock_monotonic.return_value = 100
+    test_registry = HelperRegistry(MagicMock(), {})
+    test_registry.deadline = 105
+    mock_retry_after_response = MagicMock()
+    mock_retry_after_response.headers = {
+        "Retry-After": "12",
+    }
+    mock_no_hint_response = MagicMock()
+    mock_no_hint_response.headers = {}
+    mock_uniform.return_value = 3
+
+    # Run unit under test and check expectations
+    # The server's delay is longer than the time left until the deadline.
+    with pytest.raises(registry.RegistryError):
+        test_registry._get_retry_delay(mock_retry_after_response, 0)
+    # The backoff is limited by the time left until the deadline.
+    assert test_registry._get_retry_delay(mock_no_hint_response, 5) == 3
+
+    mock_uniform.assert_called_once_with(0, 5)
+
+@patch.object(registry.Registry, "_record_request_result", MagicMock())
+@patch.object(registry.Registry, "_is_circuit_open", MagicMock(return_value=False))
+@patch.object(registry.Registry, "_get_token_bucket")
+@patch.object(registry.Core, "config_file")
+@patch.object(registry.Core, "_http_session")
+@patch("dem.core.registry.time.time")
+def test_Registry__send_request_quota_exhausted(mock_time: MagicMock, mock_http_session: MagicMock,
+                                                mock_config_file: MagicMock,
+                                                mock__get_token_bucket: MagicMock) -> None:
+    # Test setup
+    mock_time.return_value = 1700000000
+    mock_response = MagicMock()
+    mock_response.status_code = requests.codes.ok
+    mock_response.headers = {
+        "X-RateLimit-Remaining": "0",
+        "X-RateLimit-Reset": str(1700000000 + 6 * 3600),
+    }
+    mock_http_session.get.return_value = mock_response
+    mock_token_bucket = MagicMock()
+    mock__get_token_bucket.return_value = mock_token_bucket
+
+    test_registry = HelperRegistry(MagicMock(), {})
+
+    # Run unit under test
+    actual_response = test_registry._send_request("test_url")
+
+    # Check expectations
+    assert actual_response is mock_response
+    # The workers of the host are not paused until the end of the rate limit window.
+    mock_token_bucket.update_quota.assert_called_once_with(0, registry.Registry._backoff_max_s)
+
+@patch.object(registry.Registry, "_record_request_result", MagicMock())
+@patch.object(registry.Registry, "_is_circuit_open", MagicMock(return_value=False))
+@patch.object(registry.Registry, "_get_time_left", MagicMock(return_value=5.0))
+@patch.object(registry.Registry, "_get_token_bucket")
+@patch.object(registry.Core, "config_file")
+@patch.object(registry.Core, "_http_session")
+def test_Registry__send_request_deadline(mock_http_session: MagicMock, mock_config_file: MagicMock,
+                                         mock__get_token_bucket: MagicMock) -> None:
+    # Test setup
+    mock_config_file.http_request_timeout_s = 10
+    mock_response = MagicMock()
+    mock_response.status_code = requests.codes.ok
+    mock_response.headers = {}
+    mock_http_session.get.return_value = mock_response
+    mock_token_bucket = MagicMock()
+    mock_token_bucket.acquire.return_value = True
+    mock__get_token_bucket.return_value = mock_token_bucket
+
+    test_registry = HelperRegistry(MagicMock(), {})
+
+    # Run unit under test
+    actual_response = test_registry._send_request("test_url")
+
+    # Check expectations
+    assert actual_response is mock_response
+
+    # Neither the token nor the response is waited for longer than the time left.
+    mock_token_bucket.acquire.assert_called_once_with(5.0)
+    mock_http_session.get.assert_called_once_with("test_url", headers={}, timeout=5.0)
+
+@pytest.mark.parametrize("test_time_left_s, test_acquired", [
+    (0, True),
+    (5.0, False),
+])
+@patch.object(registry.Registry, "_record_request_result", MagicMock())
+@patch.object(registry.Registry, "_is_circuit_open", MagicMock(return_value=False))
+@patch.object(registry.Registry, "_get_token_bucket")
+@patch.object(registry.Core, "config_file")
+@patch.object(registry.Core, "_http_session")
+def test_Registry__send_request_deadline_reached(mock_http_session: MagicMock, 
+                                                 mock_config_file: MagicMock,
+                                                 mock__get_token_bucket: MagicMock,
+                                                 test_time_left_s: float, 
+                                                 test_acquired: bool) -> None:
+    # Test setup
+    mock_token_bucket = MagicMock()
+    mock_token_bucket.acquire.return_value = test_acquired
+    mock__get_token_bucket.return_value = mock_token_bucket
+
+    test_registry = HelperRegistry(MagicMock(), {})
+
+    # Run unit under test
+    with patch.object(registry.Registry, "_get_time_left", return_value=test_time_left_s):
+        with pytest.raises(registry.RegistryError) as exported_exception_info:
+            test_registry._send_request("test_url")
+
+    # Check expectations
+    assert str(exported_exception_info.value) == "Registry error: The crawl deadline is reached."
+
+    mock_http_session.get.assert_not_called()
+
+@patch.object(registry.Core, "config_file")
+@patch("dem.core.registry.time.time")
+@patch.object(registry.DockerHub, "_iter_pages")
+def test_Registry__list_tags_paginated(mock__iter_pages: MagicMock, mock_time: MagicMock,
+                                       mock_config_file: MagicMock) -> None:
+    # Test setup
+    test_repo = "test_repo"
+    test_etag = "test_etag"
+    mock_time.return_value = 1000
+
+    mock_first_response = MagicMock()
+    mock_first_response.headers = {
+        "ETag": test_etag
+    }
+    test_pages = [
+        (mock_first_response, {"results": [{"name": "latest"}, {"name": "v0.0.2"}]}),
+        (MagicMock(), {"results": [{"name": "v0.0.1"}]}),
+    ]
+    mock__iter_pages.return_value = iter(test_pages)
+
+    test_docker_hub = registry.DockerHub(MagicMock(), {
+        "url": "test_url"
+    })
+
+    # Run unit under test
+    test_docker_hub._list_tags(test_repo)
+
+    # Check expectations
+    expected_tags = ["latest", "v0.0.2", "v0.0.1"]
+    assert test_docker_hub._tags[test_repo] == expected_tags
+    # The validators of the first page don't cover the whole tag list.
+    assert test_docker_hub._cache[test_repo] == {
+        "tags": expected_tags,
+        "timestamp": 1000,
+        "etag": None,
+        "last_modified": None,
+        "last_updated": None,
+    }
+
+    # A later crawl doesn't send conditional headers for the multi-page tag list.
+    assert test_docker_hub._get_conditional_headers(test_repo) == {}
+
+    mock__iter_pages.assert_called_once_with("test_url/v2/repositories/" + test_repo + 
+                                             "/tags/?page_size=100", {})
+
+@patch.object(registry.Core, "config_file")
+@patch("dem.core.registry.time.time")
+@patch.object(registry.DockerHub, "_iter_pages")
+def test_Registry__list_tags_revalidated(mock__iter_pages: MagicMock, mock_time: MagicMock,
+                                         mock_config_file: MagicMock) -> None:
+    # Test setup
+    test_repo = "test_repo"
+    mock_config_file.registry_cache_ttl_s = 100
+    mock_config_file.registry_cache_max_staleness_s = 1000
+    mock_time.return_value = 2000
+
+    mock_response = MagicMock()
+    mock_response.headers = {
+        "ETag": "new_etag",
+    }
+    mock__iter_pages.return_value = iter([
+        (mock_response, {"results": [{"name": "new1"}]}),
+    ])
+
+    test_docker_hub = registry.DockerHub(MagicMock(), {
+        "url": "test_url"
+    })
+    test_docker_hub._cache = {
+        test_repo: {
+            "tags": ["old1", "old2"],
+            "timestamp": 1500,
+            "etag": "old_etag",
+            "last_modified": None,
+        }
+    }
+
+    # The crawl serves the stale tags.
+    test_docker_hub.serve_stale = True
+    test_docker_hub._list_tags(test_repo)
+    assert test_docker_hub._tags[test_repo] == ["old1", "old2"]
+    mock__iter_pages.assert_not_called()
+
+    # Run unit under test
+    # The background revalidation gets the changed tags.
+    test_docker_hub.serve_stale = False
+    test_docker_hub._list_tags(test_repo, False)
+
+    # Check expectations
+    assert test_docker_hub._tags[test_repo] == ["new1"]
+    assert test_docker_hub._cache[test_repo] == {
+        "tags": ["new1"],
+        "timestamp": 2000,
+        "etag": "new_etag",
+        "last_modified": None,
+        "last_updated": None,
+    }
+
+    mock__iter_pages.assert_called_once_with("test_url/v2/repositories/" + test_repo + 
+                                             "/tags/?page_size=100", 
+                                             {"If-None-Match": "old_etag"})
+
+@patch.object(registry.Core, "user_output")
+@patch.object(registry.DockerHub, "_iter_pages")
+def test_Registry__list_tags_failed_page(mock__iter_pages: MagicMock, 
+                                         mock_user_output: MagicMock) -> None:
+    # Test setup
+    test_repo = "test_repo"
+    test_exception_text = "test_exception_text"
+
+    def test_pages():
+        yield MagicMock(), {"results": [{"name": "latest"}]}
+        raise registry.RegistryError(test_exception_text)
+    mock__iter_pages.return_value = test_pages()
+
+    test_docker_hub = registry.DockerHub(MagicMock(), {
+        "url": "test_url"
+    })
+
+    # Run unit under test
+    test_docker_hub._list_tags(test_repo)
+
+    # Check expectations
+    assert test_repo not in test_docker_hub._tags
+    assert test_repo not in test_docker_hub._cache
+
+    mock_user_output.error.assert_called_once_with("Registry error: " + test_exception_text)
     mock_user_output.msg.assert_called_once_with("Skipping repository: " + test_repo)
 
 @patch.object(registry.Core, "user_output")
@@ -145,35 +830,1035 @@ def test_Registry_repos(mock__list_repos_in_registry: MagicMock, mock_user_outpu
     mock__list_repos_in_registry.assert_called_once()
     mock_user_output.status_generator.assert_called_once_with(mock_generator)
 
-def test_DockerHub__append_repo_with_tag():
+@patch.object(registry.Registry, "_record_request_result", MagicMock())
+@patch.object(registry.Registry, "_is_circuit_open", MagicMock(return_value=False))
+@patch.object(registry.Core, "config_file")
+@patch.object(registry.Registry, "_list_tags")
+def test_Registry__list_tags_of_repos(mock__list_tags: MagicMock, mock_config_file: MagicMock):
     # Test setup
     mock_container_engine = MagicMock()
     test_registry_config = {}
+    mock_config_file.max_workers = 4
 
-    test_endpoint_response = {
-        "results": [
-            {
-                "name": "latest"
-            },
-            {
-                "name": "v0.0.1"
-            }
-        ]
+    test_repos = ["test_repo1", "test_repo2", "test_repo3"]
+    test_tags = {
+        "test_repo1": ["latest", "v0.0.1"],
+        "test_repo3": ["latest"],
     }
-    test_repo = "test_repo"
 
-    test_docker_hub = registry.DockerHub(mock_container_engine, test_registry_config)
+    test_registry = HelperRegistry(mock_container_engine, test_registry_config)
+    # The tags of the last repository arrive first, the order of the result must not change.
+    test_registry._tags = dict(reversed(test_tags.items()))
+
+    # Run unit under test
+    actual_items = list(test_registry._list_tags_of_repos(test_repos))
+
+    # Check expectations
+    assert actual_items == ["Loading image data from: " + test_repo for test_repo in test_repos]
+    assert test_registry._repos == ["test_repo1:latest", "test_repo1:v0.0.1", "test_repo3:latest"]
+
+    mock__list_tags.assert_has_calls([call(test_repo) for test_repo in test_repos], any_order=True)
+
+@patch.object(registry.Registry, "_record_request_result", MagicMock())
+@patch.object(registry.Registry, "_is_circuit_open", MagicMock(return_value=False))
+@patch.object(registry.Core, "config_file")
+@patch.object(registry.Registry, "_list_tags")
+def test_Registry__list_tags_of_repos_filtered(mock__list_tags: MagicMock, 
+                                               mock_config_file: MagicMock):
+    # Test setup
+    mock_config_file.max_workers = 4
+    test_registry_config = {
+        "include": ["axem/*"],
+        "exclude": ["*_old"],
+    }
+    test_repos = ["axem/make_gnu_arm", "axem/make_gnu_arm_old", "axem/cpputest", "other/repo"]
+
+    test_registry = HelperRegistry(MagicMock(), test_registry_config)
+    test_registry.repo_filter = ["*arm*", "*stlink*"]
+
+    # Run unit under test
+    actual_items = list(test_registry._list_tags_of_repos(test_repos))
+
+    # Check expectations
+    assert actual_items == ["Loading image data from: axem/make_gnu_arm"]
+
+    mock__list_tags.assert_called_once_with("axem/make_gnu_arm")
+
+@patch("dem.core.registry.time.time")
+@patch.object(registry.Core, "config_file")
+def test_Registry__get_cached_tags_serve_stale(mock_config_file: MagicMock, 
+                                               mock_time: MagicMock) -> None:
+    # Test setup
+    mock_config_file.registry_cache_ttl_s = 100
+    mock_config_file.registry_cache_max_staleness_s = 1000
+    mock_time.return_value = 2000
+
+    test_registry = HelperRegistry(MagicMock(), {})
+    test_registry.serve_stale = True
+    test_registry._cache = {
+        "fresh_repo": {"tags": ["fresh"], "timestamp": 1950},
+        "stale_repo": {"tags": ["stale"], "timestamp": 1500},
+        "too_stale_repo": {"tags": ["too_stale"], "timestamp": 500},
+    }
+
+    # Run unit under test and check expectations
+    assert test_registry._get_cached_tags("fresh_repo") == ["fresh"]
+    assert test_registry._get_cached_tags("stale_repo") == ["stale"]
+    assert test_registry._get_cached_tags("too_stale_repo") is None
+    assert test_registry._stale_repos == ["stale_repo"]
+
+    test_registry.serve_stale = False
+    assert test_registry._get_cached_tags("stale_repo") is None
+
+@patch("dem.core.registry.time.time")
+@patch.object(registry.Core, "config_file")
+def test_Registry__get_cached_tags_incremental(mock_config_file: MagicMock, 
+                                               mock_time: MagicMock) -> None:
+    # Test setup
+    mock_config_file.registry_cache_ttl_s = 100
+    mock_time.return_value = 10000
+
+    test_registry = HelperRegistry(MagicMock(), {})
+    test_registry.incremental = True
+    test_registry._cache = {
+        "unchanged_repo": {"tags": ["latest"], "timestamp": 1000, "last_updated": "v1"},
+        "changed_repo": {"tags": ["latest"], "timestamp": 1000, "last_updated": "v1"},
+        "expired_unknown_version_repo": {"tags": ["latest"], "timestamp": 1000},
+        "fresh_unknown_version_repo": {"tags": ["latest"], "timestamp": 9950},
+    }
+    test_registry._repo_versions = {
+        "unchanged_repo": "v1",
+        "changed_repo": "v2",
+        "new_repo": "v1",
+    }
+
+    # Run unit under test and check expectations
+    # The age of the entries doesn't matter, only the change markers.
+    assert test_registry._get_cached_tags("unchanged_repo") == ["latest"]
+    assert test_registry._get_cached_tags("changed_repo") is None
+    assert test_registry._get_cached_tags("new_repo") is None
+    # Without a change marker the TTL applies.
+    assert test_registry._get_cached_tags("expired_unknown_version_repo") is None
+    assert test_registry._get_cached_tags("fresh_unknown_version_repo") == ["latest"]
+
+    test_registry.refresh = True
+    assert test_registry._get_cached_tags("unchanged_repo") is None
+
+@patch.object(registry.Core, "config_file")
+@patch("dem.core.registry.time.time")
+@patch.object(registry.DockerRegistry, "_iter_pages")
+def test_Registry__list_tags_incremental_no_change_marker(mock__iter_pages: MagicMock, 
+                                                          mock_time: MagicMock,
+                                                          mock_config_file: MagicMock) -> None:
+    # Test setup
+    test_repo = "test_registry/test_repo"
+    mock_config_file.registry_cache_ttl_s = 100
+    mock_time.return_value = 10000
+    mock__iter_pages.return_value = iter([(MagicMock(), None)])
+
+    test_docker_registry = registry.DockerRegistry(MagicMock(), {
+        "url": "test_url"
+    })
+    test_docker_registry.incremental = True
+    test_docker_registry._cache = {
+        test_repo: {
+            "tags": ["latest"],
+            "timestamp": 1000,
+            "etag": "test_etag",
+            "last_modified": None,
+        }
+    }
+
+    # Run unit under test
+    test_docker_registry._list_tags(test_repo)
+
+    # Check expectations
+    # The catalog doesn't report a change marker, so the expired tags get revalidated.
+    assert test_docker_registry._tags[test_repo] == ["latest"]
+    assert test_docker_registry._cache[test_repo]["timestamp"] == 10000
+
+    mock__iter_pages.assert_called_once_with(test_docker_registry._get_tag_endpoint_url(test_repo),
+                                             {"If-None-Match": "test_etag"})
+
+@patch.object(registry.Registry, "_record_request_result", MagicMock())
+@patch.object(registry.Registry, "_is_circuit_open", MagicMock(return_value=False))
+@patch.object(registry.Core, "config_file")
+@patch.object(registry.Registry, "_list_tags")
+def test_Registry__list_tags_of_repos_incremental(mock__list_tags: MagicMock, 
+                                                  mock_config_file: MagicMock):
+    # Test setup
+    mock_config_file.max_workers = 4
+    test_cache = {
+        "test_repo1": {"tags": ["latest"], "timestamp": 1000},
+        "removed_repo": {"tags": ["latest"], "timestamp": 1000},
+        "excluded_repo": {"tags": ["latest"], "timestamp": 1000},
+    }
+    mock_registry_cache = MagicMock()
+    mock_registry_cache.get_registry_cache.return_value = test_cache
+
+    test_registry = HelperRegistry(MagicMock(), {"url": "test_url", "exclude": ["excluded_*"]}, 
+                                   mock_registry_cache)
+    test_registry.incremental = True
+
+    # Run unit under test
+    test_registry._repo_listing_complete = False
+    list(test_registry._list_tags_of_repos(["test_repo1", "excluded_repo"]))
+
+    # Check expectations
+    # An incomplete listing doesn't prove that a repository has been removed.
+    assert "removed_repo" in test_cache
+
+    # Run unit under test
+    test_registry._repo_listing_complete = True
+    list(test_registry._list_tags_of_repos(["test_repo1", "excluded_repo"]))
+
+    # Check expectations
+    assert list(test_cache) == ["test_repo1", "excluded_repo"]
+
+@patch.object(registry.Registry, "_record_request_result", MagicMock())
+@patch.object(registry.Registry, "_is_circuit_open", MagicMock(return_value=False))
+@patch.object(registry.Core, "config_file")
+@patch.object(registry.Registry, "_list_tags")
+def test_Registry__list_tags_of_repos_priority(mock__list_tags: MagicMock, 
+                                               mock_config_file: MagicMock):
+    # Test setup
+    mock_config_file.max_workers = 1
+    mock_config_file.registry_crawl_deadline_s = 0
+    test_repos = ["test/repo1", "test/repo2", "test/repo3"]
+
+    test_registry = HelperRegistry(MagicMock(), {"exclude": ["*_old"]})
+    test_registry.priority_repos = ["test/repo3", "test/missing", "test/repo_old"]
+    test_registry._tags = {
+        "test/repo1": ["latest"],
+        "test/repo3": ["latest"],
+    }
+
+    # Run unit under test
+    actual_items = list(test_registry._list_tags_of_repos(test_repos))
+
+    # Check expectations
+    assert actual_items == ["Loading image data from: test/repo3", 
+                            "Loading image data from: test/missing",
+                            "Loading image data from: test/repo1", 
+                            "Loading image data from: test/repo2"]
+    assert test_registry._repos == ["test/repo3:latest", "test/repo1:latest"]
+
+    # With a single worker the requests are executed in the order of submission.
+    assert mock__list_tags.call_args_list == [call("test/repo3", False), call("test/missing", False),
+                                              call("test/repo1"), call("test/repo2")]
+
+@patch("dem.core.registry.time.time")
+@patch.object(registry.Core, "config_file")
+def test_Registry_circuit_breaker(mock_config_file: MagicMock, mock_time: MagicMock) -> None:
+    # Test setup
+    mock_config_file.circuit_breaker_threshold = 2
+    mock_config_file.circuit_breaker_cooldown_s = 100
+    mock_time.return_value = 1000
+
+    test_registry = HelperRegistry(MagicMock(), {})
+
+    # Run unit under test and check expectations
+    test_registry._record_request_result(False)
+    assert test_registry._is_circuit_open() is False
+
+    test_registry._record_request_result(False)
+    assert test_registry._is_circuit_open() is True
+    assert test_registry._circuit_breaker == {"failures": 2, "opened_at": 1000}
+
+    # Half-open after the cooldown
+    mock_time.return_value = 1100
+    assert test_registry._is_circuit_open() is False
+
+    # A failure in half-open state opens the circuit again
+    test_registry._record_request_result(False)
+    assert test_registry._is_circuit_open() is True
+
+    # A success closes the circuit
+    test_registry._record_request_result(True)
+    assert test_registry._is_circuit_open() is False
+    assert test_registry._circuit_breaker["failures"] == 0
+
+def test_Registry__get_circuit_breaker_from_cache() -> None:
+    # Test setup
+    mock_registry_cache = MagicMock()
+    test_registry_config = {
+        "url": "test_url"
+    }
+    test_registry = HelperRegistry(MagicMock(), test_registry_config, mock_registry_cache)
+
+    # Run unit under test
+    actual_circuit_breaker = test_registry._get_circuit_breaker()
+
+    # Check expectations
+    assert actual_circuit_breaker is mock_registry_cache.get_circuit_breaker.return_value
+
+    mock_registry_cache.get_circuit_breaker.assert_called_once_with("test_url")
+
+@patch.object(registry.Registry, "_get_token_bucket")
+@patch.object(registry.Registry, "_is_circuit_open")
+@patch.object(registry.Core, "config_file")
+@patch.object(registry.Core, "_http_session")
+def test_Registry__iter_pages_circuit_open(mock_http_session: MagicMock, 
+                                          mock_config_file: MagicMock,
+                                          mock__is_circuit_open: MagicMock,
+                                          mock__get_token_bucket: MagicMock) -> None:
+    # Test setup
+    mock_config_file.circuit_breaker_cooldown_s = 300
+    mock__is_circuit_open.return_value = True
+
+    test_registry = HelperRegistry(MagicMock(), {})
+
+    # Run unit under test
+    with pytest.raises(registry.RegistryError) as e:
+        list(test_registry._iter_pages("test_url"))
+
+    # Check expectations
+    assert str(e.value) == "Registry error: The registry failed repeatedly, it is disabled for 300 seconds. Use the --refresh option to retry now."
+
+    mock__get_token_bucket.return_value.acquire.assert_not_called()
+    mock_http_session.get.assert_not_called()
+
+@patch.object(registry.Registry, "_get_token_bucket", MagicMock())
+@patch.object(registry.Registry, "_is_circuit_open", MagicMock(return_value=False))
+@patch.object(registry.Registry, "_record_request_result")
+@patch.object(registry.Core, "config_file")
+@patch.object(registry.Core, "_http_session")
+def test_Registry__iter_pages_records_request_results(mock_http_session: MagicMock, 
+                                                     mock_config_file: MagicMock,
+                                                     mock__record_request_result: MagicMock) -> None:
+    # Test setup
+    mock_error_response = MagicMock()
+    mock_error_response.status_code = requests.codes.service_unavailable
+    mock_http_session.get.side_effect = [mock_error_response, Exception("test")]
+
+    test_registry = HelperRegistry(MagicMock(), {})
+
+    # Run unit under test
+    with pytest.raises(registry.RegistryError):
+        list(test_registry._iter_pages("test_url"))
+    with pytest.raises(registry.RegistryError):
+        list(test_registry._iter_pages("test_url"))
+
+    # Check expectations
+    mock__record_request_result.assert_has_calls([call(False), call(False)])
+
+@patch.object(registry.Registry, "_is_circuit_open", MagicMock(return_value=False))
+@patch.object(registry.Core, "user_output")
+@patch.object(registry.Core, "config_file")
+@patch.object(registry.Registry, "_list_tags")
+def test_Registry__list_tags_of_repos_deadline(mock__list_tags: MagicMock, 
+                                               mock_config_file: MagicMock,
+                                               mock_user_output: MagicMock) -> None:
+    # Test setup
+    mock_config_file.max_workers = 2
+    test_repos = ["test_repo1", "test_repo2", "test_repo3"]
+
+    test_registry = HelperRegistry(MagicMock(), {"name": "test_registry"})
+    test_registry._tags = {
+        "test_repo1": ["latest"],
+        "test_repo2": ["latest"],
+    }
+    test_registry.deadline = 0.0
+
+    with patch.object(registry.Registry, "_get_time_left", side_effect=[1.0, 1.0, 0.0, 1.0, 1.0]):
+        # Run unit under test
+        actual_items = list(test_registry._list_tags_of_repos(test_repos))
+
+    # Check expectations
+    # The third repository is not requested, the results of the first two are kept.
+    assert actual_items == ["Loading image data from: test_repo1", 
+                            "Loading image data from: test_repo2"]
+    assert test_registry._repos == ["test_repo1:latest", "test_repo2:latest"]
+
+    mock__list_tags.assert_has_calls([call("test_repo1"), call("test_repo2")], any_order=True)
+    assert mock__list_tags.call_count == 2
+    mock_user_output.msg.assert_called_once_with("[yellow]The crawl deadline is reached, the tool image list of the test_registry registry is incomplete.[/]")
+
+@patch.object(registry.Registry, "_is_circuit_open", MagicMock(return_value=False))
+@patch.object(registry.Core, "user_output", MagicMock())
+@patch.object(registry.Core, "config_file")
+@patch.object(registry.Registry, "_list_tags")
+def test_Registry__list_tags_of_repos_deadline_running_request(mock__list_tags: MagicMock, 
+                                                               mock_config_file: MagicMock) -> None:
+    # Test setup
+    mock_config_file.max_workers = 2
+    test_request_released = threading.Event()
+
+    def test_list_tags(repo: str) -> None:
+        if repo == "test_repo2":
+            test_request_released.wait(10)
+    mock__list_tags.side_effect = test_list_tags
+
+    test_registry = HelperRegistry(MagicMock(), {"name": "test_registry"})
+    test_registry._tags = {
+        "test_repo1": ["latest"],
+    }
+    test_registry.deadline = 0.0
+
+    try:
+        with patch.object(registry.Registry, "_get_time_left", side_effect=[1.0, 1.0, 1.0, 0.0]):
+            # Run unit under test
+            actual_items = list(test_registry._list_tags_of_repos(["test_repo1", "test_repo2"]))
+
+        # Check expectations
+        # The crawl is finished while the request of the second repository is still running.
+        assert not test_request_released.is_set()
+        assert actual_items == ["Loading image data from: test_repo1", 
+                                "Loading image data from: test_repo2"]
+        assert test_registry._repos == ["test_repo1:latest"]
+        assert test_registry._is_crawl_abandoned is True
+    finally:
+        test_request_released.set()
+
+@patch.object(registry.Core, "config_file", MagicMock())
+@patch("dem.core.registry.time.time")
+@patch.object(registry.DockerHub, "_iter_pages")
+def test_Registry__list_tags_crawl_abandoned(mock__iter_pages: MagicMock, 
+                                             mock_time: MagicMock) -> None:
+    # Test setup
+    test_repo = "test_repo"
+    mock_time.return_value = 1000
+    mock__iter_pages.return_value = iter([
+        (MagicMock(headers={}), {"results": [{"name": "latest"}]}),
+    ])
+
+    test_docker_hub = registry.DockerHub(MagicMock(), {
+        "url": "test_url"
+    })
+    test_docker_hub._is_crawl_abandoned = True
+
+    # Run unit under test
+    test_docker_hub._list_tags(test_repo)
+
+    # Check expectations
+    # The crawl has been finished without this request, so the cache is not modified anymore.
+    assert test_docker_hub._tags[test_repo] == ["latest"]
+    assert test_repo not in test_docker_hub._cache
+
+@patch.object(registry.Registry, "_is_circuit_open")
+@patch.object(registry.Core, "config_file")
+@patch.object(registry.Registry, "_list_tags")
+def test_Registry__list_tags_of_repos_circuit_opens(mock__list_tags: MagicMock, 
+                                                    mock_config_file: MagicMock,
+                                                    mock__is_circuit_open: MagicMock) -> None:
+    # Test setup
+    mock_config_file.max_workers = 1
+    mock_config_file.circuit_breaker_cooldown_s = 300
+    mock__is_circuit_open.side_effect = [False, True]
+
+    test_registry = HelperRegistry(MagicMock(), {})
+    test_pages = test_registry._list_tags_of_repos(["test_repo1", "test_repo2"])
+
+    # Run unit under test
+    actual_first_item = next(test_pages)
+    with pytest.raises(registry.RegistryError):
+        next(test_pages)
+
+    # Check expectations
+    assert actual_first_item == "Loading image data from: test_repo1"
+
+@patch.object(registry.Registry, "_send_request")
+@patch.object(registry.Core, "config_file")
+def test_Registry_is_tag_available(mock_config_file: MagicMock, 
+                                   mock__send_request: MagicMock) -> None:
+    # Test setup
+    test_registry = HelperRegistry(MagicMock(), {"url": "https://test_url"})
+    mock_found_response = MagicMock()
+    mock_found_response.status_code = requests.codes.ok
+    mock_not_found_response = MagicMock()
+    mock_not_found_response.status_code = requests.codes.not_found
+    mock_error_response = MagicMock()
+    mock_error_response.status_code = requests.codes.unauthorized
+    mock__send_request.side_effect = [mock_found_response, mock_not_found_response, 
+                                      mock_error_response]
+
+    # Run unit under test and check expectations
+    assert test_registry.is_tag_available("test/repo", "latest") is True
+    assert test_registry.is_tag_available("test/repo", "missing") is False
+    with pytest.raises(registry.RegistryError) as e:
+        test_registry.is_tag_available("test/repo", "latest")
+    assert str(e.value) == "Registry error: Error in communication with the registry. Response status code: 401"
+
+    mock__send_request.assert_called_with("https://test_url/v2/test/repo/manifests/latest", 
+                                          {"Accept": ", ".join(registry.Registry._manifest_media_types)},
+                                          "HEAD")
+
+@patch("dem.core.registry.platform.machine")
+@patch.object(registry.Registry, "_send_request")
+@patch.object(registry.Core, "config_file")
+def test_Registry_get_layers(mock_config_file: MagicMock, mock__send_request: MagicMock,
+                             mock_machine: MagicMock) -> None:
+    # Test setup
+    mock_machine.return_value = "aarch64"
+    test_registry = HelperRegistry(MagicMock(), {"url": "https://test_url"})
+    mock_list_response = MagicMock()
+    mock_list_response.status_code = requests.codes.ok
+    mock_list_response.json.return_value = {
+        "mediaType": "application/vnd.oci.image.index.v1+json",
+        "manifests": [
+            {"digest": "sha256:amd64", "platform": {"os": "linux", "architecture": "amd64"}},
+            {"digest": "sha256:arm64", "platform": {"os": "linux", "architecture": "arm64"}},
+        ]
+    }
+    mock_manifest_response = MagicMock()
+    mock_manifest_response.status_code = requests.codes.ok
+    mock_manifest_response.json.return_value = {
+        "mediaType": "application/vnd.oci.image.manifest.v1+json",
+        "layers": [
+            {"digest": "sha256:layer1", "size": 100},
+            {"digest": "sha256:layer2", "size": 200},
+        ]
+    }
+    mock__send_request.side_effect = [mock_list_response, mock_manifest_response]
+
+    # Run unit under test
+    actual_layers = test_registry.get_layers("test/repo", "latest")
+
+    # Check expectations
+    assert actual_layers == [("sha256:layer1", 100), ("sha256:layer2", 200)]
+
+    test_accept_header = {"Accept": ", ".join(registry.Registry._manifest_media_types)}
+    mock__send_request.assert_has_calls([
+        call("https://test_url/v2/test/repo/manifests/latest", test_accept_header),
+        call("https://test_url/v2/test/repo/manifests/sha256:arm64", test_accept_header),
+    ])
+
+@patch("dem.core.registry.platform.machine")
+@patch.object(registry.Registry, "_send_request")
+@patch.object(registry.Core, "config_file")
+def test_Registry_get_layers_unsupported_platform(mock_config_file: MagicMock, 
+                                                 mock__send_request: MagicMock,
+                                                 mock_machine: MagicMock) -> None:
+    # Test setup
+    mock_machine.return_value = "riscv64"
+    test_registry = HelperRegistry(MagicMock(), {"url": "https://test_url"})
+    mock_list_response = MagicMock()
+    mock_list_response.status_code = requests.codes.ok
+    mock_list_response.json.return_value = {
+        "mediaType": "application/vnd.docker.distribution.manifest.list.v2+json",
+        "manifests": [
+            {"digest": "sha256:amd64", "platform": {"os": "linux", "architecture": "amd64"}},
+        ]
+    }
+    mock__send_request.return_value = mock_list_response
+
+    # Run unit under test
+    actual_layers = test_registry.get_layers("test/repo", "latest")
+
+    # Check expectations
+    assert actual_layers == []
+    mock__send_request.assert_called_once()
+
+@patch.object(registry.Registry, "_send_request")
+@patch.object(registry.Core, "config_file")
+def test_Registry_get_layers_invalid_status_code(mock_config_file: MagicMock, 
+                                                mock__send_request: MagicMock) -> None:
+    # Test setup
+    test_registry = HelperRegistry(MagicMock(), {"url": "https://test_url"})
+    mock_response = MagicMock()
+    mock_response.status_code = requests.codes.not_found
+    mock__send_request.return_value = mock_response
+
+    # Run unit under test
+    with pytest.raises(registry.RegistryError) as e:
+        test_registry.get_layers("test/repo", "latest")
+
+    # Check expectations
+    assert str(e.value) == "Registry error: Error in communication with the registry. Response status code: 404"
+
+@patch("dem.core.registry.time.time")
+@patch.object(registry.Registry, "_send_request")
+@patch.object(registry.Core, "config_file")
+def test_Registry_is_tag_available_cached(mock_config_file: MagicMock, 
+                                          mock__send_request: MagicMock,
+                                          mock_time: MagicMock) -> None:
+    # Test setup
+    mock_config_file.registry_cache_ttl_s = 100
+    mock_time.return_value = 1050
+    mock_registry_cache = MagicMock()
+    mock_registry_cache.get_registry_cache.return_value = {
+        "test/repo": {
+            "tags": ["latest"],
+            "timestamp": 1000,
+        }
+    }
+    test_registry = HelperRegistry(MagicMock(), {"url": "https://test_url"}, mock_registry_cache)
+
+    # Run unit under test
+    actual_available = test_registry.is_tag_available("test/repo", "latest")
+
+    # Check expectations
+    assert actual_available is True
+
+    mock_registry_cache.get_registry_cache.assert_called_once_with("https://test_url")
+    mock__send_request.assert_not_called()
+
+@patch.object(registry.Registry, "_get_token_bucket", MagicMock())
+@patch.object(registry.Registry, "_record_request_result", MagicMock())
+@patch.object(registry.Registry, "_is_circuit_open", MagicMock(return_value=False))
+@patch.object(registry.Core, "config_file")
+@patch.object(registry.Core, "_http_session")
+def test_Registry__send_request_head(mock_http_session: MagicMock, 
+                                     mock_config_file: MagicMock) -> None:
+    # Test setup
+    mock_response = MagicMock()
+    mock_response.status_code = requests.codes.ok
+    mock_http_session.head.return_value = mock_response
+    test_headers = {"Accept": "test"}
+
+    test_registry = HelperRegistry(MagicMock(), {})
+
+    # Run unit under test
+    actual_response = test_registry._send_request("test_url", test_headers, "HEAD")
+
+    # Check expectations
+    assert actual_response is mock_response
+
+    mock_http_session.head.assert_called_once_with("test_url", headers=test_headers, 
+                                                   timeout=mock_config_file.http_request_timeout_s)
+    mock_http_session.get.assert_not_called()
+
+def test_Registry__parse_bearer_challenge() -> None:
+    # Run unit under test and check expectations
+    assert registry.Registry._parse_bearer_challenge(
+        'Bearer realm="https://auth.test/token",service="registry.test",scope="repository:test/repo:pull"'
+    ) == {
+        "realm": "https://auth.test/token",
+        "service": "registry.test",
+        "scope": "repository:test/repo:pull",
+    }
+    assert registry.Registry._parse_bearer_challenge('Basic realm="test"') is None
+    assert registry.Registry._parse_bearer_challenge("Bearer") is None
+    assert registry.Registry._parse_bearer_challenge(None) is None
+
+def test_Registry__get_bearer_scope() -> None:
+    # Run unit under test and check expectations
+    assert registry.Registry._get_bearer_scope("https://test_url/v2/_catalog?n=100") == "registry:catalog:*"
+    assert registry.Registry._get_bearer_scope("https://test_url/v2/test/repo/tags/list?n=100") == "repository:test/repo:pull"
+    assert registry.Registry._get_bearer_scope("https://test_url/v2/repo/manifests/latest") == "repository:repo:pull"
+    assert registry.Registry._get_bearer_scope("https://test_url/v2/") is None
+    # The Docker Hub API is not a registry endpoint.
+    assert registry.Registry._get_bearer_scope("https://hub.docker.com/v2/repositories/ns/repo/tags/?page_size=100") is None
+
+@patch.dict(registry.Registry._bearer_tokens, clear=True)
+@patch.dict(registry.Registry._bearer_challenges, clear=True)
+@patch.object(registry.Registry, "_get_bearer_token")
+def test_Registry__get_authorization_headers_hub_api(mock__get_bearer_token: MagicMock) -> None:
+    # Test setup
+    mock__get_bearer_token.return_value = "test_token"
+    registry.Registry._bearer_challenges["hub.docker.com"] = {
+        "realm": "https://auth.docker.io/token",
+        "service": "registry.docker.io",
+    }
+
+    test_registry = HelperRegistry(MagicMock(), {})
+
+    # Run unit under test
+    actual_hub_api_headers = test_registry._get_authorization_headers("https://hub.docker.com/v2/repositories/ns/repo/tags/?page_size=100")
+    actual_manifest_headers = test_registry._get_authorization_headers("https://hub.docker.com/v2/ns/repo/manifests/latest")
+
+    # Check expectations
+    # The challenged host of a manifest request doesn't make the Hub API requests authenticated.
+    assert actual_hub_api_headers == {}
+    assert actual_manifest_headers == {"Authorization": "Bearer test_token"}
+
+    mock__get_bearer_token.assert_called_once_with(registry.Registry._bearer_challenges["hub.docker.com"],
+                                                   "repository:ns/repo:pull")
+
+@patch.dict(registry.Registry._bearer_challenges, clear=True)
+@patch.object(registry.Registry, "_get_bearer_token")
+@patch.object(registry.Registry, "_get_token_bucket", MagicMock())
+@patch.object(registry.Registry, "_record_request_result", MagicMock())
+@patch.object(registry.Registry, "_is_circuit_open", MagicMock(return_value=False))
+@patch.object(registry.Core, "config_file")
+@patch.object(registry.Core, "_http_session")
+def test_Registry__send_request_bearer_challenge_unknown_scope(mock_http_session: MagicMock, 
+                                                               mock_config_file: MagicMock,
+                                                               mock__get_bearer_token: MagicMock) -> None:
+    # Test setup
+    mock_response = MagicMock()
+    mock_response.status_code = requests.codes.unauthorized
+    mock_response.headers = {
+        "WWW-Authenticate": 'Bearer realm="https://auth.docker.io/token",service="registry.docker.io"',
+    }
+    mock_http_session.get.return_value = mock_response
+
+    test_registry = HelperRegistry(MagicMock(), {})
+
+    # Run unit under test
+    actual_response = test_registry._send_request("https://hub.docker.com/v2/repositories/ns/repo/tags/")
+
+    # Check expectations
+    assert actual_response is mock_response
+    assert registry.Registry._bearer_challenges == {}
+
+    mock__get_bearer_token.assert_not_called()
+    mock_http_session.get.assert_called_once()
+
+@patch.dict(registry.Registry._bearer_tokens, clear=True)
+@patch.dict(registry.Registry._bearer_challenges, clear=True)
+@patch.object(registry.Registry, "_get_token_bucket", MagicMock())
+@patch.object(registry.Registry, "_record_request_result", MagicMock())
+@patch.object(registry.Registry, "_is_circuit_open", MagicMock(return_value=False))
+@patch.object(registry.Core, "config_file")
+@patch.object(registry.Core, "_http_session")
+def test_Registry__send_request_bearer_challenge(mock_http_session: MagicMock, 
+                                                 mock_config_file: MagicMock) -> None:
+    # Test setup
+    mock_config_file.registry_token_cache_on_disk = False
+    mock_unauthorized_response = MagicMock()
+    mock_unauthorized_response.status_code = requests.codes.unauthorized
+    mock_unauthorized_response.headers = {
+        "WWW-Authenticate": 'Bearer realm="https://auth.test/token",service="registry.test",scope="repository:repo:pull"'
+    }
+    mock_ok_response = MagicMock()
+    mock_ok_response.status_code = requests.codes.ok
+    mock_ok_response.headers = {}
+    mock_token_response = MagicMock()
+    mock_token_response.status_code = requests.codes.ok
+    mock_token_response.json.return_value = {"token": "test_token", "expires_in": 300}
+    mock_http_session.head.side_effect = [mock_unauthorized_response, mock_ok_response, 
+                                          mock_ok_response]
+    mock_http_session.get.return_value = mock_token_response
+    test_headers = {"Accept": "test"}
+    test_authorized_headers = {"Accept": "test", "Authorization": "Bearer test_token"}
+
+    test_registry = HelperRegistry(MagicMock(), {})
+
+    # Run unit under test
+    actual_first_response = test_registry._send_request("https://registry.test/v2/repo/manifests/1", 
+                                                        test_headers, "HEAD")
+    actual_second_response = test_registry._send_request("https://registry.test/v2/repo/manifests/2", 
+                                                         test_headers, "HEAD")
+
+    # Check expectations
+    assert actual_first_response is mock_ok_response
+    assert actual_second_response is mock_ok_response
+
+    # The token is requested once, the second request sends it right away.
+    mock_http_session.get.assert_called_once_with("https://auth.test/token", 
+                                                  params={"service": "registry.test", 
+                                                          "scope": "repository:repo:pull"},
+                                                  timeout=mock_config_file.http_request_timeout_s)
+    mock_http_session.head.assert_has_calls([
+        call("https://registry.test/v2/repo/manifests/1", headers=test_headers, 
+             timeout=mock_config_file.http_request_timeout_s),
+        call("https://registry.test/v2/repo/manifests/1", headers=test_authorized_headers, 
+             timeout=mock_config_file.http_request_timeout_s),
+        call("https://registry.test/v2/repo/manifests/2", headers=test_authorized_headers, 
+             timeout=mock_config_file.http_request_timeout_s),
+    ])
+
+@patch.dict(registry.Registry._bearer_tokens, clear=True)
+@patch.object(registry.Registry, "_get_token_bucket", MagicMock())
+@patch("dem.core.registry.time.time")
+@patch.object(registry.Core, "config_file")
+@patch.object(registry.Core, "_http_session")
+def test_Registry__get_bearer_token_stored(mock_http_session: MagicMock, mock_config_file: MagicMock,
+                                          mock_time: MagicMock) -> None:
+    # Test setup
+    mock_config_file.registry_token_cache_on_disk = True
+    mock_time.return_value = 1000.0
+    test_challenge = {"realm": "https://auth.test/token", "service": "registry.test"}
+    test_scope = "repository:repo:pull"
+    test_key = "https://auth.test/token registry.test repository:repo:pull"
+    test_stored_tokens = {
+        test_key: {"token": "stored_token", "expires_at": 2000.0},
+        "expired_key": {"token": "expired_token", "expires_at": 500.0},
+    }
+    mock_registry_cache = MagicMock()
+    mock_registry_cache.get_bearer_tokens.return_value = test_stored_tokens
+    mock_token_response = MagicMock()
+    mock_token_response.status_code = requests.codes.ok
+    mock_token_response.json.return_value = {"access_token": "new_token"}
+    mock_http_session.get.return_value = mock_token_response
+
+    test_registry = HelperRegistry(MagicMock(), {}, mock_registry_cache)
+
+    # Run unit under test
+    actual_stored_token = test_registry._get_bearer_token(test_challenge, test_scope)
+    actual_new_token = test_registry._get_bearer_token(test_challenge, test_scope, "stored_token")
+
+    # Check expectations
+    assert actual_stored_token == "stored_token"
+    assert actual_new_token == "new_token"
+    assert test_stored_tokens == {
+        test_key: {
+            "token": "new_token", 
+            "expires_at": 1000.0 + registry.Registry._bearer_token_lifetime_s - \
+                registry.Registry._bearer_token_expiry_margin_s
+        }
+    }
+
+    mock_http_session.get.assert_called_once()
+
+@patch.object(registry.Registry, "_get_token_bucket", MagicMock())
+@patch.object(registry.Core, "config_file")
+@patch.object(registry.Core, "_http_session")
+def test_Registry__get_bearer_token_failed(mock_http_session: MagicMock, 
+                                          mock_config_file: MagicMock) -> None:
+    # Test setup
+    mock_config_file.registry_token_cache_on_disk = False
+    mock_token_response = MagicMock()
+    mock_token_response.status_code = requests.codes.unauthorized
+    mock_http_session.get.return_value = mock_token_response
+
+    test_registry = HelperRegistry(MagicMock(), {})
+
+    # Run unit under test
+    with pytest.raises(registry.RegistryError) as e:
+        test_registry._get_bearer_token({"realm": "https://auth.test/failing"}, None)
+
+    # Check expectations
+    assert str(e.value) == "Registry error: Failed to obtain a token from https://auth.test/failing. Response status code: 401"
+
+    mock_http_session.get.assert_called_once_with("https://auth.test/failing", params={}, 
+                                                  timeout=mock_config_file.http_request_timeout_s)
+
+def test_Registry__is_repo_selected() -> None:
+    # Test setup
+    test_registry = HelperRegistry(MagicMock(), {})
+    test_excluding_registry = HelperRegistry(MagicMock(), {"exclude": ["test/*"]})
+
+    # Run unit under test and check expectations
+    assert test_registry._is_repo_selected("test/repo") is True
+    assert test_excluding_registry._is_repo_selected("test/repo") is False
+    assert test_excluding_registry._is_repo_selected("other/repo") is True
+
+@patch.object(registry.Registry, "_record_request_result", MagicMock())
+@patch.object(registry.Registry, "_is_circuit_open", MagicMock(return_value=False))
+@patch.object(registry.Core, "config_file")
+@patch.object(registry.Registry, "_list_tags")
+def test_Registry__list_tags_of_repos_exception(mock__list_tags: MagicMock, 
+                                                mock_config_file: MagicMock):
+    # Test setup
+    mock_container_engine = MagicMock()
+    test_registry_config = {}
+    mock_config_file.max_workers = 2
+
+    test_exception_text = "test_exception_text"
+    mock__list_tags.side_effect = Exception(test_exception_text)
+
+    test_registry = HelperRegistry(mock_container_engine, test_registry_config)
+
+    # Run unit under test
+    with pytest.raises(Exception) as e:
+        list(test_registry._list_tags_of_repos(["test_repo"]))
+
+    # Check expectations
+    assert test_exception_text == str(e.value)
+
+def test_DockerHub__append_repo_with_tag():
+    # Test setup
+    mock_container_engine = MagicMock()
+    test_registry_config = {}
+
+    test_endpoint_response = {
+        "results": [
+            {
+                "name": "latest"
+            },
+            {
+                "name": "v0.0.1"
+            }
+        ]
+    }
+    test_repo = "test_repo"
+
+    test_docker_hub = registry.DockerHub(mock_container_engine, test_registry_config)
+
+    # Run unit under test
+    test_docker_hub._append_repo_with_tag(test_endpoint_response, test_repo)
+
+    # Check expectations
+    expected_tags = [test_result["name"] for test_result in test_endpoint_response["results"]]
+    assert expected_tags == test_docker_hub._tags[test_repo]
+
+def test_DockerHub__get_tag_endpoint_url():
+    # Test setup
+    mock_container_engine = MagicMock()
+    test_registry_config = {
+        "url": "test_url",
+    }
+
+    test_repo = "registry/test_repo"
+
+    test_docker_hub = registry.DockerHub(mock_container_engine, test_registry_config)
+
+    # Run unit under test
+    actual_endpoint_url = test_docker_hub._get_tag_endpoint_url(test_repo)
+
+    # Check expectations
+    expected_endpoint_url = test_registry_config["url"] + "/v2/repositories/" + test_repo + \
+        "/tags/?page_size=100"
+    assert expected_endpoint_url == actual_endpoint_url
+
+def test_DockerHub__get_next_page_url():
+    # Test setup
+    test_docker_hub = registry.DockerHub(MagicMock(), {})
+    test_next_url = "test_next_url"
+
+    # Run unit under test
+    actual_next_url = test_docker_hub._get_next_page_url(MagicMock(), {"next": test_next_url})
+    actual_last_page_next_url = test_docker_hub._get_next_page_url(MagicMock(), {"next": None})
+
+    # Check expectations
+    assert actual_next_url == test_next_url
+    assert actual_last_page_next_url is None
+
+@patch.object(registry.DockerHub, "_search")
+@patch.object(registry.DockerHub, "_list_tags_of_repos")
+def test_DockerHub__list_repos_in_registry(mock__list_tags_of_repos: MagicMock, 
+                                           mock__search: MagicMock):
+    # Test setup
+    mock_container_engine = MagicMock()
+    test_registry_config = {
+        "name": "test_registry_name"
+    }
+    test_repos = [
+        test_registry_config["name"] + "/test_repo1",
+        test_registry_config["name"] + "/test_repo2",
+    ]
+    test_items = ["Loading image data from: " + test_repo for test_repo in test_repos]
+
+    mock__search.return_value = iter(test_repos)
+    mock__list_tags_of_repos.return_value = iter(test_items)
+
+    test_docker_hub = registry.DockerHub(mock_container_engine, test_registry_config)
+
+    # Run unit under test
+    actual_items = list(test_docker_hub._list_repos_in_registry())
+
+    # Check expectations
+    assert test_items == actual_items
+
+    mock_container_engine.search.assert_not_called()
+    mock__list_tags_of_repos.assert_called_once()
+    assert test_repos == list(mock__list_tags_of_repos.call_args.args[0])
+
+@patch.object(registry.DockerHub, "_iter_pages")
+def test_DockerHub__search(mock__iter_pages: MagicMock) -> None:
+    # Test setup
+    test_registry_config = {
+        "name": "test_namespace",
+        "url": "test_url",
+    }
+    test_pages = [
+        (MagicMock(), {"results": [{"namespace": "test_namespace", "name": "test_repo1", 
+                                    "last_updated": "2024-01-01T00:00:00Z"},
+                                   {"namespace": "test_namespace", "name": "test_repo2", 
+                                    "last_updated": None}]}),
+        (MagicMock(), {"results": [{"name": "test_repo3", "last_updated": "2024-02-01T00:00:00Z"}]}),
+    ]
+    mock__iter_pages.return_value = iter(test_pages)
+
+    test_docker_hub = registry.DockerHub(MagicMock(), test_registry_config)
+
+    # Run unit under test
+    actual_repos = list(test_docker_hub._search())
+
+    # Check expectations
+    assert actual_repos == ["test_namespace/test_repo1", "test_namespace/test_repo2", 
+                            "test_namespace/test_repo3"]
+    assert test_docker_hub._repo_versions == {
+        "test_namespace/test_repo1": "2024-01-01T00:00:00Z",
+        "test_namespace/test_repo3": "2024-02-01T00:00:00Z",
+    }
+    assert test_docker_hub._repo_listing_complete is True
+
+    mock__iter_pages.assert_called_once_with("test_url/v2/repositories/test_namespace/?page_size=100")
+
+@patch.object(registry.DockerHub, "user_output")
+@patch.object(registry.DockerHub, "_iter_pages")
+def test_DockerHub__search_exception(mock__iter_pages: MagicMock, 
+                                     mock_user_output: MagicMock) -> None:
+    # Test setup
+    test_registry_config = {
+        "name": "test_namespace",
+        "url": "test_url",
+    }
+    test_exception_text = "test_exception_text"
+    def iter_pages(url: str) -> Generator:
+        yield MagicMock(), {"results": [{"name": "test_repo1"}]}
+        raise registry.RegistryError(test_exception_text)
+    mock__iter_pages.side_effect = iter_pages
+
+    test_docker_hub = registry.DockerHub(MagicMock(), test_registry_config)
+
+    # Run unit under test
+    actual_repos = list(test_docker_hub._search())
+
+    # Check expectations
+    assert actual_repos == ["test_namespace/test_repo1"]
+    assert test_docker_hub._repo_listing_complete is False
+
+    mock_user_output.error.assert_called_once_with("Registry error: " + test_exception_text)
+    mock_user_output.msg.assert_called_once_with("Skipping registry: test_namespace")
+
+def test_DockerHub__get_manifest_url() -> None:
+    # Test setup
+    test_docker_hub = registry.DockerHub(MagicMock(), {"url": "https://registry.hub.docker.com"})
+
+    # Run unit under test
+    actual_url = test_docker_hub._get_manifest_url("axemsolutions/make_gnu_arm", "latest")
+
+    # Check expectations
+    assert actual_url == "https://registry.hub.docker.com/v2/repositories/axemsolutions/make_gnu_arm/tags/latest"
+    assert test_docker_hub._manifest_request_method == "GET"
+
+def test_DockerHub__get_image_manifest_url() -> None:
+    # Test setup
+    test_docker_hub = registry.DockerHub(MagicMock(), {"url": "https://registry.hub.docker.com"})
+
+    # Run unit under test
+    actual_url = test_docker_hub._get_image_manifest_url("axemsolutions/make_gnu_arm", "latest")
+
+    # Check expectations
+    assert actual_url == "https://registry.hub.docker.com/v2/axemsolutions/make_gnu_arm/manifests/latest"
+
+def test_DockerRegistry__get_manifest_url() -> None:
+    # Test setup
+    test_docker_registry = registry.DockerRegistry(MagicMock(), {"url": "http://localhost:5000"})
+
+    # Run unit under test
+    actual_url = test_docker_registry._get_manifest_url("localhost:5000/test_repo", "v1.0.0")
+
+    # Check expectations
+    assert actual_url == "http://localhost:5000/v2/test_repo/manifests/v1.0.0"
+    assert test_docker_registry._manifest_request_method == "HEAD"
+
+def test_DockerRegistry__get_manifest_url_nested_repo() -> None:
+    # Test setup
+    test_docker_registry = registry.DockerRegistry(MagicMock(), {"url": "http://localhost:5000"})
+
+    # Run unit under test
+    actual_url = test_docker_registry._get_manifest_url("localhost:5000/team/b", "x")
+    actual_image_manifest_url = test_docker_registry._get_image_manifest_url("localhost:5000/team/b",
+                                                                             "x")
+
+    # Check expectations
+    assert actual_url == "http://localhost:5000/v2/team/b/manifests/x"
+    assert actual_image_manifest_url == "http://localhost:5000/v2/team/b/manifests/x"
+
+def test_DockerRegistry__append_repo_with_tag():
+    # Test setup
+    mock_container_engine = MagicMock()
+    test_registry_config = {}
+
+    test_endpoint_response = {
+        "tags": ["latest", "v0.0.1"]
+    }
+    test_repo = "test_repo"
+
+    test_docker_registry = registry.DockerRegistry(mock_container_engine, test_registry_config)
 
     # Run unit under test
-    test_docker_hub._append_repo_with_tag(test_endpoint_response, test_repo)
+    test_docker_registry._append_repo_with_tag(test_endpoint_response, test_repo)
 
     # Check expectations
-    expected_repos = []
-    for test_result in test_endpoint_response["results"]:
-        expected_repos.append(test_repo + ":" + test_result["name"])
-    assert expected_repos == test_docker_hub._repos
+    assert test_endpoint_response["tags"] == test_docker_registry._tags[test_repo]
 
-def test_DockerHub__get_tag_endpoint_url():
+def test_DockerRegistry__get_tag_endpoint_url():
     # Test setup
     mock_container_engine = MagicMock()
     test_registry_config = {
@@ -182,85 +1867,173 @@ def test_DockerHub__get_tag_endpoint_url():
 
     test_repo = "registry/test_repo"
 
-    test_docker_hub = registry.DockerHub(mock_container_engine, test_registry_config)
+    test_docker_registry = registry.DockerRegistry(mock_container_engine, test_registry_config)
 
     # Run unit under test
-    actual_endpoint_url = test_docker_hub._get_tag_endpoint_url(test_repo)
+    actual_endpoint_url = test_docker_registry._get_tag_endpoint_url(test_repo)
 
     # Check expectations
-    expected_endpoint_url = test_registry_config["url"] + "/v2/repositories/" + test_repo + "/tags/"
+    expected_endpoint_url = test_registry_config["url"] + "/v2/test_repo/tags/list?n=100"
     assert expected_endpoint_url == actual_endpoint_url
 
-@patch.object(registry.DockerHub, "_list_tags")
-def test_DockerHub__list_repos_in_registry(mock__list_tags: MagicMock):
+def test_DockerRegistry__get_tag_endpoint_url_nested_repo():
+    # Test setup
+    test_docker_registry = registry.DockerRegistry(MagicMock(), {"url": "test_url"})
+
+    # Run unit under test
+    actual_endpoint_url = test_docker_registry._get_tag_endpoint_url("registry/team/b")
+
+    # Check expectations
+    assert actual_endpoint_url == "test_url/v2/team/b/tags/list?n=100"
+
+def test_DockerRegistry__get_next_page_url():
     # Test setup
-    mock_container_engine = MagicMock()
     test_registry_config = {
-        "name": "test_registry_name"
+        "url": "http://test_url:5000",
     }
-    test_repos = [
-        test_registry_config["name"] + "/test_repo1",
-        test_registry_config["name"] + "/test_repo2",
-    ]
-
-    mock_container_engine.search.return_value = test_repos
+    mock_response = MagicMock()
+    mock_response.links = {
+        "next": {
+            "url": "/v2/_catalog?last=test_repo&n=100",
+            "rel": "next"
+        }
+    }
+    mock_last_response = MagicMock()
+    mock_last_response.links = {}
 
-    test_docker_hub = registry.DockerHub(mock_container_engine, test_registry_config)
+    test_docker_registry = registry.DockerRegistry(MagicMock(), test_registry_config)
 
     # Run unit under test
-    generator = test_docker_hub._list_repos_in_registry()
+    actual_next_url = test_docker_registry._get_next_page_url(mock_response, {})
+    actual_last_page_next_url = test_docker_registry._get_next_page_url(mock_last_response, {})
 
     # Check expectations
-    calls = []
-    for idx, item in enumerate(generator):
-        expected_item = "Loading image data from: " + test_repos[idx]
-        assert expected_item == item
+    assert actual_next_url == "http://test_url:5000/v2/_catalog?last=test_repo&n=100"
+    assert actual_last_page_next_url is None
+
+@pytest.mark.parametrize("test_timestamp, test_serve_stale, expected_is_stale", [
+    (1950, False, False),
+    (1500, True, True),
+])
+@patch("dem.core.registry.time.time")
+@patch.object(registry.Core, "config_file")
+@patch.object(registry.DockerRegistry, "_search")
+def test_Registry__iter_repo_listing_cached(mock__search: MagicMock, mock_config_file: MagicMock,
+                                            mock_time: MagicMock, test_timestamp: float, 
+                                            test_serve_stale: bool, 
+                                            expected_is_stale: bool) -> None:
+    # Test setup
+    mock_config_file.registry_cache_ttl_s = 100
+    mock_config_file.registry_cache_max_staleness_s = 1000
+    mock_time.return_value = 2000
+    mock_registry_cache = MagicMock()
+    mock_registry_cache.get_repo_listing.return_value = {
+        "repos": ["test_repo1", "test_repo2"],
+        "repo_versions": {"test_repo1": "v1"},
+        "timestamp": test_timestamp,
+    }
 
-        calls.append(call(test_repos[idx]))
+    test_docker_registry = registry.DockerRegistry(MagicMock(), {"url": "test_url"}, 
+                                                   mock_registry_cache)
+    test_docker_registry.serve_stale = test_serve_stale
 
-    mock_container_engine.search.assert_called_once_with(test_registry_config["name"])
-    mock__list_tags.assert_has_calls(calls)
+    # Run unit under test
+    actual_repos = list(test_docker_registry._iter_repo_listing())
 
-def test_DockerRegistry__append_repo_with_tag():
+    # Check expectations
+    # The registry is not searched.
+    assert actual_repos == ["test_repo1", "test_repo2"]
+    assert test_docker_registry._repo_versions == {"test_repo1": "v1"}
+    assert test_docker_registry._is_repo_listing_stale is expected_is_stale
+
+    mock__search.assert_not_called()
+    mock_registry_cache.get_repo_listing.assert_called_once_with("test_url")
+
+@pytest.mark.parametrize("test_listing, test_incremental", [
+    ({}, False),
+    ({"repos": ["old_repo"], "repo_versions": {}, "timestamp": 1500}, False),
+    ({"repos": ["old_repo"], "repo_versions": {}, "timestamp": 1950}, True),
+])
+@patch("dem.core.registry.time.time")
+@patch.object(registry.Core, "config_file")
+@patch.object(registry.DockerHub, "_search")
+def test_Registry__iter_repo_listing_searched(mock__search: MagicMock, mock_config_file: MagicMock,
+                                              mock_time: MagicMock, test_listing: dict, 
+                                              test_incremental: bool) -> None:
     # Test setup
-    mock_container_engine = MagicMock()
-    test_registry_config = {}
+    mock_config_file.registry_cache_ttl_s = 100
+    mock_time.return_value = 2000
+    mock_registry_cache = MagicMock()
+    mock_registry_cache.get_repo_listing.return_value = test_listing
 
-    test_endpoint_response = {
-        "tags": ["latest", "v0.0.1"]
-    }
-    test_repo = "test_repo"
+    test_docker_hub = registry.DockerHub(MagicMock(), {"url": "test_url"}, mock_registry_cache)
+    test_docker_hub.incremental = test_incremental
 
-    test_docker_registry = registry.DockerRegistry(mock_container_engine, test_registry_config)
+    def test_search(report_errors: bool) -> Generator:
+        test_docker_hub._repo_versions["test_repo1"] = "v1"
+        yield "test_repo1"
+        yield "test_repo2"
+        test_docker_hub._repo_listing_complete = True
+    mock__search.side_effect = test_search
 
     # Run unit under test
-    test_docker_registry._append_repo_with_tag(test_endpoint_response, test_repo)
+    actual_repos = list(test_docker_hub._iter_repo_listing())
 
     # Check expectations
-    expected_repos = [test_repo + ":" + test_result for test_result in test_endpoint_response["tags"]]
-    assert expected_repos == test_docker_registry._repos
+    # The complete listing gets cached.
+    assert actual_repos == ["test_repo1", "test_repo2"]
+    assert test_listing == {
+        "repos": ["test_repo1", "test_repo2"],
+        "repo_versions": {"test_repo1": "v1"},
+        "timestamp": 2000,
+    }
 
-def test_DockerRegistry__get_tag_endpoint_url():
+    mock__search.assert_called_once_with(True)
+
+@patch.object(registry.Core, "config_file", MagicMock())
+@patch.object(registry.DockerRegistry, "_search")
+def test_Registry__iter_repo_listing_incomplete(mock__search: MagicMock) -> None:
     # Test setup
-    mock_container_engine = MagicMock()
-    test_registry_config = {
-        "url": "test_url",
-    }
+    mock__search.return_value = iter(["test_repo1"])
+    test_listing = {}
+    mock_registry_cache = MagicMock()
+    mock_registry_cache.get_repo_listing.return_value = test_listing
 
-    test_repo = "registry/test_repo"
+    test_docker_registry = registry.DockerRegistry(MagicMock(), {"url": "test_url"}, 
+                                                   mock_registry_cache)
 
-    test_docker_registry = registry.DockerRegistry(mock_container_engine, test_registry_config)
+    # Run unit under test
+    actual_repos = list(test_docker_registry._iter_repo_listing())
+
+    # Check expectations
+    # The listing failed, so it's not cached.
+    assert actual_repos == ["test_repo1"]
+    assert test_listing == {}
+
+@patch.object(registry.Core, "user_output")
+@patch.object(registry.DockerRegistry, "_iter_pages")
+def test_DockerRegistry__search_errors_not_reported(mock__iter_pages: MagicMock, 
+                                                    mock_user_output: MagicMock) -> None:
+    # Test setup
+    mock__iter_pages.side_effect = registry.RegistryError("test_exception_text")
+
+    test_docker_registry = registry.DockerRegistry(MagicMock(), {"url": "test_url", 
+                                                                 "name": "test_registry"})
 
     # Run unit under test
-    actual_endpoint_url = test_docker_registry._get_tag_endpoint_url(test_repo)
+    actual_repo_names = list(test_docker_registry._search(False))
 
     # Check expectations
-    expected_endpoint_url = test_registry_config["url"] + "/v2/" + test_repo.split("/")[1] + "/tags/list"
-    assert expected_endpoint_url == actual_endpoint_url
+    assert actual_repo_names == []
+    assert test_docker_registry._repo_listing_complete is False
+
+    mock_user_output.error.assert_not_called()
+    mock_user_output.msg.assert_not_called()
 
-@patch.object(registry.DockerRegistry, "_list_tags")
+@patch.object(registry.DockerRegistry, "_list_tags_of_repos")
 @patch.object(registry.DockerRegistry, "_search")
-def test_DockerRegistry__list_repos_in_registry(mock__search: MagicMock, mock__list_tags: MagicMock):
+def test_DockerRegistry__list_repos_in_registry(mock__search: MagicMock, 
+                                                mock__list_tags_of_repos: MagicMock):
     # Test setup
     mock_container_engine = MagicMock()
     test_registry_config = {
@@ -270,65 +2043,57 @@ def test_DockerRegistry__list_repos_in_registry(mock__search: MagicMock, mock__l
         "test_repo1",
         "test_repo2",
     ]
+    expected_repos = [test_registry_config["name"] + "/" + test_repo_name 
+                      for test_repo_name in test_repo_names]
+    test_items = ["Loading image data from: " + expected_repo for expected_repo in expected_repos]
 
-    mock__search.return_value = test_repo_names
+    mock__search.return_value = iter(test_repo_names)
+    mock__list_tags_of_repos.return_value = iter(test_items)
 
     test_docker_registry = registry.DockerRegistry(mock_container_engine, test_registry_config)
 
     # Run unit under test
-    generator = test_docker_registry._list_repos_in_registry()
+    actual_items = list(test_docker_registry._list_repos_in_registry())
 
     # Check expectations
-    calls = []
-    for idx, item in enumerate(generator):
-        expected_repo = test_registry_config["name"] + "/" + test_repo_names[idx]
-        expected_item = "Loading image data from: " + expected_repo
-        assert expected_item == item
+    assert test_items == actual_items
 
-        calls.append(call(expected_repo))
+    mock__list_tags_of_repos.assert_called_once()
+    assert expected_repos == list(mock__list_tags_of_repos.call_args.args[0])
+    mock__search.assert_called_once_with(True)
 
-    mock__search.assert_called_once()
-    mock__list_tags.assert_has_calls(calls)
-
-@patch.object(registry.Core, "config_file")
-@patch("dem.core.registry.requests.get")
-def test_DockerRegistry__search(mock_requests_get: MagicMock, mock_config_file) -> None:
+@patch.object(registry.DockerRegistry, "_iter_pages")
+def test_DockerRegistry__search(mock__iter_pages: MagicMock) -> None:
     # Test setup
     mock_container_engine = MagicMock()
     test_registry_config = {
-        "url": "test_url"
-    }
-    test_response = {
-        "repositories": [
-            "test_repo1",
-            "test_repo2",
-        ] 
+        "url": "test_url",
+        "page_size": 2
     }
-
-    mock_response = MagicMock()
-    mock_response.status_code = registry.requests.codes.ok
-    mock_response.json.return_value = test_response
-    mock_requests_get.return_value = mock_response
-
-    test_http_request_timeout_s = 10
-    mock_config_file.http_request_timeout_s = test_http_request_timeout_s
+    test_pages = [
+        (MagicMock(), {"repositories": ["test_repo1", "test_repo2"]}),
+        (MagicMock(), {"repositories": ["test_repo3"]}),
+    ]
+    mock__iter_pages.return_value = iter(test_pages)
 
     test_docker_registry = registry.DockerRegistry(mock_container_engine, test_registry_config)
 
     # Run unit under test
-    actual_repo_names = test_docker_registry._search()
+    actual_repo_names = list(test_docker_registry._search())
 
     # Check expectations
-    assert actual_repo_names is test_response["repositories"]
+    assert actual_repo_names == ["test_repo1", "test_repo2", "test_repo3"]
+    assert test_docker_registry._repo_listing_complete is True
 
-    mock_requests_get.assert_called_once_with(test_registry_config["url"] + "/v2/_catalog", 
-                                              timeout=test_http_request_timeout_s)
-    mock_response.json.assert_called_once()
+    mock__iter_pages.assert_called_once_with(test_registry_config["url"] + "/v2/_catalog?n=2")
 
+@patch.object(registry.Registry, "_record_request_result", MagicMock())
+@patch.object(registry.Registry, "_is_circuit_open", MagicMock(return_value=False))
+@patch.object(registry.Registry, "_get_token_bucket", MagicMock())
 @patch.object(registry.Core, "config_file")
 @patch.object(registry.DockerRegistry, "user_output")
-@patch("dem.core.registry.requests.get")
-def test_DockerRegistry__search_requests_get_exception(mock_requests_get: MagicMock, 
+@patch.object(registry.Core, "_http_session")
+def test_DockerRegistry__search_requests_get_exception(mock_http_session: MagicMock, 
                                                        mock_user_output: MagicMock,
                                                        mock_config_file: MagicMock) -> None:
     # Test setup
@@ -338,7 +2103,7 @@ def test_DockerRegistry__search_requests_get_exception(mock_requests_get: MagicM
         "url": "test_url"
     }
 
-    mock_requests_get.side_effect = Exception("test")
+    mock_http_session.get.side_effect = Exception("test")
 
     test_http_request_timeout_s = 10
     mock_config_file.http_request_timeout_s = test_http_request_timeout_s
@@ -346,20 +2111,24 @@ def test_DockerRegistry__search_requests_get_exception(mock_requests_get: MagicM
     test_docker_registry = registry.DockerRegistry(mock_container_engine, test_registry_config)
 
     # Run unit under test
-    actual_repo_names = test_docker_registry._search()
+    actual_repo_names = list(test_docker_registry._search())
 
     # Check expectations
     assert actual_repo_names == []
 
-    mock_requests_get.assert_called_once_with(test_registry_config["url"] + "/v2/_catalog", 
-                                              timeout=test_http_request_timeout_s)
-    mock_user_output.error(str(mock_requests_get.side_effect))
-    mock_user_output.msg("Skipping registry: " + test_registry_config["name"])
+    mock_http_session.get.assert_called_once_with(test_registry_config["url"] + "/v2/_catalog?n=100", 
+                                                  headers={}, 
+                                                  timeout=test_http_request_timeout_s)
+    mock_user_output.error.assert_called_once_with("Registry error: test")
+    mock_user_output.msg.assert_called_once_with("Skipping registry: " + test_registry_config["name"])
 
+@patch.object(registry.Registry, "_record_request_result", MagicMock())
+@patch.object(registry.Registry, "_is_circuit_open", MagicMock(return_value=False))
+@patch.object(registry.Registry, "_get_token_bucket", MagicMock())
 @patch.object(registry.Core, "config_file")
 @patch.object(registry.DockerRegistry, "user_output")
-@patch("dem.core.registry.requests.get")
-def test_DockerRegistry__search_invalid_status_code(mock_requests_get: MagicMock, 
+@patch.object(registry.Core, "_http_session")
+def test_DockerRegistry__search_invalid_status_code(mock_http_session: MagicMock, 
                                                     mock_user_output: MagicMock,
                                                     mock_config_file: MagicMock) -> None:
     # Test setup
@@ -371,7 +2140,7 @@ def test_DockerRegistry__search_invalid_status_code(mock_requests_get: MagicMock
 
     mock_response = MagicMock()
     mock_response.status_code = 0
-    mock_requests_get.return_value = mock_response
+    mock_http_session.get.return_value = mock_response
 
     test_http_request_timeout_s = 10
     mock_config_file.http_request_timeout_s = test_http_request_timeout_s
@@ -379,20 +2148,24 @@ def test_DockerRegistry__search_invalid_status_code(mock_requests_get: MagicMock
     test_docker_registry = registry.DockerRegistry(mock_container_engine, test_registry_config)
 
     # Run unit under test
-    actual_repo_names = test_docker_registry._search()
+    actual_repo_names = list(test_docker_registry._search())
 
     # Check expectations
     assert actual_repo_names == []
 
-    mock_requests_get.assert_called_once_with(test_registry_config["url"] + "/v2/_catalog", 
-                                              timeout=test_http_request_timeout_s)
-    mock_user_output.error("Error in communication with the registry. Failed to retrieve the repositories. Response status code: " + str(mock_response.status_code))
-    mock_user_output.msg("Skipping registry: " + test_registry_config["name"])
+    mock_http_session.get.assert_called_once_with(test_registry_config["url"] + "/v2/_catalog?n=100", 
+                                                  headers={},
+                                                  timeout=test_http_request_timeout_s)
+    mock_user_output.error.assert_called_once_with("Registry error: Error in communication with the registry. Response status code: " + str(mock_response.status_code))
+    mock_user_output.msg.assert_called_once_with("Skipping registry: " + test_registry_config["name"])
 
+@patch.object(registry.Registry, "_record_request_result", MagicMock())
+@patch.object(registry.Registry, "_is_circuit_open", MagicMock(return_value=False))
+@patch.object(registry.Registry, "_get_token_bucket", MagicMock())
 @patch.object(registry.Core, "config_file")
 @patch.object(registry.DockerRegistry, "user_output")
-@patch("dem.core.registry.requests.get")
-def test_DockerRegistry__search_json_decode_exception(mock_requests_get: MagicMock, 
+@patch.object(registry.Core, "_http_session")
+def test_DockerRegistry__search_json_decode_exception(mock_http_session: MagicMock, 
                                                       mock_user_output: MagicMock,
                                                       mock_config_file: MagicMock) -> None:
     # Test setup
@@ -405,7 +2178,7 @@ def test_DockerRegistry__search_json_decode_exception(mock_requests_get: MagicMo
     mock_response = MagicMock()
     mock_response.status_code = requests.codes.ok
     mock_response.json.side_effect = requests.exceptions.JSONDecodeError("dummy_msg", "dummy_doc", 0)
-    mock_requests_get.return_value = mock_response
+    mock_http_session.get.return_value = mock_response
 
     test_http_request_timeout_s = 10
     mock_config_file.http_request_timeout_s = test_http_request_timeout_s
@@ -413,21 +2186,22 @@ def test_DockerRegistry__search_json_decode_exception(mock_requests_get: MagicMo
     test_docker_registry = registry.DockerRegistry(mock_container_engine, test_registry_config)
 
     # Run unit under test
-    actual_repo_names = test_docker_registry._search()
+    actual_repo_names = list(test_docker_registry._search())
 
     # Check expectations
     assert actual_repo_names == []
 
-    mock_requests_get.assert_called_once_with(test_registry_config["url"] + "/v2/_catalog", 
-                                              timeout=test_http_request_timeout_s)
     mock_response.json.assert_called_once()
-    mock_user_output.error("Invalid JSON format in response. " + str(mock_response.json.side_effect))
-    mock_user_output.msg("Skipping registry: " + test_registry_config["name"])
+    mock_user_output.error.assert_called_once_with("Invalid JSON format in response. " + str(mock_response.json.side_effect))
+    mock_user_output.msg.assert_called_once_with("Skipping registry: " + test_registry_config["name"])
 
+@patch.object(registry.Registry, "_record_request_result", MagicMock())
+@patch.object(registry.Registry, "_is_circuit_open", MagicMock(return_value=False))
+@patch.object(registry.Registry, "_get_token_bucket", MagicMock())
 @patch.object(registry.Core, "config_file")
 @patch.object(registry.DockerRegistry, "user_output")
-@patch("dem.core.registry.requests.get")
-def test_DockerRegistry__search_json_generic_exception(mock_requests_get: MagicMock, 
+@patch.object(registry.Core, "_http_session")
+def test_DockerRegistry__search_json_generic_exception(mock_http_session: MagicMock,
                                                        mock_user_output: MagicMock,
                                                        mock_config_file: MagicMock) -> None:
     # Test setup
@@ -440,7 +2214,7 @@ def test_DockerRegistry__search_json_generic_exception(mock_requests_get: MagicM
     mock_response = MagicMock()
     mock_response.status_code = requests.codes.ok
     mock_response.json.side_effect = Exception("test")
-    mock_requests_get.return_value = mock_response
+    mock_http_session.get.return_value = mock_response
 
     test_http_request_timeout_s = 10
     mock_config_file.http_request_timeout_s = test_http_request_timeout_s
@@ -448,22 +2222,21 @@ def test_DockerRegistry__search_json_generic_exception(mock_requests_get: MagicM
     test_docker_registry = registry.DockerRegistry(mock_container_engine, test_registry_config)
     
     # Run unit under test
-    actual_repo_names = test_docker_registry._search()
+    actual_repo_names = list(test_docker_registry._search())
 
     # Check expectations
     assert actual_repo_names == []
 
-    mock_requests_get.assert_called_once_with(test_registry_config["url"] + "/v2/_catalog", 
-                                              timeout=test_http_request_timeout_s)
     mock_response.json.assert_called_once()
-    mock_user_output.error(str(mock_response.json.side_effect))
-    mock_user_output.msg("Skipping registry: " + test_registry_config["name"])
+    mock_user_output.error.assert_called_once_with(str(mock_response.json.side_effect))
+    mock_user_output.msg.assert_called_once_with("Skipping registry: " + test_registry_config["name"])
 
+@patch("dem.core.registry.RegistryCacheJSON")
 @patch.object(registry.Core, "config_file")
 @patch("dem.core.registry.DockerRegistry")
 @patch("dem.core.registry.DockerHub")
 def test_Registries(mock_DockerHub: MagicMock, mock_DockerRegistry: MagicMock, 
-                    mock_config_file: MagicMock) -> None:
+                    mock_config_file: MagicMock, mock_RegistryCacheJSON: MagicMock) -> None:
     # Test setup
     mock_container_engine = MagicMock()
     mock_config_file.registries = [
@@ -491,14 +2264,18 @@ def test_Registries(mock_DockerHub: MagicMock, mock_DockerRegistry: MagicMock,
     assert mock_docker_hub in test_registries.registries
     assert mock_docker_registry in test_registries.registries
 
-    mock_DockerHub.assert_called_once_with(mock_container_engine, mock_config_file.registries[0])
-    mock_DockerRegistry.assert_called_once_with(mock_container_engine, mock_config_file.registries[1])
+    mock_DockerHub.assert_called_once_with(mock_container_engine, mock_config_file.registries[0],
+                                           mock_RegistryCacheJSON.return_value)
+    mock_DockerRegistry.assert_called_once_with(mock_container_engine, mock_config_file.registries[1],
+                                                mock_RegistryCacheJSON.return_value)
 
+@patch("dem.core.registry.RegistryCacheJSON")
 @patch.object(registry.Core, "config_file")
 @patch("dem.core.registry.DockerRegistry")
 @patch("dem.core.registry.DockerHub")
 def test_Registries_list_repos(mock_DockerHub: MagicMock, mock_DockerRegistry: MagicMock,
-                               mock_config_file: MagicMock) -> None:
+                               mock_config_file: MagicMock, 
+                               mock_RegistryCacheJSON: MagicMock) -> None:
     # Test setup
     mock_container_engine = MagicMock()
     mock_config_file.registries = [
@@ -512,42 +2289,261 @@ def test_Registries_list_repos(mock_DockerHub: MagicMock, mock_DockerRegistry: M
         }
     ]
 
-    test_repos = [
+    test_hub_repos = [
         "test_repo1",
         "test_repo2",
     ]
+    test_registry_repos = [
+        "test_repo3",
+    ]
+
+    mock_config_file.registry_crawl_deadline_s = 0
+
+    mock_docker_hub = MagicMock()
+    mock_docker_hub._registry_config = mock_config_file.registries[0]
+    mock_docker_hub._is_circuit_open.return_value = False
+    mock_docker_hub._list_repos_in_registry.return_value = iter(["test_status1"])
+    mock_docker_hub._repos = test_hub_repos
+    mock_docker_hub._stale_repos = []
+    mock_docker_hub._is_repo_listing_stale = False
+    mock_docker_registry = MagicMock()
+    mock_docker_registry._registry_config = mock_config_file.registries[1]
+    mock_docker_registry._is_circuit_open.return_value = False
+    mock_docker_registry._list_repos_in_registry.return_value = iter(["test_status2"])
+    mock_docker_registry._repos = test_registry_repos
+    mock_docker_registry._stale_repos = []
+    mock_docker_registry._is_repo_listing_stale = False
+    mock_DockerHub.return_value = mock_docker_hub
+    mock_DockerHub._docker_hub_domain = "registry.hub.docker.com"
+    mock_DockerRegistry.return_value = mock_docker_registry
+
+    test_registries = registry.Registries(mock_container_engine)
+
+    # Run unit under test
+    actual_repos = test_registries.list_repos([], True, 
+                                              priority_repos=["registry_config2/repo", 
+                                                              "registry_config1/repo",
+                                                              "unknown/repo"])
+
+    # Check expectations
+    assert [*test_hub_repos, *test_registry_repos] == actual_repos
+    assert mock_docker_hub.priority_repos == ["registry_config1/repo"]
+    assert mock_docker_registry.priority_repos == ["registry_config2/repo"]
+    assert mock_docker_hub.refresh is True
+    assert mock_docker_registry.refresh is True
+    assert mock_docker_hub.deadline is None
+    mock_docker_hub._record_request_result.assert_called_once_with(True)
+    mock_docker_registry._record_request_result.assert_called_once_with(True)
+
+    mock_RegistryCacheJSON.return_value.update.assert_called_once()
+    mock_RegistryCacheJSON.return_value.flush.assert_called_once()
+
+    mock_docker_hub._list_repos_in_registry.assert_called_once()
+    mock_docker_registry._list_repos_in_registry.assert_called_once()
+
+@patch("dem.core.registry.RegistryCacheJSON", MagicMock())
+@patch.object(registry.Core, "config_file")
+@patch("dem.core.registry.DockerRegistry")
+@patch("dem.core.registry.DockerHub")
+def test_Registries_list_repos_selected(mock_DockerHub: MagicMock, mock_DockerRegistry: MagicMock,
+                                        mock_config_file: MagicMock) -> None:
+    # Test setup
+    mock_container_engine = MagicMock()
+    mock_config_file.registries = [
+        {
+            "name": "registry_config1",
+            "url": "registry.hub.docker.com"
+        },
+        {
+            "name": "registry_config2",
+            "url": "https://registry_url2.io"
+        }
+    ]
+
+    test_registry_repos = [
+        "test_repo3",
+    ]
+
+    mock_config_file.registry_crawl_deadline_s = 0
 
     mock_docker_hub = MagicMock()
-    mock_docker_hub.repos = test_repos
+    mock_docker_hub._registry_config = mock_config_file.registries[0]
     mock_docker_registry = MagicMock()
-    mock_docker_registry.repos = test_repos
+    mock_docker_registry._registry_config = mock_config_file.registries[1]
+    mock_docker_registry._is_circuit_open.return_value = False
+    mock_docker_registry._list_repos_in_registry.return_value = iter([])
+    mock_docker_registry._repos = test_registry_repos
+    mock_docker_registry._stale_repos = []
+    mock_docker_registry._is_repo_listing_stale = False
     mock_DockerHub.return_value = mock_docker_hub
     mock_DockerHub._docker_hub_domain = "registry.hub.docker.com"
     mock_DockerRegistry.return_value = mock_docker_registry
 
     test_registries = registry.Registries(mock_container_engine)
 
+    # Run unit under test
+    actual_repos = test_registries.list_repos(["registry_config2"])
+
+    # Check expectations
+    assert test_registry_repos == actual_repos
+
+    mock_docker_hub._list_repos_in_registry.assert_not_called()
+    mock_docker_registry._list_repos_in_registry.assert_called_once()
+
+@patch("dem.core.registry.atexit")
+@patch.object(registry.Core, "config_file")
+@patch.object(registry.Registries, "__init__")
+def test_Registries__revalidate_in_background(mock___init__: MagicMock, 
+                                              mock_config_file: MagicMock,
+                                              mock_atexit: MagicMock) -> None:
+    # Test setup
+    mock___init__.return_value = None
+    mock_config_file.max_workers = 2
+    mock_stale_registry = MagicMock()
+    mock_stale_registry._stale_repos = ["test_repo1", "test_repo2"]
+    mock_stale_registry._is_repo_listing_stale = True
+    mock_fresh_registry = MagicMock()
+    mock_fresh_registry._stale_repos = []
+    mock_fresh_registry._is_repo_listing_stale = False
+
+    test_registries = registry.Registries(MagicMock())
+    test_registries._revalidation_thread = None
+    test_registries._revalidation_flush_lock = threading.Lock()
+    test_registries.registry_cache = MagicMock()
+
+    # Run unit under test
+    test_registries._revalidate_in_background([mock_stale_registry, mock_fresh_registry])
+    actual_revalidation_thread = test_registries._revalidation_thread
+    test_registries._wait_for_revalidation()
+
+    # Check expectations
+    # The revalidation doesn't keep the process alive.
+    assert actual_revalidation_thread.daemon is True
+    assert test_registries._revalidation_thread is None
+    assert mock_stale_registry._stale_repos == []
+    assert mock_stale_registry._is_repo_listing_stale is False
+    assert mock_stale_registry.serve_stale is False
+
+    mock_stale_registry._revalidate_repo_listing.assert_called_once_with()
+    mock_stale_registry._list_tags.assert_has_calls([call("test_repo1", False), 
+                                                     call("test_repo2", False)], any_order=True)
+    mock_fresh_registry._revalidate_repo_listing.assert_not_called()
+    mock_fresh_registry._list_tags.assert_not_called()
+    test_registries.registry_cache.flush.assert_called_once()
+    mock_atexit.register.assert_called_once_with(test_registries._finish_revalidation)
+
+@patch.object(registry.Registries, "__init__")
+def test_Registries__revalidate_in_background_nothing_stale(mock___init__: MagicMock) -> None:
+    # Test setup
+    mock___init__.return_value = None
+    mock_registry = MagicMock()
+    mock_registry._stale_repos = []
+    mock_registry._is_repo_listing_stale = False
+
+    test_registries = registry.Registries(MagicMock())
+    test_registries._revalidation_thread = None
+
+    # Run unit under test
+    test_registries._revalidate_in_background([mock_registry])
+
+    # Check expectations
+    assert test_registries._revalidation_thread is None
+
+@patch.object(registry.Registries, "_revalidation_exit_timeout_s", 0.01)
+@patch("dem.core.registry.atexit", MagicMock())
+@patch.object(registry.Core, "config_file")
+@patch.object(registry.Registries, "__init__")
+def test_Registries__finish_revalidation_timeout(mock___init__: MagicMock, 
+                                                 mock_config_file: MagicMock) -> None:
+    # Test setup
+    mock___init__.return_value = None
+    mock_config_file.max_workers = 2
+    test_revalidation_released = threading.Event()
+    mock_registry = MagicMock()
+    mock_registry._stale_repos = ["test_repo"]
+    mock_registry._is_repo_listing_stale = False
+    mock_registry._cache_lock = threading.Lock()
+    mock_registry._is_crawl_abandoned = False
+    mock_registry._list_tags.side_effect = lambda repo, report_errors: \
+        test_revalidation_released.wait(10)
+
+    test_registries = registry.Registries(MagicMock())
+    test_registries._revalidation_thread = None
+    test_registries._revalidation_flush_lock = threading.Lock()
+    test_registries.registry_cache = MagicMock()
+    test_registries.registries = [mock_registry]
+
+    test_registries._revalidate_in_background([mock_registry])
+
+    try:
+        # Run unit under test
+        test_registries._finish_revalidation()
+
+        # Check expectations
+        # The revalidation is still running, so it gets abandoned and the cache gets saved.
+        assert test_registries._revalidation_thread.is_alive()
+        assert mock_registry._is_crawl_abandoned is True
+        assert test_registries._is_revalidation_abandoned is True
+        test_registries.registry_cache.flush.assert_called_once()
+    finally:
+        test_revalidation_released.set()
+
+    test_registries._wait_for_revalidation()
+    # The abandoned revalidation doesn't save the cache anymore.
+    test_registries.registry_cache.flush.assert_called_once()
+
+@patch.object(registry.Registries, "__init__")
+def test_Registries__finish_revalidation_finished(mock___init__: MagicMock) -> None:
+    # Test setup
+    mock___init__.return_value = None
+    mock_revalidation_thread = MagicMock()
+    mock_revalidation_thread.is_alive.return_value = False
+
+    test_registries = registry.Registries(MagicMock())
+    test_registries._revalidation_thread = mock_revalidation_thread
+    test_registries.registry_cache = MagicMock()
+
+    # Run unit under test
+    test_registries._finish_revalidation()
+
+    # Check expectations
+    mock_revalidation_thread.join.assert_called_once_with(
+        registry.Registries._revalidation_exit_timeout_s)
+    test_registries.registry_cache.flush.assert_not_called()
+
+@patch.object(registry.Core, "config_file")
+def test_Registries_list_repos_no_registry(mock_config_file: MagicMock) -> None:
+    # Test setup
+    mock_config_file.registries = []
+
+    test_registries = registry.Registries(MagicMock())
+
     # Run unit under test
     actual_repos = test_registries.list_repos([])
 
     # Check expectations
-    expected_repos = [*test_repos * 2]
-    assert expected_repos == actual_repos
+    assert [] == actual_repos
 
+@patch.object(registry.Core, "config_file")
 @patch.object(registry.Registries, "user_output")
 @patch.object(registry.Registries, "__init__")
 def test_Registries_list_repos_handle_exception(mock___init__: MagicMock, 
-                                                mock_user_output: MagicMock):
+                                                mock_user_output: MagicMock,
+                                                mock_config_file: MagicMock):
     # Test setup
     mock___init__.return_value = None
+    mock_config_file.registry_crawl_deadline_s = 0
+    mock_config_file.circuit_breaker_threshold = 3
 
     test_exception_text = "test_exception_test"
     test_registry_name = "test_registry_name"
+    test_available_repos = ["test_repo"]
     class StubRegistry(registry.Registry):
-        def __init__(self) -> None:
-            self._registry_config = {
-                "name": test_registry_name
-            }
+        def __init__(self, name: str) -> None:
+            super().__init__(MagicMock(), {
+                "name": name
+            })
+            self._repos = test_available_repos
 
         def _append_repo_with_tag(self, endpoint_response: dict, repo: str) -> None:
             pass
@@ -555,20 +2551,35 @@ def test_Registries_list_repos_handle_exception(mock___init__: MagicMock,
         def _get_tag_endpoint_url(self, repo_name: str) -> str:
             return "test"
 
+        def _get_next_page_url(self, response: requests.Response, 
+                               endpoint_response: dict) -> str | None:
+            return None
+
+        def _search(self, report_errors: bool = True) -> Generator:
+            yield from []
+
         def _list_repos_in_registry(self) -> Generator:
             yield "test"
 
-        @property
-        def repos(self) -> list[str]:
+    class FailingStubRegistry(StubRegistry):
+        def _list_repos_in_registry(self) -> Generator:
+            yield "test"
             raise Exception(test_exception_text)
 
+    mock_user_output.status_generator.side_effect = lambda generator: list(generator)
+
     test_registries = registry.Registries(MagicMock())
-    test_registries.registries = [StubRegistry()]
+    test_registries._revalidation_thread = None
+    test_registries.registry_cache = MagicMock()
+    test_registries.registries = [FailingStubRegistry(test_registry_name), 
+                                  StubRegistry("available_registry")]
 
     # Run unit under test
-    test_registries.list_repos([])
+    actual_repos = test_registries.list_repos([])
 
     # Check expectations
+    assert test_available_repos == actual_repos
+
     mock___init__.assert_called_once()
 
     calls = [
@@ -576,6 +2587,204 @@ def test_Registries_list_repos_handle_exception(mock___init__: MagicMock,
         call("[red]Error: The " + test_registry_name + " registry is not available.[/]")
     ]
     mock_user_output.error.assert_has_calls(calls)
+    mock_user_output.status_generator.assert_called_once()
+
+@patch.object(registry.Registries, "user_output")
+@patch.object(registry.Registries, "__init__")
+def test_Registries__crawl_registry_circuit_open(mock___init__: MagicMock, 
+                                                 mock_user_output: MagicMock) -> None:
+    # Test setup
+    mock___init__.return_value = None
+    mock_registry = MagicMock()
+    mock_registry._registry_config = {
+        "name": "test_registry"
+    }
+    mock_registry._is_circuit_open.return_value = True
+    mock_registry._get_circuit_open_message.return_value = "test_message"
+    mock_event_queue = MagicMock()
+
+    test_registries = registry.Registries(MagicMock())
+    test_registries._revalidation_thread = None
+
+    # Run unit under test
+    actual_repos = test_registries._crawl_registry(mock_registry, mock_event_queue)
+
+    # Check expectations
+    assert actual_repos == []
+
+    mock_registry._list_repos_in_registry.assert_not_called()
+    mock_user_output.error.assert_has_calls([
+        call("Registry error: test_message"),
+        call("[red]Error: The test_registry registry is not available.[/]")
+    ])
+    mock_event_queue.put.assert_called_once_with(None)
+
+@patch.object(registry.Core, "config_file")
+@patch.object(registry.Registries, "user_output", MagicMock())
+@patch.object(registry.Registries, "__init__")
+def test_Registries_iter_tool_images(mock___init__: MagicMock, mock_config_file: MagicMock) -> None:
+    # Test setup
+    mock___init__.return_value = None
+    mock_config_file.registry_crawl_deadline_s = 60
+    mock_config_file.circuit_breaker_threshold = 3
+
+    class StubRegistry(registry.Registry):
+        def __init__(self, name: str, repos: list[str], fail: bool = False) -> None:
+            super().__init__(MagicMock(), {
+                "name": name
+            })
+            self.test_repos = repos
+            self.fail = fail
+
+        def _append_repo_with_tag(self, endpoint_response: dict, repo: str) -> None:
+            pass
+
+        def _get_tag_endpoint_url(self, repo_name: str) -> str:
+            return "test"
+
+        def _get_next_page_url(self, response: requests.Response, 
+                               endpoint_response: dict) -> str | None:
+            return None
+
+        def _search(self, report_errors: bool = True) -> Generator:
+            yield from []
+
+        def _list_repos_in_registry(self) -> Generator:
+            for repo in self.test_repos:
+                yield "Loading image data from: " + repo
+                self._repos.append(repo + ":latest")
+            if self.fail:
+                raise Exception("test_exception")
+
+    test_registries = registry.Registries(MagicMock())
+    test_registries._revalidation_thread = None
+    test_registries.registry_cache = MagicMock()
+    test_registries.registries = [StubRegistry("registry1", ["repo1", "repo2"]),
+                                  StubRegistry("registry2", ["repo3"], True),
+                                  StubRegistry("registry3", ["repo4"])]
+
+    # Run unit under test
+    actual_tool_images = list(test_registries.iter_tool_images(["registry1", "registry2"], True,
+                                                               ["repo*"]))
+
+    # Check expectations
+    # The repositories resolved after the last status of the failing registry are dropped.
+    assert sorted(actual_tool_images) == ["repo1:latest", "repo2:latest"]
+    assert test_registries.registries[0].refresh is True
+    assert test_registries.registries[1].refresh is True
+    assert test_registries.registries[0].repo_filter == ["repo*"]
+    assert test_registries.registries[0].deadline is not None
+    assert test_registries.registries[1].repo_filter == ["repo*"]
+    assert test_registries.registries[2]._repos == []
+
+    test_registries.registry_cache.update.assert_called_once()
+    test_registries.registry_cache.flush.assert_called_once()
+
+@patch.object(registry.Registries, "__init__")
+def test_Registries_iter_tool_images_no_registry(mock___init__: MagicMock) -> None:
+    # Test setup
+    mock___init__.return_value = None
+
+    test_registries = registry.Registries(MagicMock())
+    test_registries._revalidation_thread = None
+    test_registries.registry_cache = MagicMock()
+    test_registries.registries = []
+
+    # Run unit under test
+    actual_tool_images = list(test_registries.iter_tool_images([]))
+
+    # Check expectations
+    assert actual_tool_images == []
+
+    test_registries.registry_cache.update.assert_not_called()
+    test_registries.registry_cache.flush.assert_not_called()
+
+@patch.object(registry.Registries, "user_output")
+@patch.object(registry.Core, "config_file")
+@patch.object(registry.Registries, "__init__")
+def test_Registries_resolve_tool_images(mock___init__: MagicMock, mock_config_file: MagicMock,
+                                        mock_user_output: MagicMock) -> None:
+    # Test setup
+    mock___init__.return_value = None
+    mock_config_file.max_workers = 4
+
+    mock_docker_hub = MagicMock()
+    mock_docker_hub._registry_config = {"name": "axem"}
+    mock_docker_hub.is_tag_available.side_effect = lambda repo, tag: tag == "latest"
+    mock_docker_registry = MagicMock()
+    mock_docker_registry._registry_config = {"name": "localhost:5000"}
+    mock_docker_registry.is_tag_available.side_effect = registry.RegistryError("test_error")
+
+    test_registries = registry.Registries(MagicMock())
+    test_registries._revalidation_thread = None
+    test_registries.registry_cache = MagicMock()
+    test_registries.registries = [mock_docker_hub, mock_docker_registry]
+
+    # Run unit under test
+    actual_available = test_registries.resolve_tool_images(["axem/tool1:latest", "axem/tool2:v1",
+                                                            "localhost:5000/tool3:latest",
+                                                            "unknown/tool4:latest",
+                                                            "axem/tool1:latest"])
+
+    # Check expectations
+    assert actual_available == {"axem/tool1:latest"}
+
+    mock_docker_hub.is_tag_available.assert_has_calls([call("axem/tool1", "latest"), 
+                                                       call("axem/tool2", "v1")], any_order=True)
+    assert mock_docker_hub.is_tag_available.call_count == 2
+    mock_docker_registry.is_tag_available.assert_called_once_with("localhost:5000/tool3", "latest")
+    mock_user_output.error.assert_called_once_with("Registry error: test_error")
+    test_registries.registry_cache.update.assert_called_once()
+    test_registries.registry_cache.flush.assert_called_once()
+
+@patch.object(registry.Registries, "__init__")
+def test_Registries_get_repo_references(mock___init__: MagicMock) -> None:
+    # Test setup
+    mock___init__.return_value = None
+    mock_docker_hub = MagicMock()
+    mock_docker_hub._registry_config = {"name": "axem"}
+    mock_docker_registry = MagicMock()
+    mock_docker_registry._registry_config = {"name": "localhost:5000"}
+
+    test_registries = registry.Registries(MagicMock())
+    test_registries.registries = [mock_docker_hub, mock_docker_registry]
+
+    # Run unit under test and check expectations
+    assert test_registries.get_repo_references() == ["axem/*", "axem/*/*", "localhost:5000/*", 
+                                                     "localhost:5000/*/*"]
+    assert test_registries.get_repo_references(["localhost:5000"]) == ["localhost:5000/*", 
+                                                                       "localhost:5000/*/*"]
+
+@patch.object(registry.Core, "config_file")
+@patch.object(registry.Registries, "__init__")
+def test_Registries_get_tool_image_layers(mock___init__: MagicMock, 
+                                          mock_config_file: MagicMock) -> None:
+    # Test setup
+    mock___init__.return_value = None
+    mock_config_file.max_workers = 4
+
+    mock_docker_hub = MagicMock()
+    mock_docker_hub._registry_config = {"name": "axem"}
+    def get_layers(repo: str, tag: str) -> list[tuple[str, int]]:
+        if tag == "broken":
+            raise registry.RegistryError("test_error")
+        return [("sha256:" + repo, 100)]
+    mock_docker_hub.get_layers.side_effect = get_layers
+
+    test_registries = registry.Registries(MagicMock())
+    test_registries._revalidation_thread = None
+    test_registries.registries = [mock_docker_hub]
+
+    # Run unit under test
+    actual_layers = test_registries.get_tool_image_layers(["axem/tool1:latest", "axem/tool2:broken",
+                                                           "unknown/tool3:latest"])
+
+    # Check expectations
+    assert actual_layers == {
+        "axem/tool1:latest": [("sha256:axem/tool1", 100)],
+        "axem/tool2:broken": [],
+        "unknown/tool3:latest": [],
+    }
 
 @patch.object(registry.Core, "config_file")
 @patch.object(registry.Registries, "_add_registry_instance")
@@ -57,7 +57,7 @@ def test_ToolImages_update() -> None:
     assert tool_images_instance.all_tool_images["local_and_registry_tool_image:tag"].availability == tool_images.ToolImage.LOCAL_AND_REGISTRY
 
     mock_container_engine.get_local_tool_images.assert_called_once()
-    mock_registries.list_repos.assert_called_once()
+    mock_registries.list_repos.assert_called_once_with([], False, [], False, [])
 
 def test_ToolImages_get_local_ones() -> None:
     # Test setup
@@ -115,4 +115,51 @@ def test_ToolImages_get_registry_ones() -> None:
     assert "local_and_registry_tool_image:tag" in registry_tool_images
 
     mock_container_engine.get_local_tool_images.assert_called_once()
-    mock_registries.list_repos.assert_called_once()
\ No newline at end of file
+    mock_registries.list_repos.assert_called_once()
+
+def test_ToolImages_resolve() -> None:
+    # Test setup
+    mock_container_engine = MagicMock()
+    mock_registries = MagicMock()
+    mock_container_engine.is_local_tool_image.side_effect = lambda tool_image_name: \
+        tool_image_name in {"local_tool_image:tag", "local_and_registry_tool_image:tag",
+                            "not_requested_tool_image:tag"}
+    mock_registries.resolve_tool_images.return_value = {"registry_tool_image:tag", 
+                                                        "local_and_registry_tool_image:tag"}
+    test_tool_image_names = ["local_tool_image:tag", "local_and_registry_tool_image:tag",
+                             "registry_tool_image:tag", "unavailable_tool_image:tag"]
+
+    tool_images_instance = tool_images.ToolImages(mock_container_engine, mock_registries)
+
+    # Run unit under test
+    tool_images_instance.resolve(test_tool_image_names)
+
+    # Check expectations
+    assert len(tool_images_instance.all_tool_images) == 4
+    assert tool_images_instance.all_tool_images["local_tool_image:tag"].availability == tool_images.ToolImage.LOCAL_ONLY
+    assert tool_images_instance.all_tool_images["local_and_registry_tool_image:tag"].availability == tool_images.ToolImage.LOCAL_AND_REGISTRY
+    assert tool_images_instance.all_tool_images["registry_tool_image:tag"].availability == tool_images.ToolImage.REGISTRY_ONLY
+    assert tool_images_instance.all_tool_images["unavailable_tool_image:tag"].availability == tool_images.ToolImage.NOT_AVAILABLE
+
+    mock_container_engine.get_local_tool_images.assert_not_called()
+    mock_registries.resolve_tool_images.assert_called_once_with(test_tool_image_names)
+    mock_registries.list_repos.assert_not_called()
+
+def test_ToolImages_resolve_local_first() -> None:
+    # Test setup
+    mock_container_engine = MagicMock()
+    mock_registries = MagicMock()
+    mock_container_engine.is_local_tool_image.side_effect = lambda tool_image_name: \
+        tool_image_name == "local_tool_image:tag"
+    mock_registries.resolve_tool_images.return_value = {"registry_tool_image:tag"}
+
+    tool_images_instance = tool_images.ToolImages(mock_container_engine, mock_registries)
+
+    # Run unit under test
+    tool_images_instance.resolve(["local_tool_image:tag", "registry_tool_image:tag"], True)
+
+    # Check expectations
+    assert tool_images_instance.all_tool_images["local_tool_image:tag"].availability == tool_images.ToolImage.LOCAL_ONLY
+    assert tool_images_instance.all_tool_images["registry_tool_image:tag"].availability == tool_images.ToolImage.REGISTRY_ONLY
+
+    mock_registries.resolve_tool_images.assert_called_once_with(["registry_tool_image:tag"])